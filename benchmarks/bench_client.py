@@ -0,0 +1,224 @@
+"""
+Times the client's hot paths against the local stub backend.
+
+Covers retrieve_user_info with a cold and a warm cache, paging through every
+transaction, an end to end dashboard load, token refresh and keyring reads.
+Results are saved as a JSON baseline; compare two baselines to flag
+regressions before and after a change.
+
+Usage:
+    python -m benchmarks.bench_client run [--output PATH] [--repeat N] ...
+    python -m benchmarks.bench_client compare BASELINE CURRENT [--threshold 0.1]
+"""
+
+import argparse
+import sys
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+import keyring
+from keyring.backend import KeyringBackend
+from keyring.errors import PasswordDeleteError
+
+from benchmarks.harness import (
+    STATS,
+    BenchmarkResult,
+    compare_results,
+    format_comparisons,
+    format_results,
+    load_baseline,
+    measure,
+    save_baseline,
+)
+from benchmarks.stub_server import StubConfig, StubServer
+from src.core.account_management import AccountDirectory
+from src.services.api_client_service import APIClient
+from src.services.http_session import close_http_session
+from src.services.response_cache import clear_response_cache
+from src.services.session_manager import SessionManager
+
+DEFAULT_OUTPUT = "benchmarks/baselines/client.json"
+
+
+class MemoryKeyring(KeyringBackend):
+    """
+    Keeps passwords in memory so benchmarks never touch the user's keyring.
+
+    ``latency`` is added to every call to stand in for a slow OS keyring.
+    """
+
+    # Zero keeps keyring's backend discovery from ever picking this class
+    # on its own; it is only used when installed with set_keyring.
+    priority = 0
+
+    def __init__(self, latency: float = 0.0):
+        super().__init__()
+        self.latency = latency
+        self._passwords: Dict[Tuple[str, str], str] = {}
+
+    def _wait(self) -> None:
+        if self.latency:
+            time.sleep(self.latency)
+
+    def get_password(self, service: str, username: str) -> Optional[str]:
+        self._wait()
+        return self._passwords.get((service, username))
+
+    def set_password(self, service: str, username: str, password: str) -> None:
+        self._wait()
+        self._passwords[(service, username)] = password
+
+    def delete_password(self, service: str, username: str) -> None:
+        self._wait()
+        if self._passwords.pop((service, username), None) is None:
+            raise PasswordDeleteError(username)
+
+
+def load_dashboard(api_client: APIClient) -> None:
+    """Builds and renders the dashboard the way the app does after login."""
+    from PySide6.QtWidgets import QApplication
+
+    from src.ui.theme import get_theme_manager
+    from src.views.main_window_view import main_window_view
+
+    app = QApplication.instance() or QApplication([])
+    get_theme_manager().apply(app=app)
+    window = main_window_view()
+    window.api_client = api_client
+    window.account_directory = AccountDirectory(api_client)
+    window.cached_user_info = api_client.retrieve_user_info()
+    window.addSummaryCards()
+    window.addAccountCards()
+    window.populate_transaction_table(window.fetch_transactions())
+    window.grab()
+    window.deleteLater()
+    app.processEvents()
+
+
+def cold() -> None:
+    """Drops cached responses and pooled connections."""
+    clear_response_cache()
+    close_http_session()
+
+
+def benchmarks(
+    server: StubServer, session_manager: SessionManager
+) -> Dict[str, Tuple[Callable[[], object], Optional[Callable[[], object]]]]:
+    """Returns each benchmark as ``(fn, setup)``."""
+    api_client = APIClient(base_url=server.base_url)
+    return {
+        "retrieve_user_info_cold": (api_client.retrieve_user_info, cold),
+        "retrieve_user_info_warm": (api_client.retrieve_user_info, None),
+        "page_transactions": (
+            lambda: sum(1 for _ in api_client.iter_transactions(page_size=100)),
+            clear_response_cache,
+        ),
+        "dashboard_load": (lambda: load_dashboard(api_client), clear_response_cache),
+        "token_refresh": (session_manager.refresh_session, None),
+        "keyring_reload": (session_manager.invalidate_cache, None),
+        "auth_headers_cached": (session_manager.get_authenticated_headers, None),
+    }
+
+
+def run_benchmarks(
+    config: StubConfig,
+    repeat: int = 10,
+    keyring_latency: float = 0.0,
+    only: Optional[list] = None,
+) -> Dict[str, BenchmarkResult]:
+    """Starts a stub backend for ``config`` and runs the benchmarks against it."""
+    previous_keyring = keyring.get_keyring()
+    keyring.set_keyring(MemoryKeyring(keyring_latency))
+    server = StubServer(config).start()
+    try:
+        session_manager = SessionManager()
+        session_manager.base_url = server.base_url
+        session_manager.login("user1", "benchmark")
+
+        results = {}
+        for name, (fn, setup) in benchmarks(server, session_manager).items():
+            if only and name not in only:
+                continue
+            results[name] = measure(fn, repeat=repeat, setup=setup)
+        return results
+    finally:
+        server.stop()
+        cold()
+        keyring.set_keyring(previous_keyring)
+
+
+def run_command(args: argparse.Namespace) -> int:
+    config = StubConfig(
+        accounts=args.accounts,
+        transactions=args.transactions,
+        latency=args.latency,
+    )
+    results = run_benchmarks(config, args.repeat, args.keyring_latency, args.only)
+    print(format_results(results))
+    save_baseline(
+        args.output,
+        results,
+        {
+            "repeat": args.repeat,
+            "accounts": args.accounts,
+            "transactions": args.transactions,
+            "latency": args.latency,
+            "keyring_latency": args.keyring_latency,
+        },
+    )
+    print(f"Saved to {args.output}")
+    return 0
+
+
+def compare_command(args: argparse.Namespace) -> int:
+    comparisons = compare_results(
+        load_baseline(args.baseline),
+        load_baseline(args.current),
+        args.threshold,
+        args.stat,
+        args.min_delta,
+    )
+    print(format_comparisons(comparisons, args.stat))
+    regressions = [c.name for c in comparisons if c.regressed]
+    if regressions:
+        print(
+            f"{len(regressions)} regression(s) beyond {args.threshold:.0%}: "
+            f"{', '.join(regressions)}"
+        )
+        return 1
+    return 0
+
+
+def main(argv: Optional[list] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="Run the benchmarks and save a baseline.")
+    run.add_argument("--output", default=DEFAULT_OUTPUT)
+    run.add_argument("--repeat", type=int, default=10)
+    run.add_argument("--accounts", type=int, default=20)
+    run.add_argument("--transactions", type=int, default=5000)
+    run.add_argument("--latency", type=float, default=0.0)
+    run.add_argument("--keyring-latency", type=float, default=0.0)
+    run.add_argument("--only", nargs="+", help="Run only these benchmarks.")
+    run.set_defaults(handler=run_command)
+
+    compare = commands.add_parser("compare", help="Flag regressions between runs.")
+    compare.add_argument("baseline")
+    compare.add_argument("current")
+    compare.add_argument("--threshold", type=float, default=0.10)
+    compare.add_argument("--stat", choices=STATS, default="median")
+    compare.add_argument(
+        "--min-delta",
+        type=float,
+        default=0.1,
+        help="Ignore slowdowns smaller than this many milliseconds.",
+    )
+    compare.set_defaults(handler=compare_command)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
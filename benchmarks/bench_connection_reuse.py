@@ -0,0 +1,95 @@
+"""
+Shows connection reuse across a dashboard load.
+
+Runs retrieve_user_info, retrieve_user_transactions and get_account_details
+against the local stub server, once with a new connection per request (the
+old module level ``requests.request`` behaviour) and once through the pooled
+keep-alive session, and prints the number of TCP connections each opened.
+
+Usage: python -m benchmarks.bench_connection_reuse [--rounds N]
+"""
+
+import argparse
+import time
+
+import requests
+
+from benchmarks.stub_server import StubServer
+from src.services.api_client_service import APIClient
+from src.services.http_session import close_http_session
+
+
+class StaticAuthSession:
+    """Stands in for SessionManager so the benchmark never touches keyring."""
+
+    def get_authenticated_headers(self) -> dict:
+        return {"Authorization": "Bearer benchmark"}
+
+
+class OneShotSession:
+    """Opens a new connection for every request, like requests.request does."""
+
+    def request(self, **kwargs):
+        return requests.request(**kwargs)
+
+    def close(self) -> None:
+        pass
+
+
+def load_dashboard(api_client: APIClient, accounts: list) -> None:
+    api_client.retrieve_user_info()
+    api_client.retrieve_user_transactions()
+    for account in accounts:
+        api_client.get_account_details(account["account_number"], "account_name")
+
+
+def run(server: StubServer, api_client: APIClient, rounds: int) -> tuple:
+    api_client.session_manager = StaticAuthSession()
+    server.reset_counters()
+    started = time.perf_counter()
+    for _ in range(rounds):
+        load_dashboard(api_client, server.accounts)
+    elapsed = time.perf_counter() - started
+    api_client.close()
+    return server.connections_opened, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    server = StubServer().start()
+    requests_per_round = 3 + len(server.accounts)
+    try:
+        one_shot = run(
+            server,
+            APIClient(
+                base_url=server.base_url,
+                http_session=OneShotSession(),
+                cache_responses=False,
+            ),
+            args.rounds,
+        )
+        close_http_session()
+        pooled = run(
+            server,
+            APIClient(base_url=server.base_url, cache_responses=False),
+            args.rounds,
+        )
+    finally:
+        server.stop()
+
+    print(f"{args.rounds} dashboard loads, {requests_per_round} requests each")
+    for label, (connections, elapsed) in (
+        ("new connection per request", one_shot),
+        ("pooled keep-alive session", pooled),
+    ):
+        print(
+            f"{label:>28}: {connections:4d} connections, "
+            f"{elapsed * 1000 / args.rounds:7.2f} ms per load"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+"""
+Timing, baseline files and regression checks shared by the benchmarks.
+
+A baseline is a JSON file holding one BenchmarkResult per benchmark name,
+in milliseconds, plus the environment and settings it was measured with.
+"""
+
+import json
+import math
+import os
+import platform
+import statistics
+import sys
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+STATS = ("min", "median", "mean", "p95", "max")
+
+
+@dataclass
+class BenchmarkResult:
+    """Summary of one benchmark's runs, in milliseconds."""
+
+    runs: int
+    min: float
+    median: float
+    mean: float
+    p95: float
+    max: float
+
+    @classmethod
+    def from_timings(cls, timings: List[float]) -> "BenchmarkResult":
+        """:param timings: Run durations in seconds."""
+        ordered = sorted(timing * 1000 for timing in timings)
+        p95_index = max(0, math.ceil(0.95 * len(ordered)) - 1)
+        return cls(
+            runs=len(ordered),
+            min=ordered[0],
+            median=statistics.median(ordered),
+            mean=statistics.fmean(ordered),
+            p95=ordered[p95_index],
+            max=ordered[-1],
+        )
+
+
+def measure(
+    fn: Callable[[], Any],
+    repeat: int = 10,
+    warmup: int = 1,
+    setup: Optional[Callable[[], Any]] = None,
+) -> BenchmarkResult:
+    """
+    Times ``fn`` over several runs.
+
+    :param repeat: Timed runs.
+    :param warmup: Untimed runs made first, e.g. to open connections.
+    :param setup: Called untimed before every run, e.g. to clear a cache.
+    """
+    timings = []
+    for run in range(warmup + repeat):
+        if setup is not None:
+            setup()
+        started = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - started
+        if run >= warmup:
+            timings.append(elapsed)
+    return BenchmarkResult.from_timings(timings)
+
+
+def save_baseline(
+    path: str, results: Dict[str, BenchmarkResult], settings: Dict[str, Any]
+) -> None:
+    """Writes ``results`` to ``path`` as a JSON baseline."""
+    document = {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "settings": settings,
+        "results": {name: asdict(result) for name, result in results.items()},
+    }
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w") as file:
+        json.dump(document, file, indent=2)
+        file.write("\n")
+
+
+def load_baseline(path: str) -> Dict[str, BenchmarkResult]:
+    """Reads the results of a baseline written by save_baseline."""
+    with open(path) as file:
+        document = json.load(file)
+    return {
+        name: BenchmarkResult(**result)
+        for name, result in document.get("results", {}).items()
+    }
+
+
+@dataclass
+class Comparison:
+    """One benchmark in a baseline compared with a newer run."""
+
+    name: str
+    baseline: float
+    current: float
+    change: float
+    regressed: bool
+
+
+def compare_results(
+    baseline: Dict[str, BenchmarkResult],
+    current: Dict[str, BenchmarkResult],
+    threshold: float = 0.10,
+    stat: str = "median",
+    min_delta: float = 0.0,
+) -> List[Comparison]:
+    """
+    Compares the benchmarks present in both result sets.
+
+    :param threshold: Relative slowdown of ``stat`` that counts as a
+    regression, e.g. 0.10 for 10%.
+    :param stat: The BenchmarkResult field compared.
+    :param min_delta: Slowdowns under this many milliseconds are treated as
+    noise, so sub-millisecond benchmarks don't flag jitter.
+    """
+    if stat not in STATS:
+        raise ValueError(f"Unknown statistic {stat!r}, expected one of {STATS}.")
+    comparisons = []
+    for name in baseline:
+        if name not in current:
+            continue
+        before = getattr(baseline[name], stat)
+        after = getattr(current[name], stat)
+        change = (after - before) / before if before else 0.0
+        regressed = change > threshold and after - before > min_delta
+        comparisons.append(Comparison(name, before, after, change, regressed))
+    return comparisons
+
+
+def format_comparisons(comparisons: List[Comparison], stat: str = "median") -> str:
+    lines = [f"{'benchmark':<28} {'baseline':>12} {'current':>12} {'change':>8}"]
+    for comparison in comparisons:
+        lines.append(
+            f"{comparison.name:<28} "
+            f"{comparison.baseline:>9.2f} ms {comparison.current:>9.2f} ms "
+            f"{comparison.change:>+7.1%}"
+            f"{'  REGRESSION' if comparison.regressed else ''}"
+        )
+    lines.append(f"({stat} per run)")
+    return "\n".join(lines)
+
+
+def format_results(results: Dict[str, BenchmarkResult]) -> str:
+    lines = [f"{'benchmark':<28}" + "".join(f"{stat:>10}" for stat in STATS)]
+    for name, result in results.items():
+        lines.append(
+            f"{name:<28}" + "".join(f"{getattr(result, stat):>10.2f}" for stat in STATS)
+        )
+    lines.append("(milliseconds per run)")
+    return "\n".join(lines)
@@ -0,0 +1,594 @@
+"""
+Local stand-in for the BankOps API, for benchmarks and integration tests.
+
+Serves the /api/v1/ endpoints the client uses (auth/sessions, users,
+accounts and transactions) from a deterministic, generated dataset. The
+dataset size, response latency, payload size and error rate come from a
+StubConfig, so the same server backs quick tests with a handful of rows and
+load runs with e.g. 100k transactions across 500 accounts.
+
+Usage: python -m benchmarks.stub_server [--port 5000] [--transactions N] ...
+"""
+
+import argparse
+import base64
+import bisect
+import json
+import random
+import re
+import threading
+import time
+from array import array
+from dataclasses import dataclass, fields
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+API_PREFIX = "/api/v1/"
+
+ACCOUNT_TYPES = ("Checking", "Savings", "Credit", "Brokerage")
+TRANSACTION_TYPES = ("DEPOSIT", "WITHDRAWAL", "TRANSFER", "PAYMENT")
+# Weighted so most rows look settled, like a real statement.
+TRANSACTION_STATUSES = ("COMPLETED",) * 8 + ("PENDING", "FAILED")
+FIRST_ACCOUNT_NUMBER = 1000000001
+FIRST_TIMESTAMP = datetime(2024, 1, 1)
+
+Response = Tuple[int, Optional[Dict[str, Any]]]
+
+
+@dataclass
+class StubConfig:
+    """Dataset size and behaviour of a StubServer."""
+
+    users: int = 1
+    accounts: int = 2
+    transactions: int = 30
+    # Seconds added to every response, plus up to latency_jitter more.
+    latency: float = 0.0
+    latency_jitter: float = 0.0
+    # Characters of filler added to every account and transaction.
+    padding: int = 0
+    # Fraction of requests answered with error_status instead.
+    error_rate: float = 0.0
+    error_status: int = 503
+    # Answer transaction pages with a next_cursor instead of offset paging.
+    cursor_paging: bool = False
+    # Refuse requests without a valid access token issued by this server.
+    require_auth: bool = False
+    access_token_ttl: int = 900
+    refresh_token_ttl: int = 86400
+    max_page_size: int = 1000
+    seed: int = 0
+
+
+def _b64(data: dict) -> str:
+    raw = json.dumps(data, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def issue_token(user_id: int, kind: str, expires_at: int, token_id: int) -> str:
+    """Returns an unsigned JWT-shaped token; the client only reads its claims."""
+    header = _b64({"alg": "none", "typ": "JWT"})
+    claims = _b64(
+        {"sub": str(user_id), "type": kind, "exp": expires_at, "jti": token_id}
+    )
+    return f"{header}.{claims}.stub"
+
+
+def token_claims(token: str) -> Optional[dict]:
+    """Returns the claims of a token from issue_token, or None if malformed."""
+    try:
+        claims = token.split(".")[1]
+        claims += "=" * (-len(claims) % 4)
+        data = json.loads(base64.urlsafe_b64decode(claims))
+    except (IndexError, ValueError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+class StubDataset:
+    """
+    Users, accounts and transactions generated from ``config.seed``.
+
+    Transactions are kept as parallel columns and only turned into
+    dictionaries for the page being served, so a dataset of a few hundred
+    thousand rows stays cheap to hold and quick to page through.
+    """
+
+    def __init__(self, config: StubConfig):
+        self.config = config
+        self.users: Dict[int, dict] = {
+            user_id: {
+                "id": user_id,
+                "username": f"user{user_id}",
+                "email": f"user{user_id}@example.com",
+            }
+            for user_id in range(1, config.users + 1)
+        }
+        self._lock = threading.Lock()
+        self._built = False
+        self._user_ids: Dict[int, array] = {}
+        self._account_ids: Dict[int, array] = {}
+
+    # ============================
+    # Users and accounts
+    # ============================
+
+    def add_user(self, username: str, email: str) -> dict:
+        with self._lock:
+            user_id = max(self.users, default=0) + 1
+            user = {"id": user_id, "username": username, "email": email}
+            self.users[user_id] = user
+        return user
+
+    def user_by_name(self, username: str) -> Optional[dict]:
+        for user in list(self.users.values()):
+            if user["username"] == username:
+                return user
+        return None
+
+    def account_owner(self, index: int) -> int:
+        return index % max(1, self.config.users) + 1
+
+    def account(self, index: int) -> dict:
+        self._build()
+        account = {
+            "account_number": str(FIRST_ACCOUNT_NUMBER + index),
+            "account_name": f"{ACCOUNT_TYPES[index % len(ACCOUNT_TYPES)]} {index + 1}",
+            "account_type": ACCOUNT_TYPES[index % len(ACCOUNT_TYPES)],
+            "balance": round(self._balances[index], 2),
+            "latest_balance_change": f"{self._latest_change[index]:.2f}",
+            "owner_id": self.account_owner(index),
+        }
+        if self.config.padding:
+            account["description"] = "x" * self.config.padding
+        return account
+
+    def account_index(self, account_number: str) -> Optional[int]:
+        if not account_number.isdigit():
+            return None
+        index = int(account_number) - FIRST_ACCOUNT_NUMBER
+        return index if 0 <= index < self.config.accounts else None
+
+    def accounts_for(self, user_id: int) -> List[dict]:
+        return [
+            self.account(index)
+            for index in range(self.config.accounts)
+            if self.account_owner(index) == user_id
+        ]
+
+    # ============================
+    # Transactions
+    # ============================
+
+    def _build(self) -> None:
+        """Generates the transaction columns on first use."""
+        with self._lock:
+            if self._built:
+                return
+            config = self.config
+            rng = random.Random(config.seed)  # nosec
+            count = config.transactions if config.accounts else 0
+            self._account_of = array("i", bytes(4 * count))
+            self._amount = array("d", bytes(8 * count))
+            self._balance_after = array("d", bytes(8 * count))
+            self._type_of = bytearray(count)
+            self._status_of = bytearray(count)
+            balances = [
+                float(rng.randrange(500, 20000)) for _ in range(config.accounts)
+            ]
+            latest_change = [0.0] * config.accounts
+
+            for row in range(count):
+                account = rng.randrange(config.accounts)
+                kind = rng.randrange(len(TRANSACTION_TYPES))
+                # Deposits are a quarter of the rows but larger, so balances
+                # drift up slowly instead of running negative.
+                if kind == 0:
+                    amount = round(rng.uniform(1, 1000), 2)
+                else:
+                    amount = -round(rng.uniform(1, 300), 2)
+                balances[account] += amount
+                latest_change[account] = amount
+                self._account_of[row] = account
+                self._amount[row] = amount
+                self._balance_after[row] = round(balances[account], 2)
+                self._type_of[row] = kind
+                self._status_of[row] = rng.randrange(len(TRANSACTION_STATUSES))
+
+            self._balances = balances
+            self._latest_change = latest_change
+            self._built = True
+
+    def transaction(self, transaction_id: int) -> dict:
+        row = transaction_id - 1
+        account = self._account_of[row]
+        transaction = {
+            "id": transaction_id,
+            "account_from": str(FIRST_ACCOUNT_NUMBER + account),
+            "transaction_type": TRANSACTION_TYPES[self._type_of[row]],
+            "amount": self._amount[row],
+            "timestamp": (
+                FIRST_TIMESTAMP + timedelta(minutes=transaction_id)
+            ).isoformat(),
+            "balance_after": self._balance_after[row],
+            "status": TRANSACTION_STATUSES[self._status_of[row]],
+        }
+        if self.config.padding:
+            transaction["description"] = "x" * self.config.padding
+        return transaction
+
+    def _ids_for(self, user_id: int, account: Optional[int]) -> array:
+        """Ascending ids of a user's transactions, optionally of one account."""
+        self._build()
+        with self._lock:
+            if account is not None:
+                ids = self._account_ids.get(account)
+                if ids is None:
+                    ids = self._account_ids[account] = array(
+                        "i",
+                        (
+                            row + 1
+                            for row, owner in enumerate(self._account_of)
+                            if owner == account
+                        ),
+                    )
+                return ids
+
+            ids = self._user_ids.get(user_id)
+            if ids is None:
+                ids = self._user_ids[user_id] = array(
+                    "i",
+                    (
+                        row + 1
+                        for row, owner in enumerate(self._account_of)
+                        if self.account_owner(owner) == user_id
+                    ),
+                )
+            return ids
+
+    def transactions_page(
+        self,
+        user_id: int,
+        limit: int,
+        offset: int = 0,
+        cursor: Optional[int] = None,
+        since_id: Optional[int] = None,
+        transaction_type: Optional[str] = None,
+        account_number: Optional[str] = None,
+    ) -> dict:
+        """
+        Returns one page of a user's transactions, newest first.
+
+        :param cursor: Only return transactions older than this id.
+        :param since_id: Only return transactions newer than this id.
+        """
+        account = None
+        if account_number is not None:
+            account = self.account_index(account_number)
+            if account is None or self.account_owner(account) != user_id:
+                return {"transactions": []}
+        ids = self._ids_for(user_id, account)
+
+        low = bisect.bisect_right(ids, since_id) if since_id is not None else 0
+        high = bisect.bisect_left(ids, cursor) if cursor is not None else len(ids)
+        newest_first = (ids[i] for i in range(high - 1, low - 1, -1))
+        if transaction_type:
+            newest_first = (
+                transaction_id
+                for transaction_id in newest_first
+                if TRANSACTION_TYPES[self._type_of[transaction_id - 1]]
+                == transaction_type
+            )
+
+        page = []
+        for position, transaction_id in enumerate(newest_first):
+            if position < offset:
+                continue
+            if len(page) > limit:
+                break
+            page.append(transaction_id)
+
+        has_more = len(page) > limit
+        page = page[:limit]
+        data: Dict[str, Any] = {
+            "transactions": [self.transaction(i) for i in page],
+        }
+        if self.config.cursor_paging:
+            data["next_cursor"] = str(page[-1]) if has_more else None
+        return data
+
+
+class StubRequestHandler(BaseHTTPRequestHandler):
+    """Routes requests to the StubServer's dataset."""
+
+    # HTTP/1.1 keeps the connection open between requests.
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; without this, Nagle plus
+    # delayed ACKs stall every reused connection by ~40ms.
+    disable_nagle_algorithm = True
+
+    server: "StubServer"
+
+    def setup(self) -> None:
+        super().setup()
+        self.server.record_connection()
+
+    def log_message(self, format: str, *args: Any) -> None:
+        # Keep benchmark output readable.
+        pass
+
+    def do_GET(self) -> None:
+        self.handle_api("GET")
+
+    def do_POST(self) -> None:
+        self.handle_api("POST")
+
+    def do_DELETE(self) -> None:
+        self.handle_api("DELETE")
+
+    def handle_api(self, method: str) -> None:
+        parts = urlsplit(self.path)
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        status, payload = self.server.dispatch(
+            method,
+            parts.path,
+            {key: values[-1] for key, values in parse_qs(parts.query).items()},
+            self.headers.get("Authorization", ""),
+            body,
+        )
+
+        data = json.dumps(payload).encode() if payload is not None else b""
+        self.send_response(status)
+        if payload is not None:
+            self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+class StubServer(ThreadingHTTPServer):
+    """
+    Local HTTP server implementing the BankOps API over a StubDataset.
+
+    It also counts the TCP connections it accepts, the requests it served
+    and the errors it injected, for benchmarks to report.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        config: Optional[StubConfig] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        super().__init__((host, port), StubRequestHandler)
+        self.config = config or StubConfig()
+        self.dataset = StubDataset(self.config)
+        self.connections_opened = 0
+        self.requests_served = 0
+        self.errors_injected = 0
+        self._counter_lock = threading.Lock()
+        self._random = random.Random(self.config.seed)  # nosec
+        self._token_ids = 0
+        self._revoked: set = set()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}{API_PREFIX}"
+
+    @property
+    def accounts(self) -> List[dict]:
+        """The accounts of the first user, the one logged in by default."""
+        return self.dataset.accounts_for(1)
+
+    def record_connection(self) -> None:
+        with self._counter_lock:
+            self.connections_opened += 1
+
+    def reset_counters(self) -> None:
+        with self._counter_lock:
+            self.connections_opened = 0
+            self.requests_served = 0
+            self.errors_injected = 0
+
+    def start(self) -> "StubServer":
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    # ============================
+    # Request handling
+    # ============================
+
+    def dispatch(
+        self, method: str, path: str, query: Dict[str, str], auth: str, body: bytes
+    ) -> Response:
+        """Applies latency and error injection, then routes the request."""
+        config = self.config
+        with self._counter_lock:
+            self.requests_served += 1
+            delay = config.latency + self._random.uniform(0, config.latency_jitter)
+            fail = self._random.random() < config.error_rate
+            if fail:
+                self.errors_injected += 1
+        if delay:
+            time.sleep(delay)
+        if fail:
+            return config.error_status, {"error": "Injected failure"}
+
+        if not path.startswith(API_PREFIX):
+            return 404, {"error": "Not found"}
+        endpoint = path[len(API_PREFIX) :].strip("/")
+        try:
+            payload = json.loads(body) if body else {}
+        except ValueError:
+            return 400, {"error": "Malformed JSON body"}
+
+        if endpoint == "auth/sessions/users" and method == "POST":
+            return self.login(payload)
+        if endpoint == "users" and method == "POST":
+            return self.create_user(payload)
+        if endpoint == "auth/sessions/renew" and method == "POST":
+            return self.renew(auth)
+
+        user_id = self.authenticate(auth, "access")
+        if user_id is None:
+            return 401, {"error": "Unauthorized"}
+        if endpoint == "auth/sessions/users" and method == "DELETE":
+            self._revoke(auth)
+            return 204, None
+        if method != "GET":
+            return 405, {"error": "Method not allowed"}
+        return self.route_get(endpoint, query, user_id)
+
+    def route_get(self, endpoint: str, query: Dict[str, str], user_id: int) -> Response:
+        dataset = self.dataset
+        if endpoint == "users/current":
+            return 200, {"user": dataset.users[user_id]}
+
+        match = re.fullmatch(r"users/(\d+)/accounts", endpoint)
+        if match:
+            if int(match.group(1)) != user_id:
+                return 403, {"error": "Forbidden"}
+            return 200, {"accounts": dataset.accounts_for(user_id)}
+
+        match = re.fullmatch(r"accounts/(\d+)", endpoint)
+        if match:
+            index = dataset.account_index(match.group(1))
+            if index is None or dataset.account_owner(index) != user_id:
+                return 404, {"error": "Account not found"}
+            return 200, {"account": dataset.account(index)}
+
+        if endpoint == "transactions":
+            try:
+                limit = min(int(query.get("limit", 30)), self.config.max_page_size)
+                offset = int(query.get("offset", 0))
+                cursor = int(query["cursor"]) if "cursor" in query else None
+                since_id = int(query["since_id"]) if "since_id" in query else None
+            except ValueError:
+                return 400, {"error": "Invalid paging parameters"}
+            return 200, dataset.transactions_page(
+                user_id,
+                limit=max(0, limit),
+                offset=max(0, offset),
+                cursor=cursor,
+                since_id=since_id,
+                transaction_type=query.get("transaction_type"),
+                account_number=query.get("account_number"),
+            )
+        return 404, {"error": "Not found"}
+
+    # ============================
+    # Sessions
+    # ============================
+
+    def authenticate(self, auth: str, kind: str) -> Optional[int]:
+        """
+        Returns the user a bearer token belongs to, or None if refused.
+
+        Without ``require_auth``, any request is served as the first user
+        unless it carries a token naming another one. Revoked tokens are
+        always refused.
+        """
+        token = auth[len("Bearer ") :] if auth.startswith("Bearer ") else ""
+        if token in self._revoked:
+            return None
+        claims = token_claims(token) if token else None
+        if claims is not None:
+            user_id = int(claims.get("sub", 0) or 0)
+            if (
+                user_id in self.dataset.users
+                and claims.get("type") == kind
+                and claims.get("exp", 0) > time.time()
+            ):
+                return user_id
+        return None if self.config.require_auth else 1
+
+    def issue_session(self, user_id: int) -> dict:
+        now = int(time.time())
+        with self._counter_lock:
+            self._token_ids += 2
+            token_id = self._token_ids
+        access_expires = now + self.config.access_token_ttl
+        refresh_expires = now + self.config.refresh_token_ttl
+        return {
+            "access_token": issue_token(user_id, "access", access_expires, token_id),
+            "access_token_expires_in": access_expires,
+            "refresh_token": issue_token(
+                user_id, "refresh", refresh_expires, token_id + 1
+            ),
+            "refresh_token_expires_in": refresh_expires,
+        }
+
+    def _revoke(self, auth: str) -> None:
+        with self._counter_lock:
+            self._revoked.add(auth[len("Bearer ") :])
+
+    def login(self, payload: dict) -> Response:
+        username = payload.get("username")
+        if not username or not payload.get("password"):
+            return 400, {"error": "Username and password are required"}
+        user = self.dataset.user_by_name(username)
+        if user is None:
+            return 401, {"error": "Invalid username or password"}
+        return 201, self.issue_session(user["id"])
+
+    def renew(self, auth: str) -> Response:
+        user_id = self.authenticate(auth, "refresh")
+        if user_id is None:
+            return 401, {"error": "Invalid refresh token"}
+        # Refresh tokens rotate: the one just used can't be used again.
+        self._revoke(auth)
+        return 200, self.issue_session(user_id)
+
+    def create_user(self, payload: dict) -> Response:
+        username, email = payload.get("username"), payload.get("email")
+        if not username or not email or not payload.get("password"):
+            return 400, {"error": "Email, username and password are required"}
+        if self.dataset.user_by_name(username) is not None:
+            return 409, {"error": "Username already taken"}
+        return 201, {"user": self.dataset.add_user(username, email)}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=5000)
+    for field in fields(StubConfig):
+        option = f"--{field.name.replace('_', '-')}"
+        if field.type is bool:
+            parser.add_argument(option, action="store_true")
+        else:
+            parser.add_argument(option, type=field.type, default=field.default)
+    args = parser.parse_args()
+
+    config = StubConfig(
+        **{field.name: getattr(args, field.name) for field in fields(StubConfig)}
+    )
+    server = StubServer(config, args.host, args.port)
+    print(
+        f"Serving {config.transactions} transactions across {config.accounts} "
+        f"accounts and {config.users} users on {server.base_url}"
+    )
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
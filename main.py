@@ -1,14 +1,24 @@
 import logging.config
 import os
+import sqlite3
 import sys
 from datetime import datetime
 
 from PySide6.QtCore import QObject, Slot
 from PySide6.QtWidgets import QApplication, QMessageBox
 
-from services.api_client_service import APIClient
-from services.session_manager import SessionManager
+from src.controllers.async_bridge import get_async_bridge, shutdown_async_bridge
+from src.controllers.workers import get_worker_pool
 from src.models.login_model import LoginModel
+from src.services.api_client_service import APIClient
+from src.services.circuit_breaker import add_circuit_listener
+from src.services.disk_cache import DiskResponseCache
+from src.services.http_session import close_http_session
+from src.services.metrics import MetricsFileExporter, get_metrics
+from src.services.response_cache import configure_response_cache
+from src.services.session_manager import SessionManager
+from src.services.token_refresh_scheduler import TokenRefreshScheduler
+from src.ui.theme import DEFAULT_THEME, THEMES, get_theme_manager
 from src.views.login_view import LoginView
 from src.views.main_window_view import main_window_view
 
@@ -37,13 +47,40 @@ def setup_logging():
 class ApplicationManager(QObject):
     """Manages the life cycle of the application"""
 
-    def __init__(self):
+    def __init__(
+        self,
+        persistent_cache: bool = True,
+        metrics_file: str | None = None,
+    ):
         super().__init__()
         self.logger = logging.getLogger("app")
         self.app = QApplication(sys.argv)
 
+        # One application wide style sheet styles every window and card.
+        theme = os.environ.get("BANKOPS_THEME", DEFAULT_THEME)
+        if theme not in THEMES:
+            self.logger.warning(f"Unknown theme {theme!r}, using {DEFAULT_THEME}")
+            theme = DEFAULT_THEME
+        get_theme_manager().apply(theme, self.app)
+
+        self.disk_cache = None
+        if persistent_cache:
+            try:
+                self.disk_cache = DiskResponseCache()
+            except (OSError, sqlite3.Error) as e:
+                self.logger.warning(f"On-disk API cache unavailable: {e}")
+        configure_response_cache(disk_store=self.disk_cache)
+
+        add_circuit_listener(get_metrics().record_circuit_state)
+        self.metrics_exporter = None
+        metrics_file = metrics_file or os.environ.get("BANKOPS_METRICS_FILE")
+        if metrics_file:
+            # Periodic Prometheus text dump of the API request metrics.
+            self.metrics_exporter = MetricsFileExporter(get_metrics(), metrics_file)
+
         self.session_manager = SessionManager()
         self.api_client = APIClient()
+        self.token_refresh_scheduler = TokenRefreshScheduler(self.session_manager)
 
         self.login_view = LoginView(model=None)
         self.login_model = LoginModel(login_view=self.login_view)
@@ -56,6 +93,8 @@ class ApplicationManager(QObject):
     def __connect_signals(self):
         """Connects signals to slots"""
         self.login_model.login_successful.connect(self.on_login_successful)
+        self.login_model.session_restore_failed.connect(self.on_restore_failed)
+        self.app.aboutToQuit.connect(self.shutdown)
 
     def start(self):
         """Initialize and start the application"""
@@ -68,16 +107,61 @@ class ApplicationManager(QObject):
         self.logger.info("Application started successfully")
 
         self.login_view.show()
+        self.show_cached_dashboard()
 
-        try:
-            if self.session_manager.ensure_session_valid():
-                user_data = self.api_client.retrieve_user_info()
-                self.on_login_successful(user_data=user_data)
-        except Exception:
-            self.logger.error("Failed to re-login user.")
+        # Re-login from stored tokens without blocking the GUI thread.
+        self.login_model.restore_session(self.api_client, self.session_manager)
+
+        self.token_refresh_scheduler.start()
+        if self.metrics_exporter is not None:
+            self.metrics_exporter.start()
 
         return self.app.exec()
 
+    def show_cached_dashboard(self) -> bool:
+        """
+        Shows the dashboard painted from the last cached responses while
+        the stored session is revalidated in the background.
+        :return: True if cached data was shown.
+        """
+        if not self.session_manager.refresh_token:
+            return False
+        if not self.main_window.show_cached_dashboard(APIClient(cache_only=True)):
+            return False
+        self.logger.info("Showing cached dashboard until the session is restored")
+        self.login_view.hide()
+        self.main_window.show()
+        return True
+
+    @Slot()
+    def shutdown(self) -> None:
+        """Release network resources before the application exits"""
+        self.logger.info("Shutting down application")
+        self.token_refresh_scheduler.stop(timeout=1)
+        if self.metrics_exporter is not None:
+            self.metrics_exporter.stop(timeout=1)
+        get_worker_pool().cancel_all()
+        # The aiohttp session belongs to the bridge loop, so it is closed there.
+        close_task = get_async_bridge().submit(
+            self.main_window.async_api_client.close()
+        )
+        try:
+            close_task.future.result(timeout=1)
+        except Exception as e:
+            self.logger.warning(f"Failed to close the async API client: {e}")
+        shutdown_async_bridge(timeout=1)
+        close_http_session()
+        if self.disk_cache is not None:
+            self.disk_cache.close()
+
+    @Slot(str)
+    def on_restore_failed(self, message: str) -> None:
+        """Falls back to the login window if the session can't be restored"""
+        self.logger.error(f"Failed to re-login user: {message}")
+        if self.main_window.isVisible():
+            self.main_window.hide()
+            self.login_view.show()
+
     @Slot(dict)
     def on_login_successful(self, user_data: dict) -> None:
         """Handle successful login"""
@@ -86,6 +170,9 @@ class ApplicationManager(QObject):
             f"{user_data.get('user_profile').get('username', 'Unknown')}"
         )
 
+        # New tokens were stored, so renew ahead of their expiry.
+        self.token_refresh_scheduler.reschedule()
+
         self.login_view.hide()
         self.main_window.cached_user_info = user_data
         self.main_window.show()
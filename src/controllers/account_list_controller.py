@@ -0,0 +1,161 @@
+import logging
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from PySide6.QtWidgets import QVBoxLayout, QWidget
+
+from src.ui.plugins.widgets.account_card_widget import AccountCardWidget
+
+logger = logging.getLogger(__name__)
+
+CardFactory = Callable[..., AccountCardWidget]
+
+
+@dataclass
+class AccountListDiff:
+    """What one AccountListController.set_accounts call changed."""
+
+    added: int = 0
+    updated: int = 0
+    removed: int = 0
+    moved: int = 0
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.added or self.updated or self.removed or self.moved)
+
+
+def card_fields(account: Dict[str, Any]) -> Dict[str, Any]:
+    """Maps an account from the user info payload to AccountCardWidget's arguments."""
+    return {
+        "name": account.get("account_name"),
+        "balance": account.get("balance"),
+        "account_type": account.get("account_type"),
+        "account_number": account.get("account_number"),
+        "recent_change": account.get("latest_balance_change"),
+    }
+
+
+class AccountListController:
+    """
+    Keeps one AccountCardWidget per account in a container, keyed by
+    account number.
+
+    set_accounts applies a new account list as a diff: cards of known
+    accounts are updated in place, only new accounts get a card and only
+    closed ones lose theirs. Cards that are no longer needed are hidden and
+    kept in a pool, so accounts that appear later reuse them instead of
+    building new widgets.
+    """
+
+    def __init__(
+        self,
+        container: QWidget,
+        card_factory: CardFactory = AccountCardWidget,
+        pool_size: int = 8,
+    ):
+        """
+        :param container: Widget the cards are laid out in, top to bottom.
+        :param card_factory: Builds a card from AccountCardWidget's keyword
+        arguments.
+        :param pool_size: Unused cards kept for reuse at most.
+        """
+        self.container = container
+        self.card_factory = card_factory
+        self.pool_size = pool_size
+        self.layout = container.layout() or QVBoxLayout(container)
+        self._cards: Dict[str, AccountCardWidget] = {}
+        self._order: List[str] = []
+        self._pool: List[AccountCardWidget] = []
+
+    def __len__(self) -> int:
+        return len(self._cards)
+
+    @property
+    def account_numbers(self) -> List[str]:
+        """The account numbers shown, top to bottom."""
+        return list(self._order)
+
+    @property
+    def pooled(self) -> int:
+        return len(self._pool)
+
+    def card(self, account_number) -> Optional[AccountCardWidget]:
+        return self._cards.get(str(account_number))
+
+    def set_accounts(self, accounts: Iterable[Dict[str, Any]]) -> AccountListDiff:
+        """
+        Shows ``accounts``, in order, changing only what differs from the
+        cards already shown.
+
+        :param accounts: Account dictionaries from the user info payload.
+        :return: What changed.
+        """
+        wanted: Dict[str, Dict[str, Any]] = {}
+        for account in accounts:
+            if account.get("account_number") is not None:
+                wanted.setdefault(str(account["account_number"]), account)
+
+        diff = AccountListDiff()
+        # Repaint once after the whole diff instead of once per card.
+        self.container.setUpdatesEnabled(False)
+        try:
+            for key in [key for key in self._order if key not in wanted]:
+                self._release(self._cards.pop(key))
+                diff.removed += 1
+            self._order = [key for key in self._order if key in wanted]
+
+            for key, account in wanted.items():
+                card = self._cards.get(key)
+                if card is not None:
+                    if card.update_account(**card_fields(account)):
+                        diff.updated += 1
+                else:
+                    self._cards[key] = self._acquire(account)
+                    diff.added += 1
+
+            diff.moved = self._arrange(list(wanted))
+        finally:
+            self.container.setUpdatesEnabled(True)
+        if diff.changed:
+            logger.debug(f"Account cards updated: {diff}")
+        return diff
+
+    def clear(self) -> None:
+        """Removes every card; the pool keeps up to pool_size of them."""
+        self.set_accounts([])
+
+    def _acquire(self, account: Dict[str, Any]) -> AccountCardWidget:
+        if self._pool:
+            card = self._pool.pop()
+            card.update_account(**card_fields(account))
+            return card
+        return self.card_factory(**card_fields(account))
+
+    def _release(self, card: AccountCardWidget) -> None:
+        self.layout.removeWidget(card)
+        card.hide()
+        if len(self._pool) < self.pool_size:
+            self._pool.append(card)
+        else:
+            card.deleteLater()
+
+    def _arrange(self, order: List[str]) -> int:
+        """
+        Puts the cards in ``order`` in the layout, moving only those not
+        already in place.
+        :return: The number of cards moved or newly placed.
+        """
+        moved = 0
+        for index, key in enumerate(order):
+            card = self._cards[key]
+            if self.layout.indexOf(card) == index:
+                continue
+            if self.layout.indexOf(card) != -1:
+                self.layout.removeWidget(card)
+            self.layout.insertWidget(index, card)
+            card.show()
+            if key in self._order:
+                moved += 1
+        self._order = order
+        return moved
@@ -0,0 +1,203 @@
+import asyncio
+import concurrent.futures
+import logging
+import threading
+from typing import Any, Callable, Coroutine, Optional, Set
+
+from PySide6.QtCore import QEvent, QObject, Qt, Signal, Slot
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncTask(QObject):
+    """
+    Handle for a coroutine running on the AsyncBridge loop.
+
+    Exactly one of finished, failed or cancelled is emitted, always on the
+    thread the task was created on (the GUI thread), so slots may touch
+    widgets directly.
+    """
+
+    finished = Signal(object)
+    failed = Signal(str)
+    cancelled = Signal()
+
+    # Internal: carries the completed future from the loop thread.
+    _completed = Signal(object)
+
+    def __init__(self, future: concurrent.futures.Future, parent=None):
+        super().__init__(parent)
+        self.future = future
+        self._completed.connect(self._deliver, Qt.QueuedConnection)
+        future.add_done_callback(self._completed.emit)
+
+    def cancel(self) -> bool:
+        """Cancels the coroutine; returns False if it already completed."""
+        return self.future.cancel()
+
+    def done(self) -> bool:
+        return self.future.done()
+
+    @Slot(object)
+    def _deliver(self, future: concurrent.futures.Future) -> None:
+        if future.cancelled():
+            self.cancelled.emit()
+            return
+        error = future.exception()
+        if error is not None:
+            self.failed.emit(str(error))
+        else:
+            self.finished.emit(future.result())
+
+
+class AsyncBridge(QObject):
+    """
+    Runs asyncio coroutines for the Qt application.
+
+    The coroutines execute on an asyncio event loop owned by the bridge and
+    driven from a background thread, and their outcome is delivered back
+    into the QApplication event loop through AsyncTask signals, so network
+    I/O never blocks the GUI thread.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.loop = asyncio.new_event_loop()
+        self._thread: Optional[threading.Thread] = None
+        self._tasks: Set[AsyncTask] = set()
+        self._lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Starts the event loop thread if it isn't running already."""
+        with self._lock:
+            if self.running:
+                return
+            self._thread = threading.Thread(
+                target=self._run_loop, name="AsyncBridge", daemon=True
+            )
+            self._thread.start()
+
+    def _run_loop(self) -> None:
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def submit(self, coroutine: Coroutine[Any, Any, Any]) -> AsyncTask:
+        """
+        Schedules a coroutine on the bridge loop.
+
+        :param coroutine: The coroutine to run.
+        :return: An AsyncTask whose signals report the outcome.
+        """
+        self.start()
+        future = asyncio.run_coroutine_threadsafe(coroutine, self.loop)
+        task = AsyncTask(future)
+        # Keep the handle alive until its result has been delivered.
+        self._tasks.add(task)
+        task.finished.connect(lambda _: self._tasks.discard(task))
+        task.failed.connect(lambda _: self._tasks.discard(task))
+        task.cancelled.connect(lambda: self._tasks.discard(task))
+        return task
+
+    def shutdown(self, timeout: Optional[float] = None) -> None:
+        """Cancels outstanding coroutines and stops the loop thread."""
+        for task in list(self._tasks):
+            task.cancel()
+        if self.running:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self._thread.join(timeout)
+        self._thread = None
+        if not self.loop.is_running() and not self.loop.is_closed():
+            self.loop.close()
+
+
+class ViewTaskScope(QObject):
+    """
+    Lets a view or controller await API calls and update the view with the
+    results. Tasks started through the scope are cancelled when the view is
+    hidden, so a closed window never receives stale results.
+    """
+
+    def __init__(self, view: QObject, bridge: Optional[AsyncBridge] = None):
+        super().__init__(view)
+        self.view = view
+        self.bridge = bridge
+        self._tasks: Set[AsyncTask] = set()
+        view.installEventFilter(self)
+
+    @property
+    def active_tasks(self) -> int:
+        return len(self._tasks)
+
+    def run(
+        self,
+        coroutine: Coroutine[Any, Any, Any],
+        on_result: Optional[Callable[[Any], None]] = None,
+        on_error: Optional[Callable[[str], None]] = None,
+    ) -> AsyncTask:
+        """
+        Runs a coroutine and hands its result to ``on_result`` on the GUI
+        thread, or its error message to ``on_error``.
+
+        :param coroutine: The coroutine to run, e.g. an API call.
+        :param on_result: Called with the coroutine's return value.
+        :param on_error: Called with the error message if it raises.
+        :return: The AsyncTask, which can also be cancelled directly.
+        """
+        bridge = self.bridge or get_async_bridge()
+        task = bridge.submit(coroutine)
+        self._tasks.add(task)
+        if on_result is not None:
+            task.finished.connect(on_result)
+        if on_error is not None:
+            task.failed.connect(on_error)
+        task.finished.connect(lambda _: self._tasks.discard(task))
+        task.failed.connect(lambda _: self._tasks.discard(task))
+        task.cancelled.connect(lambda: self._tasks.discard(task))
+        return task
+
+    def cancel_all(self) -> None:
+        """Cancels every task started through this scope."""
+        for task in list(self._tasks):
+            task.cancel()
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        if watched is self.view and event.type() == QEvent.Hide:
+            self.cancel_all()
+        return False
+
+
+def bind_task_to_controller(task: AsyncTask, controller) -> AsyncTask:
+    """
+    Forwards an AsyncTask's outcome to a BaseController's loading_finished
+    and error_occurred signals, as bind_to_controller does for workers.
+    loading_started is emitted at once, as the coroutine is already queued.
+    """
+    controller.loading_started.emit()
+    task.finished.connect(lambda _: controller.loading_finished.emit())
+    task.cancelled.connect(controller.loading_finished.emit)
+    task.failed.connect(controller.error_occurred.emit)
+    task.failed.connect(lambda _: controller.loading_finished.emit())
+    return task
+
+
+_bridge: Optional[AsyncBridge] = None
+
+
+def get_async_bridge() -> AsyncBridge:
+    """Returns the application wide AsyncBridge, creating it on first use."""
+    global _bridge
+    if _bridge is None:
+        _bridge = AsyncBridge()
+    return _bridge
+
+
+def shutdown_async_bridge(timeout: Optional[float] = None) -> None:
+    """Stops the application wide AsyncBridge if one was created."""
+    global _bridge
+    bridge, _bridge = _bridge, None
+    if bridge is not None:
+        bridge.shutdown(timeout)
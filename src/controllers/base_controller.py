@@ -1,5 +1,14 @@
+from typing import Any, Callable, Optional, Set
+
 from PySide6.QtCore import QObject, Signal
 
+from src.controllers.workers import (
+    JobPriority,
+    Worker,
+    bind_to_controller,
+    get_worker_pool,
+)
+
 
 class BaseController(QObject):
     error_occurred = Signal(str)
@@ -8,6 +17,62 @@ class BaseController(QObject):
 
     def __init__(self):
         super().__init__()
+        self._workers: Set[Worker] = set()
 
     def __connect_signals(self):
         pass
+
+    @property
+    def pending_jobs(self) -> int:
+        """Number of jobs started by run_in_background not reported yet."""
+        return len(self._workers)
+
+    def run_in_background(
+        self,
+        fn: Callable[..., Any],
+        *args: Any,
+        priority: JobPriority = JobPriority.NORMAL,
+        on_result: Optional[Callable[[Any], None]] = None,
+        on_error: Optional[Callable[[str], None]] = None,
+        on_done: Optional[Callable[[], None]] = None,
+        **kwargs: Any,
+    ) -> Worker:
+        """
+        Runs a blocking call on the shared worker pool. The job drives this
+        controller's loading_started/loading_finished/error_occurred signals.
+
+        :param fn: The blocking callable to run, e.g. an APIClient method.
+        :param priority: Jobs with a higher priority are started first.
+        :param on_result: Called on the GUI thread with fn's return value.
+        :param on_error: Called on the GUI thread with the error message.
+        :param on_done: Called on the GUI thread once the job has finished,
+        failed or been cancelled, after on_result or on_error.
+        :return: The Worker, which can be cancelled through the pool or
+        cancel_all.
+        """
+        worker = bind_to_controller(Worker(fn, *args, **kwargs), self)
+        self._workers.add(worker)
+        for signal in (
+            worker.signals.finished,
+            worker.signals.error,
+            worker.signals.cancelled,
+        ):
+            signal.connect(lambda *_: self._workers.discard(worker))
+        if on_result is not None:
+            worker.signals.finished.connect(on_result)
+        if on_error is not None:
+            worker.signals.error.connect(on_error)
+        if on_done is not None:
+            for signal in (
+                worker.signals.finished,
+                worker.signals.error,
+                worker.signals.cancelled,
+            ):
+                signal.connect(lambda *_: on_done())
+        return get_worker_pool().start(worker, priority)
+
+    def cancel_all(self) -> None:
+        """Cancels every job started through run_in_background that is pending."""
+        pool = get_worker_pool()
+        for worker in list(self._workers):
+            pool.cancel(worker)
@@ -0,0 +1,64 @@
+import logging
+
+from PySide6.QtCore import Signal
+from PySide6.QtWidgets import QMainWindow
+
+from src.controllers.base_controller import BaseController
+
+logger = logging.getLogger(__name__)
+
+LOADING_MESSAGE = "Loading…"
+# How long an error stays in the status bar, in milliseconds.
+ERROR_MESSAGE_TIMEOUT = 10000
+
+
+class DashboardController(BaseController):
+    """
+    Runs the dashboard window's blocking network calls on the shared worker
+    pool through run_in_background. While any of them runs the window's
+    status bar says so, with the text of the latest progress signal, and
+    errors are shown there. The window cancels the jobs still pending with
+    cancel_all when it is hidden.
+    """
+
+    # What a long job got through so far, e.g. "1,500 transactions". It may
+    # be emitted from the job's worker thread.
+    progress = Signal(str)
+
+    def __init__(self, view: QMainWindow):
+        super().__init__()
+        self.setParent(view)
+        self.view = view
+        self._loading = 0
+        self.loading_started.connect(self._on_loading_started)
+        self.loading_finished.connect(self._on_loading_finished)
+        self.error_occurred.connect(self._on_error)
+        self.progress.connect(self._on_progress)
+
+    @property
+    def busy(self) -> bool:
+        """True while any job started through this controller runs."""
+        return self._loading > 0
+
+    def _on_loading_started(self) -> None:
+        self._loading += 1
+        self.view.statusBar().showMessage(LOADING_MESSAGE)
+
+    def _on_loading_finished(self) -> None:
+        self._loading = max(0, self._loading - 1)
+        status_bar = self.view.statusBar()
+        # An error shown meanwhile stays until it times out.
+        if not self._loading and status_bar.currentMessage().startswith(
+            LOADING_MESSAGE
+        ):
+            status_bar.clearMessage()
+
+    def _on_progress(self, message: str) -> None:
+        if self._loading:
+            self.view.statusBar().showMessage(f"{LOADING_MESSAGE} {message}")
+
+    def _on_error(self, message: str) -> None:
+        logger.error(f"Dashboard request failed: {message}")
+        self.view.statusBar().showMessage(
+            f"Couldn't update the dashboard: {message}", ERROR_MESSAGE_TIMEOUT
+        )
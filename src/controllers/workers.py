@@ -0,0 +1,157 @@
+import logging
+import threading
+from enum import IntEnum
+from typing import Any, Callable, Optional, Set
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+logger = logging.getLogger(__name__)
+
+
+class JobPriority(IntEnum):
+    """QThreadPool priorities; higher values are started first."""
+
+    LOW = -10
+    NORMAL = 0
+    HIGH = 10
+
+
+class WorkerSignals(QObject):
+    """
+    Signals of a Worker. They are emitted from a pool thread and delivered
+    on the thread the worker was created on (the GUI thread).
+    """
+
+    started = Signal()
+    finished = Signal(object)
+    error = Signal(str)
+    cancelled = Signal()
+
+
+class Worker(QRunnable):
+    """A blocking call run once on a QThreadPool."""
+
+    def __init__(self, fn: Callable[..., Any], *args: Any, **kwargs: Any):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = WorkerSignals()
+        self._cancelled = threading.Event()
+        self._done = threading.Event()
+        # The pool keeps a reference for as long as the job is pending.
+        self.setAutoDelete(False)
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def done(self) -> bool:
+        """True once the job has run, failed or been cancelled."""
+        return self._done.is_set()
+
+    def cancel(self) -> None:
+        """
+        Marks the job as cancelled. A job that has not started yet never
+        runs; a running job finishes, but its result is discarded.
+        """
+        self._cancelled.set()
+
+    def run(self) -> None:
+        try:
+            self._run()
+        finally:
+            self._done.set()
+
+    def _run(self) -> None:
+        if self.is_cancelled:
+            self.signals.cancelled.emit()
+            return
+
+        self.signals.started.emit()
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            if self.is_cancelled:
+                self.signals.cancelled.emit()
+            else:
+                logger.error(f"Background job {self.fn!r} failed: {e}")
+                self.signals.error.emit(str(e))
+            return
+
+        if self.is_cancelled:
+            self.signals.cancelled.emit()
+        else:
+            self.signals.finished.emit(result)
+
+
+class WorkerPool(QObject):
+    """Runs blocking calls (e.g. network I/O) on a QThreadPool."""
+
+    def __init__(self, thread_pool: Optional[QThreadPool] = None, parent=None):
+        super().__init__(parent)
+        self.thread_pool = thread_pool or QThreadPool.globalInstance()
+        self._workers: Set[Worker] = set()
+
+    @property
+    def pending_jobs(self) -> int:
+        """Number of submitted jobs that have not completed yet."""
+        return len(self._workers)
+
+    def start(
+        self, worker: Worker, priority: JobPriority = JobPriority.NORMAL
+    ) -> Worker:
+        """
+        Queues a worker on the thread pool. Connect to worker.signals before
+        calling this; signals emitted before a connection exists are lost.
+
+        :param worker: The job to run.
+        :param priority: Jobs with a higher priority are started first.
+        :return: The worker.
+        """
+        self._workers.add(worker)
+        for signal in (
+            worker.signals.finished,
+            worker.signals.error,
+            worker.signals.cancelled,
+        ):
+            signal.connect(lambda *_: self._workers.discard(worker))
+        self.thread_pool.start(worker, int(priority))
+        return worker
+
+    def cancel(self, worker: Worker) -> None:
+        """Cancels a job, removing it from the queue if it hasn't started."""
+        worker.cancel()
+        if self.thread_pool.tryTake(worker):
+            # Taken off the queue, so run() will never report it.
+            worker._done.set()
+            worker.signals.cancelled.emit()
+
+    def cancel_all(self) -> None:
+        """Cancels every job submitted through this pool."""
+        for worker in list(self._workers):
+            self.cancel(worker)
+
+
+def bind_to_controller(worker: Worker, controller) -> Worker:
+    """
+    Forwards a worker's lifecycle to a BaseController's loading_started,
+    loading_finished and error_occurred signals.
+    """
+    worker.signals.started.connect(controller.loading_started.emit)
+    worker.signals.finished.connect(lambda _: controller.loading_finished.emit())
+    worker.signals.cancelled.connect(controller.loading_finished.emit)
+    worker.signals.error.connect(controller.error_occurred.emit)
+    worker.signals.error.connect(lambda _: controller.loading_finished.emit())
+    return worker
+
+
+_worker_pool: Optional[WorkerPool] = None
+
+
+def get_worker_pool() -> WorkerPool:
+    """Returns the application wide WorkerPool, creating it on first use."""
+    global _worker_pool
+    if _worker_pool is None:
+        _worker_pool = WorkerPool()
+    return _worker_pool
@@ -8,3 +8,195 @@ retrieval, updates, and deletion of accounts.
 # accidentally forgot that this stores MANAGEMENT LOGIC, not the models lol.
 
 # TODO: add management logic.
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Seconds before an account whose lookup failed is looked up again.
+UNRESOLVABLE_RETRY_DELAY = 60.0
+
+
+class AccountDirectory:
+    """
+    Per-session map from account number to account metadata.
+
+    It is filled in bulk from the ``user_accounts`` payload returned by
+    APIClient.retrieve_user_info, so resolving the account name of a
+    transaction usually costs no request at all. Accounts that are not
+    known yet are fetched once each, no matter how many rows reference them.
+
+    The directory is shared by the GUI thread and the workers that fetch
+    transaction pages, so its state is guarded by a lock; lookups run
+    outside it. Lookups that were started before clear() are discarded.
+    """
+
+    def __init__(
+        self,
+        api_client,
+        retry_delay: float = UNRESOLVABLE_RETRY_DELAY,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        :param api_client: APIClient used to look up unknown accounts.
+        :param retry_delay: Seconds before a failed lookup is tried again.
+        :param clock: Monotonic time source, replaceable in tests.
+        """
+        self.api_client = api_client
+        self.retry_delay = retry_delay
+        self.clock = clock
+        self._accounts: Dict[str, Dict[str, Any]] = {}
+        # Accounts whose lookup failed, with the time they may be retried.
+        self._unresolvable: Dict[str, float] = {}
+        # Bumped by clear(), so lookups started before it are dropped.
+        self._generation = 0
+        self._lock = threading.RLock()
+
+    def __contains__(self, account_number) -> bool:
+        with self._lock:
+            return str(account_number) in self._accounts
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._accounts)
+
+    def clear(self) -> None:
+        """Forgets every known account, e.g. when the user changes."""
+        with self._lock:
+            self._accounts.clear()
+            self._unresolvable.clear()
+            self._generation += 1
+
+    def reset(self, user_accounts: Optional[Dict[str, Any]]) -> None:
+        """
+        Replaces every known account with those of ``user_accounts`` at
+        once, e.g. when the user changes, so a concurrent resolve never
+        sees the directory empty in between.
+        """
+        with self._lock:
+            self.clear()
+            self.load_user_accounts(user_accounts)
+
+    def load_user_accounts(self, user_accounts: Optional[Dict[str, Any]]) -> None:
+        """
+        Fills the directory from a ``user_accounts`` payload.
+
+        :param user_accounts: The 'user_accounts' value of retrieve_user_info,
+        i.e. a dictionary with an 'accounts' list.
+        """
+        if not user_accounts:
+            return
+        for account in user_accounts.get("accounts") or []:
+            if isinstance(account, dict) and account.get("account_number"):
+                self.add_account(account)
+
+    def add_account(self, account: Dict[str, Any]) -> None:
+        """Adds or updates the metadata of a single account."""
+        account_number = str(account["account_number"])
+        with self._lock:
+            self._accounts.setdefault(account_number, {}).update(account)
+            self._unresolvable.pop(account_number, None)
+
+    def get(self, account_number) -> Optional[Dict[str, Any]]:
+        """Returns the known metadata for an account without any request."""
+        if account_number is None:
+            return None
+        with self._lock:
+            account = self._accounts.get(str(account_number))
+            return dict(account) if account is not None else None
+
+    def get_account_name(self, account_number) -> Optional[str]:
+        """Returns the known name of an account without any request."""
+        account = self.get(account_number)
+        return account.get("account_name") if account else None
+
+    def resolve_transactions(
+        self, transactions: Iterable[Dict[str, Any]], key: str = "account_from"
+    ) -> List[Optional[str]]:
+        """
+        Resolves the account name of each transaction.
+
+        A server expanded 'account_name' field on the transaction is used
+        as is and remembered for later rows. Otherwise the name comes from
+        the directory, and accounts missing from it are looked up once each.
+        The names returned don't depend on a concurrent clear().
+
+        :param transactions: Transaction dictionaries from the API.
+        :param key: Transaction field holding the account number.
+        :return: One account name (or None) per transaction, in order.
+        """
+        transactions = list(transactions)
+
+        names: Dict[str, Optional[str]] = {}
+        with self._lock:
+            for transaction in transactions:
+                account_number = transaction.get(key)
+                account_name = transaction.get("account_name")
+                if account_number is not None and account_name:
+                    self._accounts.setdefault(str(account_number), {}).update(
+                        {"account_number": account_number, "account_name": account_name}
+                    )
+            for transaction in transactions:
+                account_number = transaction.get(key)
+                if account_number is not None:
+                    names[str(account_number)] = self.get_account_name(account_number)
+
+        unknown = {
+            str(transaction.get(key))
+            for transaction in transactions
+            if transaction.get(key) is not None
+            and not transaction.get("account_name")
+            and names[str(transaction.get(key))] is None
+        }
+        for account_number, account in self.fetch_accounts(unknown).items():
+            names[account_number] = account.get("account_name")
+
+        return [
+            transaction.get("account_name")
+            or (
+                names[str(transaction.get(key))]
+                if transaction.get(key) is not None
+                else None
+            )
+            for transaction in transactions
+        ]
+
+    def fetch_accounts(self, account_numbers: Iterable[str]) -> Dict[str, Dict]:
+        """
+        Looks up accounts whose name isn't known yet, one request each.
+        Accounts whose lookup failed are skipped until retry_delay passed.
+
+        :param account_numbers: Account numbers to make sure are known.
+        :return: The details fetched, by account number.
+        """
+        with self._lock:
+            generation = self._generation
+            now = self.clock()
+            pending = [
+                account_number
+                for account_number in sorted(set(account_numbers))
+                if self.get_account_name(account_number) is None
+                and self._unresolvable.get(account_number, now) <= now
+            ]
+
+        fetched: Dict[str, Dict] = {}
+        for account_number in pending:
+            try:
+                account = self.api_client.get_account_details(account_number)
+            except Exception as e:
+                logger.error(f"Failed to resolve account {account_number}: {e}")
+                with self._lock:
+                    if generation == self._generation:
+                        self._unresolvable[account_number] = (
+                            self.clock() + self.retry_delay
+                        )
+                continue
+            fetched[account_number] = {**account, "account_number": account_number}
+            with self._lock:
+                # Details of the previous user's accounts are not kept.
+                if generation == self._generation:
+                    self.add_account(fetched[account_number])
+        return fetched
@@ -0,0 +1,426 @@
+"""
+Transactions Management Module.
+
+This module holds transactions in a compact, columnar form so views can
+show and filter hundreds of thousands of rows without a Python object (or
+a Qt item) per row.
+"""
+
+import logging
+import math
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Collection, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+NO_CODE = -1
+
+
+def _to_float(value: Any) -> float:
+    """Returns ``value`` as a float, or NaN if it is missing or not a number."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+def _to_id(value: Any) -> int:
+    """Returns a transaction id as an int, or NO_CODE if it has none."""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return NO_CODE
+
+
+def is_newer(transaction_id: Any, newest_id: Optional[int]) -> bool:
+    """
+    Returns True if ``transaction_id`` is newer than ``newest_id``, the
+    largest id held. Transactions without an id are only new while nothing
+    with an id is held.
+    """
+    return newest_id is None or _to_id(transaction_id) > newest_id
+
+
+# How a parsed timestamp is written back for display: the date/time
+# separator and the suffix. Each row records the one that reproduces the
+# text the server sent, or RAW_DATE if none does.
+DATE_FORMATS: Tuple[Tuple[str, str], ...] = (
+    ("T", ""),
+    ("T", "+00:00"),
+    ("T", "Z"),
+    (" ", ""),
+)
+RAW_DATE = -1
+_NAIVE_EPOCH = datetime(1970, 1, 1)
+
+
+def parse_timestamp(value: Any) -> float:
+    """
+    Returns an ISO 8601 timestamp as seconds since the epoch, or NaN.
+
+    Timestamps without an offset are taken as UTC.
+    """
+    return _parse_date(value)[0]
+
+
+def format_timestamp(timestamp: float, date_format: int = 0) -> str:
+    """Writes seconds since the epoch as UTC ISO 8601 text in a DATE_FORMATS format."""
+    separator, suffix = DATE_FORMATS[date_format]
+    parsed = datetime.fromtimestamp(timestamp, timezone.utc).replace(tzinfo=None)
+    return parsed.isoformat(separator) + suffix
+
+
+def _parse_date(value: Any) -> Tuple[float, int]:
+    """
+    Returns the timestamp of a date text, as parse_timestamp, and the
+    DATE_FORMATS index that writes it back unchanged, or RAW_DATE.
+    """
+    text = str(value)
+    try:
+        parsed = datetime.fromisoformat(text)
+    except ValueError:
+        return math.nan, RAW_DATE
+    offset = parsed.utcoffset()
+    if offset is None:
+        timestamp = (parsed - _NAIVE_EPOCH).total_seconds()
+    else:
+        timestamp = parsed.timestamp()
+        if offset:
+            return timestamp, RAW_DATE
+    for date_format, (separator, suffix) in enumerate(DATE_FORMATS):
+        if (offset is None) != (not suffix) or text[10:11] != separator:
+            continue
+        rendered = parsed.isoformat(separator)
+        if offset is not None:
+            # Drop the "+00:00" isoformat adds to aware times.
+            rendered = rendered[:-6] + suffix
+        if rendered == text:
+            return timestamp, date_format
+    return timestamp, RAW_DATE
+
+
+class CodeTable:
+    """
+    Dictionary encoding for a repetitive string column, e.g. statuses.
+
+    Every distinct value gets a small integer code once; rows store codes.
+    """
+
+    def __init__(self):
+        self.values: List[str] = []
+        self._codes: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def encode(self, value: Optional[str]) -> int:
+        if value is None:
+            return NO_CODE
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def code_of(self, value: str) -> int:
+        """Returns the code of ``value``, or NO_CODE if it never occurred."""
+        return self._codes.get(value, NO_CODE)
+
+    def decode(self, code: int) -> str:
+        return self.values[code] if code != NO_CODE else ""
+
+
+class TransactionColumns:
+    """
+    Transactions stored as parallel numpy columns.
+
+    Amounts, balances and timestamps are float64 (NaN when missing);
+    account names and statuses are dictionary encoded into int32 codes.
+    Transaction ids are int64, NO_CODE when missing.
+
+    Dates are shown as the server sent them but stored as their float64
+    timestamp plus an int8 DATE_FORMATS index that writes it back the
+    same way. Only texts no format reproduces, e.g. ones that can't be
+    parsed or carry a non-UTC offset, are kept as text, by row.
+    Columns grow geometrically, so appending a page costs amortized
+    constant time per row.
+    """
+
+    def __init__(self, capacity: int = 64):
+        self.account_names = CodeTable()
+        self.statuses = CodeTable()
+        # Date texts no DATE_FORMATS format reproduces, by row.
+        self.raw_dates: Dict[int, str] = {}
+        self._size = 0
+        self._allocate(max(1, capacity))
+
+    def _allocate(self, capacity: int) -> None:
+        old = getattr(self, "_amount", None)
+        columns = {
+            "_amount": np.full(capacity, np.nan),
+            "_balance": np.full(capacity, np.nan),
+            "_timestamp": np.full(capacity, np.nan),
+            "_account": np.full(capacity, NO_CODE, dtype=np.int32),
+            "_status": np.full(capacity, NO_CODE, dtype=np.int32),
+            "_date_format": np.full(capacity, RAW_DATE, dtype=np.int8),
+            "_id": np.full(capacity, NO_CODE, dtype=np.int64),
+        }
+        for name, column in columns.items():
+            if old is not None:
+                column[: self._size] = getattr(self, name)[: self._size]
+            setattr(self, name, column)
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def amount(self) -> np.ndarray:
+        return self._amount[: self._size]
+
+    @property
+    def balance(self) -> np.ndarray:
+        return self._balance[: self._size]
+
+    @property
+    def timestamp(self) -> np.ndarray:
+        return self._timestamp[: self._size]
+
+    @property
+    def account(self) -> np.ndarray:
+        return self._account[: self._size]
+
+    @property
+    def status(self) -> np.ndarray:
+        return self._status[: self._size]
+
+    @property
+    def date_format(self) -> np.ndarray:
+        """DATE_FORMATS index of each row's date text, RAW_DATE if it is raw."""
+        return self._date_format[: self._size]
+
+    def date_text(self, row: int) -> str:
+        """Returns the date of ``row`` as the server sent it."""
+        date_format = int(self._date_format[row])
+        if date_format == RAW_DATE:
+            return self.raw_dates.get(row, "")
+        return format_timestamp(self._timestamp[row], date_format)
+
+    def widest_date_texts(self) -> List[str]:
+        """Returns a date text per format in use and the longest raw one."""
+        texts = []
+        for date_format in np.unique(self.date_format):
+            if date_format != RAW_DATE:
+                row = int(np.argmax(self.date_format == date_format))
+                texts.append(self.date_text(row))
+        if self.raw_dates:
+            texts.append(max(self.raw_dates.values(), key=len))
+        return texts
+
+    def _set_dates(self, start: int, values: List[Any]) -> None:
+        """Stores the dates of the rows from ``start`` on."""
+        parsed = [_parse_date(value) for value in values]
+        rows = slice(start, start + len(values))
+        self._timestamp[rows] = [timestamp for timestamp, _ in parsed]
+        self._date_format[rows] = [date_format for _, date_format in parsed]
+        for row, value, (_, date_format) in zip(
+            range(start, rows.stop), values, parsed
+        ):
+            if date_format == RAW_DATE and value is not None:
+                self.raw_dates[row] = str(value)
+            else:
+                self.raw_dates.pop(row, None)
+
+    @property
+    def id(self) -> np.ndarray:
+        return self._id[: self._size]
+
+    @property
+    def newest_id(self) -> Optional[int]:
+        """The largest transaction id held, or None."""
+        ids = self.id[self.id != NO_CODE]
+        return int(ids.max()) if len(ids) else None
+
+    def find(self, transaction_id: Any) -> Optional[int]:
+        """Returns the row holding ``transaction_id``, or None."""
+        transaction_id = _to_id(transaction_id)
+        if transaction_id == NO_CODE:
+            return None
+        rows = np.flatnonzero(self.id == transaction_id)
+        return int(rows[0]) if len(rows) else None
+
+    def extend(self, transactions: Iterable) -> int:
+        """
+        Appends transactions.
+
+        :param transactions: Objects with the Transaction attributes
+        (amount, date, account_name, balance, status, transaction_id).
+        :return: The number of rows appended.
+        """
+        transactions = list(transactions)
+        count = len(transactions)
+        needed = self._size + count
+        if needed > len(self._amount):
+            self._allocate(max(needed, 2 * len(self._amount)))
+
+        rows = slice(self._size, needed)
+        self._amount[rows] = [_to_float(t.amount) for t in transactions]
+        self._balance[rows] = [_to_float(t.balance) for t in transactions]
+        self._set_dates(self._size, [t.date for t in transactions])
+        self._account[rows] = [
+            self.account_names.encode(t.account_name) for t in transactions
+        ]
+        self._status[rows] = [self.statuses.encode(t.status) for t in transactions]
+        self._id[rows] = [
+            _to_id(getattr(t, "transaction_id", None)) for t in transactions
+        ]
+        self._size = needed
+        return count
+
+    def update(self, row: int, transaction) -> None:
+        """Overwrites ``row`` with ``transaction``, e.g. after a status change."""
+        if not 0 <= row < self._size:
+            raise IndexError(f"Row {row} out of range for {self._size} rows.")
+        self._amount[row] = _to_float(transaction.amount)
+        self._balance[row] = _to_float(transaction.balance)
+        self._set_dates(row, [transaction.date])
+        self._account[row] = self.account_names.encode(transaction.account_name)
+        self._status[row] = self.statuses.encode(transaction.status)
+        self._id[row] = _to_id(getattr(transaction, "transaction_id", None))
+
+    def clear(self) -> None:
+        self.account_names = CodeTable()
+        self.statuses = CodeTable()
+        self.raw_dates = {}
+        self._size = 0
+        self._allocate(len(self._amount))
+
+
+@dataclass
+class TransactionFilter:
+    """
+    Criteria a transaction must meet to be shown; None means any.
+
+    Times are seconds since the epoch (see parse_timestamp) and ranges
+    include both ends.
+    """
+
+    statuses: Optional[Collection[str]] = None
+    accounts: Optional[Collection[str]] = None
+    start: Optional[float] = None
+    end: Optional[float] = None
+    min_amount: Optional[float] = None
+    max_amount: Optional[float] = None
+
+    @staticmethod
+    def _codes(table: CodeTable, values: Collection[str]) -> List[int]:
+        # Values that never occurred have no code and match no row; they
+        # must not fall back to NO_CODE, which marks missing values.
+        codes = [table.code_of(value) for value in values]
+        return [code for code in codes if code != NO_CODE]
+
+    def mask(self, columns: TransactionColumns) -> np.ndarray:
+        """Returns a boolean array selecting the matching rows of ``columns``."""
+        mask = np.ones(len(columns), dtype=bool)
+        if self.statuses is not None:
+            mask &= np.isin(
+                columns.status, self._codes(columns.statuses, self.statuses)
+            )
+        if self.accounts is not None:
+            mask &= np.isin(
+                columns.account, self._codes(columns.account_names, self.accounts)
+            )
+        # Comparisons with NaN are False, so rows missing the value drop out
+        # of any range that constrains it.
+        if self.start is not None:
+            mask &= columns.timestamp >= self.start
+        if self.end is not None:
+            mask &= columns.timestamp <= self.end
+        if self.min_amount is not None:
+            mask &= columns.amount >= self.min_amount
+        if self.max_amount is not None:
+            mask &= columns.amount <= self.max_amount
+        return mask
+
+
+SORT_KEYS = ("account", "amount", "balance", "timestamp", "status")
+
+
+class TransactionIndex:
+    """
+    Sort permutations over TransactionColumns, computed once per column and
+    direction and reused until the columns change.
+
+    Numbers and timestamps sort by value, account names and statuses
+    alphabetically; missing values always sort last.
+    """
+
+    def __init__(self, columns: TransactionColumns):
+        self.columns = columns
+        self._permutations: Dict[Tuple[str, bool], np.ndarray] = {}
+        self._size = len(columns)
+
+    def invalidate(self) -> None:
+        """Forgets every permutation, e.g. after rows were changed in place."""
+        self._permutations.clear()
+        self._size = len(self.columns)
+
+    def _sort_values(self, key: str, descending: bool) -> np.ndarray:
+        columns = self.columns
+        if key in ("account", "status"):
+            codes = columns.account if key == "account" else columns.status
+            table = columns.account_names if key == "account" else columns.statuses
+            # Rank each code by its string; the extra last slot ranks
+            # NO_CODE after every real value.
+            ranks = np.empty(len(table) + 1)
+            ranks[np.argsort(np.array(table.values, dtype=object))] = np.arange(
+                len(table)
+            )
+            ranks[-1] = np.nan
+            values = ranks[codes]
+        else:
+            values = getattr(columns, key)
+        # argsort puts NaN last; negating keeps it there when descending.
+        return -values if descending else values
+
+    def permutation(self, key: str, descending: bool = False) -> np.ndarray:
+        """
+        Returns the row order sorted by ``key`` (one of SORT_KEYS).
+        Ties keep their original order.
+        """
+        if key not in SORT_KEYS:
+            raise ValueError(f"Unknown sort key {key!r}, expected one of {SORT_KEYS}.")
+        if len(self.columns) != self._size:
+            self.invalidate()
+        permutation = self._permutations.get((key, descending))
+        if permutation is None:
+            permutation = self._permutations[(key, descending)] = np.argsort(
+                self._sort_values(key, descending), kind="stable"
+            )
+        return permutation
+
+    def rows(
+        self,
+        key: Optional[str] = None,
+        descending: bool = False,
+        row_filter: Optional[TransactionFilter] = None,
+        order: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """
+        Returns the rows to show, in order.
+
+        :param key: Sort key, or None for the original order.
+        :param descending: Sort from largest to smallest.
+        :param row_filter: Criteria rows must match.
+        :param order: The original order if it isn't the columns' own,
+        i.e. every row once.
+        """
+        if key is None:
+            rows = np.arange(len(self.columns)) if order is None else order
+        else:
+            rows = self.permutation(key, descending)
+        if row_filter is not None:
+            rows = rows[row_filter.mask(self.columns)[rows]]
+        return rows
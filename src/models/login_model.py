@@ -1,10 +1,12 @@
 from PySide6.QtCore import Signal
 
 from src.controllers.base_controller import BaseController
+from src.controllers.workers import JobPriority, Worker
 
 
 class LoginModel(BaseController):
     login_successful = Signal(dict)
+    session_restore_failed = Signal(str)
 
     def __init__(self, login_view):
         super().__init__()
@@ -12,22 +14,76 @@ class LoginModel(BaseController):
         self.__connect_signals()
 
     def __connect_signals(self):
-        pass
+        if self.login_view is not None:
+            self.loading_started.connect(lambda: self.login_view.set_busy(True))
+            self.loading_finished.connect(lambda: self.login_view.set_busy(False))
 
-    def process_login(self, username: str, password: str, api_client, session_manager):
+    def process_login(
+        self, username: str, password: str, api_client, session_manager
+    ) -> Worker:
+        """
+        Logs the user in on a worker thread so the login window stays
+        responsive. The outcome is reported through login_successful or
+        the login view's failure message.
+        :return: The Worker running the login.
+        """
+        return self.run_in_background(
+            self.login,
+            username,
+            password,
+            api_client,
+            session_manager,
+            priority=JobPriority.HIGH,
+            on_result=self.on_login_finished,
+            on_error=lambda message: self.login_view.show_failure(
+                f"An error occurred: {message}"
+            ),
+        )
+
+    def restore_session(self, api_client, session_manager) -> Worker:
+        """
+        Logs the user back in from the stored tokens on a worker thread,
+        e.g. at start up. The outcome is reported through login_successful
+        or session_restore_failed.
+        :return: The Worker restoring the session.
+        """
+        return self.run_in_background(
+            self.restore,
+            api_client,
+            session_manager,
+            priority=JobPriority.HIGH,
+            on_result=self.login_successful.emit,
+            on_error=self.session_restore_failed.emit,
+        )
+
+    @staticmethod
+    def restore(api_client, session_manager) -> dict:
+        """
+        Validates the stored session and fetches the user info (blocking).
+        :return: The user data.
+        """
+        session_manager.ensure_session_valid()
+        return api_client.retrieve_user_info()
+
+    @staticmethod
+    def login(username: str, password: str, api_client, session_manager) -> tuple:
+        """
+        Performs the blocking login requests.
+        :return: The login response and the user data, which is None when
+        the credentials were rejected.
+        """
         login_response: dict = session_manager.login(username, password)
-        try:
-            # this ensures we get an auth access_token back from the server.
-            if login_response.get("access_token") or login_response is True:
-                user_data = api_client.retrieve_user_info()
-                self.login_successful.emit(user_data)
-                return user_data
-            else:
-                # Handle invalid credentials
-                error_message = login_response.get("error", "Unknown error occurred.")
-                self.login_view.show_failure(error_message)
-                return None
-        except Exception as e:
-            # Handle any exceptions that occur during the login process
-            self.login_view.show_failure(f"An error occurred: {str(e)}")
-            return None
+        # this ensures we get an auth access_token back from the server.
+        if login_response.get("access_token") or login_response is True:
+            return login_response, api_client.retrieve_user_info()
+        return login_response, None
+
+    def on_login_finished(self, result: tuple) -> None:
+        """Reports the outcome of a login on the GUI thread."""
+        login_response, user_data = result
+        if user_data is not None:
+            self.login_successful.emit(user_data)
+        else:
+            # Handle invalid credentials
+            error_message = login_response.get("error", "Unknown error occurred.")
+            self.login_view.show_failure(error_message)
@@ -1,16 +1,43 @@
-from typing import Any, Dict, Optional
+import logging
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Deque, Dict, Iterator, Mapping, Optional
 
 import requests
 from requests import Response
 from requests.exceptions import RequestException
 
+from src.services.circuit_breaker import CircuitOpenError, get_circuit_breaker
+from src.services.http_session import close_http_session, get_http_session
+from src.services.metrics import MetricsRegistry, get_metrics
+from src.services.request_coalescer import RequestCoalescer, get_request_coalescer
+from src.services.response_cache import (
+    ANONYMOUS,
+    ResponseCache,
+    auth_identity,
+    get_response_cache,
+)
+from src.services.retry_policy import RetryPolicy, policy_for
 from src.services.session_manager import SessionManager
 
+logger = logging.getLogger(__name__)
+
 
 class APIClientError(Exception):
     pass
 
 
+def _body_size(response: Response) -> int:
+    """Returns the size of the request body that produced a response."""
+    body = getattr(getattr(response, "request", None), "body", None)
+    if isinstance(body, str):
+        return len(body.encode())
+    if isinstance(body, bytes):
+        return len(body)
+    return 0
+
+
 class APIClient:
     """
     Service class providing methods to interact with the backend API.
@@ -18,13 +45,39 @@ class APIClient:
     """
 
     def __init__(
-        self, base_url: str = "http://127.0.0.1:5000/api/v1/", timeout: int = 5
+        self,
+        base_url: str = "http://127.0.0.1:5000/api/v1/",
+        timeout: int = 5,
+        http_session: Optional[requests.Session] = None,
+        response_cache: Optional[ResponseCache] = None,
+        cache_responses: bool = True,
+        cache_only: bool = False,
+        coalesce_requests: bool = True,
+        retry_policies: Optional[Mapping[str, RetryPolicy]] = None,
+        use_circuit_breaker: bool = True,
+        metrics: Optional[MetricsRegistry] = None,
     ):
         """
         Initializes the API client.
 
         :param base_url: The base URL for the API endpoints.
         :param timeout: Default request timeout in seconds.
+        :param http_session: Optional session to send requests through.
+        If omitted, the pooled session shared with SessionManager is used.
+        :param response_cache: Optional cache for GET responses. If omitted,
+        the process wide cache is used.
+        :param cache_responses: If False, GET responses are never cached.
+        :param cache_only: If True, the client never touches the network and
+        answers GETs with the last cached response, however old, e.g. to
+        paint the dashboard at startup before anything was revalidated.
+        :param coalesce_requests: If True, identical GETs in flight at the
+        same time, from any client, share a single network call.
+        :param retry_policies: Retry policy by HTTP method. If omitted, only
+        idempotent methods are retried; pass {} to disable retries.
+        :param use_circuit_breaker: If True, requests to a host that keeps
+        failing are refused without a network call until it recovers.
+        :param metrics: Registry requests are recorded in. If omitted, the
+        process wide registry is used.
         """
         self.base_url = base_url.rstrip("/") + "/"
         self.base_headers = {
@@ -33,6 +86,52 @@ class APIClient:
         }
         self.session_manager = SessionManager()
         self.timeout = timeout
+        self._http_session = http_session
+        self._response_cache = response_cache
+        self.cache_responses = cache_responses
+        self.cache_only = cache_only
+        self.coalesce_requests = coalesce_requests
+        self.retry_policies = retry_policies
+        self.use_circuit_breaker = use_circuit_breaker
+        self._metrics = metrics
+        # Whether the backend advertises keyset pagination (a 'next_cursor'
+        # field in transaction pages); None until a page has been seen.
+        self.keyset_paging: Optional[bool] = None
+
+    @property
+    def http_session(self) -> requests.Session:
+        """The keep-alive session requests are sent through."""
+        if self._http_session is not None:
+            return self._http_session
+        return get_http_session()
+
+    @property
+    def response_cache(self) -> Optional[ResponseCache]:
+        """The cache GET responses are served from, if caching is enabled."""
+        if not self.cache_responses:
+            return None
+        if self._response_cache is not None:
+            return self._response_cache
+        return get_response_cache()
+
+    @property
+    def metrics(self) -> MetricsRegistry:
+        """Where latency, bytes, statuses and cache outcomes are recorded."""
+        return self._metrics or get_metrics()
+
+    @property
+    def request_coalescer(self) -> Optional[RequestCoalescer]:
+        """Shares identical in-flight GETs, if coalescing is enabled."""
+        if not self.coalesce_requests:
+            return None
+        return get_request_coalescer()
+
+    def close(self) -> None:
+        """Closes the underlying HTTP session and its pooled connections."""
+        if self._http_session is not None:
+            self._http_session.close()
+        else:
+            close_http_session()
 
     def _make_request(
         self,
@@ -49,7 +148,7 @@ class APIClient:
         :param endpoint: API endpoint path relative to base_url.
         :param authenticated: If True, add authentication headers.
         :param expected_status: If set, verify the response status code.
-        :param kwargs: Additional arguments for requests.request.
+        :param kwargs: Additional arguments for requests.Session.request.
         :return: The request Response object.
         :raises APIClientError: If authentication fails, the request fails,
                                  or the status code doesn't match expected_status.
@@ -57,6 +156,9 @@ class APIClient:
         url = f"{self.base_url}{endpoint.lstrip('/')}"
         headers = self.base_headers.copy()
 
+        if self.cache_only:
+            return self._cached_response(method, endpoint, authenticated, **kwargs)
+
         if authenticated:
             try:
                 auth_headers = self.session_manager.get_authenticated_headers()
@@ -66,29 +168,182 @@ class APIClient:
                     f"Authentication failed before request: {e}"
                 ) from e
 
-        try:
-            response = requests.request(
-                method=method, url=url, headers=headers, timeout=self.timeout, **kwargs
+        is_get = method.upper() == "GET"
+        cache = self.response_cache if is_get else None
+        cache_key = None
+        if is_get:
+            identity = auth_identity(headers) if authenticated else ANONYMOUS
+            cache_key = ResponseCache.make_key(endpoint, kwargs.get("params"), identity)
+        if cache is not None:
+            cache_entry, fresh = cache.lookup(cache_key)
+            if fresh:
+                with self.metrics.track(endpoint, method) as sample:
+                    sample.cache = "hit"
+                    sample.response = cache_entry.to_response()
+                return sample.response
+
+        def send() -> Response:
+            return self._send(
+                method, endpoint, url, headers, expected_status, cache_key, **kwargs
             )
-            response.raise_for_status()
 
-            if expected_status is not None and response.status_code != expected_status:
+        coalescer = self.request_coalescer if is_get else None
+        if coalescer is not None:
+            # cache_key holds the caller's identity, endpoint and params.
+            return coalescer.do((method.upper(), self.base_url, *cache_key), send)
+        return send()
+
+    def _send(
+        self,
+        method: str,
+        endpoint: str,
+        url: str,
+        headers: Dict[str, str],
+        expected_status: Optional[int],
+        cache_key: Optional[tuple],
+        **kwargs: Any,
+    ) -> Response:
+        """
+        Sends a request prepared by _make_request over the network,
+        revalidating and updating the response cache for GETs.
+        """
+        is_get = method.upper() == "GET"
+        cache = self.response_cache if is_get else None
+        cache_entry = cache.get(cache_key) if cache is not None else None
+        if cache_entry is not None:
+            headers = {**headers, **cache_entry.validators}
+
+        with self.metrics.track(endpoint, method) as sample:
+            if cache is not None:
+                sample.cache = "miss"
+            try:
+                response = self._send_with_retries(
+                    method, endpoint, url, headers, **kwargs
+                )
+                sample.response = response
+                sample.bytes_out = _body_size(response)
+
+                revalidated = response.status_code == 304 and cache_entry is not None
+                if revalidated:
+                    sample.cache = "revalidated"
+                    cache_entry = cache.revalidated(cache_key, response) or cache_entry
+                    response = cache_entry.to_response()
+
+                response.raise_for_status()
+
+                if (
+                    expected_status is not None
+                    and response.status_code != expected_status
+                ):
+                    raise APIClientError(
+                        f"Request to {endpoint} returned status "
+                        f"{response.status_code}, but expected {expected_status}."
+                    )
+
+                if cache is not None and not revalidated:
+                    cache.store(cache_key, endpoint, response)
+                elif not is_get and self.response_cache is not None:
+                    self.response_cache.invalidate_for_write(endpoint)
+
+                return response
+            except (RequestException, CircuitOpenError) as e:
+                raise APIClientError(
+                    f"API request failed for {method} {endpoint}: {e}"
+                ) from e
+            except APIClientError:
+                raise
+            except Exception as e:
                 raise APIClientError(
-                    f"Request to {endpoint} returned status {response.status_code}, "
-                    f"but expected {expected_status}."
+                    f"An unexpected error occurred during the request "
+                    f"to {endpoint}: {e}"
+                ) from e
+
+    def _send_with_retries(
+        self,
+        method: str,
+        endpoint: str,
+        url: str,
+        headers: Dict[str, str],
+        **kwargs: Any,
+    ) -> Response:
+        """
+        Sends a request, retrying it as the method's retry policy allows and
+        reporting every outcome to the host's circuit breaker.
+
+        :return: The final response, which may still be an error response.
+        :raises RequestException: If the last attempt failed to get a response.
+        :raises CircuitOpenError: If the host's circuit is open.
+        """
+        policy = policy_for(method, self.retry_policies)
+        breaker = get_circuit_breaker(url) if self.use_circuit_breaker else None
+        attempt = 0
+        while True:
+            if breaker is not None:
+                breaker.before_request()
+            try:
+                response = self.http_session.request(
+                    method=method,
+                    url=url,
+                    headers=headers,
+                    timeout=self.timeout,
+                    **kwargs,
+                )
+            except RequestException as e:
+                if breaker is not None:
+                    breaker.record_failure()
+                delay = policy.retry_delay(attempt, error=e) if policy else None
+                if delay is None:
+                    raise
+                logger.warning(
+                    f"{method} {url} failed ({e}), retrying in {delay:.2f}s."
+                )
+            except BaseException:
+                # Not a verdict on the host, but the probe slot must be freed.
+                if breaker is not None:
+                    breaker.release()
+                raise
+            else:
+                if breaker is not None:
+                    if response.status_code >= 500:
+                        breaker.record_failure()
+                    else:
+                        breaker.record_success()
+                delay = (
+                    policy.retry_delay(attempt, response=response) if policy else None
                 )
+                if delay is None:
+                    return response
+                logger.warning(
+                    f"{method} {url} returned {response.status_code}, "
+                    f"retrying in {delay:.2f}s."
+                )
+            self.metrics.record_retry(endpoint, method)
+            time.sleep(delay)
+            attempt += 1
 
-            return response
-        except RequestException as e:
-            raise APIClientError(
-                f"API request failed for {method} {endpoint}: {e}"
-            ) from e
-        except APIClientError:
-            raise
-        except Exception as e:
+    def _cached_response(
+        self, method: str, endpoint: str, authenticated: bool, **kwargs: Any
+    ) -> Response:
+        """
+        Answers a request from the response cache alone, for cache_only
+        clients. The stored token identifies the user; it is not renewed.
+
+        :raises APIClientError: If nothing is cached for the request.
+        """
+        cache = self.response_cache
+        if method.upper() != "GET" or cache is None:
             raise APIClientError(
-                f"An unexpected error occurred during the request to {endpoint}: {e}"
-            ) from e
+                f"Cannot send {method} {endpoint} from a cache only client."
+            )
+        identity = (
+            auth_identity(self.session_manager._get_current_auth_header())
+            if authenticated
+            else ANONYMOUS
+        )
+        entry = cache.get(cache.make_key(endpoint, kwargs.get("params"), identity))
+        if entry is None:
+            raise APIClientError(f"No cached response for GET {endpoint}.")
+        return entry.to_response()
 
     def retrieve_user_info(self) -> Dict[str, Any]:
         """
@@ -160,25 +415,35 @@ class APIClient:
         offset: int = 0,
         transaction_type: Optional[str] = None,
         account_number: Optional[str] = None,
+        cursor: Optional[str] = None,
+        since_id: Optional[Any] = None,
     ) -> Dict[str, Any]:
         """
         Retrieves transactions for the authenticated user, with optional filters.
 
         :param limit: Max number of transactions.
-        :param offset: Offset for pagination.
+        :param offset: Offset for pagination. Ignored when a cursor is given.
         :param transaction_type: Filter by type (e.g., 'DEPOSIT').
         :param account_number: Filter by account number.
+        :param cursor: Opaque cursor from a previous page's 'next_cursor',
+        for backends that support keyset pagination.
+        :param since_id: Only return transactions newer than this id. Only
+        backends with keyset pagination (see keyset_paging) are known to
+        honour it.
         :return: API response JSON with transaction data.
         :raises APIClientError: If retrieving transactions fails.
         """
-        params: Dict[str, Any] = {
-            "limit": limit,
-            "offset": offset,
-        }
+        params: Dict[str, Any] = {"limit": limit}
+        if cursor is not None:
+            params["cursor"] = cursor
+        else:
+            params["offset"] = offset
         if transaction_type:
             params["transaction_type"] = transaction_type
         if account_number:
             params["account_number"] = account_number
+        if since_id is not None:
+            params["since_id"] = since_id
 
         try:
             response = self._make_request(
@@ -188,9 +453,141 @@ class APIClient:
                 params=params,
                 expected_status=200,
             )
-            return response.json()
+            data = response.json()
         except (APIClientError, ValueError) as e:
             raise APIClientError(f"Failed to retrieve user transactions: {e}") from e
+        if isinstance(data, dict):
+            self.keyset_paging = "next_cursor" in data
+        return data
+
+    def iter_transactions(
+        self,
+        page_size: int = 30,
+        read_ahead: int = 1,
+        transaction_type: Optional[str] = None,
+        account_number: Optional[str] = None,
+        since_id: Optional[Any] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily yields the user's transactions across pages.
+
+        If the backend advertises keyset pagination (a 'next_cursor' field
+        in the response), pages are followed by cursor, which costs the same
+        for every page and is not disturbed by transactions arriving
+        mid-scroll. Otherwise pages are requested by offset, and records
+        repeated from the previous page because new rows shifted the
+        offsets are dropped by transaction id.
+
+        While the current page is consumed, upcoming pages are fetched on
+        background threads, so only a few pages are held in memory. In
+        cursor mode only the next page can be prefetched, as its cursor
+        arrives with the current one. Stopping the iteration early (break or
+        close()) cancels the prefetches that haven't started yet and
+        fetches nothing more.
+
+        :param page_size: Number of transactions requested per page.
+        :param read_ahead: Number of pages to prefetch; 0 disables prefetching.
+        :param transaction_type: Filter by type (e.g., 'DEPOSIT').
+        :param account_number: Filter by account number.
+        :param since_id: Only yield transactions newer than this id.
+        :return: An iterator over transaction dictionaries.
+        :raises APIClientError: If retrieving a page fails.
+        """
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1.")
+        if read_ahead < 0:
+            raise ValueError("read_ahead must not be negative.")
+
+        previous_ids: set = set()
+        page_ids: set = set()
+        for page in self._iter_transaction_pages(
+            page_size, read_ahead, transaction_type, account_number, since_id
+        ):
+            previous_ids, page_ids = page_ids, set()
+            for transaction in page:
+                transaction_id = (
+                    transaction.get("id") if isinstance(transaction, dict) else None
+                )
+                if transaction_id is not None:
+                    if transaction_id in previous_ids or transaction_id in page_ids:
+                        continue
+                    page_ids.add(transaction_id)
+                yield transaction
+
+    def _iter_transaction_pages(
+        self,
+        page_size: int,
+        read_ahead: int,
+        transaction_type: Optional[str],
+        account_number: Optional[str],
+        since_id: Optional[Any],
+    ) -> Iterator[list]:
+        """Yields the raw transaction pages for iter_transactions."""
+
+        def fetch_page(offset: int = 0, cursor: Optional[str] = None) -> dict:
+            return self.retrieve_user_transactions(
+                limit=page_size,
+                offset=offset,
+                transaction_type=transaction_type,
+                account_number=account_number,
+                cursor=cursor,
+                since_id=since_id,
+            )
+
+        executor = (
+            ThreadPoolExecutor(
+                max_workers=read_ahead, thread_name_prefix="TransactionReadAhead"
+            )
+            if read_ahead
+            else None
+        )
+        pending: Deque[Future] = deque()
+        try:
+            data = fetch_page()
+
+            if "next_cursor" in data:
+                while True:
+                    cursor = data.get("next_cursor")
+                    upcoming = (
+                        executor.submit(fetch_page, cursor=cursor)
+                        if cursor and executor is not None
+                        else None
+                    )
+                    if upcoming is not None:
+                        pending.append(upcoming)
+                    yield data.get("transactions") or []
+                    if not cursor:
+                        return
+                    data = (
+                        pending.popleft().result()
+                        if upcoming is not None
+                        else fetch_page(cursor=cursor)
+                    )
+
+            transactions = data.get("transactions") or []
+            next_page = 1
+            while True:
+                if executor is not None:
+                    while len(transactions) == page_size and len(pending) < read_ahead:
+                        pending.append(
+                            executor.submit(fetch_page, next_page * page_size)
+                        )
+                        next_page += 1
+                yield transactions
+                if len(transactions) < page_size:
+                    # Last page; anything prefetched past it is empty.
+                    return
+                if pending:
+                    data = pending.popleft().result()
+                else:
+                    data = fetch_page(next_page * page_size)
+                    next_page += 1
+                transactions = data.get("transactions") or []
+        finally:
+            for future in pending:
+                future.cancel()
+            if executor is not None:
+                executor.shutdown(wait=False)
 
     def get_account_details(
         self, account_number: str, *filter_keys: str
@@ -0,0 +1,574 @@
+import asyncio
+import json
+import logging
+from typing import Any, Dict, Iterable, Mapping, Optional
+
+import aiohttp
+from requests import Response
+from requests.exceptions import ConnectionError, RequestException, Timeout
+from requests.structures import CaseInsensitiveDict
+
+from src.services.api_client_service import APIClientError
+from src.services.circuit_breaker import CircuitOpenError, get_circuit_breaker
+from src.services.metrics import MetricsRegistry, get_metrics
+from src.services.response_cache import (
+    ANONYMOUS,
+    ResponseCache,
+    auth_identity,
+    get_response_cache,
+)
+from src.services.retry_policy import RetryPolicy, policy_for
+from src.services.session_manager import SessionManager
+
+logger = logging.getLogger(__name__)
+
+
+def _to_response(response: aiohttp.ClientResponse, body: bytes) -> Response:
+    """
+    Copies an aiohttp response into a requests.Response, the type the
+    ResponseCache and RetryPolicy shared with APIClient work with.
+    """
+    converted = Response()
+    converted.status_code = response.status
+    converted.reason = response.reason
+    converted._content = body
+    converted.headers = CaseInsensitiveDict(response.headers)
+    converted.encoding = response.charset
+    converted.url = str(response.url)
+    return converted
+
+
+def _as_request_exception(error: Exception) -> RequestException:
+    """Maps an aiohttp failure to the requests exception RetryPolicy judges."""
+    if isinstance(error, asyncio.TimeoutError):
+        return Timeout(str(error))
+    if isinstance(error, aiohttp.ClientConnectionError):
+        return ConnectionError(str(error))
+    return RequestException(str(error))
+
+
+class AsyncAPIClient:
+    """
+    Asyncio counterpart of APIClient with the same surface.
+
+    Requests share one aiohttp session and at most ``max_concurrency`` of them
+    are in flight at once, so independent calls (user info, transactions,
+    account details) can be issued together instead of one after another.
+    Authentication goes through the same SessionManager as APIClient, and
+    so do caching, retries and circuit breaking: GET responses are served
+    from and stored in the same ResponseCache (and its disk store), so a
+    page loaded here is revalidated by APIClient later and painted by a
+    cache_only APIClient after a restart.
+    """
+
+    def __init__(
+        self,
+        base_url: str = "http://127.0.0.1:5000/api/v1/",
+        timeout: int = 5,
+        max_concurrency: int = 6,
+        response_cache: Optional[ResponseCache] = None,
+        cache_responses: bool = True,
+        retry_policies: Optional[Mapping[str, RetryPolicy]] = None,
+        use_circuit_breaker: bool = True,
+        metrics: Optional[MetricsRegistry] = None,
+    ):
+        """
+        Initializes the async API client.
+
+        :param base_url: The base URL for the API endpoints.
+        :param timeout: Default request timeout in seconds.
+        :param max_concurrency: Maximum number of requests in flight at once.
+        :param response_cache: Optional cache for GET responses. If omitted,
+        the process wide cache APIClient uses is shared.
+        :param cache_responses: If False, GET responses are never cached.
+        :param retry_policies: Retry policy by HTTP method. If omitted, only
+        idempotent methods are retried; pass {} to disable retries.
+        :param use_circuit_breaker: If True, requests to a host that keeps
+        failing are refused without a network call until it recovers. The
+        breakers are shared with APIClient.
+        :param metrics: Registry requests are recorded in, including DNS,
+        connect and time to first byte. Defaults to the process wide one.
+        """
+        self.base_url = base_url.rstrip("/") + "/"
+        self.base_headers = {
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+        }
+        self.session_manager = SessionManager()
+        self.timeout = timeout
+        self.max_concurrency = max_concurrency
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._http_session: Optional[aiohttp.ClientSession] = None
+        self._response_cache = response_cache
+        self.cache_responses = cache_responses
+        self.retry_policies = retry_policies
+        self.use_circuit_breaker = use_circuit_breaker
+        self.metrics = metrics or get_metrics()
+        # Whether the backend advertises keyset pagination (a 'next_cursor'
+        # field in transaction pages); None until a page has been seen.
+        self.keyset_paging: Optional[bool] = None
+
+    @property
+    def response_cache(self) -> Optional[ResponseCache]:
+        """The cache GET responses are served from, if caching is enabled."""
+        if not self.cache_responses:
+            return None
+        if self._response_cache is not None:
+            return self._response_cache
+        return get_response_cache()
+
+    async def __aenter__(self) -> "AsyncAPIClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    def _get_http_session(self) -> aiohttp.ClientSession:
+        if self._http_session is None or self._http_session.closed:
+            self._http_session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.max_concurrency),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                trace_configs=[_phase_trace_config()],
+            )
+        return self._http_session
+
+    async def close(self) -> None:
+        """Closes the underlying aiohttp session and its connections."""
+        if self._http_session is not None and not self._http_session.closed:
+            await self._http_session.close()
+        self._http_session = None
+
+    async def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        authenticated: bool = False,
+        expected_status: Optional[int] = None,
+        **kwargs: Any,
+    ) -> Any:
+        """
+        Internal helper method to execute HTTP requests to the API.
+
+        :param method: HTTP method ('GET', 'POST', etc.).
+        :param endpoint: API endpoint path relative to base_url.
+        :param authenticated: If True, add authentication headers.
+        :param expected_status: If set, verify the response status code.
+        :param kwargs: Additional arguments for aiohttp.ClientSession.request.
+        :return: The decoded JSON body of the response.
+        :raises APIClientError: If authentication fails, the request fails,
+                                 or the status code doesn't match expected_status.
+        """
+        url = f"{self.base_url}{endpoint.lstrip('/')}"
+        headers = self.base_headers.copy()
+
+        if authenticated:
+            try:
+                # May refresh the session, which blocks, so keep it off the loop.
+                auth_headers = await asyncio.to_thread(
+                    self.session_manager.get_authenticated_headers
+                )
+                headers.update(auth_headers)
+            except Exception as e:
+                raise APIClientError(
+                    f"Authentication failed before request: {e}"
+                ) from e
+
+        is_get = method.upper() == "GET"
+        cache = self.response_cache if is_get else None
+        cache_key = None
+        cache_entry = None
+        if cache is not None:
+            identity = auth_identity(headers) if authenticated else ANONYMOUS
+            cache_key = ResponseCache.make_key(endpoint, kwargs.get("params"), identity)
+            # The cache may read its disk store, so keep it off the loop.
+            cache_entry, fresh = await asyncio.to_thread(cache.lookup, cache_key)
+            if fresh:
+                with self.metrics.track(endpoint, method) as sample:
+                    sample.cache = "hit"
+                    sample.response = cache_entry.to_response()
+                return _decode(sample.response)
+            if cache_entry is not None:
+                headers.update(cache_entry.validators)
+
+        try:
+            with self.metrics.track(endpoint, method) as sample:
+                if cache is not None:
+                    sample.cache = "miss"
+                response = await self._send_with_retries(
+                    sample, method, url, headers, **kwargs
+                )
+
+                revalidated = response.status_code == 304 and cache_entry is not None
+                if revalidated:
+                    sample.cache = "revalidated"
+                    cache_entry = (
+                        await asyncio.to_thread(cache.revalidated, cache_key, response)
+                        or cache_entry
+                    )
+                    response = cache_entry.to_response()
+
+                response.raise_for_status()
+
+                if (
+                    expected_status is not None
+                    and response.status_code != expected_status
+                ):
+                    raise APIClientError(
+                        f"Request to {endpoint} returned status "
+                        f"{response.status_code}, but expected {expected_status}."
+                    )
+
+                if cache is not None and not revalidated:
+                    await asyncio.to_thread(cache.store, cache_key, endpoint, response)
+                elif not is_get and self.response_cache is not None:
+                    await asyncio.to_thread(
+                        self.response_cache.invalidate_for_write, endpoint
+                    )
+
+                return _decode(response)
+        except (
+            aiohttp.ClientError,
+            asyncio.TimeoutError,
+            RequestException,
+            CircuitOpenError,
+        ) as e:
+            raise APIClientError(
+                f"API request failed for {method} {endpoint}: {e}"
+            ) from e
+        except APIClientError:
+            raise
+        except Exception as e:
+            raise APIClientError(
+                f"An unexpected error occurred during the request to {endpoint}: {e}"
+            ) from e
+
+    async def _send_with_retries(
+        self,
+        sample,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        **kwargs: Any,
+    ) -> Response:
+        """
+        Sends a request, retrying it as the method's retry policy allows and
+        reporting every outcome to the host's circuit breaker, like
+        APIClient._send_with_retries.
+
+        :return: The final response, which may still be an error response.
+        :raises aiohttp.ClientError: If the last attempt got no response.
+        :raises asyncio.TimeoutError: If the last attempt timed out.
+        :raises CircuitOpenError: If the host's circuit is open.
+        """
+        policy = policy_for(method, self.retry_policies)
+        breaker = get_circuit_breaker(url) if self.use_circuit_breaker else None
+        attempt = 0
+        while True:
+            if breaker is not None:
+                breaker.before_request()
+            try:
+                response = await self._send(sample, method, url, headers, **kwargs)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if breaker is not None:
+                    breaker.record_failure()
+                delay = (
+                    policy.retry_delay(attempt, error=_as_request_exception(e))
+                    if policy
+                    else None
+                )
+                if delay is None:
+                    raise
+                logger.warning(
+                    f"{method} {url} failed ({e}), retrying in {delay:.2f}s."
+                )
+            except BaseException:
+                # Not a verdict on the host, but the probe slot must be freed.
+                if breaker is not None:
+                    breaker.release()
+                raise
+            else:
+                if breaker is not None:
+                    if response.status_code >= 500:
+                        breaker.record_failure()
+                    else:
+                        breaker.record_success()
+                delay = (
+                    policy.retry_delay(attempt, response=response) if policy else None
+                )
+                if delay is None:
+                    return response
+                logger.warning(
+                    f"{method} {url} returned {response.status_code}, "
+                    f"retrying in {delay:.2f}s."
+                )
+            self.metrics.record_retry(sample.endpoint, method)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _send(
+        self,
+        sample,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        **kwargs: Any,
+    ) -> Response:
+        """Sends one request, filling the metrics sample as it goes."""
+        # A response from an earlier attempt is not this one's outcome.
+        sample.response = None
+        json_body = kwargs.get("json")
+        if json_body is not None:
+            sample.bytes_out = len(json.dumps(json_body).encode())
+        async with self._semaphore:
+            async with self._get_http_session().request(
+                method=method,
+                url=url,
+                headers=headers,
+                trace_request_ctx=sample.phases,
+                **kwargs,
+            ) as response:
+                body = await response.read()
+        sample.response = _to_response(response, body)
+        return sample.response
+
+    async def retrieve_user_info(self) -> Dict[str, Any]:
+        """
+        Retrieves the current user's profile and associated account information.
+
+        :return: A dictionary with 'user_profile' and 'user_accounts'.
+        :raises APIClientError: If fetching fails or data is malformed.
+        """
+        try:
+            user_profile_data = await self._make_request(
+                method="GET",
+                endpoint="users/current",
+                authenticated=True,
+                expected_status=200,
+            )
+
+            user_info = user_profile_data.get("user")
+            if not isinstance(user_info, dict) or "id" not in user_info:
+                raise APIClientError(
+                    "User profile data is missing or malformed in response."
+                )
+
+            user_accounts_data = await self._make_request(
+                method="GET",
+                endpoint=f"users/{user_info['id']}/accounts",
+                authenticated=True,
+                expected_status=200,
+            )
+
+            return {
+                "user_profile": user_info,
+                "user_accounts": user_accounts_data,
+            }
+        except (APIClientError, ValueError, KeyError, AttributeError) as e:
+            raise APIClientError(
+                f"Failed to retrieve complete user information: {e}"
+            ) from e
+
+    async def create_user(
+        self, email: str, username: str, password: str
+    ) -> Dict[str, Any]:
+        """
+        Sends a request to create a new user account.
+
+        :param email: User's email address.
+        :param username: Desired username.
+        :param password: User's password.
+        :return: The API response JSON upon successful creation.
+        :raises APIClientError: If user creation fails.
+        """
+        payload = {"email": email, "username": username, "password": password}
+        try:
+            return await self._make_request(
+                method="POST",
+                endpoint="users",
+                authenticated=False,
+                json=payload,
+                expected_status=201,
+            )
+        except APIClientError as e:
+            raise APIClientError(f"Failed to create user: {e}") from e
+
+    async def retrieve_user_transactions(
+        self,
+        limit: int = 30,
+        offset: int = 0,
+        transaction_type: Optional[str] = None,
+        account_number: Optional[str] = None,
+        cursor: Optional[str] = None,
+        since_id: Optional[Any] = None,
+    ) -> Dict[str, Any]:
+        """
+        Retrieves transactions for the authenticated user, with optional filters.
+
+        :param limit: Max number of transactions.
+        :param offset: Offset for pagination. Ignored when a cursor is given.
+        :param transaction_type: Filter by type (e.g., 'DEPOSIT').
+        :param account_number: Filter by account number.
+        :param cursor: Opaque cursor from a previous page's 'next_cursor'.
+        :param since_id: Only return transactions newer than this id. Only
+        backends with keyset pagination (see keyset_paging) are known to
+        honour it.
+        :return: API response JSON with transaction data.
+        :raises APIClientError: If retrieving transactions fails.
+        """
+        params: Dict[str, Any] = {"limit": limit}
+        if cursor is not None:
+            params["cursor"] = cursor
+        else:
+            params["offset"] = offset
+        if transaction_type:
+            params["transaction_type"] = transaction_type
+        if account_number:
+            params["account_number"] = account_number
+        if since_id is not None:
+            params["since_id"] = since_id
+
+        try:
+            data = await self._make_request(
+                method="GET",
+                endpoint="transactions",
+                authenticated=True,
+                params=params,
+                expected_status=200,
+            )
+        except APIClientError as e:
+            raise APIClientError(f"Failed to retrieve user transactions: {e}") from e
+        if isinstance(data, dict):
+            self.keyset_paging = "next_cursor" in data
+        return data
+
+    async def get_account_details(
+        self, account_number: str, *filter_keys: str
+    ) -> Dict[str, Any]:
+        """
+        Fetches details for a specific account, optionally filtering returned fields.
+
+        :param account_number: Account number to query.
+        :param filter_keys: Optional field names to include in the result.
+        If empty, return all fields.
+        :return: Dictionary containing account details (potentially filtered).
+        :raises APIClientError: If fetching fails or data is malformed.
+        """
+        try:
+            data = await self._make_request(
+                method="GET",
+                endpoint=f"accounts/{account_number}",
+                authenticated=True,
+                expected_status=200,
+            )
+            account_data = data.get("account")
+
+            if not isinstance(account_data, dict):
+                raise APIClientError(
+                    "Account data is missing or not a dictionary in the response."
+                )
+
+            if filter_keys:
+                return {
+                    key: account_data[key] for key in filter_keys if key in account_data
+                }
+            return account_data
+
+        except (APIClientError, ValueError, KeyError, AttributeError) as e:
+            raise APIClientError(
+                f"Failed to retrieve or filter "
+                f"account details for {account_number}: {e}"
+            ) from e
+
+    async def get_many_account_details(
+        self, account_numbers: Iterable[str], *filter_keys: str
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetches details for several accounts concurrently.
+
+        :param account_numbers: Account numbers to query; duplicates are
+        fetched once.
+        :param filter_keys: Optional field names to include in each result.
+        :return: Dictionary mapping account number to its details.
+        :raises APIClientError: If any of the lookups fails.
+        """
+        unique_numbers = list(dict.fromkeys(str(number) for number in account_numbers))
+        details = await asyncio.gather(
+            *(
+                self.get_account_details(account_number, *filter_keys)
+                for account_number in unique_numbers
+            )
+        )
+        return dict(zip(unique_numbers, details))
+
+    async def load_dashboard(self, transaction_limit: int = 30) -> Dict[str, Any]:
+        """
+        Fetches everything the dashboard shows with as much overlap as possible.
+
+        User info and the first transaction page are requested together,
+        then any account referenced by a transaction that is neither one of
+        the user's accounts nor carries a server expanded name is looked up,
+        all at once.
+
+        :param transaction_limit: Number of transactions to fetch.
+        :return: A dictionary with 'user_profile', 'user_accounts',
+        'transactions' and 'account_details' (account number -> details).
+        :raises APIClientError: If any of the requests fails.
+        """
+        user_info, transactions = await asyncio.gather(
+            self.retrieve_user_info(),
+            self.retrieve_user_transactions(limit=transaction_limit),
+        )
+
+        known_accounts = {
+            str(account.get("account_number"))
+            for account in (user_info["user_accounts"] or {}).get("accounts") or []
+            if isinstance(account, dict)
+        }
+        unknown_accounts = [
+            str(transaction["account_from"])
+            for transaction in transactions.get("transactions") or []
+            if transaction.get("account_from") is not None
+            and not transaction.get("account_name")
+            and str(transaction["account_from"]) not in known_accounts
+        ]
+
+        return {
+            **user_info,
+            "transactions": transactions,
+            "account_details": await self.get_many_account_details(unknown_accounts),
+        }
+
+
+def _decode(response: Response) -> Any:
+    """Returns the decoded JSON body of a response, or None if it is empty."""
+    return json.loads(response.content) if response.content else None
+
+
+def _phase_trace_config() -> aiohttp.TraceConfig:
+    """
+    Records DNS, connect and time to first byte into the metrics phases
+    dict passed as a request's trace_request_ctx.
+    """
+    loop_time = asyncio.get_running_loop().time
+
+    def timer(start_key: str, phase: Optional[str] = None):
+        async def callback(session, context, params) -> None:
+            phases = context.trace_request_ctx
+            if not isinstance(phases, dict):
+                return
+            if phase is None:
+                setattr(context, start_key, loop_time())
+            elif hasattr(context, start_key):
+                phases[phase] = loop_time() - getattr(context, start_key)
+
+        return callback
+
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_request_start.append(timer("request_started"))
+    trace_config.on_dns_resolvehost_start.append(timer("dns_started"))
+    trace_config.on_dns_resolvehost_end.append(timer("dns_started", "dns"))
+    trace_config.on_connection_create_start.append(timer("connect_started"))
+    trace_config.on_connection_create_end.append(timer("connect_started", "connect"))
+    # Fires once the response headers have been received.
+    trace_config.on_request_end.append(timer("request_started", "ttfb"))
+    return trace_config
@@ -0,0 +1,228 @@
+import logging
+import threading
+import time
+from enum import Enum
+from typing import Callable, Dict, List
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of sending a request while a host's circuit is open."""
+
+    def __init__(self, host: str, retry_in: float):
+        super().__init__(host, retry_in)
+        self.host = host
+        self.retry_in = retry_in
+
+    def __str__(self) -> str:
+        return (
+            f"{self.host} is unavailable, "
+            f"not retrying for another {self.retry_in:.0f}s."
+        )
+
+
+StateListener = Callable[[str, CircuitState, CircuitState], None]
+
+
+class CircuitBreaker:
+    """
+    Fails requests to a host fast while it is down.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    requests are refused without touching the network. Once
+    ``reset_timeout`` has passed, the circuit goes half-open and lets
+    ``half_open_max_calls`` probe requests through: a successful probe
+    closes it again, a failed one reopens it.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30,
+        half_open_max_calls: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        :param host: The host this breaker guards, used in errors and events.
+        :param failure_threshold: Consecutive failures that open the circuit.
+        :param reset_timeout: Seconds the circuit stays open before probing.
+        :param half_open_max_calls: Concurrent probes allowed when half-open.
+        :param clock: Monotonic time source, replaceable in tests.
+        """
+        self.host = host
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.clock = clock
+        self.state = CircuitState.CLOSED
+        self.failures = 0
+        self.rejected = 0
+        self.state_changes = 0
+        self._opened_at = 0.0
+        self._probes = 0
+        self._listeners: List[StateListener] = []
+        self._lock = threading.Lock()
+
+    def add_listener(self, listener: StateListener) -> None:
+        """
+        Registers ``listener(host, old_state, new_state)`` to be called on
+        every state change, from the thread that caused it.
+        """
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: StateListener) -> None:
+        self._listeners.remove(listener)
+
+    def before_request(self) -> None:
+        """
+        Lets a request through or refuses it.
+
+        :raises CircuitOpenError: While the circuit is open, or half-open
+        with its probes already in flight.
+        """
+        with self._lock:
+            if self.state is CircuitState.OPEN:
+                retry_in = self._opened_at + self.reset_timeout - self.clock()
+                if retry_in > 0:
+                    self.rejected += 1
+                    raise CircuitOpenError(self.host, retry_in)
+                change = self._transition(CircuitState.HALF_OPEN)
+            else:
+                change = None
+
+            if self.state is CircuitState.HALF_OPEN:
+                if self._probes >= self.half_open_max_calls:
+                    self.rejected += 1
+                    raise CircuitOpenError(self.host, 0)
+                self._probes += 1
+        self._notify(change)
+
+    def release(self) -> None:
+        """
+        Gives back the half-open probe slot taken by before_request for a
+        request that ended without an outcome, e.g. because it raised
+        something other than a network error. Without it the slot would
+        stay taken and the circuit would refuse every later request.
+        """
+        with self._lock:
+            if self.state is CircuitState.HALF_OPEN and self._probes > 0:
+                self._probes -= 1
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            change = (
+                self._transition(CircuitState.CLOSED)
+                if self.state is not CircuitState.CLOSED
+                else None
+            )
+        self._notify(change)
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            change = None
+            if self.state is CircuitState.HALF_OPEN or (
+                self.state is CircuitState.CLOSED
+                and self.failures >= self.failure_threshold
+            ):
+                change = self._transition(CircuitState.OPEN)
+        self._notify(change)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "state": self.state.value,
+                "failures": self.failures,
+                "rejected": self.rejected,
+                "state_changes": self.state_changes,
+            }
+
+    def _transition(self, state: CircuitState):
+        # Caller holds the lock.
+        old, self.state = self.state, state
+        self.state_changes += 1
+        self._probes = 0
+        if state is CircuitState.OPEN:
+            self._opened_at = self.clock()
+        return old, state
+
+    def _notify(self, change) -> None:
+        if change is None:
+            return
+        old, new = change
+        logger.warning(
+            f"Circuit for {self.host} changed from {old.value} to {new.value}."
+        )
+        for listener in list(self._listeners):
+            try:
+                listener(self.host, old, new)
+            except Exception as e:
+                logger.error(f"Circuit breaker listener failed: {e}")
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+_breaker_options: dict = {}
+_global_listeners: List[StateListener] = []
+
+
+def host_of(url: str) -> str:
+    """Returns the scheme and network location a breaker is kept for."""
+    parts = urlsplit(url.strip())
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+def configure_circuit_breakers(**kwargs) -> None:
+    """
+    Sets the CircuitBreaker arguments used for hosts seen from now on.
+
+    :param kwargs: Arguments for CircuitBreaker, except host.
+    """
+    with _breakers_lock:
+        _breaker_options.clear()
+        _breaker_options.update(kwargs)
+
+
+def add_circuit_listener(listener: StateListener) -> None:
+    """Registers a state change listener on every current and future breaker."""
+    with _breakers_lock:
+        _global_listeners.append(listener)
+        breakers = list(_breakers.values())
+    for breaker in breakers:
+        breaker.add_listener(listener)
+
+
+def get_circuit_breaker(url: str) -> CircuitBreaker:
+    """Returns the process wide breaker for the host of ``url``."""
+    host = host_of(url)
+    with _breakers_lock:
+        breaker = _breakers.get(host)
+        if breaker is None:
+            breaker = _breakers[host] = CircuitBreaker(host, **_breaker_options)
+            for listener in _global_listeners:
+                breaker.add_listener(listener)
+        return breaker
+
+
+def circuit_breakers() -> Dict[str, CircuitBreaker]:
+    """Returns every breaker created so far, by host."""
+    with _breakers_lock:
+        return dict(_breakers)
+
+
+def reset_circuit_breakers() -> None:
+    """Forgets every breaker, listener and option."""
+    with _breakers_lock:
+        _breakers.clear()
+        _breaker_options.clear()
+        _global_listeners.clear()
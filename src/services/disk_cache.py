@@ -0,0 +1,217 @@
+import fnmatch
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+from src.services.response_cache import CacheEntry
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DISK_MAX_BYTES = 32 * 1024 * 1024
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    identity TEXT NOT NULL,
+    endpoint TEXT NOT NULL,
+    query TEXT NOT NULL,
+    url TEXT NOT NULL,
+    status_code INTEGER NOT NULL,
+    headers TEXT NOT NULL,
+    content BLOB NOT NULL,
+    encoding TEXT,
+    etag TEXT,
+    last_modified TEXT,
+    expires_at REAL NOT NULL,
+    stored_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    size INTEGER NOT NULL,
+    PRIMARY KEY (identity, endpoint, query)
+)
+"""
+
+
+def default_cache_path() -> str:
+    """Returns the default location of the on-disk API cache."""
+    return os.path.join(os.path.expanduser("~"), ".bankops", "api_cache.sqlite3")
+
+
+class DiskResponseCache:
+    """
+    SQLite store for cached API GET responses, so the last known data is
+    available right after a restart.
+
+    Rows are keyed like ResponseCache entries (user identity, endpoint and
+    query). Each write runs in its own transaction, so a crash never leaves
+    a half written row, and the least recently used rows are dropped once
+    the stored bodies exceed ``max_bytes``.
+    """
+
+    def __init__(
+        self, path: Optional[str] = None, max_bytes: int = DEFAULT_DISK_MAX_BYTES
+    ):
+        """
+        :param path: Database file; ':memory:' keeps it in memory.
+        Defaults to default_cache_path().
+        :param max_bytes: Upper bound for the total size of stored bodies.
+        """
+        self.path = path or default_cache_path()
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            # Cached responses hold account data; keep them private.
+            os.close(os.open(self.path, os.O_CREAT | os.O_RDWR, 0o600))
+        self._connection = sqlite3.connect(
+            self.path, check_same_thread=False, isolation_level=None
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(SCHEMA)
+
+    @property
+    def size(self) -> int:
+        """Total size in bytes of the stored bodies."""
+        with self._lock:
+            (size,) = self._connection.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+        return size
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._connection.execute(
+                "SELECT COUNT(*) FROM responses"
+            ).fetchone()
+        return count
+
+    def load(self, key: tuple) -> Optional[CacheEntry]:
+        """Returns the stored entry for a key, or None."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT endpoint, url, status_code, headers, content, encoding, "
+                "etag, last_modified, expires_at, stored_at FROM responses "
+                "WHERE identity = ? AND endpoint = ? AND query = ?",
+                key,
+            ).fetchone()
+            if row is None:
+                return None
+            self._connection.execute(
+                "UPDATE responses SET accessed_at = ? "
+                "WHERE identity = ? AND endpoint = ? AND query = ?",
+                (time.time(), *key),
+            )
+        (
+            endpoint,
+            url,
+            status_code,
+            headers,
+            content,
+            encoding,
+            etag,
+            last_modified,
+            expires_at,
+            stored_at,
+        ) = row
+        return CacheEntry(
+            endpoint=endpoint,
+            url=url,
+            status_code=status_code,
+            headers=json.loads(headers),
+            content=bytes(content),
+            encoding=encoding,
+            etag=etag,
+            last_modified=last_modified,
+            expires_at=expires_at,
+            stored_at=stored_at,
+        )
+
+    def save(self, key: tuple, entry: CacheEntry) -> None:
+        """Stores an entry, evicting the least recently used rows if needed."""
+        if entry.size > self.max_bytes:
+            return
+        with self._lock, self._transaction():
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES "
+                "(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    *key,
+                    entry.url,
+                    entry.status_code,
+                    json.dumps(entry.headers),
+                    entry.content,
+                    entry.encoding,
+                    entry.etag,
+                    entry.last_modified,
+                    entry.expires_at,
+                    entry.stored_at,
+                    time.time(),
+                    entry.size,
+                ),
+            )
+            self._evict()
+
+    def delete(self, key: tuple) -> None:
+        with self._lock, self._transaction():
+            self._connection.execute(
+                "DELETE FROM responses "
+                "WHERE identity = ? AND endpoint = ? AND query = ?",
+                key,
+            )
+
+    def invalidate(self, *patterns: str) -> None:
+        """Deletes every row whose endpoint matches one of the patterns."""
+        with self._lock, self._transaction():
+            endpoints = [
+                endpoint
+                for (endpoint,) in self._connection.execute(
+                    "SELECT DISTINCT endpoint FROM responses"
+                )
+                if any(fnmatch.fnmatchcase(endpoint, p) for p in patterns)
+            ]
+            self._connection.executemany(
+                "DELETE FROM responses WHERE endpoint = ?",
+                [(endpoint,) for endpoint in endpoints],
+            )
+
+    def purge(self) -> None:
+        """Deletes every stored response, e.g. when the user logs out."""
+        with self._lock, self._transaction():
+            self._connection.execute("DELETE FROM responses")
+        logger.debug("Purged on-disk API cache.")
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def _transaction(self):
+        # With isolation_level=None the connection is a context manager that
+        # commits on success and rolls back on error once BEGIN was issued.
+        self._connection.execute("BEGIN IMMEDIATE")
+        return self._connection
+
+    def _evict(self) -> None:
+        # Caller holds the lock and an open transaction.
+        (size,) = self._connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        if size <= self.max_bytes:
+            return
+        excess = size - self.max_bytes
+        freed = 0
+        stale = []
+        for identity, endpoint, query, row_size in self._connection.execute(
+            "SELECT identity, endpoint, query, size FROM responses "
+            "ORDER BY accessed_at"
+        ):
+            if freed >= excess:
+                break
+            stale.append((identity, endpoint, query))
+            freed += row_size
+        self._connection.executemany(
+            "DELETE FROM responses WHERE identity = ? AND endpoint = ? AND query = ?",
+            stale,
+        )
@@ -0,0 +1,81 @@
+import logging
+import threading
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POOL_CONNECTIONS = 4
+DEFAULT_POOL_MAXSIZE = 10
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+_pool_connections = DEFAULT_POOL_CONNECTIONS
+_pool_maxsize = DEFAULT_POOL_MAXSIZE
+
+
+def create_http_session(
+    pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+    pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+) -> requests.Session:
+    """
+    Creates a requests.Session with a keep-alive connection pool mounted
+    for both http and https.
+
+    :param pool_connections: Number of per-host connection pools to cache.
+    :param pool_maxsize: Maximum number of connections kept alive per host.
+    :return: A new requests.Session.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({"Connection": "keep-alive"})
+    return session
+
+
+def configure_http_session(
+    pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+    pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+) -> None:
+    """
+    Sets the pool size used by the shared session. An already open shared
+    session is closed so the next call to get_http_session picks it up.
+
+    :param pool_connections: Number of per-host connection pools to cache.
+    :param pool_maxsize: Maximum number of connections kept alive per host.
+    """
+    global _pool_connections, _pool_maxsize
+    with _session_lock:
+        _pool_connections = pool_connections
+        _pool_maxsize = pool_maxsize
+    close_http_session()
+
+
+def get_http_session() -> requests.Session:
+    """
+    Returns the process wide pooled session shared by APIClient and
+    SessionManager, creating it on first use.
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = create_http_session(_pool_connections, _pool_maxsize)
+            logger.debug(
+                f"Created pooled HTTP session "
+                f"(pool_connections={_pool_connections}, "
+                f"pool_maxsize={_pool_maxsize})."
+            )
+        return _session
+
+
+def close_http_session() -> None:
+    """Closes the shared session and drops every pooled connection."""
+    global _session
+    with _session_lock:
+        session, _session = _session, None
+    if session is not None:
+        session.close()
+        logger.debug("Closed pooled HTTP session.")
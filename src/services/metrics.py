@@ -0,0 +1,391 @@
+import logging
+import os
+import re
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from datetime import timedelta
+from typing import Dict, Iterator, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1,
+    2.5,
+    5,
+    10,
+)
+
+# Path segments that identify a record rather than a route, e.g. the user
+# id in users/7/accounts, are folded so each route is one series.
+_ID_SEGMENT = re.compile(r"^(\d+|[0-9a-fA-F-]{16,})$")
+
+
+def endpoint_label(endpoint: str) -> str:
+    """Returns the route of an endpoint, e.g. 'users/{id}/accounts'."""
+    return "/".join(
+        "{id}" if _ID_SEGMENT.match(segment) else segment
+        for segment in endpoint.strip().strip("/").split("/")
+    )
+
+
+class Histogram:
+    """Cumulative-bucket latency histogram, as exported to Prometheus."""
+
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimates a quantile by interpolating inside its bucket.
+
+        :return: The estimate in seconds, or None without observations.
+        """
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        lower = 0.0
+        for upper, count in zip(self.buckets, self.counts):
+            if count and seen + count >= rank:
+                return lower + (upper - lower) * (rank - seen) / count
+            seen += count
+            lower = upper
+        # Beyond the last bucket there is no upper bound to interpolate to.
+        return self.buckets[-1]
+
+    def cumulative(self) -> Iterator[Tuple[str, int]]:
+        """Yields (le, count) pairs in Prometheus order, ending with +Inf."""
+        total = 0
+        for upper, count in zip(self.buckets, self.counts):
+            total += count
+            yield f"{upper:g}", total
+        yield "+Inf", self.count
+
+
+class RequestSample:
+    """What a caller learned about one request while it was tracked."""
+
+    def __init__(self, endpoint: str, method: str):
+        self.endpoint = endpoint
+        self.method = method.upper()
+        self.response = None
+        self.status: Optional[str] = None
+        self.cache = "bypass"
+        self.bytes_in: Optional[int] = None
+        self.bytes_out = 0
+        self.phases: Dict[str, float] = {}
+
+
+class MetricsRegistry:
+    """
+    In-process store of API request metrics.
+
+    Per endpoint route and method it keeps latency histograms for the
+    phases that could be measured (total always; ttfb, dns and connect
+    when the client exposes them), request counts by status and cache
+    outcome, bytes in and out, and retries. Read it with snapshot(), or
+    export it with to_prometheus() / MetricsFileExporter.
+    """
+
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self._latency: Dict[Tuple[str, str, str], Histogram] = {}
+        self._requests: Dict[Tuple[str, str, str, str], int] = {}
+        self._bytes_in: Dict[Tuple[str, str], int] = {}
+        self._bytes_out: Dict[Tuple[str, str], int] = {}
+        self._retries: Dict[Tuple[str, str], int] = {}
+        self._circuit_changes: Dict[Tuple[str, str], int] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def track(self, endpoint: str, method: str) -> Iterator[RequestSample]:
+        """
+        Times the enclosed request and records it on exit.
+
+        Set ``sample.response`` to the requests/aiohttp response; its status,
+        body size and time to first byte are picked up from it. An exception
+        escaping the block is recorded with status 'error' and re-raised.
+
+        :param endpoint: The endpoint path, relative to the API base URL.
+        :param method: The HTTP method.
+        """
+        sample = RequestSample(endpoint, method)
+        started = time.perf_counter()
+        try:
+            yield sample
+        except BaseException:
+            if sample.response is None:
+                sample.status = sample.status or "error"
+            raise
+        finally:
+            sample.phases.setdefault("total", time.perf_counter() - started)
+            try:
+                self.record(sample)
+            except Exception as e:
+                # Instrumentation must never fail the request itself.
+                logger.warning(f"Failed to record metrics for {endpoint}: {e}")
+
+    def record(self, sample: RequestSample) -> None:
+        """Adds a finished RequestSample to the registry."""
+        response = sample.response
+        status = sample.status
+        bytes_in = sample.bytes_in or 0
+        if response is not None:
+            status = status or str(getattr(response, "status_code", None) or "")
+            content = getattr(response, "_content", None)
+            if sample.bytes_in is None and isinstance(content, bytes):
+                bytes_in = len(content)
+            elapsed = getattr(response, "elapsed", None)
+            if isinstance(elapsed, timedelta) and sample.cache != "hit":
+                # requests measures from sending to parsing the headers.
+                sample.phases.setdefault("ttfb", elapsed.total_seconds())
+
+        key = (endpoint_label(sample.endpoint), sample.method)
+        with self._lock:
+            for phase, seconds in sample.phases.items():
+                histogram = self._latency.get((*key, phase))
+                if histogram is None:
+                    histogram = self._latency[(*key, phase)] = Histogram(self.buckets)
+                histogram.observe(seconds)
+            count_key = (*key, status or "unknown", sample.cache)
+            self._requests[count_key] = self._requests.get(count_key, 0) + 1
+            self._bytes_in[key] = self._bytes_in.get(key, 0) + bytes_in
+            self._bytes_out[key] = self._bytes_out.get(key, 0) + sample.bytes_out
+
+    def record_retry(self, endpoint: str, method: str) -> None:
+        key = (endpoint_label(endpoint), method.upper())
+        with self._lock:
+            self._retries[key] = self._retries.get(key, 0) + 1
+
+    def record_circuit_state(self, host: str, old_state, new_state) -> None:
+        """CircuitBreaker listener counting state changes per host."""
+        key = (host, getattr(new_state, "value", str(new_state)))
+        with self._lock:
+            self._circuit_changes[key] = self._circuit_changes.get(key, 0) + 1
+
+    def reset(self) -> None:
+        with self._lock:
+            for series in (
+                self._latency,
+                self._requests,
+                self._bytes_in,
+                self._bytes_out,
+                self._retries,
+                self._circuit_changes,
+            ):
+                series.clear()
+
+    def histogram(
+        self, endpoint: str, method: str = "GET", phase: str = "total"
+    ) -> Optional[Histogram]:
+        """Returns the latency histogram of an endpoint route, if any."""
+        with self._lock:
+            return self._latency.get((endpoint_label(endpoint), method.upper(), phase))
+
+    def snapshot(self) -> dict:
+        """
+        Returns the metrics per 'METHOD route', e.g. 'GET users/{id}/accounts':
+        request counts by status and cache outcome, bytes, retries and, per
+        phase, the count, mean, p50 and p95 latency in seconds.
+        """
+        with self._lock:
+            endpoints: Dict[str, dict] = {}
+
+            def entry(key):
+                return endpoints.setdefault(
+                    f"{key[1]} {key[0]}",
+                    {
+                        "requests": 0,
+                        "statuses": {},
+                        "cache": {},
+                        "bytes_in": 0,
+                        "bytes_out": 0,
+                        "retries": 0,
+                        "latency": {},
+                    },
+                )
+
+            for (route, method, status, cache), count in self._requests.items():
+                data = entry((route, method))
+                data["requests"] += count
+                data["statuses"][status] = data["statuses"].get(status, 0) + count
+                data["cache"][cache] = data["cache"].get(cache, 0) + count
+            for key, value in self._bytes_in.items():
+                entry(key)["bytes_in"] = value
+            for key, value in self._bytes_out.items():
+                entry(key)["bytes_out"] = value
+            for key, value in self._retries.items():
+                entry(key)["retries"] = value
+            for (route, method, phase), histogram in self._latency.items():
+                entry((route, method))["latency"][phase] = {
+                    "count": histogram.count,
+                    "mean": histogram.sum / histogram.count,
+                    "p50": histogram.quantile(0.5),
+                    "p95": histogram.quantile(0.95),
+                }
+            return {
+                "endpoints": endpoints,
+                "circuit_state_changes": {
+                    f"{host} {state}": count
+                    for (host, state), count in self._circuit_changes.items()
+                },
+            }
+
+    def to_prometheus(self) -> str:
+        """Renders the metrics in the Prometheus text exposition format."""
+        lines = []
+        with self._lock:
+            lines += [
+                "# HELP bankops_api_request_duration_seconds "
+                "API request latency by phase.",
+                "# TYPE bankops_api_request_duration_seconds histogram",
+            ]
+            for (route, method, phase), histogram in sorted(self._latency.items()):
+                labels = _labels(endpoint=route, method=method, phase=phase)
+                for le, count in histogram.cumulative():
+                    lines.append(
+                        "bankops_api_request_duration_seconds_bucket"
+                        f"{_labels(endpoint=route, method=method, phase=phase, le=le)}"
+                        f" {count}"
+                    )
+                lines.append(
+                    f"bankops_api_request_duration_seconds_sum{labels} "
+                    f"{histogram.sum:.6f}"
+                )
+                lines.append(
+                    f"bankops_api_request_duration_seconds_count{labels} "
+                    f"{histogram.count}"
+                )
+
+            lines += _counter(
+                "bankops_api_requests_total",
+                "API requests by status and cache outcome.",
+                ("endpoint", "method", "status", "cache"),
+                self._requests,
+            )
+            lines += _counter(
+                "bankops_api_received_bytes_total",
+                "Response body bytes received.",
+                ("endpoint", "method"),
+                self._bytes_in,
+            )
+            lines += _counter(
+                "bankops_api_sent_bytes_total",
+                "Request body bytes sent.",
+                ("endpoint", "method"),
+                self._bytes_out,
+            )
+            lines += _counter(
+                "bankops_api_retries_total",
+                "Requests sent again after a transient failure.",
+                ("endpoint", "method"),
+                self._retries,
+            )
+            lines += _counter(
+                "bankops_circuit_state_changes_total",
+                "Circuit breaker state changes by new state.",
+                ("host", "state"),
+                self._circuit_changes,
+            )
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels) -> str:
+    pairs = (f'{name}="{_escape(value)}"' for name, value in labels.items())
+    return "{" + ",".join(pairs) + "}"
+
+
+def _counter(name: str, help_text: str, label_names, series: dict) -> list:
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} counter"]
+    for key, value in sorted(series.items()):
+        lines.append(f"{name}{_labels(**dict(zip(label_names, key)))} {value}")
+    return lines
+
+
+class MetricsFileExporter:
+    """
+    Periodically writes a registry to a file in Prometheus text format, e.g.
+    for node_exporter's textfile collector. Each dump replaces the file
+    atomically, so readers never see a partial one.
+    """
+
+    def __init__(self, registry: MetricsRegistry, path: str, interval: float = 15):
+        """
+        :param registry: The metrics to dump.
+        :param path: The file to write.
+        :param interval: Seconds between dumps.
+        """
+        self.registry = registry
+        self.path = path
+        self.interval = interval
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def dump(self) -> None:
+        """Writes the current metrics now."""
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        temporary = f"{self.path}.tmp"
+        with open(temporary, "w", encoding="utf-8") as file:
+            file.write(self.registry.to_prometheus())
+        os.replace(temporary, self.path)
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="MetricsFileExporter", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stops the periodic dumps, writing one last time."""
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self) -> None:
+        while True:
+            stopped = self._stopped.wait(self.interval)
+            try:
+                self.dump()
+            except OSError as e:
+                logger.warning(f"Failed to write metrics to {self.path}: {e}")
+            if stopped:
+                return
+
+
+_metrics: Optional[MetricsRegistry] = None
+_metrics_lock = threading.Lock()
+
+
+def get_metrics() -> MetricsRegistry:
+    """Returns the process wide MetricsRegistry, creating it on first use."""
+    global _metrics
+    with _metrics_lock:
+        if _metrics is None:
+            _metrics = MetricsRegistry()
+        return _metrics
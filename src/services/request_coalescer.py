@@ -0,0 +1,86 @@
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+class _Call:
+    """A call in flight and the outcome its waiters are given."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class RequestCoalescer:
+    """
+    Single-flight for identical requests made from several threads at once.
+
+    The first caller for a key runs the request; callers arriving with the
+    same key while it is in flight wait for it and share its result or
+    error instead of sending their own. Nothing is remembered once the call
+    completes, that is the response cache's job.
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.coalesced = 0
+        self._in_flight: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def in_flight(self) -> int:
+        """Number of distinct calls currently running."""
+        return len(self._in_flight)
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        Runs ``fn`` unless a call with the same key is already in flight.
+
+        :param key: Identifies identical requests.
+        :param fn: The request to run.
+        :return: The result of ``fn``, possibly from another thread's call.
+        :raises Exception: Whatever ``fn`` raised, in every waiter.
+        """
+        with self._lock:
+            call = self._in_flight.get(key)
+            leader = call is None
+            if leader:
+                call = self._in_flight[key] = _Call()
+                self.calls += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+            call.done.set()
+
+    def stats(self) -> dict:
+        """Returns how many calls were made and how many were coalesced."""
+        with self._lock:
+            return {"calls": self.calls, "coalesced": self.coalesced}
+
+
+_request_coalescer: Optional[RequestCoalescer] = None
+_request_coalescer_lock = threading.Lock()
+
+
+def get_request_coalescer() -> RequestCoalescer:
+    """Returns the process wide RequestCoalescer, creating it on first use."""
+    global _request_coalescer
+    with _request_coalescer_lock:
+        if _request_coalescer is None:
+            _request_coalescer = RequestCoalescer()
+        return _request_coalescer
@@ -0,0 +1,402 @@
+import base64
+import fnmatch
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Mapping, Optional, Tuple
+from urllib.parse import urlencode
+
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 8 * 1024 * 1024
+
+# How long a response may be served without asking the server, by endpoint
+# pattern. Responses carrying a Cache-Control max-age use that instead.
+DEFAULT_TTLS: Dict[str, float] = {
+    "users/current": 60,
+    "users/*/accounts": 15,
+    "accounts/*": 15,
+    "transactions": 5,
+}
+
+# Extra endpoint patterns a successful write invalidates, besides the
+# written resource's own collection.
+DEFAULT_INVALIDATIONS: Dict[str, Tuple[str, ...]] = {
+    "transactions*": ("accounts*", "users/*/accounts"),
+    "accounts*": ("users/*/accounts",),
+}
+
+ANONYMOUS = "anonymous"
+
+
+@dataclass
+class CacheEntry:
+    """A cached GET response and what is needed to revalidate it."""
+
+    endpoint: str
+    url: str
+    status_code: int
+    headers: Dict[str, str]
+    content: bytes
+    encoding: Optional[str]
+    etag: Optional[str]
+    last_modified: Optional[str]
+    expires_at: float
+    stored_at: float = field(default_factory=time.time)
+
+    @property
+    def size(self) -> int:
+        return len(self.content)
+
+    def is_fresh(self, now: Optional[float] = None) -> bool:
+        return (time.time() if now is None else now) < self.expires_at
+
+    @property
+    def validators(self) -> Dict[str, str]:
+        """Headers that turn a request for this entry into a conditional one."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def to_response(self) -> Response:
+        """Rebuilds a requests.Response from the cached data."""
+        response = Response()
+        response.status_code = self.status_code
+        response._content = self.content
+        response.headers = CaseInsensitiveDict(self.headers)
+        response.encoding = self.encoding
+        response.url = self.url
+        return response
+
+
+def parse_cache_control(value: Optional[str]) -> Dict[str, Optional[str]]:
+    """Parses a Cache-Control header into a directive -> argument mapping."""
+    directives: Dict[str, Optional[str]] = {}
+    for part in (value or "").split(","):
+        name, _, argument = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = argument.strip('"') or None
+    return directives
+
+
+def auth_identity(headers: Mapping[str, str]) -> str:
+    """
+    Returns a stable identity for the caller of a request, so cached
+    responses are never served to another user.
+
+    The JWT subject is used when the bearer token carries one, so the
+    identity survives token refreshes; otherwise a hash of the token.
+    """
+    authorization = headers.get("Authorization")
+    if not authorization:
+        return ANONYMOUS
+    token = authorization.split(" ", 1)[-1]
+    try:
+        payload = token.split(".")[1]
+        claims = json.loads(
+            base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4))
+        )
+        subject = claims.get("sub")
+        if subject is not None:
+            return f"sub:{subject}"
+    except (IndexError, ValueError, AttributeError):
+        pass
+    return "token:" + hashlib.sha256(token.encode()).hexdigest()
+
+
+class ResponseCache:
+    """
+    In-memory HTTP cache for APIClient GET responses.
+
+    Entries are served without a request while fresh, and revalidated with
+    If-None-Match/If-Modified-Since once stale, so an unchanged resource
+    costs a 304 instead of a full download. Freshness comes from the
+    response's Cache-Control max-age, falling back to a per-endpoint TTL.
+    The cache is bounded by the total size of the cached bodies and evicts
+    the least recently used entries first.
+
+    With a ``disk_store`` (see DiskResponseCache) every entry is also
+    persisted, and entries missing from memory are loaded from it, so the
+    last known responses survive a restart. The disk is best effort: its
+    errors are logged and never fail a request.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        ttls: Optional[Mapping[str, float]] = None,
+        default_ttl: float = 0,
+        invalidations: Optional[Mapping[str, Iterable[str]]] = None,
+        disk_store=None,
+    ):
+        """
+        :param max_bytes: Upper bound for the total size of cached bodies.
+        :param ttls: Seconds a response stays fresh, by endpoint pattern
+        (fnmatch syntax, e.g. 'users/*/accounts').
+        :param default_ttl: Freshness for endpoints without a TTL; 0 means
+        every use is revalidated.
+        :param invalidations: Extra endpoint patterns to drop after a
+        successful write to an endpoint matching the key pattern.
+        :param disk_store: Optional DiskResponseCache to persist entries in.
+        """
+        self.max_bytes = max_bytes
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.default_ttl = default_ttl
+        self.invalidations = {
+            pattern: tuple(targets)
+            for pattern, targets in (
+                DEFAULT_INVALIDATIONS if invalidations is None else invalidations
+            ).items()
+        }
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self._entries: "OrderedDict[tuple, CacheEntry]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.disk_store = disk_store
+
+    @property
+    def size(self) -> int:
+        """Total size in bytes of the cached bodies."""
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def make_key(
+        endpoint: str, params: Optional[Mapping] = None, identity: str = ANONYMOUS
+    ) -> tuple:
+        """Builds the cache key of a GET request."""
+        query = urlencode(sorted((params or {}).items()), doseq=True)
+        return identity, endpoint.strip("/"), query
+
+    def ttl_for(self, endpoint: str) -> float:
+        endpoint = endpoint.strip("/")
+        for pattern, ttl in self.ttls.items():
+            if fnmatch.fnmatchcase(endpoint, pattern):
+                return ttl
+        return self.default_ttl
+
+    def get(self, key: tuple) -> Optional[CacheEntry]:
+        """Returns the entry for a key, marking it as recently used."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry
+
+        entry = self._on_disk("load", key)
+        if entry is not None:
+            with self._lock:
+                self._insert(key, entry)
+        return entry
+
+    def lookup(self, key: tuple) -> Tuple[Optional[CacheEntry], bool]:
+        """
+        Looks up a request and records a hit or miss.
+
+        :return: The entry, if any, and whether it can be served as is.
+        """
+        entry = self.get(key)
+        fresh = entry is not None and entry.is_fresh()
+        with self._lock:
+            if fresh:
+                self.hits += 1
+            else:
+                self.misses += 1
+        return entry, fresh
+
+    def store(self, key: tuple, endpoint: str, response: Response) -> bool:
+        """
+        Caches a 200 response unless it is marked no-store.
+
+        :return: True if the response was cached.
+        """
+        content = response.content
+        if response.status_code != 200 or not isinstance(content, bytes):
+            return False
+        if len(content) > self.max_bytes:
+            return False
+
+        directives = parse_cache_control(response.headers.get("Cache-Control"))
+        if "no-store" in directives:
+            self.invalidate_key(key)
+            return False
+
+        entry = CacheEntry(
+            endpoint=endpoint.strip("/"),
+            url=response.url,
+            status_code=response.status_code,
+            headers=dict(response.headers),
+            content=content,
+            encoding=response.encoding,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+            expires_at=time.time() + self._freshness(endpoint, directives),
+        )
+        with self._lock:
+            self._insert(key, entry)
+        self._on_disk("save", key, entry)
+        return True
+
+    def revalidated(self, key: tuple, response: Response) -> Optional[CacheEntry]:
+        """
+        Refreshes an entry after the server answered 304 Not Modified.
+
+        :return: The refreshed entry, or None if it was evicted meanwhile.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self.revalidations += 1
+            directives = parse_cache_control(
+                response.headers.get("Cache-Control")
+                or entry.headers.get("Cache-Control")
+            )
+            entry.expires_at = time.time() + self._freshness(entry.endpoint, directives)
+            entry.etag = response.headers.get("ETag") or entry.etag
+            entry.last_modified = (
+                response.headers.get("Last-Modified") or entry.last_modified
+            )
+            self._entries.move_to_end(key)
+        self._on_disk("save", key, entry)
+        return entry
+
+    def invalidate_key(self, key: tuple) -> None:
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._size -= entry.size
+        self._on_disk("delete", key)
+
+    def invalidate(self, *patterns: str) -> int:
+        """
+        Drops every entry whose endpoint matches one of the patterns.
+
+        :return: The number of entries dropped.
+        """
+        with self._lock:
+            stale = [
+                key
+                for key, entry in self._entries.items()
+                if any(fnmatch.fnmatchcase(entry.endpoint, p) for p in patterns)
+            ]
+            for key in stale:
+                self._size -= self._entries.pop(key).size
+        self._on_disk("invalidate", *patterns)
+        if stale:
+            logger.debug(f"Invalidated {len(stale)} cached responses for {patterns}.")
+        return len(stale)
+
+    def invalidate_for_write(self, endpoint: str) -> int:
+        """
+        Drops the entries a successful write to ``endpoint`` makes stale:
+        the written collection and its members, plus any configured extras.
+        """
+        endpoint = endpoint.strip("/")
+        collection = endpoint.split("/", 1)[0]
+        patterns = [collection, f"{collection}/*"]
+        for pattern, targets in self.invalidations.items():
+            if fnmatch.fnmatchcase(endpoint, pattern):
+                patterns.extend(targets)
+        return self.invalidate(*patterns)
+
+    def clear(self) -> None:
+        """Drops every entry, including the ones persisted on disk."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+        self._on_disk("purge")
+
+    def stats(self) -> dict:
+        """Returns hit/miss counters and the current size of the cache."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "revalidations": self.revalidations,
+                "entries": len(self._entries),
+                "bytes": self._size,
+            }
+
+    def _freshness(self, endpoint: str, directives: Dict[str, Optional[str]]) -> float:
+        if "no-cache" in directives:
+            return 0
+        max_age = directives.get("max-age")
+        if max_age is not None:
+            try:
+                return max(0.0, float(max_age))
+            except ValueError:
+                pass
+        return self.ttl_for(endpoint)
+
+    def _insert(self, key: tuple, entry: CacheEntry) -> None:
+        # Caller holds the lock.
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._size -= old.size
+        self._entries[key] = entry
+        self._size += entry.size
+        self._evict()
+
+    def _on_disk(self, operation: str, *args):
+        if self.disk_store is None:
+            return None
+        try:
+            return getattr(self.disk_store, operation)(*args)
+        except Exception as e:
+            logger.warning(f"On-disk API cache {operation} failed: {e}")
+            return None
+
+    def _evict(self) -> None:
+        # Caller holds the lock.
+        while self._size > self.max_bytes and self._entries:
+            _, entry = self._entries.popitem(last=False)
+            self._size -= entry.size
+
+
+_response_cache: Optional[ResponseCache] = None
+_response_cache_lock = threading.Lock()
+
+
+def configure_response_cache(**kwargs) -> ResponseCache:
+    """
+    Replaces the process wide ResponseCache, e.g. to give it a disk store.
+
+    :param kwargs: Arguments for ResponseCache.
+    :return: The new cache.
+    """
+    global _response_cache
+    with _response_cache_lock:
+        _response_cache = ResponseCache(**kwargs)
+        return _response_cache
+
+
+def get_response_cache() -> ResponseCache:
+    """Returns the process wide ResponseCache, creating it on first use."""
+    global _response_cache
+    with _response_cache_lock:
+        if _response_cache is None:
+            _response_cache = ResponseCache()
+        return _response_cache
+
+
+def clear_response_cache() -> None:
+    """Empties the process wide ResponseCache, e.g. on logout."""
+    with _response_cache_lock:
+        cache = _response_cache
+    if cache is not None:
+        cache.clear()
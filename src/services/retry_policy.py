@@ -0,0 +1,112 @@
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Iterable, Mapping, Optional
+
+from requests import Response
+from requests.exceptions import ConnectionError, RequestException, Timeout
+
+IDEMPOTENT_METHODS = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE")
+RETRY_STATUSES = (429, 502, 503, 504)
+
+
+def parse_retry_after(
+    value: Optional[str], now: Optional[float] = None
+) -> Optional[float]:
+    """
+    Parses a Retry-After header, given either in seconds or as an HTTP date.
+
+    :return: The seconds to wait, or None if the header is missing or invalid.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at - (time.time() if now is None else now))
+
+
+class RetryPolicy:
+    """
+    Decides whether a failed request is sent again and how long to wait.
+
+    Connection errors, timeouts and the ``retry_statuses`` responses are
+    retried up to ``max_attempts`` requests in total. The wait grows
+    exponentially with equal jitter, so clients that failed together
+    don't retry together, unless the server asked for a specific delay
+    with Retry-After.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff_base: float = 0.25,
+        backoff_max: float = 8,
+        retry_statuses: Iterable[int] = RETRY_STATUSES,
+        max_retry_after: float = 30,
+    ):
+        """
+        :param max_attempts: Requests to send at most, the first included.
+        :param backoff_base: Delay in seconds before the first retry.
+        :param backoff_max: Upper bound for the backoff delay in seconds.
+        :param retry_statuses: Response statuses worth retrying.
+        :param max_retry_after: Longest Retry-After to honour; a longer one
+        gives up instead of blocking the caller.
+        """
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retry_statuses = frozenset(retry_statuses)
+        self.max_retry_after = max_retry_after
+
+    def backoff_delay(self, attempt: int) -> float:
+        """Returns the jittered delay before retry number ``attempt`` (from 0)."""
+        delay = min(self.backoff_max, self.backoff_base * (2**attempt))
+        return delay / 2 + random.uniform(0, delay / 2)  # nosec
+
+    def retry_delay(
+        self,
+        attempt: int,
+        response: Optional[Response] = None,
+        error: Optional[RequestException] = None,
+    ) -> Optional[float]:
+        """
+        Decides about retrying after request number ``attempt`` (from 0)
+        returned ``response`` or raised ``error``.
+
+        :return: Seconds to wait before retrying, or None to give up.
+        """
+        if attempt + 1 >= self.max_attempts:
+            return None
+        if error is not None:
+            if not isinstance(error, (ConnectionError, Timeout)):
+                return None
+            return self.backoff_delay(attempt)
+        if response is None or response.status_code not in self.retry_statuses:
+            return None
+
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        if retry_after is None:
+            return self.backoff_delay(attempt)
+        if retry_after > self.max_retry_after:
+            return None
+        return retry_after
+
+
+# Only idempotent methods are retried by default; a POST may have been
+# applied even though its response was lost.
+DEFAULT_RETRY_POLICIES: Dict[str, RetryPolicy] = {
+    method: RetryPolicy() for method in IDEMPOTENT_METHODS
+}
+
+
+def policy_for(
+    method: str, policies: Optional[Mapping[str, RetryPolicy]] = None
+) -> Optional[RetryPolicy]:
+    """Returns the retry policy for an HTTP method, or None if not retried."""
+    policies = DEFAULT_RETRY_POLICIES if policies is None else policies
+    return policies.get(method.upper())
@@ -1,28 +1,48 @@
 import logging
+import threading
 from datetime import datetime, timezone
 
 import keyring
 import requests
 
+from src import SingletonMeta
+from src.services.http_session import close_http_session, get_http_session
+from src.services.metrics import get_metrics
+from src.services.response_cache import clear_response_cache
+
 logger = logging.getLogger(__name__)
 
 
-class SessionManager:
-    """Manages JWT methods and processes."""
+class SessionManager(metaclass=SingletonMeta):
+    """
+    Manages JWT methods and processes.
+
+    Tokens and their expiry are cached in memory. Keyring is written through
+    on store_token/clear_tokens and only read at startup or when the cache is
+    explicitly invalidated, so authenticated requests never touch it.
+    """
 
     def __init__(self):
-        self.access_token = self.get_access_token()
-        self.refresh_token = self.get_refresh_token()
+        self.keyring_reads = 0
+        self.keyring_writes = 0
+        self.access_token = None
+        self.refresh_token = None
+        self.access_token_expire_time = None
+        self.refresh_token_expire_time = None
+        self.load_tokens()
         self.base_headers = {
             "Content-Type": "application/json",
             "Accept": "application/json",
         }
         self.timeout = 5
         self.base_url = " http://127.0.0.1:5000/api/v1/"
+        # Single-flight state for session refreshes, see refresh_session.
+        self._refresh_lock = threading.Lock()
+        self._refresh_generation = 0
+        self._refresh_error = None
 
     def _get_current_auth_header(self) -> dict:
         """Helper to get the current Authorization header"""
-        self.get_access_token()
         if self.access_token != "None" and self.access_token is not None:  # nosec
             return {"Authorization": f"Bearer {self.access_token}"}
         return {}
@@ -31,6 +51,37 @@ class SessionManager:
     # Keyring/Storage methods
     # ============================
 
+    def _read_keyring(self, key: str) -> str | None:
+        self.keyring_reads += 1
+        return keyring.get_password("BankOpsBanking", key)
+
+    def _write_keyring(self, key: str, value) -> None:
+        self.keyring_writes += 1
+        keyring.set_password("BankOpsBanking", key, value)
+
+    def _delete_keyring(self, key: str) -> None:
+        self.keyring_writes += 1
+        keyring.delete_password("BankOpsBanking", key)
+
+    def load_tokens(self) -> None:
+        """Fills the in-memory token cache from keyring."""
+        self.get_access_token()
+        self.get_refresh_token()
+        self.access_token_expire_time = self._read_keyring("access_token_expire_time")
+        self.refresh_token_expire_time = self._read_keyring("refresh_token_expire_time")
+
+    def invalidate_cache(self) -> None:
+        """
+        Drops the in-memory tokens and reloads them from keyring, e.g. after
+        another process changed the stored session.
+        """
+        logger.debug("Token cache invalidated, reloading from keyring.")
+        self.load_tokens()
+
+    def keyring_stats(self) -> dict:
+        """Returns how many keyring reads and writes this manager has made."""
+        return {"reads": self.keyring_reads, "writes": self.keyring_writes}
+
     def store_token(
         self,
         access_token: str,
@@ -44,48 +95,49 @@ class SessionManager:
         :param access_token_expire_time:
         :param refresh_token_expire_time:
         """
-        keyring.set_password("BankOpsBanking", "access_token", access_token)
-        keyring.set_password(
-            "BankOpsBanking", "access_token_expire_time", access_token_expire_time
-        )
-        keyring.set_password("BankOpsBanking", "refresh_token", refresh_token)
-        keyring.set_password(
-            "BankOpsBanking", "refresh_token_expire_time", refresh_token_expire_time
-        )
+        self._write_keyring("access_token", access_token)
+        self._write_keyring("access_token_expire_time", access_token_expire_time)
+        self._write_keyring("refresh_token", refresh_token)
+        self._write_keyring("refresh_token_expire_time", refresh_token_expire_time)
 
         self.access_token = access_token
         self.refresh_token = refresh_token
+        self.access_token_expire_time = access_token_expire_time
+        self.refresh_token_expire_time = refresh_token_expire_time
 
         logger.info("JWT access_token and refresh_token stored successfully.")
 
     def get_access_token(self) -> str | None:
-        """Retrieves the JWT access_token."""
-        self.access_token = keyring.get_password("BankOpsBanking", "access_token")
+        """Retrieves the JWT access_token from keyring and caches it."""
+        self.access_token = self._read_keyring("access_token")
         return self.access_token
 
     def get_refresh_token(self):
-        self.refresh_token = keyring.get_password("BankOpsBanking", "refresh_token")
+        """Retrieves the JWT refresh_token from keyring and caches it."""
+        self.refresh_token = self._read_keyring("refresh_token")
         return self.refresh_token
 
     def clear_tokens(self) -> None:
         """Clears the stored JWT access_token."""
-        keyring.delete_password("BankOpsBanking", "access_token")
-        keyring.delete_password("BankOpsBanking", "refresh_token")
-        keyring.delete_password("BankOpsBanking", "access_token_expire_time")
-        keyring.delete_password("BankOpsBanking", "refresh_token_expire_time")
+        self._delete_keyring("access_token")
+        self._delete_keyring("refresh_token")
+        self._delete_keyring("access_token_expire_time")
+        self._delete_keyring("refresh_token_expire_time")
         # TODO: find a way to not accidentally clear other
         #  tokens that are not necessary.
 
         self.access_token = None
         self.refresh_token = None
+        self.access_token_expire_time = None
+        self.refresh_token_expire_time = None
+        # Cached responses belong to the session that just ended.
+        clear_response_cache()
 
         logger.info("JWT access_token cleared.")
 
     def check_expiration(self) -> bool:
-        """Checks if the JWT access_token has expired using datetime."""
-        expiration_str = keyring.get_password(
-            "BankOpsBanking", "access_token_expire_time"
-        )
+        """Checks if the cached JWT access_token has expired using datetime."""
+        expiration_str = self.access_token_expire_time
         if expiration_str is None:
             return True
         try:
@@ -118,11 +170,13 @@ class SessionManager:
         }
 
         try:
-            results = requests.post(
-                url=url,
-                headers=refresh_headers,
-                timeout=self.timeout,
-            )
+            with get_metrics().track("auth/sessions/renew", "POST") as sample:
+                results = get_http_session().post(
+                    url=url,
+                    headers=refresh_headers,
+                    timeout=self.timeout,
+                )
+                sample.response = results
             results.raise_for_status()
 
             if results.status_code in [200, 201]:
@@ -166,12 +220,53 @@ class SessionManager:
             self.clear_tokens()
             raise
 
+    @property
+    def refresh_generation(self) -> int:
+        """Number of refreshes completed, successful or not."""
+        return self._refresh_generation
+
+    def refresh_session(self, generation: int | None = None) -> bool:
+        """
+        Renews the session with single-flight semantics: one caller performs
+        the refresh while concurrent callers wait and then share its outcome,
+        so the refresh token is never rotated twice.
+
+        :param generation: The refresh_generation the caller observed when it
+        decided a refresh was needed. If a refresh finished since then, its
+        result is reused instead of starting another one.
+        :raises Exception: The error of the refresh the caller waited on.
+        :return: True once a valid session is in place.
+        """
+        if generation is None:
+            generation = self._refresh_generation
+
+        with self._refresh_lock:
+            if self._refresh_generation != generation:
+                # Another caller refreshed while we were waiting for the lock.
+                if self._refresh_error is not None:
+                    raise self._refresh_error
+                logger.debug("Reusing session refreshed by another caller.")
+                return True
+
+            try:
+                self.attempt_session_refresh(self.refresh_token)
+                self._refresh_error = None
+            except Exception as e:
+                self._refresh_error = e
+                raise
+            finally:
+                self._refresh_generation += 1
+            return True
+
     def ensure_session_valid(self):
         """Checks if the session is valid and attempts refresh if expired."""
+        # Read before checking expiry so a refresh that completes in between
+        # is reused rather than repeated.
+        generation = self._refresh_generation
         if self.check_expiration():
             logger.info("Access token expired or invalid, attempting refresh.")
             try:
-                self.attempt_session_refresh(self.refresh_token)
+                self.refresh_session(generation)
                 return True
             except Exception as e:
                 logger.error(f"Session refresh failed: {e}")
@@ -212,12 +307,14 @@ class SessionManager:
         url: str = f"{self.base_url}auth/sessions/users"
         payload = {"username": username, "password": password}
 
-        results = requests.post(
-            url=url,
-            json=payload,
-            headers=self.base_headers,
-            timeout=self.timeout,
-        )
+        with get_metrics().track("auth/sessions/users", "POST") as sample:
+            results = get_http_session().post(
+                url=url,
+                json=payload,
+                headers=self.base_headers,
+                timeout=self.timeout,
+            )
+            sample.response = results
 
         if results.status_code == 201:
             self.store_token(
@@ -239,14 +336,18 @@ class SessionManager:
         logger.info("Logging out user.")
         url: str = f"{self.base_url}auth/sessions/users"
         current_headers = self.get_authenticated_headers()
-        results = requests.delete(
-            url=url,
-            headers=current_headers,
-            timeout=self.timeout,
-        )
+        with get_metrics().track("auth/sessions/users", "DELETE") as sample:
+            results = get_http_session().delete(
+                url=url,
+                headers=current_headers,
+                timeout=self.timeout,
+            )
+            sample.response = results
         if results.status_code == 204:
             logger.info("User logged out successfully. Clearing local tokens.")
             self.clear_tokens()
+            # Pooled connections belong to the old session, drop them too.
+            close_http_session()
             return
         else:
             raise Exception("Failed to logout user.")
@@ -0,0 +1,140 @@
+import logging
+import random
+import threading
+import time
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class TokenRefreshScheduler:
+    """
+    Renews the access token on a background thread a configurable margin
+    before it expires, so authenticated requests never wait on a renewal.
+    Failed renewals are retried with exponential backoff and jitter.
+    """
+
+    def __init__(
+        self,
+        session_manager,
+        refresh_margin: float = 60,
+        idle_interval: float = 30,
+        backoff_base: float = 1,
+        backoff_max: float = 60,
+    ):
+        """
+        :param session_manager: SessionManager whose tokens are renewed.
+        :param refresh_margin: Seconds before expiry at which to renew.
+        :param idle_interval: Seconds between checks while no token is stored.
+        :param backoff_base: Delay in seconds after the first failed renewal.
+        :param backoff_max: Upper bound for the retry delay in seconds.
+        """
+        self.session_manager = session_manager
+        self.refresh_margin = refresh_margin
+        self.idle_interval = idle_interval
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.failures = 0
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Starts the background thread if it isn't running already."""
+        if self.running:
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="TokenRefreshScheduler", daemon=True
+        )
+        self._thread.start()
+        logger.debug("Token refresh scheduler started.")
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stops the background thread and waits for it to exit."""
+        self._stopped.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        logger.debug("Token refresh scheduler stopped.")
+
+    def reschedule(self) -> None:
+        """Recomputes the next renewal, e.g. after a login stored new tokens."""
+        self.failures = 0
+        self._wake.set()
+
+    def seconds_until_refresh(self, now: Optional[float] = None) -> Optional[float]:
+        """
+        Returns the seconds left until the token should be renewed, or None
+        when there is no session to keep alive.
+        """
+        if not self.session_manager.refresh_token:
+            return None
+        try:
+            expire_time = int(self.session_manager.access_token_expire_time)
+        except (TypeError, ValueError):
+            return None
+        if now is None:
+            now = time.time()
+        return expire_time - self.refresh_margin - now
+
+    def backoff_delay(self, attempt: int) -> float:
+        """
+        Returns the delay before retry number ``attempt`` (starting at 0).
+        Half of the exponential delay is fixed and half is random, so clients
+        that failed together don't retry together.
+        """
+        delay = min(self.backoff_max, self.backoff_base * (2**attempt))
+        return delay / 2 + random.uniform(0, delay / 2)  # nosec
+
+    def next_delay(self) -> float:
+        """Returns how long the background thread should sleep next."""
+        if self.failures:
+            return self.backoff_delay(self.failures - 1)
+        delay = self.seconds_until_refresh()
+        if delay is None:
+            return self.idle_interval
+        return max(0.0, delay)
+
+    def run_pending(self) -> bool:
+        """
+        Renews the token if it is within the refresh margin.
+
+        :return: True if the token was renewed.
+        """
+        generation = self.session_manager.refresh_generation
+        delay = self.seconds_until_refresh()
+        if delay is None or delay > 0:
+            # Nothing due, or someone else already renewed the token.
+            self.failures = 0
+            return False
+
+        try:
+            # Shares the single-flight refresh with request threads.
+            self.session_manager.refresh_session(generation)
+        except Exception as e:
+            self.failures += 1
+            logger.warning(
+                f"Background token refresh failed (attempt {self.failures}): {e}"
+            )
+            return False
+
+        self.failures = 0
+        logger.info("Access token renewed ahead of expiry.")
+        return True
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            woken = self._wake.wait(self.next_delay())
+            self._wake.clear()
+            if self._stopped.is_set():
+                break
+            if woken:
+                # Rescheduled; recompute the delay from the new tokens.
+                continue
+            self.run_pending()
@@ -245,7 +245,6 @@ class Ui_MainWindow(object):
         self.widget_3.setObjectName("widget_3")
         self.widget_3.setMaximumSize(QSize(300, 1115))
         self.widget_3.setAutoFillBackground(False)
-        self.widget_3.setStyleSheet("")
         self.verticalLayout_6 = QVBoxLayout(self.widget_3)
         self.verticalLayout_6.setObjectName("verticalLayout_6")
         self.widget_11 = QWidget(self.widget_3)
@@ -258,13 +257,6 @@ class Ui_MainWindow(object):
         sizePolicy3.setHeightForWidth(self.widget_11.sizePolicy().hasHeightForWidth())
         self.widget_11.setSizePolicy(sizePolicy3)
         self.widget_11.setAutoFillBackground(False)
-        self.widget_11.setStyleSheet(
-            "QPushButton {\n"
-            "	background-color: #D9D9D9;\n"
-            "	color: black;\n"
-            "	font-size: 20px\n"
-            "}"
-        )
         self.verticalLayout_7 = QVBoxLayout(self.widget_11)
         self.verticalLayout_7.setObjectName("verticalLayout_7")
         self.widget_12 = QWidget(self.widget_11)
@@ -277,7 +269,6 @@ class Ui_MainWindow(object):
         sizePolicy4.setHeightForWidth(self.widget_12.sizePolicy().hasHeightForWidth())
         self.widget_12.setSizePolicy(sizePolicy4)
         self.widget_12.setAutoFillBackground(False)
-        self.widget_12.setStyleSheet("")
         self.verticalLayout_8 = QVBoxLayout(self.widget_12)
         self.verticalLayout_8.setObjectName("verticalLayout_8")
         self.pushButton = QPushButton(self.widget_12)
@@ -345,7 +336,6 @@ class Ui_MainWindow(object):
         self.pushButton_5.setObjectName("pushButton_5")
         self.pushButton_5.setMinimumSize(QSize(150, 50))
         self.pushButton_5.setFont(font3)
-        self.pushButton_5.setStyleSheet("")
         icon5 = QIcon()
         icon5.addFile(
             ":/dashboard/icons/support-svgrepo-com.svg",
@@ -390,7 +380,6 @@ class Ui_MainWindow(object):
         self.verticalLayout_3.setObjectName("verticalLayout_3")
         self.widget_5 = QWidget(self.dashboard_background)
         self.widget_5.setObjectName("widget_5")
-        self.widget_5.setStyleSheet("")
         self.verticalLayout_4 = QVBoxLayout(self.widget_5)
         self.verticalLayout_4.setObjectName("verticalLayout_4")
         self.widget_7 = QWidget(self.widget_5)
@@ -1,3 +1,4 @@
+import logging
 import sys
 
 from PySide6.QtCore import (
@@ -11,7 +12,7 @@ from PySide6.QtCore import (
     QSize,
     Qt,
 )
-from PySide6.QtGui import QFont, QPainter, QResizeEvent
+from PySide6.QtGui import QPainter, QResizeEvent
 from PySide6.QtWidgets import (
     QApplication,
     QFrame,
@@ -21,6 +22,25 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from src.ui.theme import get_font, get_theme_manager, set_state
+
+logger = logging.getLogger(__name__)
+
+
+def recent_change_style(recent_change: float):
+    """
+    Returns the text and trend a recent balance change is shown with.
+    :param recent_change: The change, positive or negative.
+    :return: A ``(text, trend)`` tuple; the trend is "positive", "negative"
+    or "neutral", the values of the theme's ``trend`` property.
+    """
+    # check if it's positive, negative, or 0
+    if recent_change > 0:
+        return f"+{str(recent_change)}", "positive"
+    if recent_change < 0:
+        return str(recent_change), "negative"
+    return "0", "neutral"
+
 
 class AccountCardWidget(QFrame):
     def __init__(
@@ -28,11 +48,6 @@ class AccountCardWidget(QFrame):
     ):
         super().__init__()
         self._is_hovered = False
-        self.name = name
-        self.balance = balance
-        self.account_type = account_type
-        self.account_number = account_number
-        self.recent_change = float(recent_change)
 
         self.setFrameShape(QFrame.StyledPanel)
         self.setFrameShadow(QFrame.Raised)
@@ -42,25 +57,10 @@ class AccountCardWidget(QFrame):
         self.centralLayout = QHBoxLayout()
         self.setLayout(self.centralLayout)
 
+        # Colours come from the application theme (src.ui.theme), which
+        # selects on these object names; fonts are shared from its cache.
         self.setObjectName("accountCard")
-
-        self.setStyleSheet(
-            "background-color: rgb(255, 255, 255);"
-            "border-radius: 5px;"
-            "font-family: Roboto;"
-        )
-
-        font = QFont("Roboto", 20)
-        font.setStyleStrategy(QFont.PreferAntialias)
-
-        balance_font = QFont("Roboto Condensed", 12, QFont.Bold, italic=True)
-        account_type_font = QFont("Roboto", 8, QFont.Normal)
-        account_number_font = QFont("Roboto Condensed", 8, QFont.Light, italic=True)
-        account_name_font = QFont("Roboto Condensed", 15, QFont.Normal)
-        recent_change_font = QFont("Roboto", 7, QFont.Medium)
-        recent_change_font.setItalic(True)
-
-        self.setFont(font)
+        self.setFont(get_font("account_card"))
 
         self.rightWidget = QWidget()
         self.leftWidget = QWidget()
@@ -74,38 +74,21 @@ class AccountCardWidget(QFrame):
         self.leftWidget.setLayout(self.leftLayout)
 
         # setup right widget containing account information
-        self.balanceLabel = QLabel(self, text=f"${str(self.balance)}")
-        self.balanceLabel.setFont(balance_font)
-        self.balanceLabel.setStyleSheet("color: #000000;")
-
-        # check if it's positive, negative, or 0
-        if self.recent_change > 0:
-            self.recent_change_text = f"+{str(self.recent_change)}"
-            self.recent_change_text_color = "#43A047"
-        elif self.recent_change < 0:
-            self.recent_change_text = f"-{str(self.recent_change)}"
-            self.recent_change_text_color = "#E53935"
-        else:
-            self.recent_change_value_status = None
-            self.recent_change_text = "0"
-            self.recent_change_text_color = "#000000"
-
-        self.recent_change_label = QLabel(self, text=self.recent_change_text)
-        self.recent_change_label.setStyleSheet(
-            f"color: {self.recent_change_text_color};"
-            "background-color: #BDBDBD; border-radius: 5px; padding: 1px;"
-        )
-        self.recent_change_label.setFont(recent_change_font)
+        self.balanceLabel = QLabel(self)
+        self.balanceLabel.setObjectName("accountBalance")
+        self.balanceLabel.setFont(get_font("account_balance"))
 
-        self.account_type_label = QLabel(self, text=self.account_type)
-        self.account_type_label.setFont(account_type_font)
-        self.account_type_label.setStyleSheet("color: #000000;")
+        self.recent_change_label = QLabel(self)
+        self.recent_change_label.setObjectName("accountRecentChange")
+        self.recent_change_label.setFont(get_font("account_recent_change"))
 
-        self.account_number_label = QLabel(
-            self, text=f"Account number: {str(self.account_number)}"
-        )
-        self.account_number_label.setFont(account_number_font)
-        self.account_number_label.setStyleSheet("color: #F0BDBDBD; ")
+        self.account_type_label = QLabel(self)
+        self.account_type_label.setObjectName("accountType")
+        self.account_type_label.setFont(get_font("account_type"))
+
+        self.account_number_label = QLabel(self)
+        self.account_number_label.setObjectName("accountNumber")
+        self.account_number_label.setFont(get_font("account_number"))
 
         self.rightLayout.addWidget(self.balanceLabel, alignment=Qt.AlignRight)
         self.rightLayout.addWidget(self.recent_change_label, alignment=Qt.AlignRight)
@@ -113,9 +96,9 @@ class AccountCardWidget(QFrame):
         self.rightLayout.addWidget(self.account_number_label, alignment=Qt.AlignRight)
 
         # setup left widget containing account name
-        self.account_name_label = QLabel(self, text=self.name)
-        self.account_name_label.setStyleSheet("color: #000000;")
-        self.account_name_label.setFont(account_name_font)
+        self.account_name_label = QLabel(self)
+        self.account_name_label.setObjectName("accountName")
+        self.account_name_label.setFont(get_font("account_name"))
 
         self.leftLayout.addWidget(self.account_name_label)
 
@@ -132,6 +115,53 @@ class AccountCardWidget(QFrame):
         self.animations_group = QSequentialAnimationGroup(self)
         self.animations_group.addAnimation(self.hover_animation)
 
+        self.name = None
+        self.balance = None
+        self.account_type = None
+        self.account_number = None
+        self.recent_change = None
+        self.update_account(name, balance, account_type, account_number, recent_change)
+
+    def update_account(
+        self, name, balance, account_type, account_number, recent_change
+    ) -> bool:
+        """
+        Shows another account, or new values of the same one, in place.
+        Only the labels whose text changes are touched.
+        :return: True if anything changed.
+        """
+        recent_change = float(recent_change) if recent_change is not None else 0.0
+        changed = False
+        if name != self.name:
+            self.name = name
+            self.account_name_label.setText(name)
+            changed = True
+        if balance != self.balance:
+            self.balance = balance
+            self.balanceLabel.setText(f"${str(balance)}")
+            changed = True
+        if account_type != self.account_type:
+            self.account_type = account_type
+            self.account_type_label.setText(account_type)
+            changed = True
+        if account_number != self.account_number:
+            self.account_number = account_number
+            self.account_number_label.setText(f"Account number: {str(account_number)}")
+            changed = True
+        if recent_change != self.recent_change:
+            self.recent_change = recent_change
+            self._show_recent_change()
+            changed = True
+        return changed
+
+    def _show_recent_change(self) -> None:
+        self.recent_change_text, self.recent_change_trend = recent_change_style(
+            self.recent_change
+        )
+        self.recent_change_label.setText(self.recent_change_text)
+        # Re-polishes just this label when the sign flips.
+        set_state(self.recent_change_label, "trend", self.recent_change_trend)
+
     def start_hover_animation(self):
         """Trigger hover animation based on hover state."""
         self.animations_group.stop()
@@ -189,14 +219,15 @@ class AccountCardWidget(QFrame):
         # this is to avoid anchor misplacement because of animations.
         if self.animations_group.state() != QAbstractAnimation.Running:
             self.anchor = new_position
-            print(f"Anchor updated to: {new_position}")
+            logger.debug(f"Anchor updated to: {new_position}")
             return
         else:
-            print(f"{self.animations_group.state()}, ignoring anchor update.")
+            logger.debug(f"{self.animations_group.state()}, ignoring anchor update.")
 
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
+    get_theme_manager().apply()
     account_card = AccountCardWidget(
         name="steve account",
         balance=100000,
@@ -0,0 +1,221 @@
+import logging
+from typing import Any, Dict, Iterable, List, Optional
+
+from PySide6.QtCore import (
+    QAbstractListModel,
+    QModelIndex,
+    QPersistentModelIndex,
+    QRect,
+    QSize,
+    Qt,
+)
+from PySide6.QtGui import QFontMetrics, QPainter, QPen
+from PySide6.QtWidgets import (
+    QAbstractItemView,
+    QListView,
+    QStyle,
+    QStyledItemDelegate,
+    QStyleOptionViewItem,
+)
+
+from src.ui.plugins.widgets.account_card_widget import recent_change_style
+from src.ui.theme import Palette, get_font, get_theme_manager
+
+logger = logging.getLogger(__name__)
+
+ModelIndex = QModelIndex | QPersistentModelIndex
+# The invalid index, i.e. the list's root.
+ROOT = QModelIndex()
+
+
+def _to_float(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+class AccountListModel(QAbstractListModel):
+    """
+    Accounts from the user info payload, one row each.
+
+    The display role is the account name; AccountRole returns the whole
+    account dictionary for AccountCardDelegate to paint.
+    """
+
+    AccountRole = Qt.ItemDataRole.UserRole + 1
+
+    def __init__(self, accounts: Iterable[Dict[str, Any]] = (), parent=None):
+        super().__init__(parent)
+        self._accounts: List[Dict[str, Any]] = list(accounts)
+
+    def rowCount(self, parent: ModelIndex = ROOT) -> int:
+        return 0 if parent.isValid() else len(self._accounts)
+
+    def data(self, index: ModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self._accounts):
+            return None
+        account = self._accounts[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return account.get("account_name")
+        if role == self.AccountRole:
+            return account
+        return None
+
+    def set_accounts(self, accounts: Iterable[Dict[str, Any]]) -> int:
+        """
+        Shows ``accounts``. When the same accounts are listed in the same
+        order only the rows that differ are repainted; otherwise the model
+        is reset, which costs no more with a view that only lays out and
+        paints the visible rows.
+        :return: The number of rows that changed, or -1 after a reset.
+        """
+        accounts = list(accounts)
+        keys = [account.get("account_number") for account in accounts]
+        if keys != [account.get("account_number") for account in self._accounts]:
+            self.beginResetModel()
+            self._accounts = accounts
+            self.endResetModel()
+            return -1
+
+        changed = 0
+        for row, account in enumerate(accounts):
+            if account != self._accounts[row]:
+                self._accounts[row] = account
+                self.dataChanged.emit(self.index(row), self.index(row))
+                changed += 1
+        return changed
+
+
+class AccountCardDelegate(QStyledItemDelegate):
+    """
+    Paints an account with the look of AccountCardWidget, name on the
+    left and balance, recent change, type and number on the right, without
+    any widget per account. A hovered card is nudged left, as the widget
+    does with its hover animation. Fonts and colours come from the
+    application theme.
+    """
+
+    CARD_HEIGHT = 100
+    MARGIN = 6
+    PADDING = 12
+    HOVER_SHIFT = 10
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # The same fonts the card widgets use, shared by every row.
+        self.name_font = get_font("account_name")
+        self.balance_font = get_font("account_balance")
+        self.recent_change_font = get_font("account_recent_change")
+        self.account_type_font = get_font("account_type")
+        self.account_number_font = get_font("account_number")
+
+    def sizeHint(self, option: QStyleOptionViewItem, index: ModelIndex) -> QSize:
+        return QSize(option.rect.width(), self.CARD_HEIGHT)
+
+    def paint(
+        self, painter: QPainter, option: QStyleOptionViewItem, index: ModelIndex
+    ) -> None:
+        account = index.data(AccountListModel.AccountRole)
+        if not account:
+            return
+        palette = get_theme_manager().palette
+        hovered = bool(option.state & QStyle.StateFlag.State_MouseOver)
+        card = option.rect.adjusted(
+            self.MARGIN + self.HOVER_SHIFT, self.MARGIN, -self.MARGIN, -self.MARGIN
+        )
+        if hovered:
+            card.translate(-self.HOVER_SHIFT, 0)
+
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(
+            QPen(palette.color("card_hover_border" if hovered else "card_border"), 1)
+        )
+        painter.setBrush(palette.color("card_background"))
+        painter.drawRoundedRect(card, 5, 5)
+
+        content = card.adjusted(
+            self.PADDING, self.PADDING / 2, -self.PADDING, -self.PADDING / 2
+        )
+        painter.setPen(palette.color("text"))
+        painter.setFont(self.name_font)
+        painter.drawText(
+            content,
+            Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+            QFontMetrics(self.name_font).elidedText(
+                str(account.get("account_name") or ""),
+                Qt.TextElideMode.ElideRight,
+                content.width() // 2,
+            ),
+        )
+        self._paint_details(painter, content, account, palette)
+        painter.restore()
+
+    def _paint_details(
+        self, painter: QPainter, content: QRect, account: dict, palette: Palette
+    ) -> None:
+        """Paints the right hand column, top to bottom."""
+        recent_change, trend = recent_change_style(
+            _to_float(account.get("latest_balance_change"))
+        )
+        text_color = palette.color("text")
+        lines = (
+            (self.balance_font, f"${account.get('balance')}", text_color),
+            (self.recent_change_font, recent_change, palette.color(trend)),
+            (self.account_type_font, account.get("account_type"), text_color),
+            (
+                self.account_number_font,
+                f"Account number: {account.get('account_number')}",
+                palette.color("muted_text"),
+            ),
+        )
+        heights = [QFontMetrics(font).height() for font, _, _ in lines]
+        top = content.top() + max(0, (content.height() - sum(heights)) // 2)
+        for (font, text, text_color), height in zip(lines, heights):
+            text = str(text or "")
+            metrics = QFontMetrics(font)
+            line = QRect(content.left(), top, content.width(), height)
+            painter.setFont(font)
+            if font is self.recent_change_font:
+                # The coloured pill behind the recent change.
+                width = metrics.horizontalAdvance(text) + 4
+                pill = QRect(line.right() - width + 1, line.top(), width, height)
+                painter.setPen(Qt.PenStyle.NoPen)
+                painter.setBrush(palette.color("pill_background"))
+                painter.drawRoundedRect(pill, 5, 5)
+            painter.setPen(text_color)
+            painter.drawText(
+                line.adjusted(0, 0, -2 if font is self.recent_change_font else 0, 0),
+                Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter,
+                text,
+            )
+            top += height
+
+
+class AccountListView(QListView):
+    """
+    Accounts painted as cards by AccountCardDelegate, for users with too
+    many accounts for one AccountCardWidget each. Rows have a uniform
+    height, so only the visible ones are ever laid out or painted.
+    """
+
+    def __init__(self, model: Optional[AccountListModel] = None, parent=None):
+        super().__init__(parent)
+        self.setObjectName("accountList")
+        self.setUniformItemSizes(True)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.setFrameShape(QListView.Shape.NoFrame)
+        self.setMouseTracking(True)
+        self.viewport().setAttribute(Qt.WidgetAttribute.WA_Hover)
+        self.setMaximumWidth(500)
+        self.setItemDelegate(AccountCardDelegate(self))
+        self.setModel(model if model is not None else AccountListModel(parent=self))
+        # The delegate reads the palette when painting, so a theme switch
+        # only needs a repaint.
+        get_theme_manager().theme_changed.connect(self.viewport().update)
+
+    def set_accounts(self, accounts: Iterable[Dict[str, Any]]) -> int:
+        """Shows ``accounts``; see AccountListModel.set_accounts."""
+        return self.model().set_accounts(accounts)
@@ -7,7 +7,7 @@ from PySide6.QtCore import (
     QPropertyAnimation,
     QSequentialAnimationGroup,
 )
-from PySide6.QtGui import QFont, QPainter, QResizeEvent
+from PySide6.QtGui import QPainter, QResizeEvent
 from PySide6.QtWidgets import (
     QApplication,
     QFrame,
@@ -17,6 +17,8 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from src.ui.theme import get_font, get_theme_manager, set_state
+
 
 class SummaryCardWidget(QFrame):
     """Card widget for displaying a summary value with animation."""
@@ -35,20 +37,13 @@ class SummaryCardWidget(QFrame):
         self.animations_group = QSequentialAnimationGroup(self)
         self.animations_group.addAnimation(self.hover_animation)
 
+        # Styled by the application theme (src.ui.theme) through the
+        # object names of the card and its labels.
         self.setObjectName("summaryCard")
 
         # Set frame styling
         self.setFrameShape(QFrame.StyledPanel)
         self.setFrameShadow(QFrame.Raised)
-        self.setStyleSheet(
-            """
-            #summaryCard {
-                background-color: white;
-                border-radius: 8px;
-                border: 1px solid #e0e0e0;
-            }
-        """
-        )
 
         main_layout = QVBoxLayout(self)
         main_layout.setSpacing(5)
@@ -56,18 +51,14 @@ class SummaryCardWidget(QFrame):
         # Title label
         self.title_label = QLabel(title)
         self.title_label.setObjectName("cardTitle")
-        self.title_label.setStyleSheet("color: #333744; font-size: 14px;")
 
         value_layout = QHBoxLayout()
 
         # Value label
         self.value_label = QLabel(value)
         self.value_label.setObjectName("cardValue")
-        self.value_label.setFont(QFont("Roboto", 14))
-        color = "#1E74EB" if is_positive else "#992E2E"
-        self.value_label.setStyleSheet(
-            f"color: {color}; font-size: 20px; font-weight: bold;"
-        )
+        self.value_label.setFont(get_font("summary_value"))
+        self.set_positive(is_positive)
 
         value_layout.addWidget(self.value_label)
         value_layout.addStretch()
@@ -76,6 +67,10 @@ class SummaryCardWidget(QFrame):
         main_layout.addLayout(value_layout)
         main_layout.addStretch()
 
+    def set_positive(self, is_positive: bool) -> None:
+        """Colours the value as positive or negative."""
+        set_state(self.value_label, "trend", "positive" if is_positive else "negative")
+
     def start_hover_animation(self):
         """Trigger hover animation based on hover state."""
         self.animations_group.stop()
@@ -146,6 +141,7 @@ if __name__ == "__main__":
     import sys
 
     app = QApplication(sys.argv)
+    get_theme_manager().apply()
     summary_card_widget = SummaryCardWidget("no", "200")
     widget = QWidget()
     widget.setLayout(QHBoxLayout())
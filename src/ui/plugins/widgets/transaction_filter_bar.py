@@ -0,0 +1,153 @@
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, Optional
+
+from PySide6.QtCore import QDate, Signal
+from PySide6.QtGui import QDoubleValidator
+from PySide6.QtWidgets import (
+    QComboBox,
+    QDateEdit,
+    QHBoxLayout,
+    QLineEdit,
+    QPushButton,
+    QWidget,
+)
+
+from src.core.transactions_management import TransactionFilter
+
+# Date edits at this date show "Any date" and leave that end of the range open.
+NO_DATE = QDate(2000, 1, 1)
+
+
+def _day_start(date: QDate) -> float:
+    """Seconds since the epoch at the start of ``date`` in UTC, as parse_timestamp."""
+    return datetime(
+        date.year(), date.month(), date.day(), tzinfo=timezone.utc
+    ).timestamp()
+
+
+class TransactionFilterBar(QWidget):
+    """
+    Controls above the transaction table for filtering it by status,
+    account, date range and amount range. Emits filter_changed with the
+    resulting TransactionFilter, or None when every control is cleared.
+    """
+
+    filter_changed = Signal(object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setObjectName("transactionFilterBar")
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        self._last_filter: Optional[TransactionFilter] = None
+
+        self.status_box = QComboBox(self)
+        self.account_box = QComboBox(self)
+        self.set_options((), ())
+        self.status_box.currentIndexChanged.connect(self._emit_filter)
+        self.account_box.currentIndexChanged.connect(self._emit_filter)
+
+        self.start_edit = self._date_edit("From: any date")
+        self.end_edit = self._date_edit("To: any date")
+
+        self.min_amount_edit = self._amount_edit("Min amount")
+        self.max_amount_edit = self._amount_edit("Max amount")
+
+        self.clear_button = QPushButton("Clear", self)
+        self.clear_button.clicked.connect(self.clear)
+
+        self._controls = (
+            self.status_box,
+            self.account_box,
+            self.start_edit,
+            self.end_edit,
+            self.min_amount_edit,
+            self.max_amount_edit,
+        )
+        for widget in (*self._controls, self.clear_button):
+            layout.addWidget(widget)
+
+    def _date_edit(self, any_text: str) -> QDateEdit:
+        edit = QDateEdit(self)
+        edit.setCalendarPopup(True)
+        edit.setDisplayFormat("yyyy-MM-dd")
+        edit.setMinimumDate(NO_DATE)
+        edit.setSpecialValueText(any_text)
+        edit.setDate(NO_DATE)
+        edit.dateChanged.connect(self._emit_filter)
+        return edit
+
+    def _amount_edit(self, placeholder: str) -> QLineEdit:
+        edit = QLineEdit(self)
+        edit.setPlaceholderText(placeholder)
+        edit.setValidator(QDoubleValidator(edit))
+        edit.setClearButtonEnabled(True)
+        edit.editingFinished.connect(self._emit_filter)
+        return edit
+
+    def set_options(self, statuses: Iterable[str], accounts: Iterable[str]) -> None:
+        """
+        Lists the statuses and accounts that can be picked, keeping the
+        current choices, without emitting filter_changed.
+        """
+        for box, any_text, values in (
+            (self.status_box, "All statuses", statuses),
+            (self.account_box, "All accounts", accounts),
+        ):
+            current = box.currentData()
+            values = sorted(set(values) | ({current} if current else set()))
+            box.blockSignals(True)
+            box.clear()
+            box.addItem(any_text, None)
+            for value in values:
+                box.addItem(value, value)
+            box.setCurrentIndex(max(0, box.findData(current)))
+            box.blockSignals(False)
+
+    def current_filter(self) -> Optional[TransactionFilter]:
+        """Returns the filter the controls describe, or None if they are all clear."""
+        status = self.status_box.currentData()
+        account = self.account_box.currentData()
+        start, end = self.start_edit.date(), self.end_edit.date()
+        row_filter = TransactionFilter(
+            statuses={status} if status else None,
+            accounts={account} if account else None,
+            start=_day_start(start) if start != NO_DATE else None,
+            # The whole end day is included.
+            end=(
+                _day_start(end) + timedelta(days=1).total_seconds() - 1e-3
+                if end != NO_DATE
+                else None
+            ),
+            min_amount=self._amount(self.min_amount_edit),
+            max_amount=self._amount(self.max_amount_edit),
+        )
+        return None if row_filter == TransactionFilter() else row_filter
+
+    @staticmethod
+    def _amount(edit: QLineEdit) -> Optional[float]:
+        try:
+            return float(edit.text())
+        except ValueError:
+            return None
+
+    def clear(self) -> None:
+        """Resets every control, emitting filter_changed(None) once if any was set."""
+        for widget in self._controls:
+            widget.blockSignals(True)
+        self.status_box.setCurrentIndex(0)
+        self.account_box.setCurrentIndex(0)
+        self.start_edit.setDate(NO_DATE)
+        self.end_edit.setDate(NO_DATE)
+        self.min_amount_edit.clear()
+        self.max_amount_edit.clear()
+        for widget in self._controls:
+            widget.blockSignals(False)
+        self._emit_filter()
+
+    def _emit_filter(self, *args) -> None:
+        # editingFinished fires on every focus change; only changes count.
+        row_filter = self.current_filter()
+        if row_filter != self._last_filter:
+            self._last_filter = row_filter
+            self.filter_changed.emit(row_filter)
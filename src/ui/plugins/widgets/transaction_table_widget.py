@@ -1,49 +1,924 @@
-from typing import List
+import logging
+import math
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 
-from PySide6.QtGui import QStandardItem, QStandardItemModel
-from PySide6.QtWidgets import QAbstractItemView, QApplication, QSizePolicy, QTableView
+import numpy as np
+from PySide6.QtCore import (
+    QAbstractItemModel,
+    QAbstractProxyModel,
+    QAbstractTableModel,
+    QEvent,
+    QModelIndex,
+    QPersistentModelIndex,
+    Qt,
+    QTimer,
+    Signal,
+    Slot,
+)
+from PySide6.QtGui import QFontMetrics
+from PySide6.QtWidgets import (
+    QAbstractItemView,
+    QApplication,
+    QHeaderView,
+    QSizePolicy,
+    QTableView,
+)
+
+from src.controllers.workers import JobPriority, Worker, WorkerPool, get_worker_pool
+from src.core.transactions_management import (
+    NO_CODE,
+    TransactionColumns,
+    TransactionFilter,
+    TransactionIndex,
+    is_newer,
+)
+
+logger = logging.getLogger(__name__)
+
+ModelIndex = QModelIndex | QPersistentModelIndex
+# The invalid index, i.e. the table's root.
+ROOT = QModelIndex()
 
 
 class Transaction:
-    def __init__(self, amount, date, account_name, balance, status):
+    def __init__(
+        self, amount, date, account_name, balance, status, transaction_id=None
+    ):
         self.amount = amount
         self.date = date
         self.account_name = account_name
         self.balance = balance
         self.status = status
+        self.transaction_id = transaction_id
 
 
-class TransactionTableModel(QStandardItemModel):
-    def __init__(self, transactions: List[Transaction]):
-        super().__init__()
-        self.transaction = transactions
+def _format_amount(value: float) -> str:
+    return "" if math.isnan(value) else f"{value:.2f}"
+
+
+class BaseTransactionTableModel(QAbstractTableModel):
+    """
+    Read-only table of transactions held in TransactionColumns.
+
+    Nothing is created per row: data() formats a cell from the columns
+    when the view asks for it, which it only does for visible rows.
+    Subclasses decide where a row's columns live via _locate.
+    """
+
+    HEADERS = ("Account name", "Amount", "Balance", "Date", "Status")
+    ACCOUNT_NAME, AMOUNT, BALANCE, DATE, STATUS = range(5)
+
+    def _locate(self, row: int) -> Tuple[Optional[TransactionColumns], int]:
+        """Returns the columns holding ``row`` and its index in them."""
+        raise NotImplementedError
+
+    def _stores(self) -> Iterable[TransactionColumns]:
+        """Returns every TransactionColumns currently held."""
+        raise NotImplementedError
+
+    def columnCount(self, parent: ModelIndex = ROOT) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index: ModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+        columns, row = self._locate(index.row())
+        if columns is None:
+            return None
+        column = index.column()
+        if column == self.ACCOUNT_NAME:
+            return columns.account_names.decode(int(columns.account[row]))
+        if column == self.AMOUNT:
+            return _format_amount(columns.amount[row])
+        if column == self.BALANCE:
+            return _format_amount(columns.balance[row])
+        if column == self.DATE:
+            return columns.date_text(row)
+        if column == self.STATUS:
+            return columns.statuses.decode(int(columns.status[row]))
+        return None
+
+    def headerData(
+        self,
+        section: int,
+        orientation: Qt.Orientation,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return section + 1
+
+    def width_candidates(self, column: int) -> List[str]:
+        """
+        Returns the cell texts likely to be the widest in ``column``: the
+        longest account names, statuses and dates, and the extreme amounts.
+        """
+        candidates: List[str] = []
+        for columns in self._stores():
+            if column == self.DATE:
+                candidates.extend(columns.widest_date_texts())
+            elif column == self.ACCOUNT_NAME:
+                candidates.extend(columns.account_names.values)
+            elif column == self.STATUS:
+                candidates.extend(columns.statuses.values)
+            elif column in (self.AMOUNT, self.BALANCE) and len(columns):
+                values = columns.amount if column == self.AMOUNT else columns.balance
+                if not np.isnan(values).all():
+                    candidates.append(_format_amount(np.nanmin(values)))
+                    candidates.append(_format_amount(np.nanmax(values)))
+        return sorted(set(candidates), key=len)[-3:]
+
+    def distinct_values(self, column: int) -> List[str]:
+        """
+        Returns the account names or statuses (for the ACCOUNT_NAME and
+        STATUS columns) of the rows held, sorted, e.g. to offer as filters.
+        """
+        values = set()
+        for columns in self._stores():
+            if column == self.ACCOUNT_NAME:
+                values.update(columns.account_names.values)
+            elif column == self.STATUS:
+                values.update(columns.statuses.values)
+        values.discard("")
+        return sorted(values)
 
-        self.setHorizontalHeaderLabels(
-            ["Account name", "Amount", "Balance", "Date", "Status"]
+    def transaction_at(self, row: int) -> Transaction:
+        """Rebuilds the Transaction shown in ``row``."""
+        columns, offset = self._locate(row)
+        transaction_id = None
+        if columns is not None and columns.id[offset] != NO_CODE:
+            transaction_id = int(columns.id[offset])
+        return Transaction(
+            *(
+                self.data(self.index(row, column))
+                for column in (
+                    self.AMOUNT,
+                    self.DATE,
+                    self.ACCOUNT_NAME,
+                    self.BALANCE,
+                    self.STATUS,
+                )
+            ),
+            transaction_id=transaction_id,
         )
+
+
+class TransactionTableModel(BaseTransactionTableModel):
+    """
+    Transactions held in memory in a single TransactionColumns.
+
+    Transactions merged in later with apply_changes are appended to the
+    columns; row_order lists them first, newest first, for views that
+    show the rows in the order the server sent them.
+    """
+
+    def __init__(self, transactions: Iterable[Transaction] = (), parent=None):
+        super().__init__(parent)
+        self.columns = TransactionColumns()
+        self.columns.extend(transactions)
+        # Rows added by apply_changes, oldest first.
+        self._merged_rows: List[int] = []
+
+    def _locate(self, row: int) -> Tuple[Optional[TransactionColumns], int]:
+        return self.columns, row
+
+    def _stores(self) -> Iterable[TransactionColumns]:
+        return (self.columns,)
+
+    def rowCount(self, parent: ModelIndex = ROOT) -> int:
+        return 0 if parent.isValid() else len(self.columns)
+
+    def append_transactions(self, transactions: Iterable[Transaction]) -> int:
+        """
+        Appends transactions as a single row insertion, so attached views
+        update once per batch instead of once per row.
+
+        :return: The number of rows appended.
+        """
+        transactions = list(transactions)
+        if not transactions:
+            return 0
+        first = len(self.columns)
+        self.beginInsertRows(QModelIndex(), first, first + len(transactions) - 1)
+        self.columns.extend(transactions)
+        self.endInsertRows()
+        return len(transactions)
+
+    @property
+    def newest_id(self) -> Optional[int]:
+        """The largest transaction id held, e.g. for a since_id query."""
+        return self.columns.newest_id
+
+    @property
+    def row_order(self) -> Optional[np.ndarray]:
+        """
+        The rows newest first: those merged by apply_changes above the
+        rest. None while nothing was merged, i.e. the rows are in order.
+        """
+        if not self._merged_rows:
+            return None
+        merged = np.array(self._merged_rows[::-1])
+        rest = np.ones(len(self.columns), dtype=bool)
+        rest[merged] = False
+        return np.concatenate([merged, np.flatnonzero(rest)])
+
+    def apply_changes(self, transactions: List[Transaction]) -> Tuple[int, int]:
+        """
+        Merges transactions fetched since the rows were loaded, newest
+        first, like PagedTransactionTableModel.apply_changes: held ones
+        (matched by transaction_id) are updated in place, with a single
+        dataChanged, and those newer than newest_id are appended in one
+        batch. Older ones that are not held are dropped.
+        :return: The number of rows inserted and updated.
+        """
+        newest_id = self.newest_id
+        new = []
+        updated = []
         for transaction in transactions:
-            amountItem = QStandardItem(str(transaction.amount))
-            dateItem = QStandardItem(transaction.date)
-            accountNameItem = QStandardItem(transaction.account_name)
-            balanceItem = QStandardItem(str(transaction.balance))
-            statusItem = QStandardItem(transaction.status)
+            row = self.columns.find(transaction.transaction_id)
+            if row is None:
+                if is_newer(transaction.transaction_id, newest_id):
+                    new.append(transaction)
+                continue
+            self.columns.update(row, transaction)
+            updated.append(row)
+        if updated:
+            self.dataChanged.emit(
+                self.index(min(updated), 0),
+                self.index(max(updated), self.columnCount() - 1),
+            )
+        first = len(self.columns)
+        self._merged_rows.extend(range(first, first + len(new)))
+        self.append_transactions(reversed(new))
+        return len(new), len(updated)
+
+    def clear(self) -> None:
+        self.beginResetModel()
+        self.columns.clear()
+        self._merged_rows = []
+        self.endResetModel()
+
+
+class TransactionSortFilterModel(QAbstractProxyModel):
+    """
+    Sorted and filtered view of a TransactionTableModel.
+
+    Sorting uses a TransactionIndex, so each column is sorted by its typed
+    value (amounts numerically, dates chronologically) once and the
+    permutation reused; filters are numpy masks over the columns. Neither
+    formats or compares cell strings, so re-sorting or re-filtering 100k
+    rows takes milliseconds.
+    """
+
+    SORT_KEYS = {
+        BaseTransactionTableModel.ACCOUNT_NAME: "account",
+        BaseTransactionTableModel.AMOUNT: "amount",
+        BaseTransactionTableModel.BALANCE: "balance",
+        BaseTransactionTableModel.DATE: "timestamp",
+        BaseTransactionTableModel.STATUS: "status",
+    }
+
+    def __init__(self, source: TransactionTableModel, parent=None):
+        super().__init__(parent)
+        self._sort_column = -1
+        self._sort_order = Qt.SortOrder.AscendingOrder
+        self._filter: Optional[TransactionFilter] = None
+        self._rows = np.arange(0)
+        self._source_rows: Optional[np.ndarray] = None
+        self.setSourceModel(source)
+
+    def setSourceModel(self, source: TransactionTableModel) -> None:
+        old_source = self.sourceModel()
+        if old_source is not None:
+            for signal in self._source_signals(old_source):
+                signal.disconnect(self._source_changed)
+        super().setSourceModel(source)
+        # Qt doesn't own the source; keep it alive as long as the proxy.
+        self._source = source
+        self.sort_index = TransactionIndex(source.columns)
+        for signal in self._source_signals(source):
+            signal.connect(self._source_changed)
+        self._refresh()
+
+    @staticmethod
+    def _source_signals(source):
+        return (
+            source.modelReset,
+            source.layoutChanged,
+            source.rowsInserted,
+            source.dataChanged,
+        )
+
+    @property
+    def row_filter(self) -> Optional[TransactionFilter]:
+        return self._filter
+
+    @property
+    def sort_column(self) -> int:
+        """The column sorted by, or -1 for the source order."""
+        return self._sort_column
+
+    @property
+    def sort_order(self) -> Qt.SortOrder:
+        return self._sort_order
+
+    def set_filter(self, row_filter: Optional[TransactionFilter]) -> None:
+        """Shows only the rows matching ``row_filter``, or all if None."""
+        self._filter = row_filter
+        self._refresh()
+
+    def sort(
+        self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder
+    ) -> None:
+        """Sorts by ``column``; -1 restores the source order."""
+        self._sort_column, self._sort_order = column, order
+        self._refresh()
+
+    @property
+    def newest_id(self) -> Optional[int]:
+        """The largest transaction id held, e.g. for a since_id query."""
+        return self._source.newest_id
+
+    def apply_changes(self, transactions: List[Transaction]) -> Tuple[int, int]:
+        """
+        Merges newer transactions into the source (see
+        TransactionTableModel.apply_changes); the rows shown are sorted
+        and filtered again.
+        :return: The number of rows inserted and updated.
+        """
+        return self._source.apply_changes(transactions)
+
+    def _source_changed(self, *args) -> None:
+        self.sort_index.invalidate()
+        self._refresh()
+
+    def _refresh(self) -> None:
+        self.beginResetModel()
+        self._rows = self.sort_index.rows(
+            self.SORT_KEYS.get(self._sort_column),
+            self._sort_order == Qt.SortOrder.DescendingOrder,
+            self._filter,
+            self._source.row_order,
+        )
+        self._source_rows = None
+        self.endResetModel()
+
+    def rowCount(self, parent: ModelIndex = ROOT) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: ModelIndex = ROOT) -> int:
+        return 0 if parent.isValid() else self._source.columnCount()
+
+    def index(self, row: int, column: int, parent: ModelIndex = ROOT) -> QModelIndex:
+        if parent.isValid() or not self.hasIndex(row, column, parent):
+            return QModelIndex()
+        return self.createIndex(row, column)
+
+    def parent(self, index: ModelIndex = ROOT) -> QModelIndex:
+        return QModelIndex()
+
+    def mapToSource(self, proxy_index: ModelIndex) -> QModelIndex:
+        if not proxy_index.isValid():
+            return QModelIndex()
+        return self.sourceModel().index(
+            int(self._rows[proxy_index.row()]), proxy_index.column()
+        )
+
+    def mapFromSource(self, source_index: ModelIndex) -> QModelIndex:
+        if not source_index.isValid():
+            return QModelIndex()
+        if self._source_rows is None:
+            # Built on first use only; views rarely map this way round.
+            self._source_rows = np.full(self.sourceModel().rowCount(), -1)
+            self._source_rows[self._rows] = np.arange(len(self._rows))
+        row = int(self._source_rows[source_index.row()])
+        return self.index(row, source_index.column()) if row >= 0 else QModelIndex()
+
+    def headerData(
+        self,
+        section: int,
+        orientation: Qt.Orientation,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ):
+        return self.sourceModel().headerData(section, orientation, role)
+
+    def width_candidates(self, column: int) -> List[str]:
+        return self.sourceModel().width_candidates(column)
+
+    def distinct_values(self, column: int) -> List[str]:
+        return self.sourceModel().distinct_values(column)
+
+    def transaction_at(self, row: int) -> Transaction:
+        return self.sourceModel().transaction_at(int(self._rows[row]))
+
+
+PageFetcher = Callable[[int, int], List[Transaction]]
 
-            new_row = [accountNameItem, amountItem, balanceItem, dateItem, statusItem]
 
-            self.appendRow(new_row)
+class PagedTransactionTableModel(BaseTransactionTableModel):
+    """
+    Transactions loaded page by page from the server as the view scrolls.
+
+    canFetchMore/fetchMore load the next page on the shared WorkerPool,
+    and the view reports its visible rows through note_visible_rows so the
+    next page is requested before the user reaches the end. At most
+    ``max_pages`` pages stay in memory: the ones farthest from the
+    viewport are evicted and fetched again when they scroll back in.
+
+    Transactions that arrive later are merged in with apply_changes. New
+    ones are shown above the pages, in a head block that is never evicted,
+    and page offsets on the server are shifted past them.
+
+    Only some pages are held, so the rows can't be sorted here; sort()
+    emits sort_requested for the owner to show every transaction in a
+    TransactionSortFilterModel instead.
+    """
+
+    page_failed = Signal(str)
+    sort_requested = Signal(int, Qt.SortOrder)
+
+    def __init__(
+        self,
+        fetch_page: PageFetcher,
+        page_size: int = 100,
+        first_page: Optional[List[Transaction]] = None,
+        prefetch_fraction: float = 0.75,
+        max_pages: int = 50,
+        retry_delay: float = 5.0,
+        worker_pool: Optional[WorkerPool] = None,
+        parent=None,
+    ):
+        """
+        :param fetch_page: Blocking ``fetch_page(offset, limit)`` returning
+        up to ``limit`` transactions; it runs on a worker thread.
+        :param page_size: Rows per page.
+        :param first_page: The first page if it was already fetched.
+        :param prefetch_fraction: Fraction of the loaded rows the viewport
+        passes before the next page is requested.
+        :param max_pages: Pages kept in memory at most.
+        :param retry_delay: Seconds before a failed page is requested again.
+        :param worker_pool: Pool pages are fetched on; defaults to the
+        application wide pool.
+        """
+        super().__init__(parent)
+        self.fetch_page = fetch_page
+        self.page_size = page_size
+        self.prefetch_fraction = prefetch_fraction
+        self.max_pages = max(1, max_pages)
+        self.retry_delay = retry_delay
+        self.worker_pool = worker_pool or get_worker_pool()
+        self._pages: Dict[int, TransactionColumns] = {}
+        self._in_flight: Dict[int, Worker] = {}
+        self._failed_at: Dict[int, float] = {}
+        self._row_count = 0
+        # Transactions added by apply_changes, oldest first, so new ones
+        # are appended; they are shown newest first above the pages.
+        self._head = TransactionColumns()
+        self._exhausted = False
+        self._visible = (0, 0)
+        # Bumped on clear, so results of older fetches are dropped.
+        self._generation = 0
+        if first_page is not None:
+            self._add_page(0, first_page)
+
+    @property
+    def loaded_pages(self) -> List[int]:
+        return sorted(self._pages)
+
+    @property
+    def exhausted(self) -> bool:
+        """True once the server returned a short (last) page."""
+        return self._exhausted
+
+    @property
+    def newest_id(self) -> Optional[int]:
+        """The largest transaction id loaded, e.g. for a since_id query."""
+        ids = [columns.newest_id for columns in self._stores()]
+        return max((i for i in ids if i is not None), default=None)
+
+    def _locate(self, row: int) -> Tuple[Optional[TransactionColumns], int]:
+        head = len(self._head)
+        if row < head:
+            return self._head, head - 1 - row
+        page, offset = divmod(row - head, self.page_size)
+        columns = self._pages.get(page)
+        if columns is None or offset >= len(columns):
+            return None, 0
+        return columns, offset
+
+    def _stores(self) -> Iterable[TransactionColumns]:
+        return [self._head, *self._pages.values()]
+
+    def rowCount(self, parent: ModelIndex = ROOT) -> int:
+        return 0 if parent.isValid() else len(self._head) + self._row_count
+
+    def sort(
+        self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder
+    ) -> None:
+        """Emits sort_requested; -1, the order the pages came in, is ignored."""
+        if column >= 0:
+            self.sort_requested.emit(column, order)
+
+    def canFetchMore(self, parent: ModelIndex = ROOT) -> bool:
+        if parent.isValid() or self._exhausted:
+            return False
+        return self._can_request(self._next_page)
+
+    def fetchMore(self, parent: ModelIndex = ROOT) -> None:
+        if self.canFetchMore(parent):
+            self._request_page(self._next_page)
+
+    @property
+    def _next_page(self) -> int:
+        return math.ceil(self._row_count / self.page_size)
+
+    def note_visible_rows(self, first: int, last: int) -> None:
+        """
+        Called by the view with the rows it shows. Prefetches the next page
+        past ``prefetch_fraction``, refetches evicted pages in view and
+        evicts the pages farthest away.
+        """
+        if self._row_count == 0:
+            return
+        # Pages are counted from the first row below the head.
+        head = len(self._head)
+        first = max(0, first - head)
+        last = min(max(first, last - head), self._row_count - 1)
+        self._visible = (first // self.page_size, last // self.page_size)
+        for page in range(self._visible[0], self._visible[1] + 1):
+            if page not in self._pages and self._can_request(page):
+                self._request_page(page, JobPriority.HIGH)
+        if last + 1 >= self.prefetch_fraction * self._row_count:
+            self.fetchMore()
+        self._evict()
+
+    def clear(self) -> None:
+        """Drops every page and starts over from the first one."""
+        self.beginResetModel()
+        for worker in self._in_flight.values():
+            self.worker_pool.cancel(worker)
+        self._generation += 1
+        self._pages.clear()
+        self._in_flight.clear()
+        self._failed_at.clear()
+        self._row_count = 0
+        self._head = TransactionColumns()
+        self._exhausted = False
+        self.endResetModel()
+
+    def apply_changes(self, transactions: List[Transaction]) -> Tuple[int, int]:
+        """
+        Merges transactions fetched since the last load, newest first.
+
+        Transactions already loaded (matched by transaction_id) are updated
+        in place and those newer than newest_id are inserted at the top in
+        one batch. Older ones that are not loaded, e.g. history from a
+        backend that ignored since_id, are dropped; their pages show them
+        when loaded.
+        :return: The number of rows inserted and updated.
+        """
+        newest_id = self.newest_id
+        new = []
+        updated = 0
+        for transaction in transactions:
+            row = self._find(transaction.transaction_id)
+            if row is None:
+                if is_newer(transaction.transaction_id, newest_id):
+                    new.append(transaction)
+                continue
+            columns, offset = self._locate(row)
+            columns.update(offset, transaction)
+            self.dataChanged.emit(
+                self.index(row, 0), self.index(row, self.columnCount() - 1)
+            )
+            updated += 1
+        if new:
+            self.beginInsertRows(QModelIndex(), 0, len(new) - 1)
+            self._head.extend(reversed(new))
+            self.endInsertRows()
+        return len(new), updated
+
+    def refresh_visible_pages(self) -> int:
+        """
+        Fetches the loaded pages in view again; they replace the rows in
+        place, so changes to transactions already shown (e.g. a pending one
+        that settled) appear. A since_id query only returns newer
+        transactions, so this is how such updates are picked up.
+        :return: The number of pages requested.
+        """
+        low, high = self._visible
+        pages = [
+            page
+            for page in range(low, high + 1)
+            if page in self._pages and page not in self._in_flight
+        ]
+        for page in pages:
+            self._request_page(page, JobPriority.HIGH)
+        return len(pages)
+
+    def _find(self, transaction_id) -> Optional[int]:
+        """Returns the row showing ``transaction_id``, or None."""
+        if transaction_id is None:
+            return None
+        head = len(self._head)
+        offset = self._head.find(transaction_id)
+        if offset is not None:
+            return head - 1 - offset
+        for page, columns in self._pages.items():
+            offset = columns.find(transaction_id)
+            if offset is not None:
+                return head + page * self.page_size + offset
+        return None
+
+    # ============================
+    # Page loading
+    # ============================
+
+    def _can_request(self, page: int) -> bool:
+        if page in self._in_flight:
+            return False
+        failed_at = self._failed_at.get(page)
+        return failed_at is None or time.monotonic() - failed_at >= self.retry_delay
+
+    def _request_page(
+        self, page: int, priority: JobPriority = JobPriority.NORMAL
+    ) -> None:
+        worker = Worker(self._load_page, self._generation, page, len(self._head))
+        # Connect before starting; a bound slot is dropped with the model.
+        worker.signals.finished.connect(self._on_page_loaded)
+        self._in_flight[page] = worker
+        self.worker_pool.start(worker, priority)
+
+    def _load_page(self, generation: int, page: int, head: int) -> tuple:
+        # Runs on a worker thread; errors are returned, not raised, so the
+        # result always says which page it belongs to. The server lists the
+        # head's transactions first, so its offsets are shifted past them.
+        try:
+            transactions = self.fetch_page(head + page * self.page_size, self.page_size)
+        except Exception as e:
+            return generation, page, head, None, str(e)
+        return generation, page, head, list(transactions), None
+
+    @Slot(object)
+    def _on_page_loaded(self, result: tuple) -> None:
+        generation, page, head, transactions, error = result
+        if generation != self._generation:
+            return
+        self._in_flight.pop(page, None)
+        if head != len(self._head):
+            # New transactions were merged in meanwhile, so the page was
+            # read at a stale offset.
+            self._request_page(page, JobPriority.HIGH)
+            return
+        if error is not None:
+            logger.error(f"Failed to load transaction page {page}: {error}")
+            self._failed_at[page] = time.monotonic()
+            self.page_failed.emit(error)
+            return
+        self._failed_at.pop(page, None)
+        self._add_page(page, transactions)
+        self._evict()
+
+    def _add_page(self, page: int, transactions: List[Transaction]) -> None:
+        first = page * self.page_size
+        head = len(self._head)
+        if first < self._row_count:
+            # An evicted page fetched again; only as many rows as it had
+            # before are kept, so the row count stays stable.
+            columns = TransactionColumns(self.page_size)
+            columns.extend(transactions[: min(self.page_size, self._row_count - first)])
+            self._pages[page] = columns
+            if len(columns):
+                self.dataChanged.emit(
+                    self.index(head + first, 0),
+                    self.index(head + first + len(columns) - 1, self.columnCount() - 1),
+                )
+            return
+
+        if len(transactions) < self.page_size:
+            self._exhausted = True
+        if not transactions:
+            return
+        columns = TransactionColumns(self.page_size)
+        self.beginInsertRows(
+            QModelIndex(), head + first, head + first + len(transactions) - 1
+        )
+        columns.extend(transactions)
+        self._pages[page] = columns
+        self._row_count = first + len(transactions)
+        self.endInsertRows()
+
+    def _evict(self) -> None:
+        """Drops the loaded pages farthest from the visible ones."""
+        excess = len(self._pages) - self.max_pages
+        if excess <= 0:
+            return
+        low, high = self._visible
+
+        def distance(page: int) -> int:
+            return max(low - page, page - high, 0)
+
+        for page in sorted(self._pages, key=distance, reverse=True)[:excess]:
+            if distance(page) == 0:
+                break
+            del self._pages[page]
+
+
+class ColumnWidthEstimator:
+    """
+    Estimates column widths from a sample of rows instead of every cell.
+
+    The sample is the first and last ``edge_rows`` rows plus, for models
+    that provide ``width_candidates(column)``, the values most likely to be
+    the widest. Measuring a hundred or so strings per column keeps the cost
+    independent of the row count.
+    """
+
+    def __init__(self, edge_rows: int = 50, padding: int = 16):
+        """
+        :param edge_rows: Rows sampled from each end of the table.
+        :param padding: Pixels added to the widest text for cell margins.
+        """
+        self.edge_rows = edge_rows
+        self.padding = padding
+
+    def sample_rows(self, first: int, last: int) -> List[int]:
+        """Returns the rows sampled between ``first`` and ``last`` inclusive."""
+        if last - first + 1 <= 2 * self.edge_rows:
+            return list(range(first, last + 1))
+        return list(range(first, first + self.edge_rows)) + list(
+            range(last - self.edge_rows + 1, last + 1)
+        )
+
+    def estimate(
+        self,
+        model: QAbstractItemModel,
+        font_metrics: QFontMetrics,
+        first: int = 0,
+        last: Optional[int] = None,
+    ) -> List[int]:
+        """
+        Returns a width per column for rows ``first`` to ``last``.
+
+        :param last: Last row to consider; defaults to the model's last row.
+        """
+        last = model.rowCount() - 1 if last is None else last
+        rows = self.sample_rows(first, last) if last >= first else []
+        candidates = getattr(model, "width_candidates", None)
+
+        widths = []
+        for column in range(model.columnCount()):
+            texts = [str(model.headerData(column, Qt.Orientation.Horizontal) or "")]
+            texts.extend(str(model.index(row, column).data() or "") for row in rows)
+            if candidates is not None:
+                texts.extend(candidates(column))
+            widths.append(
+                max(font_metrics.horizontalAdvance(text) for text in texts)
+                + self.padding
+            )
+        return widths
 
 
 class TransactionTableWidget(QTableView):
-    def __init__(self, model):
+    """
+    Table of transactions sized once per data change, not on every paint.
+
+    Column widths come from a ColumnWidthEstimator and are cached until the
+    model resets or gains rows; appended rows can only widen a column.
+    Rows share one fixed height, so the view never measures them. Models
+    that load rows on demand are told which rows are visible as it scrolls.
+    """
+
+    def __init__(self, model, estimator: Optional[ColumnWidthEstimator] = None):
         super().__init__()
+        self.estimator = estimator or ColumnWidthEstimator()
+        self.column_widths: List[int] = []
+        # Coalesces bursts of model changes into a single resize.
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.timeout.connect(self.resize_columns)
+        self._pending_rows: Optional[Tuple[int, int]] = None
+
+        self.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self._update_row_height()
+        self.verticalScrollBar().valueChanged.connect(self.report_visible_rows)
         self.setModel(model)
         self.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Preferred)
 
-    def paintEvent(self, event):
-        super().paintEvent(event)
-        self.resizeColumnsToContents()
-        self.resizeRowsToContents()
+    def setModel(self, model) -> None:
+        old_model = self.model()
+        if old_model is not None:
+            for signal, slot in self._model_connections(old_model):
+                signal.disconnect(slot)
+        super().setModel(model)
+        if model is not None:
+            for signal, slot in self._model_connections(model):
+                signal.connect(slot)
+        # Clicking a header sorts only models that sort by typed values, or
+        # that ask their owner to (PagedTransactionTableModel.sort). The
+        # indicator starts at the model's own sort, by default unsorted in
+        # the order the rows came in.
+        sortable = isinstance(
+            model, (TransactionSortFilterModel, PagedTransactionTableModel)
+        )
+        if sortable:
+            column, order = -1, Qt.SortOrder.AscendingOrder
+            if isinstance(model, TransactionSortFilterModel):
+                column, order = model.sort_column, model.sort_order
+            self.horizontalHeader().setSortIndicator(column, order)
+        self.setSortingEnabled(sortable)
+        self.resize_columns()
+        self.report_visible_rows()
+
+    def _model_connections(self, model):
+        return (
+            (model.modelReset, self._schedule_full_resize),
+            (model.layoutChanged, self._schedule_full_resize),
+            (model.dataChanged, self._schedule_changed_resize),
+            (model.rowsInserted, self._schedule_rows_resize),
+            (model.rowsInserted, self.report_visible_rows),
+        )
+
+    def report_visible_rows(self, *args) -> None:
+        """
+        Tells a model that loads rows on demand (see
+        PagedTransactionTableModel.note_visible_rows) which rows are shown.
+        """
+        model = self.model()
+        note_visible_rows = getattr(model, "note_visible_rows", None)
+        if note_visible_rows is None or not self.isVisible() or not model.rowCount():
+            return
+        first = max(0, self.rowAt(0))
+        last = self.rowAt(self.viewport().height() - 1)
+        note_visible_rows(first, model.rowCount() - 1 if last < 0 else last)
+
+    def _schedule_changed_resize(self, top_left, bottom_right, roles=()) -> None:
+        self._schedule_rows_resize(None, top_left.row(), bottom_right.row())
+
+    def _schedule_full_resize(self, *args) -> None:
+        self._pending_rows = None
+        self.column_widths = []
+        self._resize_timer.start(0)
+
+    def _schedule_rows_resize(self, parent, first: int, last: int) -> None:
+        if not self.column_widths:
+            self._resize_timer.start(0)
+            return
+        if self._pending_rows is not None:
+            first = min(first, self._pending_rows[0])
+            last = max(last, self._pending_rows[1])
+        self._pending_rows = (first, last)
+        self._resize_timer.start(0)
+
+    def resize_columns(self) -> None:
+        """
+        Applies estimated column widths: all rows after a reset, only the
+        pending inserted rows otherwise.
+        """
+        self._resize_timer.stop()
+        model = self.model()
+        if model is None:
+            return
+        if self.column_widths and self._pending_rows is not None:
+            first, last = self._pending_rows
+            widths = [
+                max(old, new)
+                for old, new in zip(
+                    self.column_widths,
+                    self.estimator.estimate(model, self.fontMetrics(), first, last),
+                )
+            ]
+        else:
+            widths = self.estimator.estimate(model, self.fontMetrics())
+        self._pending_rows = None
+
+        if widths == self.column_widths:
+            return
+        self.column_widths = widths
+        header = self.horizontalHeader()
+        for column, width in enumerate(widths):
+            header.resizeSection(column, width)
+
+    def _update_row_height(self) -> None:
+        self.verticalHeader().setDefaultSectionSize(self.fontMetrics().height() + 8)
+
+    def showEvent(self, event) -> None:
+        super().showEvent(event)
+        self.report_visible_rows()
+
+    def resizeEvent(self, event) -> None:
+        super().resizeEvent(event)
+        self.report_visible_rows()
+
+    def changeEvent(self, event) -> None:
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.FontChange:
+            self._update_row_height()
+            self._schedule_full_resize()
 
 
 if __name__ == "__main__":
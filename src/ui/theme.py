@@ -0,0 +1,306 @@
+"""
+Application Theme Module.
+
+The whole application is styled by one style sheet, compiled from a QSS
+template and a colour palette and set on the QApplication. Widgets are
+matched by objectName and by dynamic properties, so they never call
+setStyleSheet themselves; a state such as a positive or negative change is
+a property toggled with set_state. Switching between light and dark sets
+the application style sheet once, which re-polishes every widget in one
+pass. Fonts are shared from a FontCache instead of being built per widget.
+"""
+
+import logging
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from string import Template
+from typing import Any, Dict, Optional, Tuple
+
+from PySide6.QtCore import QObject, Signal
+from PySide6.QtGui import QColor, QFont
+from PySide6.QtWidgets import QApplication, QWidget
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Palette:
+    """The colours a theme is made of."""
+
+    window: str
+    text: str
+    muted_text: str
+    card_background: str
+    card_border: str
+    card_hover_border: str
+    pill_background: str
+    positive: str
+    negative: str
+    neutral: str
+    summary_title: str
+    summary_positive: str
+    summary_negative: str
+    button_background: str
+    button_text: str
+    table_background: str
+    table_alternate: str
+    table_header: str
+
+    def color(self, name: str) -> QColor:
+        return QColor(getattr(self, name))
+
+
+LIGHT = Palette(
+    window="#F5F5F5",
+    text="#000000",
+    muted_text="#BDBDBD",
+    card_background="#FFFFFF",
+    card_border="#E0E0E0",
+    card_hover_border="#757575",
+    pill_background="#BDBDBD",
+    positive="#43A047",
+    negative="#E53935",
+    neutral="#000000",
+    summary_title="#333744",
+    summary_positive="#1E74EB",
+    summary_negative="#992E2E",
+    button_background="#D9D9D9",
+    button_text="#000000",
+    table_background="#FFFFFF",
+    table_alternate="#F7F7F7",
+    table_header="#EEEEEE",
+)
+
+DARK = Palette(
+    window="#1E1F22",
+    text="#E8E8E8",
+    muted_text="#8A8A8A",
+    card_background="#2B2D31",
+    card_border="#3A3C41",
+    card_hover_border="#9E9E9E",
+    pill_background="#4A4C52",
+    positive="#66BB6A",
+    negative="#EF5350",
+    neutral="#E8E8E8",
+    summary_title="#C9CCD6",
+    summary_positive="#5C9CF5",
+    summary_negative="#E57373",
+    button_background="#3A3C41",
+    button_text="#E8E8E8",
+    table_background="#2B2D31",
+    table_alternate="#303237",
+    table_header="#35373C",
+)
+
+THEMES: Dict[str, Palette] = {"light": LIGHT, "dark": DARK}
+DEFAULT_THEME = "light"
+
+# $names are Palette fields; QSS braces stay literal in a string.Template.
+STYLESHEET_TEMPLATE = Template(
+    """
+QMainWindow, QWidget#centralwidget {
+    background-color: $window;
+    color: $text;
+}
+
+QWidget#widget_11 QPushButton {
+    background-color: $button_background;
+    color: $button_text;
+    font-size: 20px;
+}
+
+QFrame#accountCard {
+    background-color: $card_background;
+    border-radius: 5px;
+}
+QFrame#accountCard QWidget {
+    background-color: $card_background;
+    color: $text;
+}
+QFrame#accountCard QLabel#accountNumber {
+    color: $muted_text;
+}
+QFrame#accountCard QLabel#accountRecentChange {
+    background-color: $pill_background;
+    border-radius: 5px;
+    padding: 1px;
+    color: $neutral;
+}
+QFrame#accountCard QLabel#accountRecentChange[trend="positive"] {
+    color: $positive;
+}
+QFrame#accountCard QLabel#accountRecentChange[trend="negative"] {
+    color: $negative;
+}
+
+QFrame#summaryCard {
+    background-color: $card_background;
+    border-radius: 8px;
+    border: 1px solid $card_border;
+}
+QFrame#summaryCard QLabel#cardTitle {
+    color: $summary_title;
+    font-size: 14px;
+}
+QFrame#summaryCard QLabel#cardValue {
+    color: $summary_positive;
+    font-size: 20px;
+    font-weight: bold;
+}
+QFrame#summaryCard QLabel#cardValue[trend="negative"] {
+    color: $summary_negative;
+}
+
+QListView#accountList {
+    background-color: transparent;
+}
+
+QTableView {
+    background-color: $table_background;
+    alternate-background-color: $table_alternate;
+    color: $text;
+    gridline-color: $card_border;
+}
+QHeaderView::section {
+    background-color: $table_header;
+    color: $text;
+    border: none;
+    padding: 4px;
+}
+"""
+)
+
+
+@lru_cache(maxsize=None)
+def compile_stylesheet(theme: str) -> str:
+    """
+    Returns the application style sheet of ``theme``. It is compiled once
+    per theme and reused.
+    """
+    if theme not in THEMES:
+        raise ValueError(f"Unknown theme {theme!r}, expected one of {tuple(THEMES)}.")
+    return STYLESHEET_TEMPLATE.substitute(asdict(THEMES[theme]))
+
+
+# Named fonts: (family, point size, weight, italic).
+FONTS: Dict[str, Tuple[str, int, QFont.Weight, bool]] = {
+    "account_card": ("Roboto", 20, QFont.Normal, False),
+    "account_name": ("Roboto Condensed", 15, QFont.Normal, False),
+    "account_balance": ("Roboto Condensed", 12, QFont.Bold, True),
+    "account_type": ("Roboto", 8, QFont.Normal, False),
+    "account_number": ("Roboto Condensed", 8, QFont.Light, True),
+    "account_recent_change": ("Roboto", 7, QFont.Medium, True),
+    "summary_value": ("Roboto", 14, QFont.Normal, False),
+}
+
+
+class FontCache:
+    """Builds each distinct QFont once and hands out the same instance."""
+
+    def __init__(self):
+        self._fonts: Dict[Tuple[str, int, Any, bool], QFont] = {}
+
+    def __len__(self) -> int:
+        return len(self._fonts)
+
+    def font(
+        self,
+        family: str,
+        point_size: int,
+        weight: QFont.Weight = QFont.Normal,
+        italic: bool = False,
+    ) -> QFont:
+        key = (family, point_size, weight, italic)
+        font = self._fonts.get(key)
+        if font is None:
+            font = self._fonts[key] = QFont(family, point_size, weight, italic)
+            font.setStyleStrategy(QFont.PreferAntialias)
+        return font
+
+    def named(self, name: str) -> QFont:
+        """Returns one of the FONTS by name."""
+        return self.font(*FONTS[name])
+
+    def clear(self) -> None:
+        self._fonts.clear()
+
+
+_font_cache: Optional[FontCache] = None
+
+
+def get_font_cache() -> FontCache:
+    """Returns the application wide FontCache."""
+    global _font_cache
+    if _font_cache is None:
+        _font_cache = FontCache()
+    return _font_cache
+
+
+def get_font(name: str) -> QFont:
+    """Returns one of the FONTS by name, from the application wide cache."""
+    return get_font_cache().named(name)
+
+
+def set_state(widget: QWidget, name: str, value: Any) -> bool:
+    """
+    Sets a dynamic property the style sheet selects on, e.g.
+    ``[trend="negative"]``, and re-polishes only ``widget``.
+    :return: False if the property already had that value.
+    """
+    if widget.property(name) == value:
+        return False
+    widget.setProperty(name, value)
+    style = widget.style()
+    style.unpolish(widget)
+    style.polish(widget)
+    return True
+
+
+class ThemeManager(QObject):
+    """Applies a theme's style sheet to the application and remembers it."""
+
+    theme_changed = Signal(str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._theme = DEFAULT_THEME
+
+    @property
+    def theme(self) -> str:
+        return self._theme
+
+    @property
+    def palette(self) -> Palette:
+        return THEMES[self._theme]
+
+    def apply(self, theme: Optional[str] = None, app: Optional[QApplication] = None):
+        """
+        Sets the style sheet of ``theme`` (default: the current one) on the
+        application, re-polishing every widget once.
+        :param theme: A THEMES name.
+        :param app: The application; defaults to the running one.
+        :return: None
+        """
+        theme = theme or self._theme
+        stylesheet = compile_stylesheet(theme)
+        app = app or QApplication.instance()
+        if app is None:
+            raise RuntimeError("No QApplication to apply the theme to.")
+        changed = theme != self._theme
+        self._theme = theme
+        if app.styleSheet() != stylesheet:
+            app.setStyleSheet(stylesheet)
+            logger.info(f"Applied the {theme} theme")
+        if changed:
+            self.theme_changed.emit(theme)
+
+
+_theme_manager: Optional[ThemeManager] = None
+
+
+def get_theme_manager() -> ThemeManager:
+    """Returns the application wide ThemeManager."""
+    global _theme_manager
+    if _theme_manager is None:
+        _theme_manager = ThemeManager()
+    return _theme_manager
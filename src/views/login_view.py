@@ -26,6 +26,12 @@ class LoginView(QMainWindow, Ui_login_window):
 
         self.model.process_login(username, password, APIClient(), SessionManager())
 
+    def set_busy(self, busy: bool) -> None:
+        """Disables the login form while a login request is in flight."""
+        self.authenticatePushButton.setEnabled(not busy)
+        self.usernameLineEdit.setEnabled(not busy)
+        self.passwordLineEdit.setEnabled(not busy)
+
     def show_success(self, username) -> None:
         """show a success message to user"""
         QMessageBox.information(
@@ -1,16 +1,55 @@
-from PySide6.QtCore import Signal
+import logging
+import time
+from typing import Callable, List, Optional, Tuple, Union
+
+from PySide6.QtCore import Qt, Signal
 from PySide6.QtWidgets import QHBoxLayout, QMainWindow, QVBoxLayout
 
-from src.services.api_client_service import APIClient
+from src.controllers.account_list_controller import AccountListController
+from src.controllers.async_bridge import (
+    AsyncTask,
+    ViewTaskScope,
+    bind_task_to_controller,
+)
+from src.controllers.dashboard_controller import DashboardController
+from src.controllers.workers import JobPriority, Worker
+from src.core.account_management import AccountDirectory
+from src.core.transactions_management import TransactionFilter, is_newer
+from src.services.api_client_service import APIClient, APIClientError
+from src.services.async_api_client import AsyncAPIClient
 from src.ui.generated.main_window_ui import Ui_MainWindow
 from src.ui.plugins.widgets.account_card_widget import AccountCardWidget
+from src.ui.plugins.widgets.account_list_view import AccountListView
 from src.ui.plugins.widgets.summary_card_widget import SummaryCardWidget
+from src.ui.plugins.widgets.transaction_filter_bar import TransactionFilterBar
 from src.ui.plugins.widgets.transaction_table_widget import (
+    PagedTransactionTableModel,
     Transaction,
+    TransactionSortFilterModel,
     TransactionTableModel,
     TransactionTableWidget,
 )
 
+logger = logging.getLogger(__name__)
+
+# Transactions fetched per request as the table scrolls.
+TRANSACTION_PAGE_SIZE = 100
+# Most new transactions merged by one refresh; past that the table reloads.
+TRANSACTION_REFRESH_LIMIT = 500
+# Transactions fetched per request when every transaction is loaded to be
+# sorted or filtered.
+TRANSACTION_FULL_LOAD_PAGE_SIZE = 500
+# Above this many accounts they are painted in an AccountListView instead
+# of one AccountCardWidget each.
+ACCOUNT_LIST_VIEW_THRESHOLD = 50
+# Seconds after a refresh during which showing the window again does not
+# refresh, e.g. when it is minimized and restored in quick succession.
+DASHBOARD_REFRESH_INTERVAL = 30.0
+
+# A load run on the worker pool or, for AsyncAPIClient coroutines, on the
+# asyncio bridge.
+Job = Union[Worker, AsyncTask]
+
 
 class main_window_view(Ui_MainWindow, QMainWindow):
     window_shown = Signal()
@@ -25,8 +64,52 @@ class main_window_view(Ui_MainWindow, QMainWindow):
         self.widget_10.setMaximumWidth(500)
         self._summary_cards_added = False
         self._account_cards_added = False
-        self.cached_user_info = None
         self.api_client = APIClient()
+        self.account_directory = AccountDirectory(self.api_client)
+        self.async_api_client = AsyncAPIClient()
+        # Runs the blocking network calls below on the worker pool.
+        self.controller = DashboardController(self)
+        # Runs the async_api_client coroutines on the asyncio bridge.
+        self.task_scope = ViewTaskScope(self)
+        self.transaction_table = None
+        self.transaction_filter_bar: Optional[TransactionFilterBar] = None
+        # The filter and sort the user picked, kept across table reloads.
+        self._transaction_filter: Optional[TransactionFilter] = None
+        self._transaction_sort: Tuple[int, Qt.SortOrder] = (
+            -1,
+            Qt.SortOrder.AscendingOrder,
+        )
+        # The live table is shown from one of two models: pages fetched as
+        # it scrolls, or every transaction, loaded once it is first sorted
+        # or filtered and reused from then on.
+        self._paged_model: Optional[PagedTransactionTableModel] = None
+        self._full_model: Optional[TransactionSortFilterModel] = None
+        self._full_load: Optional[Worker] = None
+        self.account_cards: Optional[AccountListController] = None
+        self.account_list: Optional[AccountListView] = None
+        self.account_list_threshold = ACCOUNT_LIST_VIEW_THRESHOLD
+        self.cached_user_info = None
+        self._refresh_job: Optional[Job] = None
+        self._last_refresh: Optional[float] = None
+
+    @property
+    def cached_user_info(self):
+        return self._cached_user_info
+
+    @cached_user_info.setter
+    def cached_user_info(self, user_info):
+        # The account directory belongs to the logged-in user, so it is
+        # rebuilt whenever the user info changes.
+        self._cached_user_info = user_info
+        self.account_directory.reset((user_info or {}).get("user_accounts"))
+        if self.account_cards is not None:
+            self._show_accounts()
+
+    def _accounts(self) -> List[dict]:
+        # I know it looks weird, but this is because
+        # of the way that the user_info data is set up.
+        user_accounts = (self.cached_user_info or {}).get("user_accounts") or {}
+        return user_accounts.get("accounts") or []
 
     def addSummaryCards(self):
         """
@@ -49,65 +132,498 @@ class main_window_view(Ui_MainWindow, QMainWindow):
 
     def addAccountCards(self):
         """
-        This method adds the account cards to the dashboard.
-        This method is a work in progress...
+        This method adds the account cards to the dashboard. Later changes
+        to cached_user_info update the cards in place.
         :return: None
         """
-        layout = QVBoxLayout(self.widget_15)
-
-        # I know it looks weird, but this is because
-        # of the way that the user_info data is set up.
-        for account in self.cached_user_info.get("user_accounts").get("accounts"):
-            layout.addWidget(
-                AccountCardWidget(
-                    name=account.get("account_name"),
-                    balance=account.get("balance"),
-                    account_type=account.get("account_type"),
-                    account_number=account.get("account_number"),
-                    recent_change=account.get("latest_balance_change"),
-                )
+        if self.account_cards is None:
+            self.account_cards = AccountListController(
+                self.widget_15, card_factory=AccountCardWidget
             )
+        self._show_accounts()
 
         self._account_cards_added = True
 
-    def addTransactionTable(self):
-        layout = QHBoxLayout(self.widget_17)
+    def _show_accounts(self):
+        """
+        Shows the accounts as cards, or in the delegate painted
+        AccountListView once there are more than account_list_threshold.
+        :return: None
+        """
+        accounts = self._accounts()
+        layout = self.account_cards.layout
+        if len(accounts) <= self.account_list_threshold:
+            if self.account_list is not None and layout.indexOf(self.account_list) >= 0:
+                layout.removeWidget(self.account_list)
+                self.account_list.hide()
+            self.account_cards.set_accounts(accounts)
+            return
+
+        # The cards go back to the pool while the list is shown.
+        self.account_cards.clear()
+        if self.account_list is None:
+            self.account_list = AccountListView(parent=self.widget_15)
+        if layout.indexOf(self.account_list) < 0:
+            layout.addWidget(self.account_list)
+            self.account_list.show()
+        self.account_list.set_accounts(accounts)
+
+    def fetch_transactions(
+        self,
+        api_client: Optional[APIClient] = None,
+        account_directory: Optional[AccountDirectory] = None,
+        offset: int = 0,
+        limit: int = TRANSACTION_PAGE_SIZE,
+        since_id: Optional[int] = None,
+    ) -> List[Transaction]:
+        """
+        Fetches a transaction page and resolves its account names.
+        This blocks on the network, so views call it through
+        load_transaction_table instead of on the GUI thread.
+        :param api_client: Client to fetch with; defaults to the view's own.
+        :param account_directory: Directory to resolve account names with;
+        defaults to the view's own.
+        :param offset: Index of the first transaction of the page.
+        :param limit: Page size.
+        :param since_id: Only fetch transactions newer than this id.
+        :return: The transactions, ready for TransactionTableModel.
+        """
+        api_client = api_client or self.api_client
+        account_directory = account_directory or self.account_directory
+        params = {"limit": limit, "offset": offset}
+        if since_id is not None:
+            params["since_id"] = since_id
+        transactions = api_client.retrieve_user_transactions(**params).get(
+            "transactions"
+        )
+        return self._to_transactions(transactions, account_directory)
+
+    def fetch_all_transactions(
+        self, on_progress: Optional[Callable[[int], None]] = None
+    ) -> List[Transaction]:
+        """
+        Fetches every transaction of the user, for sorting and filtering
+        them all in memory. Blocks on the network, like fetch_transactions.
+        :param on_progress: Called with the number of transactions fetched
+        so far after every page, on the calling thread.
+        :return: The transactions, newest first.
+        """
+        transactions = []
+        for transaction in self.api_client.iter_transactions(
+            page_size=TRANSACTION_FULL_LOAD_PAGE_SIZE
+        ):
+            transactions.append(transaction)
+            if on_progress and len(transactions) % TRANSACTION_FULL_LOAD_PAGE_SIZE == 0:
+                on_progress(len(transactions))
+        return self._to_transactions(transactions, self.account_directory)
+
+    @staticmethod
+    def _to_transactions(
+        transactions: List[dict], account_directory: AccountDirectory
+    ) -> List[Transaction]:
+        # Resolves every row's account name in one pass; accounts that
+        # are not already known are looked up once each, not per row.
+        account_names = account_directory.resolve_transactions(transactions)
+
+        return [
+            Transaction(
+                transaction.get("amount"),
+                str(transaction.get("timestamp")),
+                associated_account_name,
+                transaction.get("balance_after"),
+                transaction.get("status"),
+                transaction.get("id"),
+            )
+            for transaction, associated_account_name in zip(transactions, account_names)
+        ]
+
+    @property
+    def all_transactions_shown(self) -> bool:
+        """True while the table shows every transaction rather than pages."""
+        return self._full_model is not None and self._shown_model() is self._full_model
+
+    def _shown_model(self):
+        return self.transaction_table.model() if self.transaction_table else None
+
+    def populate_transaction_table(
+        self, transactions_list: List[Transaction], paged: bool = False
+    ):
+        """
+        Adds a transaction table showing the given transactions, with the
+        filter bar above it.
+        :param transactions_list: The first page of transactions, or all of
+        them if not paged.
+        :param paged: If True, later pages are fetched as the user scrolls.
+        The pages can't be sorted or filtered in memory; doing so shows
+        every transaction instead (see show_all_transactions).
+        :return: The model shown.
+        """
+        self._transaction_sort = self._current_sort()
+        if paged:
+            model = self._paged_model = self._new_paged_model(transactions_list)
+        else:
+            model = TransactionSortFilterModel(TransactionTableModel(transactions_list))
+            model.set_filter(self._transaction_filter)
+            model.sort(*self._transaction_sort)
+        self._set_transaction_model(model)
+        return model
+
+    def _new_paged_model(
+        self, first_page: List[Transaction]
+    ) -> PagedTransactionTableModel:
+        model = PagedTransactionTableModel(
+            lambda offset, limit: self.fetch_transactions(offset=offset, limit=limit),
+            page_size=TRANSACTION_PAGE_SIZE,
+            first_page=first_page,
+        )
+        model.sort_requested.connect(self.sort_transactions)
+        model.page_failed.connect(self.controller.error_occurred)
+        return model
+
+    def _set_transaction_model(self, model) -> None:
+        """Shows ``model`` in the transaction table, adding the table first."""
+        if self.transaction_table is None:
+            layout = QVBoxLayout(self.widget_17)
+            self.transaction_filter_bar = TransactionFilterBar(self.widget_17)
+            self.transaction_filter_bar.filter_changed.connect(self.filter_transactions)
+            self.transaction_filter_bar.clear_button.clicked.connect(
+                self.clear_transaction_sort
+            )
+            layout.addWidget(self.transaction_filter_bar)
+            self.transaction_table = TransactionTableWidget(model)
+            layout.addWidget(self.transaction_table)
+        elif self.transaction_table.model() is not model:
+            self.transaction_table.setModel(model)
+        self._update_filter_options()
+
+    def _current_sort(self) -> Tuple[int, Qt.SortOrder]:
+        """The sort shown: the table's own if it sorts, else the one picked last."""
+        model = self.transaction_table.model() if self.transaction_table else None
+        if isinstance(model, TransactionSortFilterModel):
+            return model.sort_column, model.sort_order
+        return self._transaction_sort
+
+    def _sorted_or_filtered(self) -> bool:
+        """
+        True if the table shown is sorted or filtered, so it must show
+        every transaction (see show_all_transactions) to stay so.
+        """
+        self._transaction_sort = self._current_sort()
+        return self._transaction_filter is not None or self._transaction_sort[0] >= 0
+
+    def _update_filter_options(self) -> None:
+        """Offers the statuses and accounts of the rows held in the filter bar."""
+        model = self.transaction_table.model()
+        accounts = {account.get("account_name") for account in self._accounts()}
+        accounts.update(model.distinct_values(TransactionTableModel.ACCOUNT_NAME))
+        accounts.discard(None)
+        self.transaction_filter_bar.set_options(
+            model.distinct_values(TransactionTableModel.STATUS), accounts
+        )
+
+    def filter_transactions(self, row_filter: Optional[TransactionFilter]) -> None:
+        """
+        Shows only the transactions matching ``row_filter``, or all if None.
+        See show_transactions for which table shows them.
+        """
+        self._transaction_filter = row_filter
+        self.show_transactions()
+
+    def sort_transactions(self, column: int, order: Qt.SortOrder) -> None:
+        """
+        Sorts a paged table, asked for by its header, by showing every
+        transaction in one that sorts.
+        """
+        self._transaction_sort = (column, order)
+        self.show_transactions()
+
+    def clear_transaction_sort(self) -> None:
+        """
+        Drops the sort along with the filter the filter bar's Clear button
+        drops, so the table goes back to the pages, newest first.
+        """
+        self._transaction_sort = (-1, Qt.SortOrder.AscendingOrder)
+        model = self._shown_model()
+        if isinstance(model, TransactionSortFilterModel):
+            model.sort(*self._transaction_sort)
+        self.show_transactions()
+
+    def show_transactions(self) -> Optional[Worker]:
+        """
+        Shows the transactions as the current sort and filter ask: all of
+        them if sorted or filtered (see show_all_transactions), else the
+        pages. Until the live table is loaded, a table of given
+        transactions, e.g. cached ones, is sorted and filtered as it is.
+        :return: The Worker loading every transaction, if one was started.
+        """
+        model = self._shown_model()
+        if self._paged_model is None and isinstance(model, TransactionSortFilterModel):
+            model.set_filter(self._transaction_filter)
+            return None
+        if self._sorted_or_filtered():
+            return self.show_all_transactions()
+        if self._paged_model is not None:
+            self._set_transaction_model(self._paged_model)
+        return None
+
+    def show_all_transactions(self) -> Optional[Worker]:
+        """
+        Shows every transaction in a TransactionSortFilterModel with the
+        current sort and filter. The columnar model holds 100k transactions
+        in a few megabytes, and sorting and filtering them takes
+        milliseconds, so they are fetched once, on the worker pool, and
+        reused from then on. While they load, the filter bar is disabled
+        and the status bar counts them; a sort picked meanwhile from the
+        header is applied once they are in.
+        :return: The Worker fetching them, or None if they are loaded or
+        already loading.
+        """
+        if self._full_model is not None:
+            self._full_model.set_filter(self._transaction_filter)
+            self._full_model.sort(*self._transaction_sort)
+            self._set_transaction_model(self._full_model)
+            return None
+        if self._full_load is not None and not self._full_load.done():
+            return None
+
+        def loaded(transactions: List[Transaction]) -> None:
+            self._full_model = TransactionSortFilterModel(
+                TransactionTableModel(transactions)
+            )
+            self.show_transactions()
+
+        def done() -> None:
+            if self.transaction_filter_bar is not None:
+                self.transaction_filter_bar.setEnabled(True)
+
+        if self.transaction_filter_bar is not None:
+            self.transaction_filter_bar.setEnabled(False)
+        self._full_load = self.controller.run_in_background(
+            self.fetch_all_transactions,
+            lambda count: self.controller.progress.emit(f"{count:,} transactions"),
+            on_result=loaded,
+            on_done=done,
+        )
+        return self._full_load
+
+    def addTransactionTable(self) -> Worker:
+        """Adds the transaction table without blocking; see load_transaction_table."""
+        return self.load_transaction_table()
+
+    def load_transaction_table(self) -> Worker:
+        """
+        Fetches the first transaction page on the worker pool and adds the
+        table once it arrives; later pages load as the table is scrolled.
+        If the shown table is sorted or filtered, it keeps showing every
+        transaction instead. The fetch is cancelled if the window is hidden
+        first, and errors are shown in the status bar.
+        :return: The Worker running the fetch.
+        """
+        return self.controller.run_in_background(
+            self.fetch_transactions,
+            priority=JobPriority.HIGH,
+            on_result=self._show_first_page,
+        )
+
+    def _show_first_page(self, transactions: List[Transaction]) -> None:
+        """Starts a new paged model at ``transactions`` and shows the table."""
+        if self._sorted_or_filtered():
+            self._paged_model = self._new_paged_model(transactions)
+            self.show_all_transactions()
+        else:
+            self.populate_transaction_table(transactions, paged=True)
+
+    def load_dashboard(self) -> AsyncTask:
+        """
+        Fetches the user info, the first transaction page and the accounts
+        those transactions reference with AsyncAPIClient.load_dashboard,
+        which overlaps the requests, on the asyncio bridge; then shows them.
+        The responses land in the response cache APIClient uses, so they
+        are revalidated by later loads and shown by show_cached_dashboard
+        after a restart.
+        Later pages load on the worker pool as the table is scrolled. The
+        fetch drives the controller's loading and error signals and is
+        cancelled if the window is hidden first.
+        :return: The AsyncTask running the fetch.
+        """
+        task = self.task_scope.run(
+            self.async_api_client.load_dashboard(TRANSACTION_PAGE_SIZE),
+            on_result=self.show_dashboard,
+        )
+        return bind_task_to_controller(task, self.controller)
+
+    def show_dashboard(self, dashboard: dict) -> None:
+        """
+        Shows the result of AsyncAPIClient.load_dashboard. A sorted or
+        filtered table keeps showing every transaction instead.
+        :param dashboard: The user info, the first transaction page and the
+        details of the accounts it references that the user info lacks.
+        :return: None
+        """
+        self.cached_user_info = {
+            "user_profile": dashboard["user_profile"],
+            "user_accounts": dashboard["user_accounts"],
+        }
+        # Already fetched, so resolving the page's names costs no request.
+        for account_number, account in dashboard["account_details"].items():
+            self.account_directory.add_account(
+                {**account, "account_number": account_number}
+            )
+        self._show_first_page(
+            self._to_transactions(
+                dashboard["transactions"].get("transactions") or [],
+                self.account_directory,
+            )
+        )
+
+    def show_cached_dashboard(self, cached_api_client: APIClient) -> bool:
+        """
+        Paints the user info and recent transactions from the last cached
+        responses, without any network request, so a restarted app shows
+        data at once. The regular loads revalidate it afterwards.
+        :param cached_api_client: A cache_only APIClient.
+        :return: False if nothing usable was cached.
+        """
         try:
-            # TODO: Eventually have API provide account_name transaction info instead.
-            transactions = self.api_client.retrieve_user_transactions()
-
-            transactions_list = []
-
-            for transaction in transactions.get("transactions"):
-                # Grabs account info and filters out the request to only the
-                # account name.
-                associated_account_name = self.api_client.get_account_details(
-                    transaction.get("account_from"), "account_name"
-                ).get("account_name")
-
-                transaction_obj = Transaction(
-                    transaction.get("amount"),
-                    str(transaction.get("timestamp")),
-                    associated_account_name,
-                    transaction.get("balance_after"),
-                    transaction.get("status"),
-                )
-                transactions_list.append(transaction_obj)
+            user_info = cached_api_client.retrieve_user_info()
+        except APIClientError as e:
+            logger.debug(f"No cached dashboard to show: {e}")
+            return False
+        self.cached_user_info = user_info
+
+        # A throwaway directory, so accounts missing from the cache are not
+        # remembered as unresolvable once the network is used again.
+        account_directory = AccountDirectory(cached_api_client)
+        account_directory.load_user_accounts(user_info.get("user_accounts"))
+        try:
+            self.populate_transaction_table(
+                self.fetch_transactions(cached_api_client, account_directory)
+            )
+        except APIClientError as e:
+            logger.debug(f"No cached transactions to show: {e}")
+        return True
+
+    def fetch_dashboard_changes(
+        self, since_id: Optional[int]
+    ) -> Tuple[dict, List[Transaction]]:
+        """
+        Fetches what changed since the dashboard was loaded: the user info
+        (revalidated through the response cache, so an unchanged payload
+        costs a 304 at most) and the transactions newer than ``since_id``.
+        The server is only asked for those if it advertises keyset
+        pagination; otherwise the newest transactions are fetched and the
+        ones already shown are dropped here.
+        Blocks on the network, like fetch_transactions.
+        :param since_id: The newest transaction id shown.
+        :return: The user info and the new transactions, newest first.
+        """
+        user_info = self.api_client.retrieve_user_info()
+        # Either client may have seen the backend's first transaction page.
+        keyset_paging = True in (
+            self.api_client.keyset_paging,
+            self.async_api_client.keyset_paging,
+        )
+        transactions = self.fetch_transactions(
+            limit=TRANSACTION_REFRESH_LIMIT,
+            since_id=since_id if keyset_paging else None,
+        )
+        return user_info, [
+            transaction
+            for transaction in transactions
+            if is_newer(transaction.transaction_id, since_id)
+        ]
+
+    def _newest_id(self) -> Optional[int]:
+        """
+        The newest transaction id every live table holds, so the changes
+        fetched since it are new to each; None if one holds none.
+        """
+        ids = [
+            model.newest_id
+            for model in (self._paged_model, self._full_model)
+            if model is not None
+        ]
+        return None if None in ids else min(ids, default=None)
+
+    def apply_dashboard_changes(self, changes: Tuple[dict, List[Transaction]]):
+        """
+        Applies fetched changes to the widgets already shown, as diffs.
+        New transactions are merged into the pages and, if loaded, into
+        every transaction, which stays sorted and filtered as it was. The
+        pages in view are refetched to pick up updates to them if shown.
+        :param changes: The result of fetch_dashboard_changes.
+        :return: None
+        """
+        user_info, transactions = changes
+        if user_info != self.cached_user_info:
+            self.cached_user_info = user_info
 
-            model = TransactionTableModel(transactions_list)
+        if len(transactions) >= TRANSACTION_REFRESH_LIMIT:
+            # Too much is new to merge; start over from the first page.
+            logger.info("Many new transactions, reloading the table")
+            self._full_model = None
+            self.load_transaction_table()
+            return
+        inserted = refreshed = 0
+        for model in (self._paged_model, self._full_model):
+            if model is not None:
+                inserted, _ = model.apply_changes(transactions)
+        if self._paged_model is not None and not self.all_transactions_shown:
+            refreshed = self._paged_model.refresh_visible_pages()
+        self._update_filter_options()
+        logger.debug(
+            f"Dashboard refreshed: {inserted} new transactions, "
+            f"{refreshed} pages in view refetched"
+        )
 
-            table_view = TransactionTableWidget(model)
-            layout.addWidget(table_view)
-        except Exception as e:
-            print(e)
+    def refresh_dashboard(self, force: bool = False) -> Optional[Job]:
+        """
+        Brings the shown dashboard up to date without rebuilding it. The
+        first call, or one without a live transaction table yet, loads it
+        (see load_dashboard).
+        A table showing every transaction gets the changes merged in too,
+        keeping its sort and filter.
+        :param force: Refresh even within DASHBOARD_REFRESH_INTERVAL of the
+        last refresh.
+        :return: The Worker or AsyncTask fetching the changes, or None if
+        nothing was fetched.
+        """
+        if self._refresh_job is not None and not self._refresh_job.done():
+            return None
+        model = self.transaction_table.model() if self.transaction_table else None
+        live = self.all_transactions_shown or isinstance(
+            model, PagedTransactionTableModel
+        )
+        if not live:
+            job = self.load_dashboard()
+        elif not (
+            force
+            or self._last_refresh is None
+            or time.monotonic() - self._last_refresh >= DASHBOARD_REFRESH_INTERVAL
+        ):
+            return None
+        else:
+            job = self.controller.run_in_background(
+                self.fetch_dashboard_changes,
+                self._newest_id(),
+                on_result=self.apply_dashboard_changes,
+            )
+        self._last_refresh = time.monotonic()
+        self._refresh_job = job
+        return job
 
     def initialize_dashboard(self):
         pass
 
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        # Results of pending loads would only update a hidden window.
+        self.controller.cancel_all()
+
     def showEvent(self, event):
         super().showEvent(event)
         if not self._summary_cards_added:
             self.addSummaryCards()
         if not self._account_cards_added:
             self.addAccountCards()
-        self.addTransactionTable()
+        self.refresh_dashboard()
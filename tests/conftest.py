@@ -0,0 +1,48 @@
+import pytest
+
+from benchmarks.stub_server import StubConfig, StubServer
+from src import SingletonMeta
+from src.services.circuit_breaker import reset_circuit_breakers
+from src.services.response_cache import clear_response_cache
+
+
+@pytest.fixture(autouse=True)
+def reset_singletons():
+    """Gives every test fresh singleton instances (e.g. SessionManager)."""
+    SingletonMeta._instances.clear()
+    yield
+    SingletonMeta._instances.clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_response_cache():
+    """Keeps cached API responses and breaker state from leaking between tests."""
+    clear_response_cache()
+    reset_circuit_breakers()
+    yield
+    clear_response_cache()
+    reset_circuit_breakers()
+
+
+@pytest.fixture
+def stub_server_factory():
+    """
+    Starts local BankOps API servers; keyword arguments go to StubConfig.
+    Every server started is stopped after the test.
+    """
+    servers = []
+
+    def start(**config) -> StubServer:
+        server = StubServer(StubConfig(**config)).start()
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.stop()
+
+
+@pytest.fixture
+def stub_server(stub_server_factory):
+    """A local BankOps API server with the default, small dataset."""
+    return stub_server_factory()
@@ -0,0 +1,118 @@
+from unittest.mock import MagicMock
+
+import pytest
+from PySide6.QtWidgets import QWidget
+
+from src.controllers.account_list_controller import AccountListController
+from src.ui.plugins.widgets.account_card_widget import AccountCardWidget
+
+
+def account(number, balance=100, change="5", name=None):
+    return {
+        "account_name": name or f"Account {number}",
+        "balance": balance,
+        "account_type": "Checking",
+        "account_number": number,
+        "latest_balance_change": change,
+    }
+
+
+@pytest.fixture
+def controller(qtbot):
+    container = QWidget()
+    qtbot.add_widget(container)
+    factory = MagicMock(side_effect=AccountCardWidget)
+    return AccountListController(container, card_factory=factory, pool_size=2)
+
+
+def layout_order(controller):
+    layout = controller.layout
+    return [layout.itemAt(i).widget().account_number for i in range(layout.count())]
+
+
+class TestAccountListController:
+    def test_set_accounts_adds_a_card_per_account(self, controller):
+        # Act
+        diff = controller.set_accounts([account("1"), account("2"), account("3")])
+
+        # Assert
+        assert (diff.added, diff.updated, diff.removed) == (3, 0, 0)
+        assert controller.account_numbers == ["1", "2", "3"]
+        assert layout_order(controller) == ["1", "2", "3"]
+
+    def test_changed_accounts_are_updated_in_place(self, controller):
+        # Arrange
+        controller.set_accounts([account("1"), account("2")])
+        card = controller.card("2")
+        controller.card_factory.reset_mock()
+
+        # Act
+        diff = controller.set_accounts(
+            [account("1"), account("2", balance=250, change="-7")]
+        )
+
+        # Assert
+        assert (diff.added, diff.updated, diff.removed) == (0, 1, 0)
+        assert controller.card("2") is card
+        assert card.balanceLabel.text() == "$250"
+        assert card.recent_change_label.text() == "-7.0"
+        controller.card_factory.assert_not_called()
+
+    def test_unchanged_accounts_change_nothing(self, controller):
+        # Arrange
+        accounts = [account("1"), account("2")]
+        controller.set_accounts(accounts)
+
+        # Act
+        diff = controller.set_accounts([dict(a) for a in accounts])
+
+        # Assert
+        assert not diff.changed
+
+    def test_removed_cards_are_pooled_and_reused(self, controller):
+        # Arrange
+        controller.set_accounts([account("1"), account("2"), account("3")])
+        removed = controller.card("2")
+        controller.card_factory.reset_mock()
+
+        # Act
+        removal = controller.set_accounts([account("1"), account("3")])
+        pooled = controller.pooled
+        addition = controller.set_accounts(
+            [account("1"), account("3"), account("4", name="Brokerage")]
+        )
+
+        # Assert
+        assert (removal.removed, pooled) == (1, 1)
+        assert addition.added == 1
+        assert controller.card("4") is removed
+        assert removed.account_name_label.text() == "Brokerage"
+        assert not removed.isHidden()
+        assert controller.pooled == 0
+        controller.card_factory.assert_not_called()
+        assert layout_order(controller) == ["1", "3", "4"]
+
+    def test_pool_is_bounded(self, controller):
+        # Arrange
+        controller.set_accounts([account(str(i)) for i in range(5)])
+
+        # Act
+        controller.clear()
+
+        # Assert
+        assert len(controller) == 0
+        assert controller.pooled == 2
+        assert controller.layout.count() == 0
+
+    def test_reordered_accounts_move_their_cards(self, controller):
+        # Arrange
+        controller.set_accounts([account("1"), account("2"), account("3")])
+        cards = [controller.card(number) for number in ("1", "2", "3")]
+
+        # Act
+        diff = controller.set_accounts([account("3"), account("1"), account("2")])
+
+        # Assert
+        assert diff.moved > 0 and diff.added == 0
+        assert layout_order(controller) == ["3", "1", "2"]
+        assert [controller.card(number) for number in ("1", "2", "3")] == cards
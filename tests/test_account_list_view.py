@@ -0,0 +1,132 @@
+from unittest.mock import patch
+
+from PySide6.QtCore import QRect, Qt
+from PySide6.QtGui import QImage, QPainter
+from PySide6.QtWidgets import QStyle, QStyleOptionViewItem
+
+from src.ui.plugins.widgets.account_list_view import (
+    AccountCardDelegate,
+    AccountListModel,
+    AccountListView,
+)
+from src.views.main_window_view import main_window_view
+
+
+def make_accounts(count, balance=100):
+    return [
+        {
+            "account_name": f"Account {i}",
+            "balance": balance,
+            "account_type": "Checking",
+            "account_number": str(1000 + i),
+            "latest_balance_change": "-5" if i % 2 else "12.5",
+        }
+        for i in range(count)
+    ]
+
+
+class TestAccountListModel:
+    def test_same_accounts_only_signal_changed_rows(self, qtbot):
+        # Arrange
+        accounts = make_accounts(5)
+        model = AccountListModel(accounts)
+        changed = []
+        model.dataChanged.connect(
+            lambda top_left, bottom_right, roles: changed.append(top_left.row())
+        )
+        updated = [dict(account) for account in accounts]
+        updated[3]["balance"] = 999
+
+        # Act
+        result = model.set_accounts(updated)
+
+        # Assert
+        assert result == 1
+        assert changed == [3]
+        assert model.index(3).data(AccountListModel.AccountRole)["balance"] == 999
+
+    def test_different_accounts_reset_the_model(self, qtbot):
+        # Arrange
+        model = AccountListModel(make_accounts(5))
+
+        # Act
+        with qtbot.waitSignal(model.modelReset, timeout=1000):
+            result = model.set_accounts(make_accounts(7))
+
+        # Assert
+        assert result == -1
+        assert model.rowCount() == 7
+        assert model.index(6).data() == "Account 6"
+
+
+class TestAccountListView:
+    def test_only_visible_rows_are_painted(self, qtbot):
+        # Arrange
+        view = AccountListView()
+        qtbot.add_widget(view)
+        view.resize(400, 300)
+        view.set_accounts(make_accounts(300))
+        painted = []
+        paint = AccountCardDelegate.paint
+
+        def counting_paint(delegate, painter, option, index):
+            painted.append(index.row())
+            paint(delegate, painter, option, index)
+
+        # Act
+        with patch.object(AccountCardDelegate, "paint", counting_paint):
+            view.grab()
+
+        # Assert
+        assert painted
+        assert max(painted) < 300 // AccountCardDelegate.CARD_HEIGHT + 2
+
+    def test_hovered_cards_are_painted_differently(self, qtbot):
+        # Arrange
+        model = AccountListModel(make_accounts(1))
+        delegate = AccountCardDelegate()
+
+        def render(state):
+            image = QImage(400, 100, QImage.Format.Format_ARGB32)
+            image.fill(Qt.GlobalColor.transparent)
+            option = QStyleOptionViewItem()
+            option.rect = QRect(0, 0, 400, 100)
+            option.state = state
+            painter = QPainter(image)
+            delegate.paint(painter, option, model.index(0))
+            painter.end()
+            return image
+
+        # Act
+        normal = render(QStyle.StateFlag.State_Enabled)
+        hovered = render(
+            QStyle.StateFlag.State_Enabled | QStyle.StateFlag.State_MouseOver
+        )
+
+        # Assert
+        assert normal != hovered
+
+
+class TestAccountViewSwitch:
+    def test_list_view_replaces_cards_above_the_threshold(self, qtbot):
+        # Arrange
+        view = main_window_view()
+        qtbot.add_widget(view)
+        view.account_list_threshold = 3
+        view.cached_user_info = {"user_accounts": {"accounts": make_accounts(2)}}
+        view.addAccountCards()
+        cards_before = len(view.account_cards)
+
+        # Act
+        view.cached_user_info = {"user_accounts": {"accounts": make_accounts(10)}}
+        list_rows = view.account_list.model().rowCount()
+        list_in_layout = view.account_cards.layout.indexOf(view.account_list) >= 0
+        cards_with_list = len(view.account_cards)
+        view.cached_user_info = {"user_accounts": {"accounts": make_accounts(3)}}
+
+        # Assert
+        assert cards_before == 2
+        assert (list_rows, list_in_layout, cards_with_list) == (10, True, 0)
+        assert view.account_cards.layout.indexOf(view.account_list) == -1
+        assert view.account_list.isHidden()
+        assert view.account_cards.account_numbers == ["1000", "1001", "1002"]
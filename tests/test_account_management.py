@@ -0,0 +1,187 @@
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.core.account_management import AccountDirectory
+from src.services.api_client_service import APIClientError
+
+USER_ACCOUNTS = {
+    "accounts": [
+        {
+            "account_number": "1001",
+            "account_name": "Checking",
+            "account_type": "Checking",
+            "balance": 100,
+        },
+        {
+            "account_number": "1002",
+            "account_name": "Savings",
+            "account_type": "Savings",
+            "balance": 200,
+        },
+    ]
+}
+
+
+class TestAccountDirectory:
+    @pytest.fixture
+    def api_client(self):
+        api_client = MagicMock()
+        api_client.get_account_details.side_effect = lambda account_number: {
+            "account_name": f"Remote {account_number}"
+        }
+        return api_client
+
+    @pytest.fixture
+    def directory(self, api_client):
+        directory = AccountDirectory(api_client)
+        directory.load_user_accounts(USER_ACCOUNTS)
+        return directory
+
+    def test_load_user_accounts(self, directory):
+        # Assert
+        assert len(directory) == 2
+        assert "1001" in directory
+        assert directory.get("1002")["balance"] == 200
+        assert directory.get_account_name("1001") == "Checking"
+
+    def test_load_user_accounts_ignores_empty_payload(self, api_client):
+        # Arrange
+        directory = AccountDirectory(api_client)
+
+        # Act
+        directory.load_user_accounts(None)
+        directory.load_user_accounts({"accounts": None})
+
+        # Assert
+        assert len(directory) == 0
+
+    def test_get_normalizes_account_number(self, directory):
+        # Act & Assert
+        assert directory.get(1001)["account_name"] == "Checking"
+        assert directory.get(None) is None
+
+    def test_resolve_transactions_uses_known_accounts(self, directory, api_client):
+        # Arrange
+        transactions = [{"account_from": "1001"}, {"account_from": 1002}]
+
+        # Act
+        names = directory.resolve_transactions(transactions)
+
+        # Assert
+        assert names == ["Checking", "Savings"]
+        api_client.get_account_details.assert_not_called()
+
+    def test_resolve_transactions_prefers_server_expanded_name(
+        self, directory, api_client
+    ):
+        # Arrange
+        transactions = [
+            {"account_from": "2001", "account_name": "Expanded"},
+            {"account_from": "2001"},
+        ]
+
+        # Act
+        names = directory.resolve_transactions(transactions)
+
+        # Assert
+        assert names == ["Expanded", "Expanded"]
+        api_client.get_account_details.assert_not_called()
+
+    def test_resolve_transactions_looks_up_each_unknown_account_once(
+        self, directory, api_client
+    ):
+        # Arrange
+        transactions = [{"account_from": "3001"} for _ in range(30)]
+        transactions.append({"account_from": "3002"})
+
+        # Act
+        names = directory.resolve_transactions(transactions)
+        directory.resolve_transactions(transactions)
+
+        # Assert
+        assert names[:30] == ["Remote 3001"] * 30
+        assert names[30] == "Remote 3002"
+        assert api_client.get_account_details.call_count == 2
+
+    def test_failed_lookups_are_retried_after_a_delay(self, api_client):
+        # Arrange
+        now = [0.0]
+        directory = AccountDirectory(api_client, retry_delay=60, clock=lambda: now[0])
+        api_client.get_account_details.side_effect = APIClientError("Timed out")
+        transactions = [{"account_from": "4001"}, {"account_from": "4001"}]
+
+        # Act
+        first = directory.resolve_transactions(transactions)
+        second = directory.resolve_transactions(transactions)
+        now[0] = 61
+        api_client.get_account_details.side_effect = None
+        api_client.get_account_details.return_value = {"account_name": "Back"}
+        third = directory.resolve_transactions(transactions)
+
+        # Assert
+        assert first == [None, None]
+        assert second == [None, None]
+        assert third == ["Back", "Back"]
+        assert api_client.get_account_details.call_count == 2
+
+    def test_known_account_without_a_name_is_looked_up(self, directory, api_client):
+        # Arrange
+        directory.add_account({"account_number": "5001", "balance": 7})
+
+        # Act
+        names = directory.resolve_transactions([{"account_from": "5001"}])
+
+        # Assert
+        assert names == ["Remote 5001"]
+        assert directory.get("5001")["balance"] == 7
+
+    def test_lookup_racing_a_reset_keeps_its_names_but_not_its_accounts(
+        self, directory, api_client
+    ):
+        # Arrange
+        started, release = threading.Event(), threading.Event()
+
+        def slow_details(account_number):
+            started.set()
+            release.wait(2)
+            return {"account_name": f"Remote {account_number}"}
+
+        api_client.get_account_details.side_effect = slow_details
+        names = []
+        worker = threading.Thread(
+            target=lambda: names.extend(
+                directory.resolve_transactions([{"account_from": "6001"}])
+            )
+        )
+
+        # Act
+        worker.start()
+        started.wait(2)
+        directory.reset({"accounts": [{"account_number": "7001", "account_name": "B"}]})
+        release.set()
+        worker.join(2)
+
+        # Assert
+        assert names == ["Remote 6001"]
+        # The lookup belonged to the previous user.
+        assert "6001" not in directory
+        assert directory.get_account_name("1001") is None
+        assert directory.get_account_name("7001") == "B"
+
+    def test_resolve_transactions_without_account(self, directory, api_client):
+        # Act
+        names = directory.resolve_transactions([{"amount": 10}])
+
+        # Assert
+        assert names == [None]
+        api_client.get_account_details.assert_not_called()
+
+    def test_clear(self, directory):
+        # Act
+        directory.clear()
+
+        # Assert
+        assert len(directory) == 0
+        assert directory.get_account_name("1001") is None
@@ -1,3 +1,4 @@
+import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -26,7 +27,7 @@ class TestAPIClient:
         with patch.object(APIClient, "_make_request", autospec=True) as mock_method:
             yield mock_method
 
-    @patch("src.services.api_client_service.requests.request")
+    @patch("src.services.api_client_service.requests.Session.request")
     @patch.object(
         SessionManager,
         "get_authenticated_headers",
@@ -66,7 +67,7 @@ class TestAPIClient:
             params=expected_params,
         )
 
-    @patch("src.services.api_client_service.requests.request")
+    @patch("src.services.api_client_service.requests.Session.request")
     @patch.object(
         SessionManager,
         "get_authenticated_headers",
@@ -96,7 +97,7 @@ class TestAPIClient:
             )
 
     @patch(
-        "src.services.api_client_service.requests.request",
+        "src.services.api_client_service.requests.Session.request",
         side_effect=RequestException("Request exception"),
     )
     @patch.object(SessionManager, "get_authenticated_headers")
@@ -123,7 +124,7 @@ class TestAPIClient:
                 params=expected_params,
             )
 
-    @patch("src.services.api_client_service.requests.request")
+    @patch("src.services.api_client_service.requests.Session.request")
     @patch.object(SessionManager, "get_authenticated_headers")
     def test_make_request_status_code_check_failure(
         self, mock_get_headers, mock_request, api_client
@@ -150,7 +151,7 @@ class TestAPIClient:
             )
 
     @patch(
-        "src.services.api_client_service.requests.request",
+        "src.services.api_client_service.requests.Session.request",
         side_effect=APIClientError("Random Error"),
     )
     @patch.object(SessionManager, "get_authenticated_headers")
@@ -178,6 +179,54 @@ class TestAPIClient:
                 params=expected_params,
             )
 
+    @patch.object(
+        SessionManager,
+        "get_authenticated_headers",
+        return_value={"Authorization": "Bearer test_token"},
+    )
+    def test_make_request_uses_injected_http_session(self, mock_get_headers):
+        # Arrange
+        http_session = MagicMock()
+        response = MagicMock(spec=Response)
+        response.status_code = 200
+        http_session.request.return_value = response
+        api_client = APIClient(
+            base_url=BASE_URL, timeout=DEFAULT_TIMEOUT, http_session=http_session
+        )
+
+        # Act
+        result = api_client._make_request("GET", "test_endpoint", True)
+
+        # Assert
+        assert result is response
+        http_session.request.assert_called_once()
+
+    @patch("src.services.api_client_service.get_http_session")
+    def test_http_session_defaults_to_shared_session(
+        self, mock_get_http_session, api_client
+    ):
+        # Act & Assert
+        assert api_client.http_session is mock_get_http_session.return_value
+
+    @patch("src.services.api_client_service.close_http_session")
+    def test_close_shared_http_session(self, mock_close_http_session, api_client):
+        # Act
+        api_client.close()
+
+        # Assert
+        mock_close_http_session.assert_called_once()
+
+    def test_close_injected_http_session(self):
+        # Arrange
+        http_session = MagicMock()
+        api_client = APIClient(base_url=BASE_URL, http_session=http_session)
+
+        # Act
+        api_client.close()
+
+        # Assert
+        http_session.close.assert_called_once()
+
     # --- Retrieve User Info Tests ---
     @patch.object(
         SessionManager,
@@ -481,6 +530,180 @@ class TestAPIClient:
             expected_status=200,
         )
 
+    # --- Iterate Transactions Tests ---
+    @pytest.fixture
+    def paged_transactions(self):
+        """Patches retrieve_user_transactions to serve 7 records by offset."""
+        records = [{"id": i} for i in range(7)]
+
+        def serve(limit, offset, **_):
+            return {"transactions": records[offset : offset + limit]}
+
+        with patch.object(
+            APIClient, "retrieve_user_transactions", side_effect=serve
+        ) as mock_method:
+            yield records, mock_method
+
+    @pytest.mark.parametrize("read_ahead", [0, 1, 3])
+    def test_iter_transactions_yields_all_pages(
+        self, api_client, paged_transactions, read_ahead
+    ):
+        # Arrange
+        records, mock_method = paged_transactions
+
+        # Act
+        result = list(
+            api_client.iter_transactions(
+                page_size=3, read_ahead=read_ahead, transaction_type="DEBIT"
+            )
+        )
+
+        # Assert
+        assert result == records
+        offsets = sorted(c.kwargs["offset"] for c in mock_method.call_args_list)
+        assert offsets[:3] == [0, 3, 6]
+        for call in mock_method.call_args_list:
+            assert call.kwargs["limit"] == 3
+            assert call.kwargs["transaction_type"] == "DEBIT"
+
+    def test_iter_transactions_prefetches_next_page(self, api_client):
+        # Arrange
+        prefetched = threading.Event()
+
+        def serve(limit, offset, **_):
+            if offset == 2:
+                prefetched.set()
+            return {"transactions": [{"id": offset}, {"id": offset + 1}]}
+
+        with patch.object(APIClient, "retrieve_user_transactions", side_effect=serve):
+            iterator = api_client.iter_transactions(page_size=2, read_ahead=1)
+
+            # Act
+            first = next(iterator)
+
+            # Assert
+            # The second page is requested while the first is still consumed.
+            assert first == {"id": 0}
+            assert prefetched.wait(2)
+            iterator.close()
+
+    def test_iter_transactions_early_exit_stops_fetching(
+        self, api_client, paged_transactions
+    ):
+        # Arrange
+        _, mock_method = paged_transactions
+
+        # Act
+        iterator = api_client.iter_transactions(page_size=2, read_ahead=0)
+        first = [next(iterator), next(iterator)]
+        iterator.close()
+
+        # Assert
+        assert first == [{"id": 0}, {"id": 1}]
+        mock_method.assert_called_once()
+
+    def test_retrieve_user_transactions_with_cursor_omits_offset(
+        self, api_client, mock_make_request
+    ):
+        # Arrange
+        response = MagicMock(spec=Response)
+        response.json.return_value = {"transactions": [], "next_cursor": None}
+        mock_make_request.return_value = response
+
+        # Act
+        api_client.retrieve_user_transactions(limit=5, cursor="abc", since_id=9)
+
+        # Assert
+        assert mock_make_request.call_args.kwargs["params"] == {
+            "limit": 5,
+            "cursor": "abc",
+            "since_id": 9,
+        }
+
+    @pytest.mark.parametrize(
+        "payload, keyset_paging",
+        [
+            ({"transactions": [], "next_cursor": None}, True),
+            ({"transactions": []}, False),
+        ],
+    )
+    def test_retrieve_user_transactions_learns_keyset_paging(
+        self, api_client, mock_make_request, payload, keyset_paging
+    ):
+        # Arrange
+        response = MagicMock(spec=Response)
+        response.json.return_value = payload
+        mock_make_request.return_value = response
+        before = api_client.keyset_paging
+
+        # Act
+        api_client.retrieve_user_transactions()
+
+        # Assert
+        assert before is None
+        assert api_client.keyset_paging is keyset_paging
+
+    @pytest.mark.parametrize("read_ahead", [0, 1])
+    def test_iter_transactions_follows_cursor(self, api_client, read_ahead):
+        # Arrange
+        pages = {
+            None: {"transactions": [{"id": 1}, {"id": 2}], "next_cursor": "c1"},
+            "c1": {"transactions": [{"id": 3}, {"id": 4}], "next_cursor": "c2"},
+            "c2": {"transactions": [{"id": 5}], "next_cursor": None},
+        }
+
+        with patch.object(
+            APIClient,
+            "retrieve_user_transactions",
+            side_effect=lambda cursor=None, **_: pages[cursor],
+        ) as mock_method:
+            # Act
+            result = list(
+                api_client.iter_transactions(page_size=2, read_ahead=read_ahead)
+            )
+
+        # Assert
+        assert [t["id"] for t in result] == [1, 2, 3, 4, 5]
+        assert [c.kwargs["cursor"] for c in mock_method.call_args_list] == [
+            None,
+            "c1",
+            "c2",
+        ]
+
+    def test_iter_transactions_offset_mode_drops_shifted_duplicates(self, api_client):
+        # Arrange
+        records = [{"id": i} for i in range(10, 0, -1)]
+
+        def serve(limit, offset, **_):
+            page = records[offset : offset + limit]
+            if offset == 0:
+                # A new transaction arrives after the first page was served.
+                records.insert(0, {"id": 11})
+            return {"transactions": page}
+
+        with patch.object(APIClient, "retrieve_user_transactions", side_effect=serve):
+            # Act
+            result = list(api_client.iter_transactions(page_size=4, read_ahead=0))
+
+        # Assert
+        assert [t["id"] for t in result] == list(range(10, 0, -1))
+
+    def test_iter_transactions_propagates_errors(self, api_client):
+        # Arrange
+        with patch.object(
+            APIClient,
+            "retrieve_user_transactions",
+            side_effect=APIClientError("Failed fetch"),
+        ):
+            # Act & Assert
+            with pytest.raises(APIClientError, match="Failed fetch"):
+                list(api_client.iter_transactions())
+
+    def test_iter_transactions_rejects_invalid_page_size(self, api_client):
+        # Act & Assert
+        with pytest.raises(ValueError, match="page_size"):
+            next(api_client.iter_transactions(page_size=0))
+
     # --- Get Account Details Tests ---
     @patch.object(
         SessionManager,
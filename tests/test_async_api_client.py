@@ -0,0 +1,309 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from aiohttp import web
+
+from src.services.api_client_service import APIClient, APIClientError
+from src.services.async_api_client import AsyncAPIClient
+from src.services.circuit_breaker import CircuitState, get_circuit_breaker
+from src.services.response_cache import ResponseCache
+from src.services.retry_policy import RetryPolicy
+from src.services.session_manager import SessionManager
+
+AUTH_HEADER = {"Authorization": "Bearer test_token"}
+ACCOUNTS = [
+    {"account_number": "1001", "account_name": "Checking"},
+    {"account_number": "1002", "account_name": "Savings"},
+]
+TRANSACTIONS = [
+    {"id": 1, "account_from": "1001", "amount": 10},
+    {"id": 2, "account_from": "2001", "amount": 20},
+    {"id": 3, "account_from": "2001", "amount": 30},
+    {"id": 4, "account_from": "3001", "account_name": "Expanded", "amount": 40},
+    {"id": 5, "account_from": "2002", "amount": 50},
+]
+
+
+class StubBackend:
+    """Minimal asyncio backend that records requests and concurrency."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        # Requests still to be answered with a 503.
+        self.failures = 0
+        self.app = web.Application(middlewares=[self.track])
+        self.app.router.add_get("/api/v1/users/current", self.current_user)
+        self.app.router.add_get("/api/v1/users/{user_id}/accounts", self.accounts)
+        self.app.router.add_get("/api/v1/transactions", self.transactions)
+        self.app.router.add_get("/api/v1/accounts/{number}", self.account)
+        self.app.router.add_post("/api/v1/users", self.create_user)
+        self.runner = web.AppRunner(self.app)
+        self.base_url = None
+
+    @web.middleware
+    async def track(self, request, handler):
+        self.requests.append(request)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            if self.failures > 0:
+                self.failures -= 1
+                return web.json_response({"error": "Unavailable"}, status=503)
+            return await handler(request)
+        finally:
+            self.in_flight -= 1
+
+    async def current_user(self, request):
+        if request.headers.get("Authorization") != AUTH_HEADER["Authorization"]:
+            return web.json_response({"error": "Unauthorized"}, status=401)
+        return web.json_response({"user": {"id": 7, "username": "test_user"}})
+
+    async def accounts(self, request):
+        return web.json_response({"accounts": ACCOUNTS})
+
+    async def transactions(self, request):
+        limit = int(request.query["limit"])
+        offset = int(request.query["offset"])
+        return web.json_response(
+            {"transactions": TRANSACTIONS[offset : offset + limit]}
+        )
+
+    async def account(self, request):
+        number = request.match_info["number"]
+        if number == "404":
+            return web.json_response({"error": "Not found"}, status=404)
+        if number == "bad":
+            return web.json_response({"message": "no account"})
+        return web.json_response(
+            {"account": {"account_number": number, "account_name": f"Acc {number}"}}
+        )
+
+    async def create_user(self, request):
+        payload = await request.json()
+        return web.json_response({"id": 8, **payload}, status=201)
+
+    async def start(self):
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        port = self.runner.addresses[0][1]
+        self.base_url = f"http://127.0.0.1:{port}/api/v1/"
+
+    async def stop(self):
+        await self.runner.cleanup()
+
+
+def run_with_backend(test, delay: float = 0.0, **client_kwargs):
+    """Runs ``test(client, backend)`` against a fresh stub backend."""
+
+    async def runner():
+        backend = StubBackend(delay=delay)
+        await backend.start()
+        try:
+            async with AsyncAPIClient(
+                base_url=backend.base_url, **client_kwargs
+            ) as client:
+                return await test(client, backend)
+        finally:
+            await backend.stop()
+
+    return asyncio.run(runner())
+
+
+class TestAsyncAPIClient:
+    @pytest.fixture(autouse=True)
+    def mock_auth_headers(self):
+        with patch.object(
+            SessionManager, "get_authenticated_headers", return_value=AUTH_HEADER
+        ) as mock_headers:
+            yield mock_headers
+
+    def test_retrieve_user_info(self):
+        # Act
+        result = run_with_backend(lambda client, _: client.retrieve_user_info())
+
+        # Assert
+        assert result == {
+            "user_profile": {"id": 7, "username": "test_user"},
+            "user_accounts": {"accounts": ACCOUNTS},
+        }
+
+    def test_retrieve_user_info_auth_failure(self, mock_auth_headers):
+        # Arrange
+        mock_auth_headers.side_effect = ConnectionAbortedError("Session expired")
+
+        # Act & Assert
+        with pytest.raises(APIClientError, match="Authentication failed"):
+            run_with_backend(lambda client, _: client.retrieve_user_info())
+
+    def test_retrieve_user_transactions_sends_params(self):
+        # Arrange
+        async def test(client, backend):
+            result = await client.retrieve_user_transactions(
+                limit=2, offset=1, transaction_type="DEBIT", account_number="1001"
+            )
+            return result, dict(backend.requests[0].query), client.keyset_paging
+
+        # Act
+        result, query, keyset_paging = run_with_backend(test)
+
+        # Assert
+        assert result == {"transactions": TRANSACTIONS[1:3]}
+        assert keyset_paging is False
+        assert query == {
+            "limit": "2",
+            "offset": "1",
+            "transaction_type": "DEBIT",
+            "account_number": "1001",
+        }
+
+    def test_get_account_details_with_filter(self):
+        # Act
+        result = run_with_backend(
+            lambda client, _: client.get_account_details("5", "account_name", "x")
+        )
+
+        # Assert
+        assert result == {"account_name": "Acc 5"}
+
+    def test_get_account_details_http_error(self):
+        # Act & Assert
+        with pytest.raises(
+            APIClientError, match="Failed to retrieve or filter account details for 404"
+        ):
+            run_with_backend(lambda client, _: client.get_account_details("404"))
+
+    def test_get_account_details_malformed_response(self):
+        # Act & Assert
+        with pytest.raises(APIClientError, match="Account data is missing"):
+            run_with_backend(lambda client, _: client.get_account_details("bad"))
+
+    def test_create_user(self):
+        # Act
+        result = run_with_backend(
+            lambda client, _: client.create_user("a@b.c", "user", "pw")
+        )
+
+        # Assert
+        assert result == {
+            "id": 8,
+            "email": "a@b.c",
+            "username": "user",
+            "password": "pw",
+        }
+
+    def test_connection_refused_raises_api_client_error(self):
+        # Arrange
+        async def test():
+            async with AsyncAPIClient(base_url="http://127.0.0.1:9/api/v1/") as client:
+                await client.retrieve_user_transactions()
+
+        # Act & Assert
+        with pytest.raises(APIClientError, match="API request failed"):
+            asyncio.run(test())
+
+    def test_get_many_account_details_runs_concurrently_and_deduplicates(self):
+        # Arrange
+        async def test(client, backend):
+            result = await client.get_many_account_details(
+                ["1", "2", "1", "3", "4"], "account_name"
+            )
+            return result, backend
+
+        # Act
+        result, backend = run_with_backend(test, delay=0.05)
+
+        # Assert
+        assert result == {
+            number: {"account_name": f"Acc {number}"} for number in ["1", "2", "3", "4"]
+        }
+        assert len(backend.requests) == 4
+        assert backend.max_in_flight == 4
+
+    def test_concurrency_is_bounded(self):
+        # Arrange
+        async def test(client, backend):
+            await client.get_many_account_details([str(i) for i in range(10)])
+            return backend
+
+        # Act
+        backend = run_with_backend(test, delay=0.02, max_concurrency=3)
+
+        # Assert
+        assert len(backend.requests) == 10
+        assert backend.max_in_flight == 3
+
+    def test_load_dashboard(self):
+        # Arrange
+        async def test(client, backend):
+            return await client.load_dashboard(transaction_limit=30), backend
+
+        # Act
+        result, backend = run_with_backend(test, delay=0.02)
+
+        # Assert
+        assert result["user_profile"] == {"id": 7, "username": "test_user"}
+        assert result["transactions"] == {"transactions": TRANSACTIONS}
+        # Only accounts that are neither the user's nor server expanded.
+        assert set(result["account_details"]) == {"2001", "2002"}
+        # user info and transactions overlapped, as did the detail lookups.
+        assert backend.max_in_flight >= 2
+
+    def test_get_responses_are_shared_with_the_sync_client_cache(self):
+        # Arrange
+        cache = ResponseCache(default_ttl=60)
+
+        async def test(client, backend):
+            first = await client.get_account_details("5")
+            second = await client.get_account_details("5")
+            return first, second, backend
+
+        # Act
+        first, second, backend = run_with_backend(test, response_cache=cache)
+        # Nothing listens there, so only the cache can answer.
+        sync_client = APIClient(
+            base_url="http://127.0.0.1:9/api/v1/", response_cache=cache
+        )
+
+        # Assert
+        assert first == second == {"account_number": "5", "account_name": "Acc 5"}
+        assert len(backend.requests) == 1
+        assert sync_client.get_account_details("5") == first
+        assert cache.stats()["hits"] == 2
+
+    def test_transient_failures_are_retried(self):
+        # Arrange
+        async def test(client, backend):
+            backend.failures = 2
+            return await client.get_account_details("5"), backend
+
+        # Act
+        result, backend = run_with_backend(
+            test, retry_policies={"GET": RetryPolicy(backoff_base=0.01)}
+        )
+
+        # Assert
+        assert result["account_name"] == "Acc 5"
+        assert len(backend.requests) == 3
+
+    def test_failing_host_opens_the_shared_circuit_breaker(self):
+        # Arrange
+        async def test(client, backend):
+            backend.failures = 100
+            for _ in range(6):
+                with pytest.raises(APIClientError):
+                    await client.get_account_details("5")
+            return backend, get_circuit_breaker(client.base_url).state
+
+        # Act
+        backend, state = run_with_backend(test, retry_policies={})
+
+        # Assert
+        assert state is CircuitState.OPEN
+        # Refused without a request once the breaker opened.
+        assert len(backend.requests) < 6
@@ -0,0 +1,171 @@
+import asyncio
+import threading
+
+import pytest
+from PySide6.QtWidgets import QWidget
+
+from src.controllers.async_bridge import (
+    AsyncBridge,
+    ViewTaskScope,
+    bind_task_to_controller,
+)
+from src.controllers.base_controller import BaseController
+
+
+class TestAsyncBridge:
+    @pytest.fixture
+    def bridge(self):
+        bridge = AsyncBridge()
+        yield bridge
+        bridge.shutdown(timeout=1)
+
+    def test_submit_delivers_result_on_gui_thread(self, bridge, qtbot):
+        # Arrange
+        gui_thread = threading.current_thread()
+        seen = {}
+
+        async def work():
+            seen["loop_thread"] = threading.current_thread()
+            await asyncio.sleep(0.01)
+            return 42
+
+        # Act
+        task = bridge.submit(work())
+        task.finished.connect(
+            lambda result: seen.update(result=result, slot=threading.current_thread())
+        )
+        qtbot.waitUntil(lambda: "result" in seen, timeout=2000)
+
+        # Assert
+        assert seen["result"] == 42
+        assert seen["loop_thread"] is not gui_thread
+        assert seen["slot"] is gui_thread
+        assert bridge.running
+
+    def test_submit_reports_failure(self, bridge, qtbot):
+        # Arrange
+        async def work():
+            raise ValueError("boom")
+
+        # Act
+        task = bridge.submit(work())
+        with qtbot.waitSignal(task.failed, timeout=2000) as blocker:
+            pass
+
+        # Assert
+        assert blocker.args == ["boom"]
+
+    def test_cancel(self, bridge, qtbot):
+        # Arrange
+        started = threading.Event()
+
+        async def work():
+            started.set()
+            await asyncio.sleep(10)
+
+        task = bridge.submit(work())
+        started.wait(timeout=2)
+
+        # Act
+        with qtbot.waitSignal(task.cancelled, timeout=2000):
+            assert task.cancel() is True
+
+        # Assert
+        assert task.done()
+
+    def test_shutdown_stops_loop(self, bridge):
+        # Arrange
+        bridge.start()
+
+        # Act
+        bridge.shutdown(timeout=1)
+
+        # Assert
+        assert not bridge.running
+        assert bridge.loop.is_closed()
+
+
+class TestViewTaskScope:
+    @pytest.fixture
+    def bridge(self):
+        bridge = AsyncBridge()
+        yield bridge
+        bridge.shutdown(timeout=1)
+
+    def test_run_calls_result_handler(self, bridge, qtbot):
+        # Arrange
+        view = QWidget()
+        qtbot.addWidget(view)
+        scope = ViewTaskScope(view, bridge)
+        results = []
+
+        async def api_call():
+            return {"transactions": []}
+
+        # Act
+        scope.run(api_call(), on_result=results.append)
+        qtbot.waitUntil(lambda: len(results) == 1, timeout=2000)
+
+        # Assert
+        assert results == [{"transactions": []}]
+        qtbot.waitUntil(lambda: scope.active_tasks == 0, timeout=2000)
+
+    def test_run_calls_error_handler(self, bridge, qtbot):
+        # Arrange
+        view = QWidget()
+        qtbot.addWidget(view)
+        scope = ViewTaskScope(view, bridge)
+        errors = []
+
+        async def api_call():
+            raise ConnectionError("offline")
+
+        # Act
+        scope.run(api_call(), on_error=errors.append)
+        qtbot.waitUntil(lambda: len(errors) == 1, timeout=2000)
+
+        # Assert
+        assert errors == ["offline"]
+
+    def test_hiding_view_cancels_tasks(self, bridge, qtbot):
+        # Arrange
+        view = QWidget()
+        qtbot.addWidget(view)
+        view.show()
+        scope = ViewTaskScope(view, bridge)
+        results = []
+
+        async def slow_api_call():
+            await asyncio.sleep(10)
+            return "stale"
+
+        task = scope.run(slow_api_call(), on_result=results.append)
+
+        # Act
+        with qtbot.waitSignal(task.cancelled, timeout=2000):
+            view.hide()
+
+        # Assert
+        assert results == []
+        assert task.future.cancelled()
+
+    def test_bound_task_drives_controller_signals(self, bridge, qtbot):
+        # Arrange
+        view = QWidget()
+        qtbot.addWidget(view)
+        scope = ViewTaskScope(view, bridge)
+        controller = BaseController()
+        events = []
+        controller.loading_started.connect(lambda: events.append("started"))
+        controller.loading_finished.connect(lambda: events.append("finished"))
+        controller.error_occurred.connect(events.append)
+
+        async def api_call():
+            raise ConnectionError("offline")
+
+        # Act
+        bind_task_to_controller(scope.run(api_call()), controller)
+        qtbot.waitUntil(lambda: len(events) == 3, timeout=2000)
+
+        # Assert
+        assert events == ["started", "offline", "finished"]
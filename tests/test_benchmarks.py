@@ -0,0 +1,89 @@
+import json
+
+import pytest
+
+from benchmarks import bench_client
+from benchmarks.harness import (
+    BenchmarkResult,
+    compare_results,
+    load_baseline,
+    measure,
+    save_baseline,
+)
+
+
+def result(median: float) -> BenchmarkResult:
+    return BenchmarkResult(
+        runs=5, min=median, median=median, mean=median, p95=median, max=median
+    )
+
+
+class TestHarness:
+    def test_measure_skips_warmup_and_runs_setup(self):
+        # Arrange
+        calls = []
+
+        # Act
+        summary = measure(
+            lambda: calls.append("run"),
+            repeat=3,
+            warmup=2,
+            setup=lambda: calls.append("setup"),
+        )
+
+        # Assert
+        assert summary.runs == 3
+        assert calls == ["setup", "run"] * 5
+        assert summary.min <= summary.median <= summary.max
+
+    def test_baseline_round_trip(self, tmp_path):
+        # Arrange
+        path = tmp_path / "baselines" / "client.json"
+        results = {"token_refresh": result(4.2)}
+
+        # Act
+        save_baseline(str(path), results, {"repeat": 5})
+        loaded = load_baseline(str(path))
+
+        # Assert
+        assert loaded == results
+        assert json.loads(path.read_text())["settings"] == {"repeat": 5}
+
+    def test_compare_flags_regressions_beyond_threshold(self):
+        # Arrange
+        baseline = {"a": result(10), "b": result(10), "c": result(0.01)}
+        current = {"a": result(11.5), "b": result(10.5), "c": result(0.05)}
+
+        # Act
+        comparisons = compare_results(baseline, current, threshold=0.10, min_delta=0.1)
+
+        # Assert
+        assert [c.name for c in comparisons if c.regressed] == ["a"]
+        assert comparisons[0].change == pytest.approx(0.15)
+
+
+class TestBenchClient:
+    def test_run_and_compare(self, qapp, tmp_path, capsys):
+        # Arrange
+        first, second = tmp_path / "first.json", tmp_path / "second.json"
+        run_args = ["run", "--repeat", "1", "--transactions", "200"]
+
+        # Act
+        bench_client.main(run_args + ["--output", str(first)])
+        bench_client.main(run_args + ["--output", str(second)])
+        exit_code = bench_client.main(
+            ["compare", str(first), str(first), "--threshold", "0.1"]
+        )
+
+        # Assert
+        assert exit_code == 0
+        assert set(load_baseline(str(second))) == {
+            "retrieve_user_info_cold",
+            "retrieve_user_info_warm",
+            "page_transactions",
+            "dashboard_load",
+            "token_refresh",
+            "keyring_reload",
+            "auth_headers_cached",
+        }
+        assert "REGRESSION" not in capsys.readouterr().out
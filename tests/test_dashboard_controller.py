@@ -0,0 +1,54 @@
+import threading
+
+from PySide6.QtWidgets import QMainWindow
+
+from src.controllers.dashboard_controller import LOADING_MESSAGE, DashboardController
+
+
+class TestDashboardController:
+    def test_status_bar_shows_loading_and_errors(self, qtbot):
+        # Arrange
+        window = QMainWindow()
+        qtbot.add_widget(window)
+        controller = DashboardController(window)
+        release = threading.Event()
+
+        def fail():
+            release.wait(2)
+            raise RuntimeError("server down")
+
+        # Act
+        controller.run_in_background(fail)
+        qtbot.waitUntil(lambda: controller.busy)
+        loading = window.statusBar().currentMessage()
+        release.set()
+        qtbot.waitUntil(lambda: controller.pending_jobs == 0)
+
+        # Assert
+        assert loading == LOADING_MESSAGE
+        assert not controller.busy
+        assert "server down" in window.statusBar().currentMessage()
+
+    def test_progress_is_shown_while_loading_and_cleared_after(self, qtbot):
+        # Arrange
+        window = QMainWindow()
+        qtbot.add_widget(window)
+        controller = DashboardController(window)
+        release = threading.Event()
+
+        def load():
+            controller.progress.emit("500 transactions")
+            release.wait(2)
+
+        # Act
+        controller.run_in_background(load)
+        qtbot.waitUntil(
+            lambda: window.statusBar().currentMessage().endswith("500 transactions")
+        )
+        progress = window.statusBar().currentMessage()
+        release.set()
+        qtbot.waitUntil(lambda: controller.pending_jobs == 0)
+
+        # Assert
+        assert progress == f"{LOADING_MESSAGE} 500 transactions"
+        assert window.statusBar().currentMessage() == ""
@@ -0,0 +1,163 @@
+import json
+import os
+from unittest.mock import MagicMock, patch
+
+import pytest
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+
+from src.services.api_client_service import APIClient, APIClientError, SessionManager
+from src.services.disk_cache import DiskResponseCache
+from src.services.response_cache import CacheEntry, ResponseCache
+
+BASE_URL = "http://127.0.0.1:5000/api/v1/"
+
+
+def make_entry(endpoint="users/current", body=None, etag='"v1"') -> CacheEntry:
+    return CacheEntry(
+        endpoint=endpoint,
+        url=f"{BASE_URL}{endpoint}",
+        status_code=200,
+        headers={"ETag": etag},
+        content=json.dumps(body or {}).encode(),
+        encoding="utf-8",
+        etag=etag,
+        last_modified=None,
+        expires_at=0,
+    )
+
+
+def make_response(body) -> Response:
+    response = Response()
+    response.status_code = 200
+    response._content = json.dumps(body).encode()
+    response.headers = CaseInsensitiveDict({"ETag": '"v1"'})
+    response.url = BASE_URL
+    response.encoding = "utf-8"
+    return response
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "cache" / "api_cache.sqlite3")
+
+
+class TestDiskResponseCache:
+    def test_entries_survive_reopening(self, db_path):
+        # Arrange
+        store = DiskResponseCache(db_path)
+        key = ("sub:1", "users/current", "")
+        store.save(key, make_entry(body={"user": {"id": 1}}))
+        store.close()
+
+        # Act
+        entry = DiskResponseCache(db_path).load(key)
+
+        # Assert
+        assert entry.to_response().json() == {"user": {"id": 1}}
+        assert entry.etag == '"v1"'
+
+    def test_database_is_private(self, db_path):
+        # Act
+        DiskResponseCache(db_path)
+
+        # Assert
+        assert os.stat(db_path).st_mode & 0o077 == 0
+
+    def test_keys_are_per_user(self, db_path):
+        # Arrange
+        store = DiskResponseCache(db_path)
+        store.save(("sub:1", "users/current", ""), make_entry())
+
+        # Act & Assert
+        assert store.load(("sub:2", "users/current", "")) is None
+
+    def test_size_limit_evicts_least_recently_used(self, db_path):
+        # Arrange
+        store = DiskResponseCache(db_path, max_bytes=60)
+        body = {"data": "x" * 20}  # 32 bytes once encoded
+        store.save(("u", "a", ""), make_entry("a", body))
+        store.save(("u", "b", ""), make_entry("b", body))
+
+        # Assert
+        assert store.load(("u", "a", "")) is None
+        assert store.load(("u", "b", "")) is not None
+        assert store.size == 32
+
+    def test_invalidate_and_purge(self, db_path):
+        # Arrange
+        store = DiskResponseCache(db_path)
+        for endpoint in ["users/current", "users/1/accounts", "transactions"]:
+            store.save(("u", endpoint, ""), make_entry(endpoint))
+
+        # Act
+        store.invalidate("users/*")
+
+        # Assert
+        assert len(store) == 1
+        store.purge()
+        assert len(store) == 0
+
+
+class TestWarmStart:
+    @pytest.fixture(autouse=True)
+    def auth_header(self):
+        header = {"Authorization": "Bearer opaque"}
+        with patch.object(
+            SessionManager, "get_authenticated_headers", return_value=header
+        ), patch.object(
+            SessionManager, "_get_current_auth_header", return_value=header
+        ):
+            yield
+
+    def test_cache_only_client_serves_last_session_responses(self, db_path):
+        # Arrange
+        http_session = MagicMock()
+        http_session.request.return_value = make_response({"transactions": [1]})
+        online = APIClient(
+            base_url=BASE_URL,
+            http_session=http_session,
+            response_cache=ResponseCache(disk_store=DiskResponseCache(db_path)),
+        )
+        online.retrieve_user_transactions()
+
+        # A restart: fresh memory cache over the same database.
+        offline = APIClient(
+            base_url=BASE_URL,
+            http_session=http_session,
+            response_cache=ResponseCache(disk_store=DiskResponseCache(db_path)),
+            cache_only=True,
+        )
+
+        # Act
+        result = offline.retrieve_user_transactions()
+
+        # Assert
+        assert result == {"transactions": [1]}
+        http_session.request.assert_called_once()
+
+    def test_cache_only_client_raises_on_miss(self, db_path):
+        # Arrange
+        offline = APIClient(
+            base_url=BASE_URL,
+            response_cache=ResponseCache(disk_store=DiskResponseCache(db_path)),
+            cache_only=True,
+        )
+
+        # Act & Assert
+        with pytest.raises(APIClientError, match="No cached response"):
+            offline.retrieve_user_transactions()
+
+    def test_clear_tokens_purges_disk_cache(self, db_path):
+        # Arrange
+        store = DiskResponseCache(db_path)
+        store.save(("u", "users/current", ""), make_entry())
+        with patch(
+            "src.services.response_cache._response_cache",
+            ResponseCache(disk_store=store),
+        ), patch.object(SessionManager, "_delete_keyring"):
+            # Act
+            SessionManager().clear_tokens()
+
+        # Assert
+        assert len(store) == 0
@@ -0,0 +1,72 @@
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from src.services import http_session
+from src.services.http_session import (
+    close_http_session,
+    configure_http_session,
+    create_http_session,
+    get_http_session,
+)
+
+
+class TestHTTPSession:
+    @pytest.fixture(autouse=True)
+    def reset_shared_session(self):
+        close_http_session()
+        yield
+        configure_http_session()
+
+    def test_create_http_session_mounts_pooled_adapter(self):
+        # Act
+        session = create_http_session(pool_connections=2, pool_maxsize=7)
+
+        # Assert
+        for prefix in ("http://", "https://"):
+            adapter = session.get_adapter(f"{prefix}example.com")
+            assert adapter._pool_connections == 2
+            assert adapter._pool_maxsize == 7
+        assert session.headers["Connection"] == "keep-alive"
+
+    def test_get_http_session_returns_shared_instance(self):
+        # Act
+        first = get_http_session()
+        second = get_http_session()
+
+        # Assert
+        assert isinstance(first, requests.Session)
+        assert first is second
+
+    def test_close_http_session_closes_and_recreates(self):
+        # Arrange
+        session = get_http_session()
+
+        # Act
+        with patch.object(session, "close") as mock_close:
+            close_http_session()
+
+        # Assert
+        mock_close.assert_called_once()
+        assert http_session._session is None
+        assert get_http_session() is not session
+
+    def test_close_http_session_without_session(self):
+        # Act & Assert (no error when nothing is open)
+        close_http_session()
+        assert http_session._session is None
+
+    def test_configure_http_session_applies_to_next_session(self):
+        # Arrange
+        old_session = get_http_session()
+
+        # Act
+        configure_http_session(pool_connections=1, pool_maxsize=3)
+        new_session = get_http_session()
+
+        # Assert
+        assert new_session is not old_session
+        adapter = new_session.get_adapter("http://127.0.0.1")
+        assert adapter._pool_connections == 1
+        assert adapter._pool_maxsize == 3
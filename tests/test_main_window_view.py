@@ -1,14 +1,37 @@
-from unittest.mock import patch
+import asyncio
+import threading
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from PySide6.QtCore import Qt
 
+from src.controllers.async_bridge import get_async_bridge
+from src.services.api_client_service import APIClient, APIClientError
+from src.services.async_api_client import AsyncAPIClient
+from src.services.disk_cache import DiskResponseCache
+from src.services.response_cache import ResponseCache
+from src.services.session_manager import SessionManager
 from src.ui.plugins.widgets.account_card_widget import AccountCardWidget
 from src.ui.plugins.widgets.summary_card_widget import SummaryCardWidget
-from src.ui.plugins.widgets.transaction_table_widget import TransactionTableWidget
+from src.ui.plugins.widgets.transaction_table_widget import (
+    PagedTransactionTableModel,
+    TransactionSortFilterModel,
+    TransactionTableModel,
+    TransactionTableWidget,
+)
+from src.views import main_window_view as main_window_view_module
 from src.views.main_window_view import main_window_view
 
 
 class TestMainWindowView:
+    def wait_for_jobs(self, view, qtbot):
+        """Waits until the results of the view's background jobs are in."""
+        qtbot.waitUntil(
+            lambda: view.controller.pending_jobs == 0
+            and view.task_scope.active_tasks == 0,
+            timeout=2000,
+        )
+
     @patch("src.views.main_window_view.SummaryCardWidget", wraps=SummaryCardWidget)
     def test_add_summary_cards(self, summary_card_widget, qtbot):
         # Arrange
@@ -76,6 +99,43 @@ class TestMainWindowView:
                 recent_change=account["latest_balance_change"],
             )
 
+    @patch("src.views.main_window_view.AccountCardWidget", wraps=AccountCardWidget)
+    def test_user_info_changes_update_account_cards_in_place(
+        self, account_card_widget, qtbot
+    ):
+        # Arrange
+        def user_info(*accounts):
+            return {
+                "user_accounts": {
+                    "accounts": [
+                        {
+                            "account_name": f"Account {number}",
+                            "balance": balance,
+                            "account_type": "Savings",
+                            "account_number": number,
+                            "latest_balance_change": "0",
+                        }
+                        for number, balance in accounts
+                    ]
+                }
+            }
+
+        view = main_window_view()
+        qtbot.add_widget(view)
+        view.cached_user_info = user_info(("1", 100), ("2", 200))
+        view.addAccountCards()
+        card = view.account_cards.card("1")
+
+        # Act
+        view.cached_user_info = user_info(("1", 150), ("3", 300))
+
+        # Assert
+        assert view.account_cards.card("1") is card
+        assert card.balanceLabel.text() == "$150"
+        assert view.account_cards.account_numbers == ["1", "3"]
+        # The card of account 2 was recycled for account 3.
+        assert account_card_widget.call_count == 2
+
     @pytest.mark.parametrize(
         "transactions",
         [
@@ -136,10 +196,549 @@ class TestMainWindowView:
 
         # Act
         view.addTransactionTable()
+        self.wait_for_jobs(view, qtbot)
 
         # Assert
         assert mock_transaction_table_widget.call_count == 1
         mock_api_client_instance.retrieve_user_transactions.assert_called_once()
-        mock_api_client_instance.get_account_details.assert_any_call(
-            transactions[0]["account_from"], "account_name"
+        # The API already expanded account_name, so no per-row lookups happen.
+        mock_api_client_instance.get_account_details.assert_not_called()
+
+    @patch(
+        "src.views.main_window_view.TransactionTableWidget",
+        wraps=TransactionTableWidget,
+    )
+    @patch("src.views.main_window_view.APIClient")
+    def test_add_transaction_table_deduplicates_account_lookups(
+        self, mock_api_client_class, mock_transaction_table_widget, qtbot
+    ):
+        # Arrange
+        transactions = [
+            {
+                "account_from": account_from,
+                "amount": 10 * i,
+                "timestamp": "2023-10-01T12:00:00",
+                "balance_after": 900,
+                "status": "Completed",
+            }
+            for i, account_from in enumerate(["111", "222", "111", "333", "222"])
+        ]
+        mock_api_client_instance = mock_api_client_class.return_value
+        mock_api_client_instance.retrieve_user_transactions.return_value = {
+            "transactions": transactions
+        }
+        mock_api_client_instance.get_account_details.side_effect = (
+            lambda account_number: {"account_name": f"Account {account_number}"}
+        )
+        view = main_window_view()
+        qtbot.add_widget(view)
+        # "111" is known from the user info payload.
+        view.cached_user_info = {
+            "user_accounts": {
+                "accounts": [{"account_number": "111", "account_name": "Checking"}]
+            }
+        }
+
+        # Act
+        view.addTransactionTable()
+        self.wait_for_jobs(view, qtbot)
+
+        # Assert
+        assert mock_api_client_instance.get_account_details.call_count == 2
+        mock_api_client_instance.get_account_details.assert_any_call("222")
+        mock_api_client_instance.get_account_details.assert_any_call("333")
+        model = mock_transaction_table_widget.call_args.args[0]
+        assert [
+            model.transaction_at(row).account_name for row in range(model.rowCount())
+        ] == [
+            "Checking",
+            "Account 222",
+            "Checking",
+            "Account 333",
+            "Account 222",
+        ]
+
+    @patch("src.views.main_window_view.APIClient")
+    def test_load_transaction_table_runs_off_gui_thread(
+        self, mock_api_client_class, qtbot
+    ):
+        # Arrange
+        gui_thread = threading.current_thread()
+        fetch_threads = []
+
+        def retrieve_user_transactions(**params):
+            fetch_threads.append(threading.current_thread())
+            return {
+                "transactions": [
+                    {
+                        "account_from": "123",
+                        "account_name": "Test Account",
+                        "amount": 100,
+                        "timestamp": "2023-10-01T12:00:00",
+                        "balance_after": 900,
+                        "status": "Completed",
+                    }
+                ]
+            }
+
+        mock_api_client_instance = mock_api_client_class.return_value
+        mock_api_client_instance.retrieve_user_transactions.side_effect = (
+            retrieve_user_transactions
         )
+        view = main_window_view()
+        qtbot.add_widget(view)
+
+        # Act
+        view.load_transaction_table()
+        self.wait_for_jobs(view, qtbot)
+
+        # Assert
+        assert fetch_threads and fetch_threads[0] is not gui_thread
+        assert view.widget_17.findChild(TransactionTableWidget) is not None
+
+    @pytest.mark.parametrize("keyset_paging", [True, False])
+    @patch("src.views.main_window_view.AsyncAPIClient")
+    @patch("src.views.main_window_view.APIClient")
+    def test_refresh_dashboard_applies_changes_in_place(
+        self, mock_api_client_class, mock_async_api_client_class, keyset_paging, qtbot
+    ):
+        # Arrange
+        def transaction(transaction_id, status="COMPLETED"):
+            return {
+                "id": transaction_id,
+                "account_from": "111",
+                "account_name": "Checking",
+                "amount": transaction_id,
+                "timestamp": "2023-10-01T12:00:00",
+                "balance_after": 900,
+                "status": status,
+            }
+
+        server = [transaction(i) for i in range(10, 0, -1)]
+
+        def retrieve_user_transactions(limit, offset, since_id=None):
+            # Only a keyset paging backend honours since_id.
+            rows = server[offset : offset + limit]
+            if keyset_paging and since_id is not None:
+                rows = [row for row in rows if row["id"] > since_id]
+            return {"transactions": rows}
+
+        mock_api_client_instance = mock_api_client_class.return_value
+        mock_api_client_instance.keyset_paging = keyset_paging
+        mock_api_client_instance.retrieve_user_transactions.side_effect = (
+            retrieve_user_transactions
+        )
+        user_info = {"user_profile": {"id": 1}, "user_accounts": {"accounts": []}}
+        mock_api_client_instance.retrieve_user_info.return_value = user_info
+        mock_async_api_client = mock_async_api_client_class.return_value
+        mock_async_api_client.keyset_paging = None
+        mock_async_api_client.load_dashboard = AsyncMock(
+            side_effect=lambda limit: {
+                **user_info,
+                "transactions": retrieve_user_transactions(limit, 0),
+                "account_details": {},
+            }
+        )
+        view = main_window_view()
+        qtbot.add_widget(view)
+        view.refresh_dashboard()
+        self.wait_for_jobs(view, qtbot)
+        table = view.transaction_table
+        model = table.model()
+        server.insert(0, transaction(11))
+        server[8] = transaction(3, "FAILED")
+
+        # Act
+        throttled = view.refresh_dashboard()
+        view.refresh_dashboard(force=True)
+        self.wait_for_jobs(view, qtbot)
+        qtbot.waitUntil(lambda: not model._in_flight, timeout=2000)
+
+        # Assert
+        assert throttled is None
+        assert view.transaction_table is table and table.model() is model
+        assert len(view.widget_17.findChildren(TransactionTableWidget)) == 1
+        refresh_call = (
+            mock_api_client_instance.retrieve_user_transactions.call_args_list[0]
+        )
+        assert refresh_call.kwargs.get("since_id") == (10 if keyset_paging else None)
+        assert model.rowCount() == 11
+        assert [model.transaction_at(row).transaction_id for row in range(11)] == list(
+            range(11, 0, -1)
+        )
+        assert model.transaction_at(8).status == "FAILED"
+
+    @patch("src.views.main_window_view.APIClient")
+    def test_show_cached_dashboard(self, mock_api_client_class, qtbot):
+        # Arrange
+        cached_client = MagicMock()
+        cached_client.retrieve_user_info.return_value = {
+            "user_profile": {"id": 1},
+            "user_accounts": {
+                "accounts": [{"account_number": "111", "account_name": "Checking"}]
+            },
+        }
+        cached_client.retrieve_user_transactions.return_value = {
+            "transactions": [{"account_from": "111", "amount": 5, "status": "OK"}]
+        }
+        view = main_window_view()
+        qtbot.add_widget(view)
+
+        # Act
+        shown = view.show_cached_dashboard(cached_client)
+
+        # Assert
+        assert shown
+        assert view.account_directory.get_account_name("111") == "Checking"
+        model = view.transaction_table.model()
+        assert model.transaction_at(0).account_name == "Checking"
+        mock_api_client_class.return_value.retrieve_user_transactions.assert_not_called()
+
+    @patch("src.views.main_window_view.APIClient")
+    def test_show_cached_dashboard_without_cache(self, mock_api_client_class, qtbot):
+        # Arrange
+        cached_client = MagicMock()
+        cached_client.retrieve_user_info.side_effect = APIClientError("No cached")
+        view = main_window_view()
+        qtbot.add_widget(view)
+
+        # Act & Assert
+        assert not view.show_cached_dashboard(cached_client)
+        assert view.transaction_table is None
+
+    @patch("src.views.main_window_view.APIClient")
+    def test_filtering_and_sorting_the_live_table_loads_every_transaction(
+        self, mock_api_client_class, qtbot
+    ):
+        # Arrange
+        def transaction(transaction_id):
+            return {
+                "id": transaction_id,
+                "account_from": "111",
+                "account_name": "Checking",
+                "amount": transaction_id,
+                "timestamp": f"2023-10-{transaction_id:02d}T12:00:00",
+                "balance_after": 900,
+                "status": "FAILED" if transaction_id % 5 == 0 else "COMPLETED",
+            }
+
+        server = [transaction(i) for i in range(30, 0, -1)]
+        mock_api_client_instance = mock_api_client_class.return_value
+        mock_api_client_instance.retrieve_user_transactions.side_effect = (
+            lambda limit, offset: {"transactions": server[offset : offset + 10]}
+        )
+        mock_api_client_instance.iter_transactions.side_effect = lambda **params: iter(
+            server
+        )
+        mock_api_client_instance.retrieve_user_info.return_value = {
+            "user_profile": {"id": 1},
+            "user_accounts": {"accounts": []},
+        }
+        view = main_window_view()
+        qtbot.add_widget(view)
+        view.load_transaction_table()
+        self.wait_for_jobs(view, qtbot)
+        bar = view.transaction_filter_bar
+        paged_model = view.transaction_table.model()
+
+        # Act
+        bar.status_box.setCurrentIndex(bar.status_box.findData("FAILED"))
+        self.wait_for_jobs(view, qtbot)
+        filtered = view.transaction_table.model()
+        view.transaction_table.sortByColumn(
+            TransactionTableModel.AMOUNT, Qt.SortOrder.AscendingOrder
+        )
+        server[:0] = [transaction(35), transaction(31)]
+        view.refresh_dashboard(force=True)
+        self.wait_for_jobs(view, qtbot)
+        refreshed = view.transaction_table.model()
+        refreshed_amounts = [
+            refreshed.transaction_at(row).amount for row in range(refreshed.rowCount())
+        ]
+        sorted_by = view.transaction_table.horizontalHeader().sortIndicatorSection()
+        bar.clear_button.click()
+        cleared = view.transaction_table.model()
+
+        # Assert
+        assert isinstance(paged_model, PagedTransactionTableModel)
+        assert isinstance(filtered, TransactionSortFilterModel)
+        # The new transactions are merged into the loaded ones, which stay
+        # filtered and sorted.
+        assert refreshed is filtered
+        assert refreshed_amounts == [
+            "5.00",
+            "10.00",
+            "15.00",
+            "20.00",
+            "25.00",
+            "30.00",
+            "35.00",
+        ]
+        assert sorted_by == TransactionTableModel.AMOUNT
+        assert mock_api_client_instance.iter_transactions.call_count == 1
+        # Clearing goes back to the pages, which got the new ones on top.
+        assert cleared is paged_model
+        assert not view.all_transactions_shown
+        assert paged_model.rowCount() == 12
+        assert [paged_model.transaction_at(row).transaction_id for row in (0, 1)] == [
+            35,
+            31,
+        ]
+        assert filtered.sort_column == -1 and filtered.row_filter is None
+        assert [filtered.transaction_at(row).transaction_id for row in (0, 1, 2)] == [
+            35,
+            31,
+            30,
+        ]
+
+    @patch("src.views.main_window_view.APIClient")
+    def test_every_transaction_is_loaded_once_with_progress_shown(
+        self, mock_api_client_class, qtbot
+    ):
+        # Arrange
+        server = [
+            {"id": i, "amount": i, "status": "FAILED" if i % 2 else "COMPLETED"}
+            for i in range(1200, 0, -1)
+        ]
+        release = threading.Event()
+
+        def iter_transactions(page_size):
+            for index, transaction in enumerate(server):
+                if index == page_size:
+                    release.wait(2)
+                yield transaction
+
+        mock_api_client_instance = mock_api_client_class.return_value
+        mock_api_client_instance.retrieve_user_transactions.side_effect = (
+            lambda limit, offset: {"transactions": server[offset : offset + limit]}
+        )
+        mock_api_client_instance.iter_transactions.side_effect = iter_transactions
+        view = main_window_view()
+        qtbot.add_widget(view)
+        view.load_transaction_table()
+        self.wait_for_jobs(view, qtbot)
+        bar = view.transaction_filter_bar
+        paged_model = view.transaction_table.model()
+
+        # Act
+        bar.status_box.setCurrentIndex(bar.status_box.findData("FAILED"))
+        qtbot.waitUntil(lambda: "500 transactions" in view.statusBar().currentMessage())
+        bar_enabled_while_loading = bar.isEnabled()
+        # A header click meanwhile is applied once every transaction is in.
+        view.transaction_table.sortByColumn(
+            TransactionTableModel.AMOUNT, Qt.SortOrder.AscendingOrder
+        )
+        release.set()
+        self.wait_for_jobs(view, qtbot)
+        full_model = view.transaction_table.model()
+        first_failed = full_model.transaction_at(0).amount
+        bar.status_box.setCurrentIndex(bar.status_box.findData("COMPLETED"))
+        bar.clear()
+        self.wait_for_jobs(view, qtbot)
+
+        # Assert
+        assert not bar_enabled_while_loading
+        assert bar.isEnabled()
+        assert not view.controller.busy
+        assert view.statusBar().currentMessage() == ""
+        assert first_failed == "1.00"
+        # Still sorted, so every transaction stays shown, from the same model.
+        assert view.transaction_table.model() is full_model
+        assert view.all_transactions_shown
+        assert full_model.rowCount() == 1200
+        assert full_model.transaction_at(0).amount == "1.00"
+        assert mock_api_client_instance.iter_transactions.call_count == 1
+        assert paged_model is view._paged_model
+
+    @patch("src.views.main_window_view.APIClient")
+    def test_sorting_the_paged_table_loads_every_transaction(
+        self, mock_api_client_class, qtbot
+    ):
+        # Arrange
+        server = [
+            {"id": i, "amount": i, "timestamp": "2023-10-01T12:00:00"}
+            for i in range(30, 0, -1)
+        ]
+        mock_api_client_instance = mock_api_client_class.return_value
+        mock_api_client_instance.retrieve_user_transactions.side_effect = (
+            lambda limit, offset: {"transactions": server[offset : offset + 10]}
+        )
+        mock_api_client_instance.iter_transactions.side_effect = lambda **params: iter(
+            server
+        )
+        view = main_window_view()
+        qtbot.add_widget(view)
+        view.load_transaction_table()
+        self.wait_for_jobs(view, qtbot)
+
+        # Act
+        view.transaction_table.sortByColumn(
+            TransactionTableModel.AMOUNT, Qt.SortOrder.AscendingOrder
+        )
+        self.wait_for_jobs(view, qtbot)
+        model = view.transaction_table.model()
+
+        # Assert
+        assert isinstance(model, TransactionSortFilterModel)
+        assert model.rowCount() == 30
+        assert model.transaction_at(0).amount == "1.00"
+        assert model.transaction_at(29).amount == "30.00"
+
+    @patch("src.views.main_window_view.AsyncAPIClient")
+    @patch("src.views.main_window_view.APIClient")
+    def test_hiding_the_window_cancels_pending_loads(
+        self, mock_api_client_class, mock_async_api_client_class, qtbot
+    ):
+        # Arrange
+        async def slow_load_dashboard(limit):
+            await asyncio.sleep(10)
+
+        mock_async_api_client_class.return_value.load_dashboard = slow_load_dashboard
+        release = threading.Event()
+        mock_api_client_instance = mock_api_client_class.return_value
+        mock_api_client_instance.retrieve_user_transactions.side_effect = (
+            lambda **params: release.wait(2) and {"transactions": []}
+        )
+        view = main_window_view()
+        qtbot.add_widget(view)
+        worker = view.load_transaction_table()
+
+        # Act
+        view.show()
+        dashboard_task = view._refresh_job
+        view.hide()
+        release.set()
+        self.wait_for_jobs(view, qtbot)
+
+        # Assert
+        assert worker.is_cancelled
+        assert dashboard_task.future.cancelled()
+        assert view.transaction_table is None
+        assert not view.controller.busy
+
+    @patch("src.views.main_window_view.AsyncAPIClient")
+    @patch("src.views.main_window_view.APIClient")
+    def test_load_dashboard_fetches_concurrently_through_the_async_client(
+        self, mock_api_client_class, mock_async_api_client_class, qtbot
+    ):
+        # Arrange
+        user_info = {
+            "user_profile": {"id": 1},
+            "user_accounts": {
+                "accounts": [{"account_number": "111", "account_name": "Checking"}]
+            },
+        }
+        mock_async_api_client = mock_async_api_client_class.return_value
+        mock_async_api_client.load_dashboard = AsyncMock(
+            return_value={
+                **user_info,
+                "transactions": {
+                    "transactions": [
+                        {"id": 2, "account_from": "222", "amount": 20},
+                        {"id": 1, "account_from": "111", "amount": 10},
+                    ]
+                },
+                "account_details": {"222": {"account_name": "Savings"}},
+            }
+        )
+        view = main_window_view()
+        qtbot.add_widget(view)
+        loading = []
+        view.controller.loading_started.connect(lambda: loading.append("started"))
+        view.controller.loading_finished.connect(lambda: loading.append("finished"))
+
+        # Act
+        task = view.load_dashboard()
+        self.wait_for_jobs(view, qtbot)
+
+        # Assert
+        assert task.done()
+        mock_async_api_client.load_dashboard.assert_awaited_once_with(
+            main_window_view_module.TRANSACTION_PAGE_SIZE
+        )
+        assert view.cached_user_info == user_info
+        model = view.transaction_table.model()
+        assert isinstance(model, PagedTransactionTableModel)
+        assert [model.transaction_at(row).account_name for row in range(2)] == [
+            "Savings",
+            "Checking",
+        ]
+        # The account lookup was part of load_dashboard; none was made here.
+        mock_api_client_class.return_value.get_account_details.assert_not_called()
+        assert loading == ["started", "finished"]
+
+    def test_loaded_dashboard_is_painted_from_the_disk_cache_after_restart(
+        self, stub_server_factory, tmp_path, qtbot
+    ):
+        # Arrange
+        server = stub_server_factory(transactions=150)
+        header = {"Authorization": "Bearer opaque"}
+        db_path = str(tmp_path / "api_cache.sqlite3")
+        with patch.object(
+            SessionManager, "get_authenticated_headers", return_value=header
+        ), patch.object(
+            SessionManager, "_get_current_auth_header", return_value=header
+        ), patch(
+            "src.views.main_window_view.AsyncAPIClient",
+            lambda: AsyncAPIClient(base_url=server.base_url),
+        ), patch(
+            "src.views.main_window_view.APIClient",
+            lambda: APIClient(base_url=server.base_url),
+        ):
+            with patch(
+                "src.services.response_cache._response_cache",
+                ResponseCache(disk_store=DiskResponseCache(db_path)),
+            ):
+                online = main_window_view()
+                qtbot.add_widget(online)
+                online.load_dashboard()
+                self.wait_for_jobs(online, qtbot)
+                get_async_bridge().submit(
+                    online.async_api_client.close()
+                ).future.result(timeout=1)
+
+            # A restart: fresh memory cache over the same database.
+            with patch(
+                "src.services.response_cache._response_cache",
+                ResponseCache(disk_store=DiskResponseCache(db_path)),
+            ):
+                restarted = main_window_view()
+                qtbot.add_widget(restarted)
+
+                # Act
+                shown = restarted.show_cached_dashboard(
+                    APIClient(base_url=server.base_url, cache_only=True)
+                )
+
+        # Assert
+        assert shown
+        page_size = main_window_view_module.TRANSACTION_PAGE_SIZE
+        assert online.transaction_table.model().rowCount() == page_size
+        model = restarted.transaction_table.model()
+        assert model.rowCount() == page_size
+        assert [model.transaction_at(row).transaction_id for row in range(3)] == [
+            online.transaction_table.model().transaction_at(row).transaction_id
+            for row in range(3)
+        ]
+
+    @patch("src.views.main_window_view.AsyncAPIClient")
+    def test_failed_dashboard_load_is_reported(
+        self, mock_async_api_client_class, qtbot
+    ):
+        # Arrange
+        mock_async_api_client_class.return_value.load_dashboard = AsyncMock(
+            side_effect=APIClientError("server down")
+        )
+        view = main_window_view()
+        qtbot.add_widget(view)
+        errors = []
+        view.controller.error_occurred.connect(errors.append)
+
+        # Act
+        view.load_dashboard()
+        self.wait_for_jobs(view, qtbot)
+
+        # Assert
+        assert errors == ["server down"]
+        assert "server down" in view.statusBar().currentMessage()
+        assert view.transaction_table is None
@@ -0,0 +1,258 @@
+import asyncio
+import json
+from datetime import timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+from requests import PreparedRequest, Response
+from requests.exceptions import ConnectionError
+from requests.structures import CaseInsensitiveDict
+
+from src.services.api_client_service import APIClient, APIClientError
+from src.services.async_api_client import AsyncAPIClient
+from src.services.metrics import (
+    Histogram,
+    MetricsFileExporter,
+    MetricsRegistry,
+    endpoint_label,
+)
+from src.services.response_cache import ResponseCache
+from src.services.session_manager import SessionManager
+from tests.test_async_api_client import StubBackend
+
+BASE_URL = "http://127.0.0.1:5000/api/v1/"
+
+
+def make_response(status_code=200, body=None, headers=None, sent=None) -> Response:
+    response = Response()
+    response.status_code = status_code
+    response._content = json.dumps(body or {}).encode()
+    response.headers = CaseInsensitiveDict(headers or {})
+    response.elapsed = timedelta(milliseconds=20)
+    response.request = PreparedRequest()
+    response.request.body = sent
+    return response
+
+
+class TestMetricsRegistry:
+    def test_endpoint_label_folds_ids(self):
+        # Act & Assert
+        assert endpoint_label("users/7/accounts") == "users/{id}/accounts"
+        assert endpoint_label("/accounts/1001") == "accounts/{id}"
+        assert endpoint_label("users/current") == "users/current"
+
+    def test_histogram_quantiles(self):
+        # Arrange
+        histogram = Histogram(buckets=(0.1, 0.2, 0.4))
+        for value in (0.05, 0.05, 0.15, 0.3):
+            histogram.observe(value)
+
+        # Act & Assert
+        assert histogram.quantile(0.5) == pytest.approx(0.1)
+        assert 0.2 < histogram.quantile(0.95) <= 0.4
+        assert list(histogram.cumulative()) == [
+            ("0.1", 2),
+            ("0.2", 3),
+            ("0.4", 4),
+            ("+Inf", 4),
+        ]
+
+    def test_track_records_status_bytes_and_phases(self):
+        # Arrange
+        registry = MetricsRegistry()
+
+        # Act
+        with registry.track("users/7/accounts", "get") as sample:
+            sample.response = make_response(body={"accounts": []}, sent=b"abc")
+            sample.bytes_out = 3
+
+        # Assert
+        endpoint = registry.snapshot()["endpoints"]["GET users/{id}/accounts"]
+        assert endpoint["requests"] == 1
+        assert endpoint["statuses"] == {"200": 1}
+        assert endpoint["bytes_in"] == len(b'{"accounts": []}')
+        assert endpoint["bytes_out"] == 3
+        assert set(endpoint["latency"]) == {"total", "ttfb"}
+        assert endpoint["latency"]["ttfb"]["mean"] == pytest.approx(0.02)
+
+    def test_track_records_errors(self):
+        # Arrange
+        registry = MetricsRegistry()
+
+        # Act
+        with pytest.raises(ConnectionError):
+            with registry.track("transactions", "GET"):
+                raise ConnectionError("down")
+
+        # Assert
+        endpoint = registry.snapshot()["endpoints"]["GET transactions"]
+        assert endpoint["statuses"] == {"error": 1}
+
+    def test_prometheus_text(self):
+        # Arrange
+        registry = MetricsRegistry(buckets=(0.5, 1))
+        with registry.track("users/current", "GET") as sample:
+            sample.response = make_response()
+        registry.record_retry("users/current", "GET")
+
+        # Act
+        text = registry.to_prometheus()
+
+        # Assert
+        assert "# TYPE bankops_api_request_duration_seconds histogram" in text
+        assert (
+            'bankops_api_request_duration_seconds_bucket{endpoint="users/current",'
+            'method="GET",phase="total",le="+Inf"} 1'
+        ) in text
+        assert (
+            'bankops_api_requests_total{endpoint="users/current",method="GET",'
+            'status="200",cache="bypass"} 1'
+        ) in text
+        assert (
+            'bankops_api_retries_total{endpoint="users/current",method="GET"} 1'
+        ) in text
+
+    def test_file_exporter_writes_prometheus_text(self, tmp_path):
+        # Arrange
+        registry = MetricsRegistry()
+        registry.record_retry("transactions", "GET")
+        path = tmp_path / "metrics" / "bankops.prom"
+        exporter = MetricsFileExporter(registry, str(path), interval=60)
+
+        # Act
+        exporter.start()
+        exporter.stop(timeout=2)
+
+        # Assert
+        assert path.read_text() == registry.to_prometheus()
+        assert not (tmp_path / "metrics" / "bankops.prom.tmp").exists()
+
+
+class TestAPIClientMetrics:
+    @pytest.fixture(autouse=True)
+    def no_sleep(self):
+        with patch("src.services.api_client_service.time.sleep"):
+            yield
+
+    @pytest.fixture
+    def http_session(self):
+        return MagicMock()
+
+    @pytest.fixture
+    def registry(self):
+        return MetricsRegistry()
+
+    def test_cache_outcomes_are_recorded(self, http_session, registry):
+        # Arrange
+        client = APIClient(
+            base_url=BASE_URL,
+            http_session=http_session,
+            response_cache=ResponseCache(ttls={}),
+            metrics=registry,
+        )
+        http_session.request.side_effect = [
+            make_response(body={"user": {}}, headers={"ETag": '"v1"'}),
+            make_response(status_code=304),
+        ]
+
+        # Act
+        client._make_request("GET", "users/current")
+        client._make_request("GET", "users/current")
+        client.response_cache.ttls = {"users/current": 60}
+        client.response_cache.store(
+            client.response_cache.make_key("users/current"),
+            "users/current",
+            make_response(body={"user": {}}),
+        )
+        client._make_request("GET", "users/current")
+
+        # Assert
+        endpoint = registry.snapshot()["endpoints"]["GET users/current"]
+        assert endpoint["cache"] == {"miss": 1, "revalidated": 1, "hit": 1}
+        assert endpoint["statuses"] == {"200": 2, "304": 1}
+
+    def test_retries_and_bytes_sent_are_recorded(self, http_session, registry):
+        # Arrange
+        client = APIClient(
+            base_url=BASE_URL,
+            http_session=http_session,
+            cache_responses=False,
+            metrics=registry,
+        )
+        http_session.request.side_effect = [
+            ConnectionError("reset"),
+            make_response(status_code=201, sent=b'{"a": 1}'),
+        ]
+
+        # Act
+        client._make_request("PUT", "accounts/1001", json={"a": 1})
+
+        # Assert
+        endpoint = registry.snapshot()["endpoints"]["PUT accounts/{id}"]
+        assert endpoint["retries"] == 1
+        assert endpoint["bytes_out"] == 8
+        assert endpoint["statuses"] == {"201": 1}
+
+    def test_failed_request_is_recorded(self, http_session, registry):
+        # Arrange
+        client = APIClient(
+            base_url=BASE_URL,
+            http_session=http_session,
+            cache_responses=False,
+            retry_policies={},
+            metrics=registry,
+        )
+        http_session.request.return_value = make_response(status_code=404)
+
+        # Act
+        with pytest.raises(APIClientError):
+            client._make_request("GET", "accounts/1")
+
+        # Assert
+        endpoint = registry.snapshot()["endpoints"]["GET accounts/{id}"]
+        assert endpoint["statuses"] == {"404": 1}
+
+    def test_session_manager_login_is_recorded(self, registry):
+        # Arrange
+        with patch(
+            "src.services.session_manager.get_metrics", return_value=registry
+        ), patch("requests.Session.post") as mock_post, patch.object(
+            SessionManager, "_read_keyring", return_value=None
+        ):
+            mock_post.return_value = make_response(
+                status_code=401, body={"error": "Invalid credentials"}
+            )
+
+            # Act
+            SessionManager().login("user", "bad")
+
+        # Assert
+        endpoint = registry.snapshot()["endpoints"]["POST auth/sessions/users"]
+        assert endpoint["statuses"] == {"401": 1}
+
+
+class TestAsyncAPIClientMetrics:
+    def test_connect_and_ttfb_phases_are_recorded(self):
+        # Arrange
+        registry = MetricsRegistry()
+
+        async def run():
+            backend = StubBackend()
+            await backend.start()
+            try:
+                async with AsyncAPIClient(
+                    base_url=backend.base_url, metrics=registry
+                ) as client:
+                    await client.create_user("a@b.c", "user", "pw")
+            finally:
+                await backend.stop()
+
+        # Act
+        asyncio.run(run())
+
+        # Assert
+        endpoint = registry.snapshot()["endpoints"]["POST users"]
+        assert endpoint["statuses"] == {"201": 1}
+        assert endpoint["bytes_out"] > 0
+        assert endpoint["bytes_in"] > 0
+        assert {"total", "ttfb", "connect"} <= set(endpoint["latency"])
@@ -0,0 +1,178 @@
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import pytest
+from requests import Response
+
+from src.services.api_client_service import APIClient, APIClientError, SessionManager
+from src.services.request_coalescer import RequestCoalescer
+
+BASE_URL = "http://127.0.0.1:5000/api/v1/"
+
+
+def run_concurrently(count, fn):
+    with ThreadPoolExecutor(max_workers=count) as executor:
+        futures = [executor.submit(fn) for _ in range(count)]
+        return [future.exception() or future.result() for future in futures]
+
+
+class TestRequestCoalescer:
+    def test_concurrent_calls_share_one_result(self):
+        # Arrange
+        coalescer = RequestCoalescer()
+        release = threading.Event()
+        fn = MagicMock(side_effect=lambda: release.wait(2) and "result")
+
+        def call():
+            return coalescer.do("key", fn)
+
+        # Act
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            futures = [executor.submit(call) for _ in range(5)]
+            while coalescer.stats()["coalesced"] < 4:
+                pass
+            release.set()
+            results = [future.result() for future in futures]
+
+        # Assert
+        assert results == ["result"] * 5
+        fn.assert_called_once()
+        assert coalescer.stats() == {"calls": 1, "coalesced": 4}
+        assert coalescer.in_flight == 0
+
+    def test_error_is_shared_with_waiters(self):
+        # Arrange
+        coalescer = RequestCoalescer()
+        release = threading.Event()
+
+        def fail():
+            release.wait(2)
+            raise ValueError("boom")
+
+        # Act
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [executor.submit(coalescer.do, "key", fail) for _ in range(3)]
+            while coalescer.stats()["coalesced"] < 2:
+                pass
+            release.set()
+            errors = [future.exception() for future in futures]
+
+        # Assert
+        assert all(isinstance(error, ValueError) for error in errors)
+        assert coalescer.stats()["calls"] == 1
+
+    def test_calls_after_completion_run_again(self):
+        # Arrange
+        coalescer = RequestCoalescer()
+        fn = MagicMock(return_value=1)
+
+        # Act
+        coalescer.do("key", fn)
+        coalescer.do("key", fn)
+
+        # Assert
+        assert fn.call_count == 2
+
+
+class TestAPIClientCoalescing:
+    @pytest.fixture(autouse=True)
+    def auth_headers(self):
+        with patch.object(
+            SessionManager,
+            "get_authenticated_headers",
+            return_value={"Authorization": "Bearer test_token"},
+        ) as mock_headers:
+            yield mock_headers
+
+    @pytest.fixture
+    def slow_session(self):
+        """An HTTP session whose requests take a moment to answer."""
+        session = MagicMock()
+
+        def request(method, url, **kwargs):
+            time.sleep(0.2)
+            response = Response()
+            response.status_code = 200
+            response._content = json.dumps(
+                {"account": {"account_name": url.rsplit("/", 1)[-1]}}
+            ).encode()
+            return response
+
+        session.request.side_effect = request
+        return session
+
+    def test_identical_gets_share_one_request(self, slow_session):
+        # Arrange
+        client = APIClient(
+            base_url=BASE_URL, http_session=slow_session, cache_responses=False
+        )
+
+        # Act
+        results = run_concurrently(5, lambda: client.get_account_details("111"))
+
+        # Assert
+        assert results == [{"account_name": "111"}] * 5
+        slow_session.request.assert_called_once()
+
+    def test_different_params_are_not_coalesced(self, slow_session):
+        # Arrange
+        client = APIClient(
+            base_url=BASE_URL, http_session=slow_session, cache_responses=False
+        )
+        numbers = iter(["111", "222"])
+
+        # Act
+        run_concurrently(2, lambda: client.get_account_details(next(numbers)))
+
+        # Assert
+        assert slow_session.request.call_count == 2
+
+    def test_different_users_are_not_coalesced(self, slow_session, auth_headers):
+        # Arrange
+        client = APIClient(
+            base_url=BASE_URL, http_session=slow_session, cache_responses=False
+        )
+        tokens = iter(["Bearer a", "Bearer b"])
+        auth_headers.side_effect = lambda: {"Authorization": next(tokens)}
+
+        # Act
+        run_concurrently(2, lambda: client.get_account_details("111"))
+
+        # Assert
+        assert slow_session.request.call_count == 2
+
+    def test_coalesced_error_reaches_every_caller(self, slow_session):
+        # Arrange
+        def request(*args, **kwargs):
+            time.sleep(0.2)
+            raise OSError("down")
+
+        slow_session.request.side_effect = request
+        client = APIClient(
+            base_url=BASE_URL, http_session=slow_session, cache_responses=False
+        )
+
+        # Act
+        results = run_concurrently(3, lambda: client.get_account_details("111"))
+
+        # Assert
+        assert all(isinstance(result, APIClientError) for result in results)
+        slow_session.request.assert_called_once()
+
+    def test_coalescing_can_be_disabled(self, slow_session):
+        # Arrange
+        client = APIClient(
+            base_url=BASE_URL,
+            http_session=slow_session,
+            cache_responses=False,
+            coalesce_requests=False,
+        )
+
+        # Act
+        run_concurrently(3, lambda: client.get_account_details("111"))
+
+        # Assert
+        assert slow_session.request.call_count == 3
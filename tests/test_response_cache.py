@@ -0,0 +1,220 @@
+import base64
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+
+from src.services.api_client_service import APIClient, SessionManager
+from src.services.response_cache import ResponseCache, auth_identity
+
+BASE_URL = "http://127.0.0.1:5000/api/v1/"
+
+
+def make_response(status_code=200, body=None, headers=None, url=BASE_URL):
+    response = Response()
+    response.status_code = status_code
+    response._content = b"" if body is None else json.dumps(body).encode()
+    response.headers = CaseInsensitiveDict(headers or {})
+    response.url = url
+    response.encoding = "utf-8"
+    return response
+
+
+def make_jwt(subject) -> str:
+    payload = base64.urlsafe_b64encode(json.dumps({"sub": subject}).encode())
+    return f"header.{payload.decode().rstrip('=')}.signature"
+
+
+class TestResponseCache:
+    def test_store_and_lookup_fresh_entry(self):
+        # Arrange
+        cache = ResponseCache(ttls={"users/current": 60})
+        key = cache.make_key("users/current")
+        cache.store(key, "users/current", make_response(body={"user": {"id": 1}}))
+
+        # Act
+        entry, fresh = cache.lookup(key)
+
+        # Assert
+        assert fresh
+        assert entry.to_response().json() == {"user": {"id": 1}}
+        assert cache.stats()["hits"] == 1
+
+    def test_max_age_overrides_endpoint_ttl(self):
+        # Arrange
+        cache = ResponseCache(ttls={"transactions": 60})
+        key = cache.make_key("transactions")
+
+        # Act
+        cache.store(
+            key,
+            "transactions",
+            make_response(body={}, headers={"Cache-Control": "max-age=0"}),
+        )
+
+        # Assert
+        assert cache.lookup(key) == (cache.get(key), False)
+
+    def test_no_store_is_not_cached(self):
+        # Arrange
+        cache = ResponseCache()
+        key = cache.make_key("users/current")
+
+        # Act
+        stored = cache.store(
+            key,
+            "users/current",
+            make_response(body={}, headers={"Cache-Control": "no-store"}),
+        )
+
+        # Assert
+        assert not stored
+        assert len(cache) == 0
+
+    def test_lru_eviction_by_bytes(self):
+        # Arrange
+        cache = ResponseCache(max_bytes=40)
+        body = {"data": "x" * 10}  # 22 bytes once encoded
+        first, second = cache.make_key("a"), cache.make_key("b")
+        cache.store(first, "a", make_response(body=body))
+        cache.store(second, "b", make_response(body=body))
+
+        # Assert
+        assert cache.get(first) is None
+        assert cache.get(second) is not None
+        assert cache.size == 22
+
+    def test_params_order_does_not_matter(self):
+        # Act & Assert
+        assert ResponseCache.make_key(
+            "transactions", {"limit": 30, "offset": 0}
+        ) == ResponseCache.make_key("transactions", {"offset": 0, "limit": 30})
+
+    def test_invalidate_for_write(self):
+        # Arrange
+        cache = ResponseCache()
+        for endpoint in ["users/current", "users/1/accounts", "transactions"]:
+            cache.store(cache.make_key(endpoint), endpoint, make_response(body={}))
+
+        # Act
+        dropped = cache.invalidate_for_write("users")
+
+        # Assert
+        assert dropped == 2
+        assert cache.get(cache.make_key("transactions")) is not None
+
+    def test_auth_identity_uses_jwt_subject(self):
+        # Act
+        first = auth_identity({"Authorization": f"Bearer {make_jwt(7)}"})
+        opaque = auth_identity({"Authorization": "Bearer opaque"})
+
+        # Assert
+        assert first == "sub:7"
+        assert opaque.startswith("token:")
+        assert auth_identity({}) == "anonymous"
+
+
+class TestAPIClientResponseCache:
+    @pytest.fixture
+    def http_session(self):
+        return MagicMock()
+
+    @pytest.fixture
+    def api_client(self, http_session):
+        return APIClient(
+            base_url=BASE_URL,
+            http_session=http_session,
+            response_cache=ResponseCache(ttls={}, default_ttl=0),
+        )
+
+    @pytest.fixture(autouse=True)
+    def auth_headers(self):
+        with patch.object(
+            SessionManager,
+            "get_authenticated_headers",
+            return_value={"Authorization": f"Bearer {make_jwt(1)}"},
+        ) as mock_headers:
+            yield mock_headers
+
+    def test_not_modified_is_served_from_cache(self, api_client, http_session):
+        # Arrange
+        http_session.request.side_effect = [
+            make_response(body={"user": {"id": 1}}, headers={"ETag": '"v1"'}),
+            make_response(status_code=304, headers={"ETag": '"v1"'}),
+        ]
+
+        # Act
+        api_client._make_request("GET", "users/current", authenticated=True)
+        response = api_client._make_request(
+            "GET", "users/current", authenticated=True, expected_status=200
+        )
+
+        # Assert
+        assert response.status_code == 200
+        assert response.json() == {"user": {"id": 1}}
+        second_headers = http_session.request.call_args_list[1].kwargs["headers"]
+        assert second_headers["If-None-Match"] == '"v1"'
+        assert api_client.response_cache.stats()["revalidations"] == 1
+
+    def test_fresh_entry_skips_the_network(self, api_client, http_session):
+        # Arrange
+        api_client.response_cache.ttls = {"transactions": 30}
+        http_session.request.return_value = make_response(body={"transactions": []})
+
+        # Act
+        api_client._make_request(
+            "GET", "transactions", authenticated=True, params={"limit": 30}
+        )
+        api_client._make_request(
+            "GET", "transactions", authenticated=True, params={"limit": 30}
+        )
+
+        # Assert
+        http_session.request.assert_called_once()
+
+    def test_other_user_does_not_share_entries(
+        self, api_client, http_session, auth_headers
+    ):
+        # Arrange
+        api_client.response_cache.ttls = {"users/current": 30}
+        http_session.request.return_value = make_response(body={"user": {"id": 1}})
+        api_client._make_request("GET", "users/current", authenticated=True)
+
+        # Act
+        auth_headers.return_value = {"Authorization": f"Bearer {make_jwt(2)}"}
+        api_client._make_request("GET", "users/current", authenticated=True)
+
+        # Assert
+        assert http_session.request.call_count == 2
+
+    def test_write_invalidates_cached_collection(self, api_client, http_session):
+        # Arrange
+        api_client.response_cache.ttls = {"users/*": 30}
+        http_session.request.side_effect = [
+            make_response(body={"user": {"id": 1}}),
+            make_response(status_code=201, body={"id": 2}),
+        ]
+        api_client._make_request("GET", "users/current", authenticated=True)
+
+        # Act
+        api_client.create_user("a@b.c", "user", "pw")
+
+        # Assert
+        assert len(api_client.response_cache) == 0
+
+    def test_caching_can_be_disabled(self, http_session):
+        # Arrange
+        client = APIClient(
+            base_url=BASE_URL, http_session=http_session, cache_responses=False
+        )
+        http_session.request.return_value = make_response(body={})
+
+        # Act
+        client._make_request("GET", "users/current")
+        client._make_request("GET", "users/current")
+
+        # Assert
+        assert client.response_cache is None
+        assert http_session.request.call_count == 2
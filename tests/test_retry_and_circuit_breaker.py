@@ -0,0 +1,283 @@
+from email.utils import formatdate
+from unittest.mock import MagicMock, patch
+
+import pytest
+from requests import Response
+from requests.exceptions import ConnectionError, RequestException
+from requests.structures import CaseInsensitiveDict
+
+from src.services.api_client_service import APIClient, APIClientError
+from src.services.circuit_breaker import (
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
+    add_circuit_listener,
+    configure_circuit_breakers,
+    get_circuit_breaker,
+)
+from src.services.retry_policy import RetryPolicy, parse_retry_after, policy_for
+
+BASE_URL = "http://127.0.0.1:5000/api/v1/"
+
+
+def make_response(status_code, headers=None) -> Response:
+    response = Response()
+    response.status_code = status_code
+    response._content = b"{}"
+    response.headers = CaseInsensitiveDict(headers or {})
+    return response
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestRetryPolicy:
+    def test_only_idempotent_methods_are_retried_by_default(self):
+        # Act & Assert
+        assert policy_for("get") is not None
+        assert policy_for("PUT") is not None
+        assert policy_for("POST") is None
+        assert policy_for("PATCH") is None
+
+    def test_backoff_grows_with_jitter_and_is_capped(self):
+        # Arrange
+        policy = RetryPolicy(backoff_base=1, backoff_max=4)
+
+        # Act
+        delays = [policy.backoff_delay(attempt) for attempt in range(5)]
+
+        # Assert
+        assert 0.5 <= delays[0] <= 1
+        assert 1 <= delays[1] <= 2
+        assert all(2 <= delay <= 4 for delay in delays[2:])
+
+    def test_gives_up_after_max_attempts(self):
+        # Arrange
+        policy = RetryPolicy(max_attempts=2)
+        error = ConnectionError("down")
+
+        # Act & Assert
+        assert policy.retry_delay(0, error=error) is not None
+        assert policy.retry_delay(1, error=error) is None
+
+    def test_only_transient_failures_are_retried(self):
+        # Arrange
+        policy = RetryPolicy()
+
+        # Act & Assert
+        assert policy.retry_delay(0, error=RequestException("bad url")) is None
+        assert policy.retry_delay(0, response=make_response(404)) is None
+        assert policy.retry_delay(0, response=make_response(503)) is not None
+
+    def test_retry_after_is_honoured(self):
+        # Arrange
+        policy = RetryPolicy(max_retry_after=10)
+
+        # Act & Assert
+        response = make_response(429, {"Retry-After": "3"})
+        assert policy.retry_delay(0, response=response) == 3
+        response = make_response(503, {"Retry-After": "60"})
+        assert policy.retry_delay(0, response=response) is None
+
+    def test_parse_retry_after_http_date(self):
+        # Act
+        delay = parse_retry_after(formatdate(1000 + 5, usegmt=True), now=1000)
+
+        # Assert
+        assert delay == 5
+
+
+class TestCircuitBreaker:
+    def test_opens_after_threshold_and_fails_fast(self):
+        # Arrange
+        breaker = CircuitBreaker("host", failure_threshold=2, clock=FakeClock())
+
+        # Act
+        breaker.record_failure()
+        breaker.record_failure()
+
+        # Assert
+        assert breaker.state is CircuitState.OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request()
+        assert breaker.stats()["rejected"] == 1
+
+    def test_half_open_probe_closes_on_success(self):
+        # Arrange
+        clock = FakeClock()
+        breaker = CircuitBreaker(
+            "host", failure_threshold=1, reset_timeout=10, clock=clock
+        )
+        breaker.record_failure()
+        clock.now = 10
+
+        # Act
+        breaker.before_request()
+
+        # Assert
+        assert breaker.state is CircuitState.HALF_OPEN
+        # Only one probe at a time.
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request()
+        breaker.record_success()
+        assert breaker.state is CircuitState.CLOSED
+
+    def test_failed_probe_reopens(self):
+        # Arrange
+        clock = FakeClock()
+        breaker = CircuitBreaker(
+            "host", failure_threshold=1, reset_timeout=10, clock=clock
+        )
+        breaker.record_failure()
+        clock.now = 10
+        breaker.before_request()
+
+        # Act
+        breaker.record_failure()
+
+        # Assert
+        assert breaker.state is CircuitState.OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request()
+
+    def test_release_frees_the_probe_slot(self):
+        # Arrange
+        clock = FakeClock()
+        breaker = CircuitBreaker(
+            "host", failure_threshold=1, reset_timeout=10, clock=clock
+        )
+        breaker.record_failure()
+        clock.now = 10
+        breaker.before_request()
+
+        # Act
+        breaker.release()
+
+        # Assert
+        assert breaker.state is CircuitState.HALF_OPEN
+        breaker.before_request()
+
+    def test_listeners_receive_state_changes(self):
+        # Arrange
+        listener = MagicMock()
+        add_circuit_listener(listener)
+        configure_circuit_breakers(failure_threshold=1)
+        breaker = get_circuit_breaker(BASE_URL)
+
+        # Act
+        breaker.record_failure()
+
+        # Assert
+        assert breaker.host == "http://127.0.0.1:5000"
+        listener.assert_called_once_with(
+            "http://127.0.0.1:5000", CircuitState.CLOSED, CircuitState.OPEN
+        )
+
+
+class TestAPIClientRetries:
+    @pytest.fixture(autouse=True)
+    def no_sleep(self):
+        with patch("src.services.api_client_service.time.sleep") as mock_sleep:
+            yield mock_sleep
+
+    @pytest.fixture
+    def http_session(self):
+        return MagicMock()
+
+    def make_client(self, http_session, **kwargs):
+        return APIClient(
+            base_url=BASE_URL,
+            http_session=http_session,
+            cache_responses=False,
+            **kwargs,
+        )
+
+    def test_get_is_retried_until_it_succeeds(self, http_session, no_sleep):
+        # Arrange
+        http_session.request.side_effect = [
+            ConnectionError("reset"),
+            make_response(503, {"Retry-After": "2"}),
+            make_response(200),
+        ]
+        client = self.make_client(http_session)
+
+        # Act
+        response = client._make_request("GET", "users/current")
+
+        # Assert
+        assert response.status_code == 200
+        assert http_session.request.call_count == 3
+        assert no_sleep.call_args_list[1].args == (2.0,)
+
+    def test_post_is_not_retried(self, http_session):
+        # Arrange
+        http_session.request.side_effect = ConnectionError("reset")
+        client = self.make_client(http_session)
+
+        # Act & Assert
+        with pytest.raises(APIClientError, match="API request failed"):
+            client._make_request("POST", "users", json={})
+        http_session.request.assert_called_once()
+
+    def test_retries_can_be_disabled(self, http_session):
+        # Arrange
+        http_session.request.side_effect = ConnectionError("reset")
+        client = self.make_client(http_session, retry_policies={})
+
+        # Act & Assert
+        with pytest.raises(APIClientError):
+            client._make_request("GET", "users/current")
+        http_session.request.assert_called_once()
+
+    def test_open_circuit_fails_fast(self, http_session):
+        # Arrange
+        configure_circuit_breakers(failure_threshold=2)
+        http_session.request.side_effect = ConnectionError("down")
+        client = self.make_client(http_session, retry_policies={})
+        for _ in range(2):
+            with pytest.raises(APIClientError):
+                client._make_request("GET", "users/current")
+
+        # Act & Assert
+        with pytest.raises(APIClientError, match="is unavailable"):
+            client._make_request("GET", "users/current")
+        assert http_session.request.call_count == 2
+
+    def test_client_errors_do_not_trip_the_circuit(self, http_session):
+        # Arrange
+        configure_circuit_breakers(failure_threshold=1)
+        http_session.request.return_value = make_response(404)
+        client = self.make_client(http_session)
+
+        # Act
+        with pytest.raises(APIClientError):
+            client._make_request("GET", "accounts/1")
+
+        # Assert
+        assert get_circuit_breaker(BASE_URL).state is CircuitState.CLOSED
+
+    def test_aborted_probe_does_not_wedge_the_circuit(self, http_session):
+        # Arrange
+        configure_circuit_breakers(failure_threshold=1, reset_timeout=0)
+        http_session.request.side_effect = [
+            ConnectionError("down"),
+            ValueError("bad response"),
+            make_response(200),
+        ]
+        client = self.make_client(http_session, retry_policies={})
+        with pytest.raises(APIClientError, match="API request failed"):
+            client._make_request("GET", "users/current")
+
+        # Act
+        with pytest.raises(APIClientError, match="unexpected error"):
+            client._make_request("GET", "users/current")
+        response = client._make_request("GET", "users/current")
+
+        # Assert
+        assert response.status_code == 200
+        assert get_circuit_breaker(BASE_URL).state is CircuitState.CLOSED
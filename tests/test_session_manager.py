@@ -1,3 +1,4 @@
+import threading
 import time
 from datetime import datetime, timezone
 from unittest.mock import MagicMock, call, patch
@@ -23,6 +24,8 @@ class TestSessionManager:
         session_manager.timeout = DEFAULT_TIMEOUT
         session_manager.access_token = None
         session_manager.refresh_token = None
+        session_manager.access_token_expire_time = None
+        session_manager.refresh_token_expire_time = None
         session_manager.base_headers = {
             "Content-Type": "application/json",
             "Accept": "application/json",
@@ -40,17 +43,19 @@ class TestSessionManager:
 
     @pytest.fixture
     def mock_requests_post(self):
-        with patch("src.services.session_manager.requests.post") as mock_post:
+        with patch("src.services.session_manager.requests.Session.post") as mock_post:
             yield mock_post
 
     @pytest.fixture
     def mock_requests_get(self):
-        with patch("src.services.session_manager.requests.get") as mock_get:
+        with patch("src.services.session_manager.requests.Session.get") as mock_get:
             yield mock_get
 
     @pytest.fixture
     def mock_requests_delete(self):
-        with patch("src.services.session_manager.requests.delete") as mock_delete:
+        with patch(
+            "src.services.session_manager.requests.Session.delete"
+        ) as mock_delete:
             yield mock_delete
 
     # --- Helper ---
@@ -162,12 +167,13 @@ class TestSessionManager:
     def test_check_expiration_no_token(self, session_manager, mock_keyring):
         # Arrange
         mock_keyring.get_password.return_value = None
+        session_manager.invalidate_cache()
 
         # Act
         is_expired = session_manager.check_expiration()
 
         # Assert
-        mock_keyring.get_password.assert_called_with(
+        mock_keyring.get_password.assert_any_call(
             KEYRING_SERVICE, "access_token_expire_time"
         )
         assert is_expired is True
@@ -178,6 +184,7 @@ class TestSessionManager:
             int(datetime.now(timezone.utc).timestamp() - 60)
         )  # 1 minute ago
         mock_keyring.get_password.return_value = past_timestamp
+        session_manager.invalidate_cache()
 
         # Act
         is_expired = session_manager.check_expiration()
@@ -191,6 +198,7 @@ class TestSessionManager:
             int(datetime.now(timezone.utc).timestamp() + 3600)
         )  # 1 hour from now
         mock_keyring.get_password.return_value = future_timestamp
+        session_manager.invalidate_cache()
 
         # Act
         is_expired = session_manager.check_expiration()
@@ -205,6 +213,7 @@ class TestSessionManager:
         # Arrange
         invalid_timestamp = "not-a-timestamp"
         mock_keyring.get_password.return_value = invalid_timestamp
+        session_manager.invalidate_cache()
         # Mock clear_tokens which gets called internally
         with patch.object(session_manager, "clear_tokens") as mock_clear:
             # Act
@@ -217,6 +226,76 @@ class TestSessionManager:
             )
             mock_clear.assert_called_once()
 
+    def test_init_loads_tokens_from_keyring(self, mock_keyring):
+        # Arrange
+        stored = {
+            "access_token": "stored_access",
+            "refresh_token": "stored_refresh",
+            "access_token_expire_time": "100",
+            "refresh_token_expire_time": "200",
+        }
+        mock_keyring.get_password.side_effect = lambda service, key: stored[key]
+
+        # Act
+        session_manager = SessionManager()
+
+        # Assert
+        assert session_manager.access_token == "stored_access"
+        assert session_manager.refresh_token == "stored_refresh"
+        assert session_manager.access_token_expire_time == "100"
+        assert session_manager.refresh_token_expire_time == "200"
+        assert session_manager.keyring_stats() == {"reads": 4, "writes": 0}
+
+    def test_session_manager_is_shared(self):
+        # Act & Assert
+        assert SessionManager() is SessionManager()
+
+    def test_authenticated_headers_served_from_cache(
+        self, session_manager, mock_keyring
+    ):
+        # Arrange
+        future_timestamp = str(int(datetime.now(timezone.utc).timestamp() + 3600))
+        session_manager.store_token(
+            "cached_access", future_timestamp, "cached_refresh", future_timestamp
+        )
+        mock_keyring.get_password.reset_mock()
+        reads_before = session_manager.keyring_reads
+
+        # Act
+        for _ in range(10):
+            headers = session_manager.get_authenticated_headers()
+
+        # Assert
+        assert headers["Authorization"] == "Bearer cached_access"
+        mock_keyring.get_password.assert_not_called()
+        assert session_manager.keyring_reads == reads_before
+
+    def test_invalidate_cache_rereads_keyring(self, session_manager, mock_keyring):
+        # Arrange
+        session_manager.access_token = "stale"
+        mock_keyring.get_password.return_value = "fresh"
+        reads_before = session_manager.keyring_reads
+
+        # Act
+        session_manager.invalidate_cache()
+
+        # Assert
+        assert session_manager.access_token == "fresh"
+        assert session_manager.refresh_token == "fresh"
+        assert session_manager.keyring_reads == reads_before + 4
+
+    def test_keyring_writes_are_counted(self, session_manager):
+        # Arrange
+        writes_before = session_manager.keyring_writes
+
+        # Act
+        session_manager.store_token("a", "1", "r", "2")
+        session_manager.clear_tokens()
+
+        # Assert
+        assert session_manager.keyring_writes == writes_before + 8
+        assert session_manager.access_token_expire_time is None
+
     # --- Test attempt_session_refresh ---
     @patch("src.services.session_manager.datetime", wraps=datetime)
     def test_attempt_session_refresh_success(
@@ -410,6 +489,82 @@ class TestSessionManager:
         mock_check_exp.assert_called_once()
         mock_refresh.assert_called_once_with(session_manager.refresh_token)
 
+    # --- Test refresh_session (single-flight) ---
+    def test_refresh_session_concurrent_callers_share_one_refresh(
+        self, session_manager
+    ):
+        # Arrange
+        session_manager.refresh_token = "old_refresh"
+        past_timestamp = str(int(datetime.now(timezone.utc).timestamp() - 60))
+        future_timestamp = str(int(datetime.now(timezone.utc).timestamp() + 3600))
+        session_manager.access_token_expire_time = past_timestamp
+        callers = 8
+        start = threading.Barrier(callers)
+
+        def slow_refresh(refresh_token):
+            time.sleep(0.05)
+            session_manager.store_token(
+                "new_access", future_timestamp, "new_refresh", future_timestamp
+            )
+            return True
+
+        results = []
+
+        def call_get_headers():
+            start.wait()
+            results.append(session_manager.get_authenticated_headers())
+
+        # Act
+        with patch.object(
+            session_manager, "attempt_session_refresh", side_effect=slow_refresh
+        ) as mock_refresh:
+            threads = [
+                threading.Thread(target=call_get_headers) for _ in range(callers)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(timeout=5)
+
+        # Assert
+        mock_refresh.assert_called_once_with("old_refresh")
+        assert len(results) == callers
+        assert all(
+            headers["Authorization"] == "Bearer new_access" for headers in results
+        )
+
+    def test_refresh_session_waiters_share_failure(self, session_manager):
+        # Arrange
+        error = Exception("Refresh rejected")
+        generation = session_manager.refresh_generation
+
+        with patch.object(
+            session_manager, "attempt_session_refresh", side_effect=error
+        ) as mock_refresh:
+            with pytest.raises(Exception, match="Refresh rejected"):
+                session_manager.refresh_session(generation)
+
+            # Act & Assert: a caller that observed the same generation gets
+            # the same error without another refresh attempt.
+            with pytest.raises(Exception, match="Refresh rejected"):
+                session_manager.refresh_session(generation)
+
+        mock_refresh.assert_called_once()
+        assert session_manager.refresh_generation == generation + 1
+
+    def test_refresh_session_new_generation_refreshes_again(self, session_manager):
+        # Arrange
+        with patch.object(
+            session_manager, "attempt_session_refresh", return_value=True
+        ) as mock_refresh:
+            # Act
+            session_manager.refresh_session()
+            session_manager.refresh_session()
+
+        # Assert
+        assert mock_refresh.call_count == 2
+        assert session_manager.refresh_generation == 2
+
     # --- Test get_authenticated_headers ---
     @patch.object(SessionManager, "ensure_session_valid", return_value=True)
     @patch.object(
@@ -620,10 +775,12 @@ class TestSessionManager:
     # --- Logout Tests ---
     @patch.object(SessionManager, "get_authenticated_headers")
     @patch.object(SessionManager, "clear_tokens")
+    @patch("src.services.session_manager.close_http_session")
     @patch("src.services.session_manager.logger", autospec=True)
     def test_logout_success(
         self,
         mock_logger,
+        mock_close_http_session,
         mock_clear_tokens,
         mock_get_headers,
         session_manager,
@@ -652,6 +809,7 @@ class TestSessionManager:
             timeout=DEFAULT_TIMEOUT,
         )
         mock_clear_tokens.assert_called_once()  # Verify tokens were cleared on success
+        mock_close_http_session.assert_called_once()  # Pooled connections dropped
         mock_logger.info.assert_any_call("Logging out user.")
         mock_logger.info.assert_any_call(
             "User logged out successfully. Clearing local tokens."
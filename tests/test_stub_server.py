@@ -0,0 +1,191 @@
+import time
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from benchmarks.stub_server import StubConfig, StubDataset, token_claims
+from src.services.api_client_service import APIClient, APIClientError
+from src.services.http_session import close_http_session
+from src.services.session_manager import SessionManager
+
+
+@pytest.fixture(autouse=True)
+def memory_keyring():
+    """Keeps SessionManager's tokens in memory instead of the user's keyring."""
+    store = {}
+    with patch("src.services.session_manager.keyring", autospec=True) as keyring:
+        keyring.get_password.side_effect = lambda service, key: store.get(key)
+        keyring.set_password.side_effect = lambda service, key, value: (
+            store.__setitem__(key, value)
+        )
+        keyring.delete_password.side_effect = lambda service, key: store.pop(key, None)
+        yield store
+    close_http_session()
+
+
+def logged_in_session(server, username: str = "user1") -> SessionManager:
+    session_manager = SessionManager()
+    session_manager.base_url = server.base_url
+    session_manager.login(username, "secret")
+    return session_manager
+
+
+def client_for(server, **kwargs) -> APIClient:
+    """Returns an uncached client for ``server``, logging in if needed."""
+    if SessionManager().access_token is None:
+        logged_in_session(server)
+    return APIClient(base_url=server.base_url, cache_responses=False, **kwargs)
+
+
+class TestStubServerSessions:
+    def test_login_and_retrieve_user_info(self, stub_server_factory):
+        # Arrange
+        server = stub_server_factory(require_auth=True, users=2, accounts=6)
+        logged_in_session(server, "user2")
+
+        # Act
+        user_info = client_for(server).retrieve_user_info()
+
+        # Assert
+        assert user_info["user_profile"]["username"] == "user2"
+        accounts = user_info["user_accounts"]["accounts"]
+        assert len(accounts) == 3
+        assert {account["owner_id"] for account in accounts} == {2}
+
+    def test_requests_without_token_are_refused(self, stub_server_factory):
+        # Arrange
+        server = stub_server_factory(require_auth=True)
+
+        # Act
+        response = requests.get(f"{server.base_url}users/current", timeout=5)
+
+        # Assert
+        assert response.status_code == 401
+
+    def test_refresh_rotates_the_refresh_token(self, stub_server):
+        # Arrange
+        session_manager = logged_in_session(stub_server)
+        old_refresh_token = session_manager.refresh_token
+
+        # Act
+        session_manager.refresh_session()
+        reused = requests.post(
+            f"{stub_server.base_url}auth/sessions/renew",
+            headers={"Authorization": f"Bearer {old_refresh_token}"},
+            timeout=5,
+        )
+
+        # Assert
+        assert session_manager.refresh_token != old_refresh_token
+        assert token_claims(session_manager.access_token)["sub"] == "1"
+        assert reused.status_code == 401
+
+    def test_logout_revokes_the_access_token(self, stub_server_factory):
+        # Arrange
+        server = stub_server_factory(require_auth=True)
+        session_manager = logged_in_session(server)
+        access_token = session_manager.access_token
+
+        # Act
+        session_manager.logout()
+        response = requests.get(
+            f"{server.base_url}users/current",
+            headers={"Authorization": f"Bearer {access_token}"},
+            timeout=5,
+        )
+
+        # Assert
+        assert session_manager.access_token is None
+        assert response.status_code == 401
+
+
+class TestStubServerTransactions:
+    def test_offset_paging_returns_every_transaction_once(self, stub_server_factory):
+        # Arrange
+        server = stub_server_factory(transactions=250, accounts=5)
+
+        # Act
+        ids = [
+            transaction["id"]
+            for transaction in client_for(server).iter_transactions(page_size=40)
+        ]
+
+        # Assert
+        assert ids == list(range(250, 0, -1))
+
+    def test_cursor_paging(self, stub_server_factory):
+        # Arrange
+        server = stub_server_factory(transactions=95, cursor_paging=True)
+        api_client = client_for(server)
+
+        # Act
+        first_page = api_client.retrieve_user_transactions(limit=50)
+        ids = [transaction["id"] for transaction in api_client.iter_transactions(50)]
+
+        # Assert
+        assert first_page["next_cursor"] == "46"
+        assert ids == list(range(95, 0, -1))
+
+    def test_filters(self, stub_server_factory):
+        # Arrange
+        server = stub_server_factory(transactions=500, accounts=4)
+        api_client = client_for(server)
+        account_number = server.accounts[1]["account_number"]
+
+        # Act
+        by_account = api_client.retrieve_user_transactions(
+            limit=1000, account_number=account_number
+        )["transactions"]
+        deposits = api_client.retrieve_user_transactions(
+            limit=1000, transaction_type="DEPOSIT"
+        )["transactions"]
+        newer = api_client.retrieve_user_transactions(limit=1000, since_id=480)[
+            "transactions"
+        ]
+
+        # Assert
+        assert by_account
+        assert {t["account_from"] for t in by_account} == {account_number}
+        assert deposits and all(t["amount"] > 0 for t in deposits)
+        assert {t["transaction_type"] for t in deposits} == {"DEPOSIT"}
+        assert [t["id"] for t in newer] == list(range(500, 480, -1))
+
+
+class TestStubServerBehaviour:
+    def test_injected_errors(self, stub_server_factory):
+        # Arrange
+        server = stub_server_factory(error_rate=1.0, error_status=500)
+        api_client = client_for(server, retry_policies={}, use_circuit_breaker=False)
+
+        # Act / Assert
+        with pytest.raises(APIClientError):
+            api_client.retrieve_user_transactions()
+        assert server.errors_injected == 1
+
+    def test_latency_and_padding(self, stub_server_factory):
+        # Arrange
+        server = stub_server_factory(latency=0.05, padding=100)
+        api_client = client_for(server)
+
+        # Act
+        started = time.perf_counter()
+        transactions = api_client.retrieve_user_transactions()["transactions"]
+        elapsed = time.perf_counter() - started
+
+        # Assert
+        assert elapsed >= 0.05
+        assert len(transactions[0]["description"]) == 100
+
+    def test_dataset_is_deterministic(self):
+        # Arrange
+        first = StubDataset(StubConfig(transactions=2000, accounts=50, seed=3))
+        second = StubDataset(StubConfig(transactions=2000, accounts=50, seed=3))
+
+        # Act
+        first_page = first.transactions_page(1, limit=100, offset=700)
+        second_page = second.transactions_page(1, limit=100, offset=700)
+
+        # Assert
+        assert first_page == second_page
+        assert first.account(7) == second.account(7)
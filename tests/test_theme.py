@@ -0,0 +1,129 @@
+import pytest
+from PySide6.QtGui import QPalette
+from PySide6.QtWidgets import QApplication, QLabel, QWidget
+
+from src.ui.plugins.widgets.account_card_widget import AccountCardWidget
+from src.ui.plugins.widgets.summary_card_widget import SummaryCardWidget
+from src.ui.theme import (
+    DARK,
+    LIGHT,
+    FontCache,
+    compile_stylesheet,
+    get_font,
+    get_theme_manager,
+    set_state,
+)
+
+
+@pytest.fixture
+def themed(qtbot):
+    """Applies the light theme and restores an unstyled application after."""
+    manager = get_theme_manager()
+    manager.apply("light")
+    yield manager
+    manager.apply("light")
+    QApplication.instance().setStyleSheet("")
+
+
+def make_card(recent_change="5"):
+    return AccountCardWidget(
+        name="Checking",
+        balance=100,
+        account_type="Checking",
+        account_number="1001",
+        recent_change=recent_change,
+    )
+
+
+def text_color(label: QLabel) -> str:
+    label.ensurePolished()
+    return label.palette().color(QPalette.ColorRole.WindowText).name().upper()
+
+
+class TestStylesheet:
+    def test_each_theme_is_compiled_once(self):
+        # Act
+        first = compile_stylesheet("dark")
+        second = compile_stylesheet("dark")
+
+        # Assert
+        assert first is second
+        assert DARK.card_background in first
+        assert "$" not in first
+
+    def test_unknown_theme(self):
+        # Act & Assert
+        with pytest.raises(ValueError, match="Unknown theme"):
+            compile_stylesheet("sepia")
+
+
+class TestFontCache:
+    def test_fonts_are_shared(self):
+        # Arrange
+        cache = FontCache()
+
+        # Act
+        first = cache.font("Roboto", 8)
+        second = cache.font("Roboto", 8)
+
+        # Assert
+        assert first is second
+        assert len(cache) == 1
+        assert get_font("account_balance") is get_font("account_balance")
+        assert get_font("account_balance").italic()
+
+
+class TestThemedWidgets:
+    def test_cards_have_no_style_sheets_of_their_own(self, qtbot):
+        # Arrange
+        card = make_card()
+        summary = SummaryCardWidget(title="Income", value="200")
+        qtbot.add_widget(card)
+        qtbot.add_widget(summary)
+
+        # Act
+        widgets = [card, summary, *card.findChildren(QWidget)]
+        widgets += summary.findChildren(QWidget)
+
+        # Assert
+        assert all(widget.styleSheet() == "" for widget in widgets)
+        assert card.balanceLabel.font() == get_font("account_balance")
+
+    def test_trend_is_a_dynamic_property(self, themed, qtbot):
+        # Arrange
+        card = make_card("-5")
+        qtbot.add_widget(card)
+        negative = text_color(card.recent_change_label)
+
+        # Act
+        card.update_account("Checking", 100, "Checking", "1001", "7")
+
+        # Assert
+        assert card.recent_change_label.property("trend") == "positive"
+        assert negative == LIGHT.negative
+        assert text_color(card.recent_change_label) == LIGHT.positive
+
+    def test_set_state_skips_unchanged_values(self, qtbot):
+        # Arrange
+        label = QLabel()
+        qtbot.add_widget(label)
+
+        # Act & Assert
+        assert set_state(label, "trend", "negative")
+        assert not set_state(label, "trend", "negative")
+
+    def test_switching_theme_restyles_existing_widgets(self, themed, qtbot):
+        # Arrange
+        card = make_card("-5")
+        qtbot.add_widget(card)
+        light = text_color(card.recent_change_label)
+
+        # Act
+        with qtbot.waitSignal(themed.theme_changed, timeout=1000) as changed:
+            themed.apply("dark")
+
+        # Assert
+        assert changed.args == ["dark"]
+        assert QApplication.instance().styleSheet() == compile_stylesheet("dark")
+        assert light == LIGHT.negative
+        assert text_color(card.recent_change_label) == DARK.negative
@@ -0,0 +1,155 @@
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.services.token_refresh_scheduler import TokenRefreshScheduler
+
+
+class TestTokenRefreshScheduler:
+    @pytest.fixture
+    def session_manager(self):
+        session_manager = MagicMock()
+        session_manager.refresh_token = "refresh"
+        session_manager.refresh_generation = 7
+        session_manager.access_token_expire_time = str(int(time.time()) + 3600)
+        return session_manager
+
+    @pytest.fixture
+    def scheduler(self, session_manager):
+        scheduler = TokenRefreshScheduler(
+            session_manager,
+            refresh_margin=60,
+            idle_interval=30,
+            backoff_base=1,
+            backoff_max=8,
+        )
+        yield scheduler
+        scheduler.stop(timeout=1)
+
+    # --- seconds_until_refresh / next_delay ---
+    def test_seconds_until_refresh(self, scheduler, session_manager):
+        # Arrange
+        session_manager.access_token_expire_time = "1000"
+
+        # Act & Assert
+        assert scheduler.seconds_until_refresh(now=500) == 440
+
+    @pytest.mark.parametrize("expire_time", [None, "None", "not-a-timestamp"])
+    def test_seconds_until_refresh_without_expiry(
+        self, scheduler, session_manager, expire_time
+    ):
+        # Arrange
+        session_manager.access_token_expire_time = expire_time
+
+        # Act & Assert
+        assert scheduler.seconds_until_refresh() is None
+        assert scheduler.next_delay() == 30
+
+    def test_seconds_until_refresh_without_refresh_token(
+        self, scheduler, session_manager
+    ):
+        # Arrange
+        session_manager.refresh_token = None
+
+        # Act & Assert
+        assert scheduler.seconds_until_refresh() is None
+
+    def test_next_delay_never_negative(self, scheduler, session_manager):
+        # Arrange
+        session_manager.access_token_expire_time = str(int(time.time()) - 10)
+
+        # Act & Assert
+        assert scheduler.next_delay() == 0
+
+    @pytest.mark.parametrize("attempt, cap", [(0, 1), (1, 2), (2, 4), (3, 8), (9, 8)])
+    def test_backoff_delay_bounds(self, scheduler, attempt, cap):
+        # Act
+        delays = [scheduler.backoff_delay(attempt) for _ in range(50)]
+
+        # Assert
+        assert all(cap / 2 <= delay <= cap for delay in delays)
+
+    def test_next_delay_backs_off_after_failure(self, scheduler):
+        # Arrange
+        scheduler.failures = 3
+
+        # Act & Assert
+        with patch.object(scheduler, "backoff_delay", return_value=5) as backoff:
+            assert scheduler.next_delay() == 5
+        backoff.assert_called_once_with(2)
+
+    # --- run_pending ---
+    def test_run_pending_not_due(self, scheduler, session_manager):
+        # Act
+        renewed = scheduler.run_pending()
+
+        # Assert
+        assert renewed is False
+        session_manager.refresh_session.assert_not_called()
+
+    def test_run_pending_renews_within_margin(self, scheduler, session_manager):
+        # Arrange
+        session_manager.access_token_expire_time = str(int(time.time()) + 30)
+
+        # Act
+        renewed = scheduler.run_pending()
+
+        # Assert
+        assert renewed is True
+        session_manager.refresh_session.assert_called_once_with(7)
+        assert scheduler.failures == 0
+
+    def test_run_pending_counts_failures(self, scheduler, session_manager):
+        # Arrange
+        session_manager.access_token_expire_time = str(int(time.time()) + 30)
+        session_manager.refresh_session.side_effect = Exception("offline")
+
+        # Act
+        scheduler.run_pending()
+        scheduler.run_pending()
+
+        # Assert
+        assert scheduler.failures == 2
+
+    def test_reschedule_resets_failures(self, scheduler):
+        # Arrange
+        scheduler.failures = 4
+
+        # Act
+        scheduler.reschedule()
+
+        # Assert
+        assert scheduler.failures == 0
+
+    # --- background thread ---
+    def test_background_thread_renews_before_expiry(self, scheduler, session_manager):
+        # Arrange
+        session_manager.access_token_expire_time = str(int(time.time()) + 60)
+
+        def renew(generation):
+            session_manager.access_token_expire_time = str(int(time.time()) + 3600)
+
+        session_manager.refresh_session.side_effect = renew
+
+        # Act
+        scheduler.start()
+        deadline = time.monotonic() + 2
+        while (
+            not session_manager.refresh_session.called and time.monotonic() < deadline
+        ):
+            time.sleep(0.01)
+
+        # Assert
+        session_manager.refresh_session.assert_called_once_with(7)
+        assert scheduler.running
+
+    def test_stop_ends_background_thread(self, scheduler):
+        # Arrange
+        scheduler.start()
+
+        # Act
+        scheduler.stop(timeout=1)
+
+        # Assert
+        assert not scheduler.running
@@ -0,0 +1,73 @@
+from PySide6.QtCore import QDate
+
+from src.core.transactions_management import TransactionFilter, parse_timestamp
+from src.ui.plugins.widgets.transaction_filter_bar import TransactionFilterBar
+
+
+class TestTransactionFilterBar:
+    def test_controls_build_the_filter(self, qtbot):
+        # Arrange
+        bar = TransactionFilterBar()
+        qtbot.add_widget(bar)
+        bar.set_options(["PENDING", "COMPLETED"], ["Savings", "Checking"])
+        emitted = []
+        bar.filter_changed.connect(emitted.append)
+
+        # Act
+        bar.status_box.setCurrentIndex(bar.status_box.findData("PENDING"))
+        bar.account_box.setCurrentIndex(bar.account_box.findData("Savings"))
+        bar.start_edit.setDate(QDate(2025, 3, 1))
+        bar.end_edit.setDate(QDate(2025, 3, 5))
+        bar.min_amount_edit.setText("10.5")
+        bar.min_amount_edit.editingFinished.emit()
+        bar.min_amount_edit.editingFinished.emit()
+
+        # Assert
+        assert len(emitted) == 5
+        row_filter = emitted[-1]
+        assert row_filter.statuses == {"PENDING"}
+        assert row_filter.accounts == {"Savings"}
+        assert row_filter.start == parse_timestamp("2025-03-01T00:00:00")
+        assert (
+            parse_timestamp("2025-03-05T23:59:59")
+            < row_filter.end
+            < parse_timestamp("2025-03-06T00:00:00")
+        )
+        assert row_filter.min_amount == 10.5
+        assert row_filter.max_amount is None
+
+    def test_clear_emits_none_once(self, qtbot):
+        # Arrange
+        bar = TransactionFilterBar()
+        qtbot.add_widget(bar)
+        bar.set_options(["FAILED"], [])
+        bar.status_box.setCurrentIndex(1)
+        emitted = []
+        bar.filter_changed.connect(emitted.append)
+
+        # Act
+        bar.clear()
+        bar.clear()
+
+        # Assert
+        assert emitted == [None]
+        assert bar.current_filter() is None
+
+    def test_set_options_keeps_the_choice_without_emitting(self, qtbot):
+        # Arrange
+        bar = TransactionFilterBar()
+        qtbot.add_widget(bar)
+        bar.set_options(["FAILED"], ["Savings"])
+        bar.account_box.setCurrentIndex(bar.account_box.findData("Savings"))
+        emitted = []
+        bar.filter_changed.connect(emitted.append)
+
+        # Act
+        bar.set_options(["FAILED", "PENDING"], ["Checking"])
+
+        # Assert
+        assert not emitted
+        assert bar.current_filter() == TransactionFilter(accounts={"Savings"})
+        assert [
+            bar.account_box.itemData(i) for i in range(bar.account_box.count())
+        ] == [None, "Checking", "Savings"]
@@ -0,0 +1,712 @@
+import math
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from PySide6.QtCore import QModelIndex, Qt, QThreadPool
+from PySide6.QtWidgets import QHeaderView
+
+from src.controllers.workers import WorkerPool
+from src.core.transactions_management import (
+    TransactionColumns,
+    TransactionFilter,
+    TransactionIndex,
+    format_timestamp,
+    parse_timestamp,
+)
+from src.ui.plugins.widgets.transaction_table_widget import (
+    ColumnWidthEstimator,
+    PagedTransactionTableModel,
+    Transaction,
+    TransactionSortFilterModel,
+    TransactionTableModel,
+    TransactionTableWidget,
+)
+
+
+def make_transactions(count: int, start: int = 0):
+    return [
+        Transaction(
+            amount=10 * i,
+            date=f"2025-03-05T12:{i % 60:02d}:00",
+            account_name=f"Account {i % 3}",
+            balance=1000 - i,
+            status="COMPLETED" if i % 2 else "PENDING",
+            transaction_id=i,
+        )
+        for i in range(start, start + count)
+    ]
+
+
+class TestTransactionColumns:
+    def test_extend_grows_and_encodes(self):
+        # Arrange
+        columns = TransactionColumns(capacity=2)
+
+        # Act
+        columns.extend(make_transactions(5))
+        columns.extend([Transaction("n/a", "None", None, None, "FAILED")])
+
+        # Assert
+        assert len(columns) == 6
+        assert list(columns.amount[:5]) == [0, 10, 20, 30, 40]
+        assert len(columns.account_names) == 3
+        assert columns.statuses.values == ["PENDING", "COMPLETED", "FAILED"]
+        assert math.isnan(columns.amount[5])
+        assert math.isnan(columns.timestamp[5])
+        assert columns.account_names.decode(int(columns.account[5])) == ""
+
+    def test_dates_are_stored_as_timestamps_and_shown_as_sent(self):
+        # Arrange
+        dates = [
+            "2025-03-05T12:00:00",
+            "2025-03-05T12:00:00.250000+00:00",
+            "2025-03-05 12:00:00",
+            "2025-03-05T12:00:00Z",
+            "2025-03-05T12:00:00+02:00",
+            "3/5/2025",
+            "None",
+        ]
+        columns = TransactionColumns()
+
+        # Act
+        columns.extend([Transaction(1, date, "Checking", 1, "OK") for date in dates])
+        columns.update(0, Transaction(1, "soon", "Checking", 1, "OK"))
+        columns.update(5, Transaction(1, "2025-03-06T00:00:00", "Checking", 1, "OK"))
+
+        # Assert
+        assert [columns.date_text(row) for row in range(1, 5)] == dates[1:5]
+        assert columns.date_text(0) == "soon"
+        assert columns.date_text(5) == "2025-03-06T00:00:00"
+        # Only texts no format reproduces are kept as text.
+        assert columns.raw_dates == {0: "soon", 4: dates[4], 6: "None"}
+
+    def test_unique_dates_hold_no_per_row_objects(self):
+        # Arrange
+        start = parse_timestamp("2025-01-01T00:00:00")
+        transactions = [
+            Transaction(1, format_timestamp(start + i), "Checking", 1, "OK")
+            for i in range(100_000)
+        ]
+        columns = TransactionColumns()
+
+        # Act
+        columns.extend(transactions)
+
+        # Assert
+        assert not columns.raw_dates
+        assert columns.date_format.nbytes == 100_000
+        assert columns.date_text(99_999) == transactions[-1].date
+
+    def test_parse_timestamp_treats_naive_times_as_utc(self):
+        # Act & Assert
+        assert parse_timestamp("1970-01-01T00:01:00") == 60
+        assert parse_timestamp("1970-01-01T01:01:00+01:00") == 60
+
+
+class TestTransactionTableModel:
+    def test_data_is_read_from_the_columns(self, qtbot):
+        # Arrange
+        model = TransactionTableModel(make_transactions(3))
+
+        # Act
+        row = [model.index(1, column).data() for column in range(5)]
+
+        # Assert
+        assert model.rowCount() == 3
+        assert model.columnCount() == 5
+        assert row == [
+            "Account 1",
+            "10.00",
+            "999.00",
+            "2025-03-05T12:01:00",
+            "COMPLETED",
+        ]
+        assert model.headerData(0, Qt.Orientation.Horizontal) == "Account name"
+        assert model.index(0, 0).data(Qt.ItemDataRole.EditRole) is None
+
+    def test_dates_are_shown_as_sent(self, qtbot):
+        # Arrange
+        dates = [
+            "2025-03-05T12:00:00+02:00",
+            "3/5/2025",
+            "Wed, 05 Mar 2025 12:00:00 GMT",
+            "2025-03-05T09:00:00",
+        ]
+        model = TransactionSortFilterModel(
+            TransactionTableModel(
+                [Transaction(1, date, "Checking", 1, "COMPLETED") for date in dates]
+            )
+        )
+
+        # Act
+        model.sort(TransactionTableModel.DATE, Qt.SortOrder.AscendingOrder)
+
+        # Assert
+        # Sorted by time; the dates that can't be parsed go last.
+        assert [
+            model.index(row, TransactionTableModel.DATE).data() for row in range(4)
+        ] == [dates[3], dates[0], dates[1], dates[2]]
+
+    def test_append_inserts_each_batch_once(self, qtbot):
+        # Arrange
+        model = TransactionTableModel(make_transactions(2))
+        inserted = []
+        model.rowsInserted.connect(
+            lambda parent, first, last: inserted.append((first, last))
+        )
+
+        # Act
+        model.append_transactions(make_transactions(100, start=2))
+        model.append_transactions([])
+
+        # Assert
+        assert inserted == [(2, 101)]
+        assert model.rowCount() == 102
+        assert model.transaction_at(101).amount == "1010.00"
+
+    def test_apply_changes_appends_new_rows_and_updates_in_place(self, qtbot):
+        # Arrange
+        model = TransactionTableModel(reversed(make_transactions(10)))
+        inserted, changed = [], []
+        model.rowsInserted.connect(
+            lambda parent, first, last: inserted.append((first, last))
+        )
+        model.dataChanged.connect(
+            lambda top_left, bottom_right, roles: changed.append(
+                (top_left.row(), bottom_right.row())
+            )
+        )
+        settled = [
+            Transaction(10 * i, "2025-03-05T12:00:00", "Account 0", 0, "FAILED", i)
+            for i in (8, 3)
+        ]
+
+        # Act
+        result = model.apply_changes(
+            [*reversed(make_transactions(2, start=10)), *settled]
+        )
+
+        # Assert
+        assert result == (2, 2)
+        assert changed == [(1, 6)]
+        assert inserted == [(10, 11)]
+        assert model.newest_id == 11
+        assert model.index(6, TransactionTableModel.STATUS).data() == "FAILED"
+        assert model.row_order.tolist() == [11, 10, *range(10)]
+
+    def test_clear_resets_the_model(self, qtbot):
+        # Arrange
+        model = TransactionTableModel(make_transactions(4))
+
+        # Act
+        with qtbot.waitSignal(model.modelReset):
+            model.clear()
+
+        # Assert
+        assert model.rowCount() == 0
+        assert model.rowCount(model.index(0, 0)) == 0
+        assert model.rowCount(QModelIndex()) == 0
+
+    @pytest.mark.parametrize("count", [100_000])
+    def test_large_models_hold_no_per_row_objects(self, qtbot, count):
+        # Arrange
+        transactions = make_transactions(count)
+
+        # Act
+        model = TransactionTableModel(transactions)
+
+        # Assert
+        assert model.rowCount() == count
+        assert model.columns.amount.nbytes == count * 8
+        assert model.index(count - 1, 1).data() == f"{10 * (count - 1)}.00"
+
+
+class TestTransactionTableWidget:
+    @pytest.fixture
+    def table(self, qtbot):
+        table = TransactionTableWidget(TransactionTableModel(make_transactions(500)))
+        qtbot.add_widget(table)
+        return table
+
+    def test_sample_rows_is_bounded(self):
+        # Arrange
+        estimator = ColumnWidthEstimator(edge_rows=50)
+
+        # Act
+        rows = estimator.sample_rows(0, 99_999)
+
+        # Assert
+        assert len(rows) == 100
+        assert rows[:2] == [0, 1] and rows[-1] == 99_999
+        assert estimator.sample_rows(3, 5) == [3, 4, 5]
+
+    def test_repaint_does_not_resize(self, table, qtbot):
+        # Arrange
+        table.show()
+        qtbot.waitExposed(table)
+
+        # Act
+        with patch.object(table.estimator, "estimate") as estimate:
+            table.viewport().repaint()
+            table.verticalScrollBar().setValue(100)
+            table.viewport().repaint()
+
+        # Assert
+        estimate.assert_not_called()
+
+    def test_widest_value_outside_the_sample_sets_the_width(self, qtbot):
+        # Arrange
+        transactions = make_transactions(1000)
+        transactions[500].account_name = "A very long account name " * 3
+        model = TransactionTableModel(transactions)
+
+        # Act
+        table = TransactionTableWidget(model)
+        qtbot.add_widget(table)
+
+        # Assert
+        text_width = table.fontMetrics().horizontalAdvance(
+            transactions[500].account_name
+        )
+        assert table.columnWidth(0) >= text_width
+
+    def test_appends_are_sized_once_per_burst(self, table, qtbot):
+        # Arrange
+        model = table.model()
+        widths = list(table.column_widths)
+
+        # Act
+        with patch.object(
+            table.estimator, "estimate", wraps=table.estimator.estimate
+        ) as estimate:
+            model.append_transactions(make_transactions(10, start=500))
+            model.append_transactions(make_transactions(10, start=510))
+            qtbot.waitUntil(lambda: not table._resize_timer.isActive())
+
+        # Assert
+        estimate.assert_called_once()
+        assert estimate.call_args.args[2:] == (500, 519)
+        assert all(new >= old for new, old in zip(table.column_widths, widths))
+
+    def test_rows_have_a_uniform_fixed_height(self, table):
+        # Assert
+        header = table.verticalHeader()
+        assert header.sectionResizeMode(0) == QHeaderView.ResizeMode.Fixed
+        assert {table.rowHeight(row) for row in (0, 250, 499)} == {
+            header.defaultSectionSize()
+        }
+
+
+class TestPagedTransactionTableModel:
+    @pytest.fixture
+    def source(self):
+        """A fake server: 250 transactions and a log of (offset, limit, thread)."""
+        transactions = make_transactions(250)
+        source = SimpleNamespace(calls=[], fail=False, transactions=transactions)
+
+        def fetch_page(offset, limit):
+            source.calls.append((offset, limit, threading.current_thread()))
+            if source.fail:
+                raise RuntimeError("server down")
+            return transactions[offset : offset + limit]
+
+        source.fetch_page = fetch_page
+        return source
+
+    @pytest.fixture
+    def make_model(self, source, qtbot):
+        def make(**kwargs):
+            kwargs.setdefault("page_size", 50)
+            return PagedTransactionTableModel(
+                source.fetch_page, worker_pool=WorkerPool(QThreadPool()), **kwargs
+            )
+
+        return make
+
+    def load(self, model, qtbot):
+        """Waits until no page is in flight."""
+        qtbot.waitUntil(lambda: not model._in_flight, timeout=2000)
+
+    def test_fetch_more_appends_pages_off_the_gui_thread(
+        self, make_model, source, qtbot
+    ):
+        # Arrange
+        model = make_model(first_page=make_transactions(50))
+        inserted = []
+        model.rowsInserted.connect(lambda parent, first, last: inserted.append(first))
+
+        # Act
+        while model.canFetchMore(QModelIndex()):
+            model.fetchMore(QModelIndex())
+            self.load(model, qtbot)
+
+        # Assert
+        assert model.rowCount() == 250
+        assert inserted == [50, 100, 150, 200]
+        assert model.exhausted
+        assert all(call[2] is not threading.current_thread() for call in source.calls)
+        assert model.index(249, 1).data() == "2490.00"
+
+    def test_prefetches_past_the_fraction(self, make_model, source, qtbot):
+        # Arrange
+        model = make_model(first_page=make_transactions(50), prefetch_fraction=0.5)
+
+        # Act
+        model.note_visible_rows(0, 20)
+        calls_before_fraction = len(source.calls)
+        with qtbot.waitSignal(model.rowsInserted, timeout=2000):
+            model.note_visible_rows(10, 30)
+
+        # Assert
+        assert calls_before_fraction == 0
+        assert source.calls[0][:2] == (50, 50)
+        assert model.rowCount() == 100
+
+    def test_far_pages_are_evicted_and_refetched(self, make_model, source, qtbot):
+        # Arrange
+        model = make_model(max_pages=2, prefetch_fraction=1.0)
+        model.fetchMore(QModelIndex())
+        for _ in range(3):
+            self.load(model, qtbot)
+            model.note_visible_rows(model.rowCount() - 10, model.rowCount() - 1)
+        self.load(model, qtbot)
+
+        # Act
+        evicted_pages = model.loaded_pages
+        evicted_cell = model.index(0, 1).data()
+        with qtbot.waitSignal(model.dataChanged, timeout=2000):
+            model.note_visible_rows(0, 10)
+
+        # Assert
+        assert model.rowCount() == 200
+        assert evicted_pages == [2, 3]
+        assert evicted_cell is None
+        assert model.index(0, 1).data() == "0.00"
+        assert 0 in model.loaded_pages and len(model.loaded_pages) == 2
+
+    def test_failed_pages_are_retried_after_a_delay(self, make_model, source, qtbot):
+        # Arrange
+        model = make_model(first_page=make_transactions(50), retry_delay=60)
+        source.fail = True
+
+        # Act
+        with qtbot.waitSignal(model.page_failed, timeout=2000) as failed:
+            model.fetchMore(QModelIndex())
+        can_fetch_after_failure = model.canFetchMore(QModelIndex())
+        model.retry_delay = 0
+
+        # Assert
+        assert failed.args == ["server down"]
+        assert not can_fetch_after_failure
+        assert model.canFetchMore(QModelIndex())
+        assert model.rowCount() == 50
+
+    def test_apply_changes_inserts_new_rows_on_top_and_updates_in_place(
+        self, make_model, qtbot
+    ):
+        # Arrange
+        model = make_model(first_page=make_transactions(50))
+        inserted, changed = [], []
+        model.rowsInserted.connect(
+            lambda parent, first, last: inserted.append((first, last))
+        )
+        model.dataChanged.connect(
+            lambda top_left, bottom_right, roles: changed.append(top_left.row())
+        )
+        settled = Transaction(30, "2025-03-05T12:03:00", "Account 0", 997, "FAILED", 3)
+
+        # Act
+        result = model.apply_changes(
+            [*reversed(make_transactions(2, start=300)), settled]
+        )
+
+        # Assert
+        assert result == (2, 1)
+        assert inserted == [(0, 1)]
+        assert changed == [3]
+        assert model.rowCount() == 52
+        assert [model.transaction_at(row).transaction_id for row in range(3)] == [
+            301,
+            300,
+            0,
+        ]
+        assert model.index(5, TransactionTableModel.STATUS).data() == "FAILED"
+        assert model.newest_id == 301
+
+    def test_apply_changes_drops_history_that_is_not_loaded(self, make_model, qtbot):
+        # Arrange
+        history = list(reversed(make_transactions(300)))
+        model = make_model(first_page=history[:100], page_size=100)
+
+        # Act: a backend that ignored since_id returns the whole history.
+        result = model.apply_changes(history)
+
+        # Assert
+        assert result == (0, 100)
+        assert model.rowCount() == 100
+        assert model.newest_id == 299
+
+    def test_refresh_visible_pages_updates_rows_in_place(
+        self, make_model, source, qtbot
+    ):
+        # Arrange
+        model = make_model(first_page=make_transactions(50))
+        model.note_visible_rows(0, 10)
+        source.transactions[3] = Transaction(
+            30, "2025-03-05T12:03:00", "Account 0", 997, "FAILED", 3
+        )
+        inserted = []
+        model.rowsInserted.connect(lambda *args: inserted.append(args))
+
+        # Act
+        with qtbot.waitSignal(model.dataChanged, timeout=2000):
+            requested = model.refresh_visible_pages()
+
+        # Assert
+        assert requested == 1
+        assert source.calls[0][:2] == (0, 50)
+        assert model.index(3, TransactionTableModel.STATUS).data() == "FAILED"
+        assert model.rowCount() == 50
+        assert not inserted
+
+    def test_pages_are_read_past_new_rows(self, make_model, source, qtbot):
+        # Arrange
+        model = make_model(first_page=make_transactions(50))
+        model.apply_changes(make_transactions(3, start=300))
+
+        # Act
+        model.fetchMore(QModelIndex())
+        self.load(model, qtbot)
+
+        # Assert
+        assert source.calls[0][:2] == (53, 50)
+        assert model.rowCount() == 103
+        assert model.index(53, 1).data() == "530.00"
+
+    def test_header_click_asks_for_a_sort(self, make_model, qtbot):
+        # Arrange
+        model = make_model(first_page=make_transactions(50))
+        table = TransactionTableWidget(model)
+        qtbot.add_widget(table)
+
+        # Act
+        with qtbot.waitSignal(model.sort_requested, timeout=1000) as requested:
+            table.sortByColumn(
+                TransactionTableModel.AMOUNT, Qt.SortOrder.DescendingOrder
+            )
+
+        # Assert
+        assert table.isSortingEnabled()
+        assert requested.args == [
+            TransactionTableModel.AMOUNT,
+            Qt.SortOrder.DescendingOrder,
+        ]
+        assert model.transaction_at(0).transaction_id == 0
+        assert model.distinct_values(TransactionTableModel.STATUS) == [
+            "COMPLETED",
+            "PENDING",
+        ]
+
+    def test_table_scrolling_loads_more_rows(self, make_model, qtbot):
+        # Arrange
+        model = make_model(first_page=make_transactions(50))
+        table = TransactionTableWidget(model)
+        qtbot.add_widget(table)
+        table.resize(400, 300)
+        table.show()
+        qtbot.waitExposed(table)
+
+        # Act
+        table.scrollToBottom()
+
+        # Assert
+        qtbot.waitUntil(lambda: model.rowCount() >= 100, timeout=2000)
+
+
+class TestTransactionIndex:
+    @pytest.fixture
+    def columns(self):
+        columns = TransactionColumns()
+        columns.extend(
+            [
+                Transaction(100, "2025-03-02T00:00:00", "Savings", 5, "PENDING"),
+                Transaction(20, "2025-03-01T00:00:00", "checking", 7, "COMPLETED"),
+                Transaction(None, "None", None, 1, None),
+                Transaction(-5, "2025-03-03T00:00:00", "Brokerage", 7, "FAILED"),
+            ]
+        )
+        return columns
+
+    def test_amounts_sort_numerically_with_missing_values_last(self, columns):
+        # Arrange
+        index = TransactionIndex(columns)
+
+        # Act & Assert
+        assert list(index.rows("amount")) == [3, 1, 0, 2]
+        assert list(index.rows("amount", descending=True)) == [0, 1, 3, 2]
+
+    def test_strings_sort_alphabetically_and_ties_keep_order(self, columns):
+        # Arrange
+        index = TransactionIndex(columns)
+
+        # Act & Assert
+        assert list(index.rows("account")) == [3, 0, 1, 2]
+        assert list(index.rows("status", descending=True)) == [0, 3, 1, 2]
+        assert list(index.rows("balance")) == [2, 0, 1, 3]
+
+    def test_permutations_are_cached_until_rows_change(self, columns):
+        # Arrange
+        index = TransactionIndex(columns)
+        first = index.permutation("timestamp")
+
+        # Act
+        again = index.permutation("timestamp")
+        columns.extend(make_transactions(1))
+        after_append = index.permutation("timestamp")
+
+        # Assert
+        assert again is first
+        assert len(after_append) == 5
+
+    def test_filters(self, columns):
+        # Arrange
+        index = TransactionIndex(columns)
+        march_2 = parse_timestamp("2025-03-02T00:00:00")
+
+        # Act & Assert
+        assert list(
+            index.rows(row_filter=TransactionFilter(statuses=["FAILED", "PENDING"]))
+        ) == [0, 3]
+        assert list(
+            index.rows(row_filter=TransactionFilter(accounts=["checking", "Unknown"]))
+        ) == [1]
+        assert list(index.rows(row_filter=TransactionFilter(start=march_2))) == [0, 3]
+        assert list(
+            index.rows("amount", row_filter=TransactionFilter(min_amount=0))
+        ) == [1, 0]
+        assert list(index.rows(row_filter=TransactionFilter(max_amount=20))) == [1, 3]
+
+    def test_unknown_sort_key(self, columns):
+        # Act & Assert
+        with pytest.raises(ValueError, match="Unknown sort key"):
+            TransactionIndex(columns).permutation("date")
+
+
+class TestTransactionSortFilterModel:
+    @pytest.fixture
+    def proxy(self, qtbot):
+        return TransactionSortFilterModel(TransactionTableModel(make_transactions(30)))
+
+    def column(self, model, column):
+        return [model.index(row, column).data() for row in range(model.rowCount())]
+
+    def test_sort_and_filter(self, proxy):
+        # Act
+        proxy.sort(TransactionTableModel.AMOUNT, Qt.SortOrder.DescendingOrder)
+        proxy.set_filter(TransactionFilter(statuses=["PENDING"], max_amount=100))
+
+        # Assert
+        assert self.column(proxy, TransactionTableModel.AMOUNT) == [
+            "100.00",
+            "80.00",
+            "60.00",
+            "40.00",
+            "20.00",
+            "0.00",
+        ]
+        assert proxy.transaction_at(0).amount == "100.00"
+
+    def test_maps_between_source_and_proxy(self, proxy):
+        # Arrange
+        proxy.sort(TransactionTableModel.AMOUNT, Qt.SortOrder.DescendingOrder)
+        source = proxy.sourceModel()
+
+        # Act
+        proxy_index = proxy.mapFromSource(source.index(29, 1))
+
+        # Assert
+        assert proxy_index.row() == 0
+        assert proxy.mapToSource(proxy_index).row() == 29
+        proxy.set_filter(TransactionFilter(max_amount=10))
+        assert not proxy.mapFromSource(source.index(29, 1)).isValid()
+
+    def test_source_appends_are_sorted_in(self, proxy):
+        # Arrange
+        proxy.sort(TransactionTableModel.AMOUNT, Qt.SortOrder.DescendingOrder)
+
+        # Act
+        proxy.sourceModel().append_transactions(
+            [Transaction(999, "2025-03-05T12:00:00", "New", 1, "COMPLETED")]
+        )
+
+        # Assert
+        assert proxy.rowCount() == 31
+        assert proxy.index(0, 0).data() == "New"
+
+    def test_changes_are_merged_into_the_sorted_and_filtered_rows(self, qtbot):
+        # Arrange
+        source = TransactionTableModel(reversed(make_transactions(30)))
+        proxy = TransactionSortFilterModel(source)
+        proxy.set_filter(TransactionFilter(statuses=["PENDING"]))
+        proxy.sort(TransactionTableModel.AMOUNT, Qt.SortOrder.DescendingOrder)
+        proxy.sort_index.permutation("amount", True)
+
+        # Act
+        result = proxy.apply_changes(list(reversed(make_transactions(4, start=30))))
+        sorted_amounts = self.column(proxy, TransactionTableModel.AMOUNT)[:3]
+        proxy.set_filter(None)
+        proxy.sort(-1)
+
+        # Assert
+        assert result == (4, 0)
+        assert proxy.sourceModel() is source
+        assert proxy.newest_id == 33
+        assert sorted_amounts == ["320.00", "300.00", "280.00"]
+        assert [proxy.transaction_at(row).transaction_id for row in range(5)] == [
+            33,
+            32,
+            31,
+            30,
+            29,
+        ]
+
+    def test_header_click_sorts_the_table(self, proxy, qtbot):
+        # Arrange
+        table = TransactionTableWidget(proxy)
+        qtbot.add_widget(table)
+        unsorted = self.column(proxy, TransactionTableModel.AMOUNT)
+
+        # Act
+        table.sortByColumn(TransactionTableModel.AMOUNT, Qt.SortOrder.DescendingOrder)
+
+        # Assert
+        assert table.isSortingEnabled()
+        assert unsorted[:2] == ["0.00", "10.00"]
+        assert self.column(proxy, TransactionTableModel.AMOUNT)[:2] == [
+            "290.00",
+            "280.00",
+        ]
+
+    def test_sorting_and_filtering_100k_rows_is_fast(self, qtbot):
+        # Arrange
+        proxy = TransactionSortFilterModel(
+            TransactionTableModel(make_transactions(100_000))
+        )
+        row_filter = TransactionFilter(
+            statuses=["COMPLETED"], min_amount=1000, max_amount=500_000
+        )
+
+        # Act
+        started = time.perf_counter()
+        proxy.sort(TransactionTableModel.DATE, Qt.SortOrder.AscendingOrder)
+        proxy.set_filter(row_filter)
+        proxy.sort(TransactionTableModel.AMOUNT, Qt.SortOrder.DescendingOrder)
+        elapsed = time.perf_counter() - started
+
+        # Assert
+        assert proxy.rowCount() == 24_950
+        assert proxy.index(0, 1).data() == "499990.00"
+        assert elapsed < 0.5
@@ -0,0 +1,276 @@
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+from PySide6.QtCore import QThreadPool
+
+from src.controllers.base_controller import BaseController
+from src.controllers.workers import JobPriority, Worker, WorkerPool
+from src.models.login_model import LoginModel
+
+
+@pytest.fixture
+def worker_pool(qtbot):
+    thread_pool = QThreadPool()
+    thread_pool.setMaxThreadCount(1)
+    pool = WorkerPool(thread_pool)
+    yield pool
+    pool.cancel_all()
+    thread_pool.waitForDone(2000)
+
+
+def blocker(event: threading.Event) -> Worker:
+    """A job that occupies the single pool thread until ``event`` is set."""
+    return Worker(event.wait, 2)
+
+
+class TestWorkerPool:
+    def test_result_is_delivered(self, worker_pool, qtbot):
+        # Arrange
+        worker = Worker(lambda a, b: a + b, 2, b=3)
+
+        # Act
+        with qtbot.waitSignal(worker.signals.finished) as blocker_signal:
+            worker_pool.start(worker)
+
+        # Assert
+        assert blocker_signal.args == [5]
+        qtbot.waitUntil(lambda: worker_pool.pending_jobs == 0)
+
+    def test_error_is_delivered(self, worker_pool, qtbot):
+        # Arrange
+        def fail():
+            raise ValueError("boom")
+
+        worker = Worker(fail)
+
+        # Act
+        with qtbot.waitSignal(worker.signals.error) as blocker_signal:
+            worker_pool.start(worker)
+
+        # Assert
+        assert blocker_signal.args == ["boom"]
+
+    def test_higher_priority_runs_first(self, worker_pool, qtbot):
+        # Arrange
+        release = threading.Event()
+        order = []
+        low = Worker(order.append, "low")
+        high = Worker(order.append, "high")
+        worker_pool.start(blocker(release))
+
+        # Act
+        worker_pool.start(low, JobPriority.LOW)
+        worker_pool.start(high, JobPriority.HIGH)
+        with qtbot.waitSignal(low.signals.finished):
+            release.set()
+
+        # Assert
+        assert order == ["high", "low"]
+
+    def test_cancel_pending_job(self, worker_pool, qtbot):
+        # Arrange
+        release = threading.Event()
+        ran = MagicMock()
+        worker = Worker(ran)
+        worker_pool.start(blocker(release))
+        worker_pool.start(worker)
+
+        # Act
+        with qtbot.waitSignal(worker.signals.cancelled):
+            worker_pool.cancel(worker)
+        release.set()
+
+        # Assert
+        assert worker_pool.thread_pool.waitForDone(2000)
+        ran.assert_not_called()
+
+    def test_cancel_running_job_discards_result(self, worker_pool, qtbot):
+        # Arrange
+        started = threading.Event()
+        release = threading.Event()
+
+        def job():
+            started.set()
+            release.wait(2)
+            return "stale"
+
+        worker = Worker(job)
+        on_finished = MagicMock()
+        worker.signals.finished.connect(on_finished)
+        worker_pool.start(worker)
+        assert started.wait(2)
+
+        # Act
+        with qtbot.waitSignal(worker.signals.cancelled):
+            worker_pool.cancel(worker)
+            release.set()
+
+        # Assert
+        on_finished.assert_not_called()
+
+    def test_done_once_run_or_cancelled(self, worker_pool, qtbot):
+        # Arrange
+        release = threading.Event()
+        worker_pool.start(blocker(release))
+        ran, dropped = Worker(lambda: None), Worker(lambda: None)
+        worker_pool.start(ran)
+        worker_pool.start(dropped)
+
+        # Act
+        pending = ran.done(), dropped.done()
+        worker_pool.cancel(dropped)
+        release.set()
+
+        # Assert
+        assert pending == (False, False)
+        assert dropped.done()
+        qtbot.waitUntil(ran.done)
+
+
+class TestBaseControllerBackgroundJobs:
+    def test_run_in_background_drives_controller_signals(self, qtbot):
+        # Arrange
+        controller = BaseController()
+        events = []
+        controller.loading_started.connect(lambda: events.append("started"))
+        controller.loading_finished.connect(lambda: events.append("finished"))
+        on_result = MagicMock()
+
+        # Act
+        controller.run_in_background(lambda: 42, on_result=on_result)
+        qtbot.waitUntil(lambda: len(events) == 2)
+
+        # Assert
+        assert events == ["started", "finished"]
+        on_result.assert_called_once_with(42)
+
+    def test_run_in_background_reports_errors(self, qtbot):
+        # Arrange
+        controller = BaseController()
+
+        def fail():
+            raise RuntimeError("network down")
+
+        errors = []
+        controller.error_occurred.connect(errors.append)
+
+        # Act
+        with qtbot.waitSignal(controller.loading_finished):
+            controller.run_in_background(fail)
+
+        # Assert
+        assert errors == ["network down"]
+
+    def test_run_in_background_calls_on_done_after_success_and_error(self, qtbot):
+        # Arrange
+        controller = BaseController()
+        done = []
+
+        def fail():
+            raise RuntimeError("network down")
+
+        # Act
+        controller.run_in_background(lambda: 42, on_done=lambda: done.append("ok"))
+        controller.run_in_background(fail, on_done=lambda: done.append("failed"))
+        qtbot.waitUntil(lambda: len(done) == 2)
+
+        # Assert
+        assert sorted(done) == ["failed", "ok"]
+
+    def test_cancel_all_cancels_pending_jobs(self, worker_pool, qtbot):
+        # Arrange
+        controller = BaseController()
+        release = threading.Event()
+        ran = MagicMock()
+        with patch(
+            "src.controllers.base_controller.get_worker_pool", return_value=worker_pool
+        ):
+            jobs = [
+                controller.run_in_background(release.wait, 2),
+                *(controller.run_in_background(ran) for _ in range(3)),
+            ]
+
+            # Act
+            controller.cancel_all()
+            release.set()
+
+        # Assert
+        qtbot.waitUntil(lambda: controller.pending_jobs == 0, timeout=3000)
+        assert all(job.is_cancelled for job in jobs)
+        ran.assert_not_called()
+
+
+class TestLoginModelBackgroundLogin:
+    def test_login_runs_off_the_gui_thread(self, qtbot):
+        # Arrange
+        login_view = MagicMock()
+        model = LoginModel(login_view)
+        gui_thread = threading.get_ident()
+        login_threads = []
+        session_manager = MagicMock()
+        session_manager.login.side_effect = lambda *_: (
+            login_threads.append(threading.get_ident()) or {"access_token": "t"}
+        )
+        api_client = MagicMock()
+        api_client.retrieve_user_info.return_value = {"user_profile": {"id": 1}}
+
+        # Act
+        with qtbot.waitSignal(model.login_successful) as blocker_signal:
+            model.process_login("user", "pw", api_client, session_manager)
+
+        # Assert
+        assert blocker_signal.args == [{"user_profile": {"id": 1}}]
+        assert login_threads and login_threads[0] != gui_thread
+        login_view.set_busy.assert_any_call(True)
+        qtbot.waitUntil(lambda: login_view.set_busy.call_count == 2)
+        login_view.set_busy.assert_called_with(False)
+
+    def test_rejected_credentials_show_failure(self, qtbot):
+        # Arrange
+        login_view = MagicMock()
+        model = LoginModel(login_view)
+        session_manager = MagicMock()
+        session_manager.login.return_value = {"error": "Invalid credentials"}
+        api_client = MagicMock()
+
+        # Act
+        model.process_login("user", "bad", api_client, session_manager)
+        qtbot.waitUntil(lambda: login_view.show_failure.called)
+
+        # Assert
+        login_view.show_failure.assert_called_once_with("Invalid credentials")
+        api_client.retrieve_user_info.assert_not_called()
+
+    def test_restore_session_runs_off_the_gui_thread(self, qtbot):
+        # Arrange
+        model = LoginModel(MagicMock())
+        gui_thread = threading.get_ident()
+        restore_threads = []
+        session_manager = MagicMock()
+        session_manager.ensure_session_valid.side_effect = lambda: (
+            restore_threads.append(threading.get_ident())
+        )
+        api_client = MagicMock()
+        api_client.retrieve_user_info.return_value = {"user_profile": {"id": 1}}
+
+        # Act
+        with qtbot.waitSignal(model.login_successful) as blocker_signal:
+            model.restore_session(api_client, session_manager)
+
+        # Assert
+        assert blocker_signal.args == [{"user_profile": {"id": 1}}]
+        assert restore_threads and restore_threads[0] != gui_thread
+
+    def test_failed_restore_is_reported(self, qtbot):
+        # Arrange
+        model = LoginModel(MagicMock())
+        session_manager = MagicMock()
+        session_manager.ensure_session_valid.side_effect = RuntimeError("expired")
+
+        # Act
+        with qtbot.waitSignal(model.session_restore_failed) as blocker_signal:
+            model.restore_session(MagicMock(), session_manager)
+
+        # Assert
+        assert blocker_signal.args == ["expired"]